@@ -5,7 +5,8 @@ from typing import Any
 
 import pandas as pd
 
-from backend.storage import get_ip_clusters, get_risk_dashboard
+from backend import read_cache
+from backend.storage import current_data_version, get_ip_clusters, get_risk_dashboard
 
 CORE_IPS = ["maplestory", "dnf", "arcraiders", "bluearchive", "fconline"]
 THEME_ACTION_MAP = {
@@ -18,20 +19,22 @@ THEME_ACTION_MAP = {
 }
 
 
+@read_cache.memoize(current_data_version)
 def build_project_snapshot(
     *,
     date_from: str = "2024-01-01",
     date_to: str = "2026-12-31",
     ips: list[str] | None = None,
+    columnar: bool | None = None,
 ) -> dict[str, Any]:
     target_ips = ips or CORE_IPS
 
-    overall = get_risk_dashboard(date_from=date_from, date_to=date_to, ip="all")
+    overall = get_risk_dashboard(date_from=date_from, date_to=date_to, ip="all", columnar=columnar)
     ip_summaries: list[dict[str, Any]] = []
 
     for ip in target_ips:
-        risk = get_risk_dashboard(date_from=date_from, date_to=date_to, ip=ip)
-        clusters = get_ip_clusters(date_from=date_from, date_to=date_to, ip=ip, limit=6)
+        risk = get_risk_dashboard(date_from=date_from, date_to=date_to, ip=ip, columnar=columnar)
+        clusters = get_ip_clusters(date_from=date_from, date_to=date_to, ip=ip, limit=6, columnar=columnar)
         top_theme = (risk.get("risk_themes") or [{}])[0]
         ip_summaries.append(
             {
@@ -0,0 +1,505 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Any, Callable
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError:  # 선택 의존성: 없으면 분석 함수는 기존 SQLite 경로만 쓴다.
+    pa = pc = pq = None
+
+from backend import archive, storage
+from backend.db import connect_dedicated
+from backend.db_writer import run_write
+
+logger = logging.getLogger("backend.analytics_store")
+
+# 장기 구간 분석(클러스터/리스크 대시보드/프로젝트 스냅샷)용 월별 Parquet 스토어.
+# 기사 + 태그 + 감성 + 클러스터 토큰을 월(YYYY-MM) 파티션에 내보내고, 워터마크(id) 이후 신규분만 파일을 추가한다.
+ANALYTICS_COLUMNAR_ENABLED = os.getenv("ANALYTICS_COLUMNAR_ENABLED", "1").strip() != "0"
+ANALYTICS_STORE_DIR = os.getenv("ANALYTICS_STORE_DIR", "").strip()
+ANALYTICS_STORE_PART_ROWS = int(os.getenv("ANALYTICS_STORE_PART_ROWS", "100000"))
+# 한 월에 part_rows 미만 작은 파일이 이 수를 넘으면 하나로 합친다(증분 갱신마다 파일이 쌓이는 것 방지).
+ANALYTICS_STORE_COMPACT_FILES = int(os.getenv("ANALYTICS_STORE_COMPACT_FILES", "4"))
+ANALYTICS_STORE_REFRESH_MINUTES = int(os.getenv("ANALYTICS_STORE_REFRESH_MINUTES", "60"))
+# 파티션 파일 열 캐시 상한(MB). 파일은 만든 뒤 바뀌지 않으므로 무효화 없이 LRU로만 비운다.
+ANALYTICS_STORE_CACHE_MB = int(os.getenv("ANALYTICS_STORE_CACHE_MB", "256"))
+STORE_FORMAT_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+
+_refresh_lock = Lock()
+_column_cache: OrderedDict[tuple[str, str], Any] = OrderedDict()
+_column_cache_bytes = 0
+_column_cache_lock = Lock()
+# 조건 열은 고유값이 적어 사전 인코딩으로 캐시하고 조건을 고유값에만 계산한다.
+_FILTER_COLUMNS = ["company", "is_test", "date", "ip_tags"]
+_ROW_SQL = (
+    """
+    SELECT id, company, is_test, date, title_clean, description_clean,
+           COALESCE(sentiment, '') AS sentiment,
+           COALESCE(source_group_id, '') AS source_group_id,
+           COALESCE(NULLIF(outlet, ''), 'unknown') AS outlet,
+           """
+    + storage._ARTICLE_MONTH_SQL.format(date="date")
+    + """ AS month,
+           (SELECT group_concat(t.tag, '|') FROM article_tags t
+            WHERE t.article_id = articles.id AND t.tag_type = 'ip') AS ip_tags,
+    """
+    + storage.ARTICLE_TAG_COLUMNS_SQL
+    + """
+    FROM articles
+    """
+)
+
+if pa is not None:
+    SCHEMA = pa.schema(
+        [
+            ("id", pa.int64()),
+            ("company", pa.string()),
+            ("is_test", pa.int8()),
+            ("date", pa.string()),
+            ("title", pa.string()),
+            ("sentiment", pa.string()),
+            ("source_group_id", pa.string()),
+            ("outlet", pa.string()),
+            ("primary_ip", pa.string()),
+            # "|IP1|IP2|" 형태(기사 목록과 같은 article_tags 소속 IP)
+            ("ip_tags", pa.string()),
+            # RISK_THEME_RULES 순서의 "테마1|테마2"
+            ("themes", pa.string()),
+            # IP 키워드 제외 전 클러스터 토큰(_extract_cluster_tokens(text, ""))
+            ("tokens", pa.list_(pa.string())),
+        ]
+    )
+else:
+    SCHEMA = None
+
+
+@dataclass
+class ColumnarArticles:
+    """스토어 + SQLite 증분을 합친 기사 프레임(요청한 정렬 순).
+
+    token_rows/token_codes는 행 순서대로 펼친 토큰(행 번호, vocab 코드)이다.
+    """
+
+    frame: pd.DataFrame
+    token_rows: np.ndarray | None = None
+    token_codes: np.ndarray | None = None
+    vocab: list[str] | None = None
+
+
+def available() -> bool:
+    return pa is not None and ANALYTICS_COLUMNAR_ENABLED
+
+
+def store_dir(db_path: str | Path | None = None) -> Path:
+    path = Path(db_path or storage.get_active_db_path())
+    base = Path(ANALYTICS_STORE_DIR) if ANALYTICS_STORE_DIR else path.parent / "analytics"
+    if not base.is_absolute():
+        base = storage.ROOT_DIR / base
+    return base / path.stem
+
+
+def _store_fingerprint() -> str:
+    """태그 규칙/토큰 규칙이 바뀌면 스토어 전체를 다시 만든다."""
+    rules = {
+        "format": STORE_FORMAT_VERSION,
+        "tags": storage._article_tag_fingerprint(),
+        "stopwords": sorted(storage.CLUSTER_TOKEN_STOPWORDS),
+        "suffixes": list(storage.KOREAN_PARTICLE_SUFFIXES),
+    }
+    return hashlib.sha1(json.dumps(rules, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _load_manifest(root: Path) -> dict[str, Any] | None:
+    try:
+        return json.loads((root / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(root: Path, manifest: dict[str, Any]) -> None:
+    tmp = root / f".{MANIFEST_NAME}.tmp"
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=1), encoding="utf-8")
+    os.replace(tmp, root / MANIFEST_NAME)
+
+
+def _record(r: sqlite3.Row, with_tokens: bool = True) -> dict[str, Any]:
+    primary_ip, themes = storage.row_article_tags(r, True)
+    ip_tags = str(r["ip_tags"] or "")
+    return {
+        "id": int(r["id"]),
+        "company": str(r["company"] or ""),
+        "is_test": int(r["is_test"] or 0),
+        "date": r["date"],
+        "title": str(r["title_clean"] or ""),
+        "sentiment": str(r["sentiment"] or ""),
+        "source_group_id": str(r["source_group_id"] or ""),
+        "outlet": str(r["outlet"] or "unknown"),
+        "primary_ip": primary_ip,
+        "ip_tags": f"|{ip_tags}|" if ip_tags else "",
+        "themes": "|".join(themes),
+        "tokens": (
+            storage._extract_cluster_tokens(f"{r['title_clean'] or ''} {r['description_clean'] or ''}", "")
+            if with_tokens
+            else []
+        ),
+    }
+
+
+def _write_part(root: Path, month: str, name: str, records: list[dict[str, Any]]) -> str:
+    table = pa.Table.from_pylist(records, schema=SCHEMA).sort_by([("date", "ascending"), ("id", "ascending")])
+    rel = f"month={month}/{name}.parquet"
+    (root / rel).parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, root / rel, compression="zstd")
+    return rel
+
+
+def _compact_month(root: Path, month: str, files: list[str], prefix: str, part_rows: int) -> list[str]:
+    """part_rows 미만인 작은 파일이 ANALYTICS_STORE_COMPACT_FILES개를 넘으면 (date, id) 순으로 다시 묶는다."""
+    small = [f for f in files if pq.ParquetFile(root / f).metadata.num_rows < part_rows]
+    if len(small) <= max(1, ANALYTICS_STORE_COMPACT_FILES):
+        return files
+    table = pa.concat_tables([pq.read_table(root / f) for f in small]).sort_by(
+        [("date", "ascending"), ("id", "ascending")]
+    )
+    merged = []
+    for n, start in enumerate(range(0, table.num_rows, part_rows)):
+        rel = f"month={month}/{prefix}{n:04d}.parquet"
+        pq.write_table(table.slice(start, part_rows), root / rel, compression="zstd")
+        merged.append(rel)
+    return [f for f in files if f not in small] + merged
+
+
+def refresh_store(db_path: str | Path | None = None) -> dict[str, Any]:
+    """스토어를 DB와 맞춘다: 워터마크 이후 신규 기사는 월별 파일로 추가하고, 표시된 월만 다시 쓴다.
+
+    규칙(태그/토큰)이 바뀌었거나 스토어가 없으면 전체를 다시 만든다. 태그 재생성 전이면 건너뛴다.
+    """
+    if pa is None:
+        return {"status": "skipped", "reason": "pyarrow_missing"}
+    path = Path(db_path or storage.get_active_db_path())
+    root = store_dir(path)
+    started = time.perf_counter()
+    with _refresh_lock:
+        conn = connect_dedicated(path, readonly=True)
+        try:
+            # 워터마크, 재작성 표시, 기사 행을 한 읽기 스냅샷에서 읽는다.
+            conn.execute("BEGIN")
+            if not storage.article_tags_ready(conn):
+                return {"status": "skipped", "reason": "article_tags_not_ready"}
+            dirty = {str(r["month"]): int(r["seq"]) for r in conn.execute("SELECT month, seq FROM analytics_dirty_months")}
+            watermark = int(conn.execute("SELECT COALESCE(MAX(id), 0) FROM articles").fetchone()[0])
+            fingerprint = _store_fingerprint()
+            manifest = _load_manifest(root)
+            # 파일 이름은 갱신 회차로 구분해 읽는 쪽이 들고 있는 파일을 덮어쓰지 않는다.
+            generation = int((manifest or {}).get("generation", 0)) + 1
+            full = not manifest or manifest.get("fingerprint") != fingerprint
+            if full:
+                manifest = {"fingerprint": fingerprint, "watermark": 0, "partitions": {}}
+            old_watermark = int(manifest["watermark"])
+            partitions: dict[str, list[str]] = {m: list(files) for m, files in manifest["partitions"].items()}
+
+            if full:
+                where, params = "id <= ?", [watermark]
+            elif dirty:
+                placeholders = ",".join(["?"] * len(dirty))
+                month_sql = storage._ARTICLE_MONTH_SQL.format(date="date")
+                where = f"id <= ? AND (id > ? OR {month_sql} IN ({placeholders}))"
+                params = [watermark, old_watermark, *sorted(dirty)]
+            else:
+                where, params = "id > ? AND id <= ?", [old_watermark, watermark]
+
+            written: dict[str, list[str]] = {}
+            buffers: dict[str, list[dict[str, Any]]] = {}
+            counts = {"rows": 0, "files": 0}
+
+            def flush(month: str) -> None:
+                rows = buffers.pop(month, [])
+                if rows:
+                    name = f"part-{generation:08d}-{counts['files']:05d}"
+                    written.setdefault(month, []).append(_write_part(root, month, name, rows))
+                    counts["files"] += 1
+
+            part_rows = max(1000, ANALYTICS_STORE_PART_ROWS)
+
+            def consume(cur: sqlite3.Cursor) -> None:
+                while True:
+                    rows = cur.fetchmany(5000)
+                    if not rows:
+                        break
+                    for r in rows:
+                        month = str(r["month"])
+                        buffers.setdefault(month, []).append(_record(r))
+                        counts["rows"] += 1
+                        if len(buffers[month]) >= part_rows:
+                            flush(month)
+                    # 월이 섞여 들어와도 버퍼 전체가 파일 1개 분량을 넘지 않게 한다(작은 파일은 아래에서 합친다).
+                    while sum(len(v) for v in buffers.values()) > part_rows:
+                        flush(max(buffers, key=lambda m: len(buffers[m])))
+
+            consume(conn.execute(_ROW_SQL + f" WHERE {where} ORDER BY id", params))
+            # 월 아카이브로 옮겨진 기사는 다시 쓰는 월(전체 재생성이면 모든 월)에만 더한다.
+            for month, archive_path in archive.archive_files(path).items():
+                if full or month in dirty:
+                    archive_conn = archive.open_archive(archive_path)
+                    try:
+                        consume(archive_conn.execute(_ROW_SQL + " ORDER BY id"))
+                    finally:
+                        archive_conn.close()
+            for month in list(buffers):
+                flush(month)
+        finally:
+            conn.close()
+
+        rewritten = set(written) if full else set(dirty)
+        for month in rewritten:
+            partitions.pop(month, None)
+        for month, files in written.items():
+            partitions.setdefault(month, []).extend(files)
+            partitions[month] = _compact_month(root, month, partitions[month], f"part-{generation:08d}-c", part_rows)
+        root.mkdir(parents=True, exist_ok=True)
+        _write_manifest(
+            root,
+            {
+                "fingerprint": fingerprint,
+                "generation": generation,
+                "db_path": str(path),
+                "watermark": watermark,
+                "partitions": dict(sorted(partitions.items())),
+                "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            },
+        )
+        # manifest 교체 후에 표시를 지운다(읽는 쪽은 표시를 먼저, manifest를 나중에 읽는다).
+        if dirty:
+            run_write(
+                path,
+                lambda wconn: wconn.executemany(
+                    "DELETE FROM analytics_dirty_months WHERE month = ? AND seq = ?", list(dirty.items())
+                ),
+                label="analytics_dirty_months",
+            )
+        referenced = {root / f for files in partitions.values() for f in files}
+        stale = [p for p in root.glob("month=*/*.parquet") if p not in referenced]
+        for p in stale:
+            p.unlink(missing_ok=True)
+        _drop_cached_files({str(p) for p in stale} | {str(root / f) for files in written.values() for f in files})
+        removed = len(stale)
+
+    result = {
+        "status": "ok",
+        "full": bool(full),
+        "watermark": watermark,
+        "rows_written": counts["rows"],
+        "files_written": counts["files"],
+        "files_removed": removed,
+        "rewritten_months": len(rewritten),
+        "partitions": len(partitions),
+        "elapsed_ms": int((time.perf_counter() - started) * 1000),
+    }
+    logger.info("analytics store refreshed: %s", result)
+    return result
+
+
+def _on_values(column: Any, fn: Callable[[Any], Any]) -> Any:
+    """사전 인코딩 열이면 조건을 고유값에만 계산하고 행으로 펼친다."""
+    if pa.types.is_dictionary(column.type):
+        return pc.take(fn(column.dictionary), column.indices)
+    return fn(column)
+
+
+def _plain(column: Any) -> Any:
+    return column.dictionary_decode() if pa.types.is_dictionary(column.type) else column
+
+
+def _read_columns(path: str, columns: list[str]) -> dict[str, Any]:
+    """파티션 파일의 열을 읽는다. 파일은 만든 뒤 바뀌지 않으므로 (경로, 열) 단위로 메모리에 캐시한다."""
+    global _column_cache_bytes
+    out: dict[str, Any] = {}
+    with _column_cache_lock:
+        for column in columns:
+            cached = _column_cache.get((path, column))
+            if cached is not None:
+                _column_cache.move_to_end((path, column))
+                out[column] = cached
+    missing = [c for c in columns if c not in out]
+    if not missing:
+        return out
+    table = pq.read_table(path, columns=missing, read_dictionary=[c for c in missing if c in _FILTER_COLUMNS])
+    limit = max(0, ANALYTICS_STORE_CACHE_MB) * 1024 * 1024
+    with _column_cache_lock:
+        for column in missing:
+            out[column] = table[column].combine_chunks()
+            if (path, column) not in _column_cache:
+                _column_cache[(path, column)] = out[column]
+                _column_cache_bytes += out[column].nbytes
+        while _column_cache and _column_cache_bytes > limit:
+            _, evicted = _column_cache.popitem(last=False)
+            _column_cache_bytes -= evicted.nbytes
+    return out
+
+
+def _drop_cached_files(paths: set[str]) -> None:
+    global _column_cache_bytes
+    with _column_cache_lock:
+        for key in [k for k in _column_cache if k[0] in paths]:
+            _column_cache_bytes -= _column_cache.pop(key).nbytes
+
+
+def _delta_rows(
+    conn: sqlite3.Connection,
+    *,
+    company: str,
+    date_from: str,
+    date_to: str,
+    watermark: int,
+    months: list[str],
+    archives: dict[str, sqlite3.Connection] | None = None,
+) -> list[sqlite3.Row]:
+    """스토어에 없는 기사(워터마크 이후 신규분 + 재작성 대기 월)를 SQLite에서 읽는다.
+
+    재작성 대기 월에 아카이브가 있으면 아카이브로 옮겨진 기사도 함께 읽는다.
+    """
+    scope = " AND company = ? AND is_test = 0 AND date BETWEEN ? AND ?"
+    # NOT INDEXED: company/date 색인 대신 rowid 범위(id > 워터마크)로 읽게 한다.
+    rows = conn.execute(
+        _ROW_SQL + " NOT INDEXED WHERE id > ?" + scope, [watermark, company, date_from, date_to]
+    ).fetchall()
+    for month in months:
+        if month == "other":
+            month_sql = f" AND {storage._ARTICLE_MONTH_SQL.format(date='date')} = 'other'"
+            params: list[Any] = []
+        else:
+            # 'YYYY-MM'으로 시작하는 date는 [YYYY-MM, 마지막 글자+1) 범위라 색인 구간으로 읽는다.
+            month_sql = " AND date >= ? AND date < ?"
+            params = [month, month[:-1] + chr(ord(month[-1]) + 1)]
+        rows.extend(
+            conn.execute(
+                _ROW_SQL + " WHERE id <= ?" + scope + month_sql,
+                [watermark, company, date_from, date_to, *params],
+            ).fetchall()
+        )
+        if archives and month in archives:
+            # 아카이브 기사는 운영 DB에 없으므로 워터마크와 무관하게 읽는다.
+            rows.extend(
+                archives[month]
+                .execute(_ROW_SQL + " WHERE 1 = 1" + scope + month_sql, [company, date_from, date_to, *params])
+                .fetchall()
+            )
+    return rows
+
+
+def load_articles(
+    conn: sqlite3.Connection,
+    *,
+    columns: list[str],
+    company: str,
+    date_from: str,
+    date_to: str,
+    ip_name: str,
+    descending: bool = False,
+    archives: dict[str, sqlite3.Connection] | None = None,
+) -> ColumnarArticles | None:
+    """company/is_test=0/date BETWEEN/IP 조건의 기사에서 columns 열만 읽는다(정렬: date, id).
+
+    월 파티션으로 범위 밖 파일을 건너뛰고, 조건 열로 행을 먼저 거른 뒤 나머지 열을 가져온다.
+    워터마크 이후 신규분과 재작성 대기 월은 SQLite에서 읽어 합치므로 결과는 SQLite 경로와 같다.
+    스토어는 월 아카이브 기사도 담고 있으며, 재작성 대기 월의 아카이브 기사는 archives({월: 연결})에서 읽는다.
+    columns에 tokens가 있으면 토큰을 (행 번호, vocab 코드)로 펼쳐 함께 돌려준다.
+    스토어를 쓸 수 없으면(pyarrow 없음, 스토어 없음/규칙 변경, 태그 재생성 전) None.
+    """
+    if not available() or not storage.article_tags_ready(conn):
+        return None
+    # 표시를 먼저, manifest를 나중에 읽어야 갱신 작업과 겹쳐도 낡은 파티션을 쓰지 않는다.
+    try:
+        dirty = {str(r[0]) for r in conn.execute("SELECT month FROM analytics_dirty_months")}
+    except sqlite3.OperationalError:
+        return None
+    root = store_dir()
+    manifest = _load_manifest(root)
+    if not manifest or manifest.get("fingerprint") != _store_fingerprint():
+        return None
+
+    with_tokens = "tokens" in columns
+    frame_columns = [c for c in columns if c != "tokens"]
+    read_columns = list(dict.fromkeys(["date", "id", *columns]))
+    # _build_ip_sql_filter와 같이 키워드 없는 IP는 빈 결과
+    ip_pattern = f"|{ip_name}|" if ip_name != "전체" else ""
+    ip_empty = bool(ip_pattern) and not any(
+        str(k).strip() for k in storage.IP_RULES.get(ip_name, {}).get("keywords", [])
+    )
+
+    def in_range(month: str) -> bool:
+        return month == "other" or date_from[:7] <= month <= date_to[:7]
+
+    def matches(cols: dict[str, Any], month: str = "other") -> Any:
+        mask = pc.and_(_on_values(cols["company"], lambda v: pc.equal(v, company)), pc.equal(cols["is_test"], 0))
+        # 구간 안쪽 월은 날짜 조건을 건너뛴다(양 끝 월과 'other'만 검사).
+        if month == "other" or not date_from[:7] < month < date_to[:7]:
+            mask = pc.and_(
+                mask,
+                _on_values(cols["date"], lambda v: pc.and_(pc.greater_equal(v, date_from), pc.less_equal(v, date_to))),
+            )
+        if ip_pattern:
+            mask = pc.and_(mask, _on_values(cols["ip_tags"], lambda v: pc.match_substring(v, ip_pattern)))
+        return pc.fill_null(mask, False)
+
+    parts = []
+    try:
+        for month, month_files in manifest["partitions"].items():
+            if month in dirty or not in_range(month) or ip_empty:
+                continue
+            for f in month_files:
+                path = str(root / f)
+                mask = matches(_read_columns(path, _FILTER_COLUMNS), month)
+                if mask.true_count:
+                    cols = _read_columns(path, read_columns)
+                    parts.append(pa.table({c: _plain(cols[c].filter(mask)) for c in read_columns}))
+    except (OSError, pa.ArrowInvalid) as exc:
+        # 갱신 작업이 파일을 교체하는 중이면 이번 호출만 SQLite 경로로 처리한다.
+        logger.warning("analytics store read failed: %s", exc)
+        return None
+
+    delta_rows = (
+        []
+        if ip_empty
+        else _delta_rows(
+            conn,
+            company=company,
+            date_from=date_from,
+            date_to=date_to,
+            watermark=int(manifest["watermark"]),
+            months=sorted(m for m in dirty if in_range(m)),
+            archives=archives,
+        )
+    )
+    if delta_rows:
+        delta = pa.Table.from_pylist([_record(r, with_tokens) for r in delta_rows], schema=SCHEMA)
+        parts.append(delta.filter(matches({c: delta[c] for c in _FILTER_COLUMNS})).select(read_columns))
+    table = pa.concat_tables(parts) if parts else SCHEMA.empty_table().select(read_columns)
+    order = "descending" if descending else "ascending"
+    table = table.sort_by([("date", order), ("id", order)])
+
+    out = ColumnarArticles(frame=table.select(frame_columns).to_pandas())
+    if with_tokens:
+        tokens = table["tokens"].combine_chunks()
+        encoded = pc.dictionary_encode(pc.list_flatten(tokens))
+        out.token_rows = pc.list_parent_indices(tokens).to_numpy()
+        out.token_codes = encoded.indices.to_numpy()
+        out.vocab = encoded.dictionary.to_pylist()
+    return out
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from backend import storage
+from backend.db import connect, connect_dedicated
+
+logger = logging.getLogger("backend.archive")
+
+# 보존 기간이 지난 live 기사를 월별 아카이브 DB(articles-YYYY-MM.db)로 옮긴다.
+# 운영 DB(hot)는 보존 기간만 유지하고, 장기 구간 조회는 구간이 걸친 월 아카이브만 함께 읽는다.
+ARTICLE_ARCHIVE_ENABLED = os.getenv("ARTICLE_ARCHIVE_ENABLED", "1").strip() != "0"
+ARTICLE_ARCHIVE_DIR = os.getenv("ARTICLE_ARCHIVE_DIR", "").strip()
+# ATTACH 상한(SQLITE_LIMIT_ATTACHED 기본 10) 안에서 한 번에 붙이는 아카이브 수
+ARCHIVE_ATTACH_BATCH = 8
+# 아카이브에 옮기는 표(스키마는 운영 DB 정의를 그대로 복사, 트리거/FTS/LSH 색인은 제외)
+ARCHIVE_TABLES = (
+    "articles",
+    "article_tags",
+    "source_groups",
+    "sentiment_results",
+    "storage_meta",
+    "article_daily_rollup",
+    "article_daily_rollup_groups",
+    "article_daily_rollup_dirty",
+)
+_FILE_RE = re.compile(r"^articles-(\d{4}-\d{2}|other)\.db$")
+
+_archive_lock = Lock()
+
+
+def archive_dir(db_path: str | Path | None = None) -> Path:
+    path = Path(db_path or storage.get_active_db_path())
+    base = Path(ARTICLE_ARCHIVE_DIR) if ARTICLE_ARCHIVE_DIR else path.parent / "archive"
+    if not base.is_absolute():
+        base = storage.ROOT_DIR / base
+    return base / path.stem
+
+
+def archive_files(db_path: str | Path | None = None) -> dict[str, Path]:
+    """{월: 아카이브 파일} (월 순)."""
+    root = archive_dir(db_path)
+    if not root.is_dir():
+        return {}
+    out = {}
+    for p in root.iterdir():
+        m = _FILE_RE.match(p.name)
+        if m:
+            out[m.group(1)] = p
+    return dict(sorted(out.items()))
+
+
+def _create_schema(path: Path, hot_path: Path) -> None:
+    """운영 DB의 표/색인 정의로 아카이브 파일을 만든다(없는 표만)."""
+    src = connect_dedicated(hot_path, readonly=True)
+    try:
+        placeholders = ",".join(["?"] * len(ARCHIVE_TABLES))
+        ddl = src.execute(
+            f"""
+            SELECT type, name, sql FROM sqlite_master
+            WHERE tbl_name IN ({placeholders}) AND type IN ('table', 'index') AND sql IS NOT NULL
+            ORDER BY type = 'index', rowid
+            """,
+            ARCHIVE_TABLES,
+        ).fetchall()
+    finally:
+        src.close()
+    conn = connect_dedicated(path)
+    try:
+        existing = {str(r[0]) for r in conn.execute("SELECT name FROM sqlite_master")}
+        for r in ddl:
+            if str(r["name"]) not in existing:
+                conn.execute(str(r["sql"]))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _common_columns(conn: sqlite3.Connection, schema: str, table: str) -> str:
+    """운영 DB와 아카이브 양쪽에 있는 열(이후 마이그레이션으로 열이 늘어도 복사가 깨지지 않게)."""
+    hot = [str(r["name"]) for r in conn.execute(f"PRAGMA main.table_info({table})")]
+    cold = {str(r["name"]) for r in conn.execute(f"PRAGMA {schema}.table_info({table})")}
+    return ", ".join(c for c in hot if c in cold)
+
+
+def _copy_month(conn: sqlite3.Connection, schema: str, ids: list[int]) -> None:
+    """ids 기사와 태그/감성/그룹을 아카이브로 복사한다. 같은 기사를 다시 복사해도 결과가 같다."""
+    payload = json.dumps(ids)
+    in_ids = "IN (SELECT value FROM json_each(?))"
+    cols = _common_columns(conn, schema, "articles")
+    conn.execute(
+        f"INSERT OR REPLACE INTO {schema}.articles ({cols}) SELECT {cols} FROM main.articles WHERE id {in_ids}",
+        (payload,),
+    )
+    cols = _common_columns(conn, schema, "article_tags")
+    conn.execute(f"DELETE FROM {schema}.article_tags WHERE article_id {in_ids}", (payload,))
+    conn.execute(
+        f"INSERT INTO {schema}.article_tags ({cols}) SELECT {cols} FROM main.article_tags WHERE article_id {in_ids}",
+        (payload,),
+    )
+    cols = _common_columns(conn, schema, "sentiment_results")
+    conn.execute(
+        f"""
+        INSERT OR REPLACE INTO {schema}.sentiment_results ({cols})
+        SELECT {cols} FROM main.sentiment_results WHERE article_id {in_ids}
+        """,
+        (payload,),
+    )
+    group_ids = [
+        str(r[0])
+        for r in conn.execute(
+            f"""
+            SELECT DISTINCT source_group_id FROM main.articles
+            WHERE id {in_ids} AND COALESCE(source_group_id, '') != ''
+            """,
+            (payload,),
+        )
+    ]
+    if group_ids:
+        groups = json.dumps(group_ids, ensure_ascii=False)
+        cols = _common_columns(conn, schema, "source_groups")
+        conn.execute(
+            f"""
+            INSERT OR IGNORE INTO {schema}.source_groups ({cols})
+            SELECT {cols} FROM main.source_groups WHERE group_id IN (SELECT value FROM json_each(?))
+            """,
+            (groups,),
+        )
+        # 아카이브 쪽 repost_count는 아카이브에 있는 기사 수다(운영 DB 쪽은 삭제 후 남은 기사 수).
+        conn.execute(
+            f"""
+            UPDATE {schema}.source_groups
+            SET repost_count = (
+                SELECT COUNT(1) FROM {schema}.articles a WHERE a.source_group_id = source_groups.group_id
+            )
+            WHERE group_id IN (SELECT value FROM json_each(?))
+            """,
+            (groups,),
+        )
+    # 롤업은 복사 후 아카이브 연결에서 다시 만든다. 그 전에 중단되면 읽을 때 다시 만든다.
+    conn.execute(f"DELETE FROM {schema}.storage_meta WHERE key = 'article_daily_rollup_fingerprint'")
+
+
+def _archive_ready(conn: sqlite3.Connection) -> bool:
+    return storage.article_tags_ready(conn) and storage.daily_rollup_ready(conn)
+
+
+def _refresh_archive(path: Path) -> None:
+    """아카이브의 태그(규칙 변경 시)와 일별 롤업을 현재 규칙으로 다시 만든다."""
+    conn = connect_dedicated(path)
+    try:
+        if not storage.article_tags_ready(conn):
+            storage._rewrite_article_tags(conn)
+        storage._rebuild_daily_rollup(conn)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def archive_articles(ids: list[int], db_path: str | Path | None = None) -> dict[str, int]:
+    """운영 DB 기사 ids를 월별 아카이브로 복사한다({월: 기사 수}). 운영 DB에서 지우는 것은 호출자 몫이다.
+
+    복사를 먼저 커밋하고 운영 DB 삭제는 그 뒤라, 중간에 중단되면 잠시 양쪽에 같은 기사가 있다가
+    다음 정리 때 같은 기사를 다시 복사(덮어쓰기)하고 지우면서 맞춰진다.
+    """
+    hot_path = Path(db_path or storage.get_active_db_path())
+    if not ids:
+        return {}
+    started = time.perf_counter()
+    root = archive_dir(hot_path)
+    with _archive_lock:
+        conn = connect_dedicated(hot_path, readonly=True)
+        try:
+            by_month: dict[str, list[int]] = {}
+            month_sql = storage._ARTICLE_MONTH_SQL.format(date="date")
+            for i in range(0, len(ids), 10000):
+                chunk = json.dumps([int(x) for x in ids[i : i + 10000]])
+                for r in conn.execute(
+                    f"SELECT id, {month_sql} AS month FROM articles WHERE id IN (SELECT value FROM json_each(?))",
+                    (chunk,),
+                ):
+                    by_month.setdefault(str(r["month"]), []).append(int(r["id"]))
+        finally:
+            conn.close()
+        if not by_month:
+            return {}
+
+        root.mkdir(parents=True, exist_ok=True)
+        months = sorted(by_month)
+        paths = {m: root / f"articles-{m}.db" for m in months}
+        for m in months:
+            _create_schema(paths[m], hot_path)
+
+        # 복사는 운영 DB 연결에 아카이브를 붙여(ATTACH) INSERT ... SELECT로 한다.
+        # 그룹의 대표 기사가 운영 DB에 남을 수 있어 외래 키 검사는 끈다(아카이브는 조회 전용 사본).
+        conn = connect_dedicated(hot_path)
+        try:
+            conn.execute("PRAGMA foreign_keys = OFF")
+            for i in range(0, len(months), ARCHIVE_ATTACH_BATCH):
+                batch = months[i : i + ARCHIVE_ATTACH_BATCH]
+                schemas = {m: f"arc{n}" for n, m in enumerate(batch)}
+                for m, schema in schemas.items():
+                    conn.execute("ATTACH DATABASE ? AS " + schema, (str(paths[m]),))
+                try:
+                    conn.execute("BEGIN")
+                    for m, schema in schemas.items():
+                        _copy_month(conn, schema, by_month[m])
+                    conn.commit()
+                finally:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    for schema in schemas.values():
+                        conn.execute(f"DETACH DATABASE {schema}")
+        finally:
+            conn.close()
+
+        for m in months:
+            _refresh_archive(paths[m])
+
+    result = {m: len(v) for m, v in by_month.items()}
+    logger.info(
+        "articles archived: rows=%s months=%s elapsed_ms=%s",
+        sum(result.values()),
+        len(result),
+        int((time.perf_counter() - started) * 1000),
+    )
+    return result
+
+
+def archive_files_in_range(date_from: str, date_to: str, db_path: str | Path | None = None) -> dict[str, Path]:
+    """조회 구간이 걸친 월 아카이브 파일({월: 경로}, 월 순).
+
+    형식이 다른 date('other')는 구간 판정이 안 되므로 항상 포함한다.
+    """
+    return {
+        month: path
+        for month, path in archive_files(db_path).items()
+        if month == "other" or date_from[:7] <= month <= date_to[:7]
+    }
+
+
+def open_archives(date_from: str, date_to: str, db_path: str | Path | None = None) -> dict[str, sqlite3.Connection]:
+    """조회 구간이 걸친 월 아카이브를 읽기 전용으로 연다({월: 연결}, 반납은 호출자가 close())."""
+    return {month: open_archive(path) for month, path in archive_files_in_range(date_from, date_to, db_path).items()}
+
+
+def open_archive(path: Path) -> sqlite3.Connection:
+    """아카이브 1개의 읽기 전용 연결. 태그/롤업이 현재 규칙과 다르면 먼저 다시 만든다."""
+    conn = connect(path, readonly=True)
+    if not _archive_ready(conn):
+        conn.close()
+        with _archive_lock:
+            _refresh_archive(path)
+        conn = connect(path, readonly=True)
+    return conn
+
+
+def archive_stats(db_path: str | Path | None = None) -> dict[str, Any]:
+    files = archive_files(db_path)
+    return {
+        "enabled": ARTICLE_ARCHIVE_ENABLED,
+        "dir": str(archive_dir(db_path)),
+        "months": len(files),
+        "bytes": sum(p.stat().st_size for p in files.values()),
+    }
@@ -10,13 +10,18 @@ from typing import Any
 
 import pandas as pd
 
+from backend.db import connect as db_connect
 from backend.storage import (
+    ARTICLE_TAG_COLUMNS_SQL,
     IP_RULES,
     OUTLET_GAME_MEDIA,
     OUTLET_TIER1,
     RISK_FORMULA_VERSION,
     THEME_WEIGHTS_HEAT,
     THEME_WEIGHTS_RISK,
+    article_tags_ready,
+    latest_group_sentiments,
+    row_article_tags,
 )
 from utils.sentiment import analyze_sentiment_rule_v1
 
@@ -40,12 +45,7 @@ def get_backtest_db_path() -> str:
 
 
 def _connect() -> sqlite3.Connection:
-    db_path = get_backtest_db_path()
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    return conn
+    return db_connect(get_backtest_db_path())
 
 
 def _resolve_ip_name(ip: str) -> str:
@@ -56,16 +56,6 @@ def _resolve_ip_name(ip: str) -> str:
     return ""
 
 
-def _detect_ip(text: str) -> str:
-    low = (text or "").lower()
-    for name, meta in IP_RULES.items():
-        if meta["slug"] == "all":
-            continue
-        if any(k.lower() in low for k in meta["keywords"]):
-            return name
-    return "기타"
-
-
 def _parse_article_dt(pub_date: str, date_only: str) -> datetime | None:
     dt = pd.to_datetime(pub_date or "", errors="coerce")
     if pd.isna(dt):
@@ -97,14 +87,6 @@ def _outlet_weight(outlet: str) -> float:
     return 0.4
 
 
-RISK_THEME_RULES: dict[str, list[str]] = {
-    "확률형/BM": ["확률", "확률형", "가챠", "과금", "bm", "뽑기"],
-    "운영/장애": ["점검", "장애", "오류", "버그", "접속", "서버", "롤백"],
-    "보상/환불": ["보상", "환불", "배상", "보상안", "환급"],
-    "규제/법적": ["공정위", "소송", "제재", "법원", "과징금", "규제"],
-    "여론/논란": ["논란", "비판", "불만", "시위", "잡음"],
-    "신작/성과": ["신작", "출시", "흥행", "매출", "사전예약", "수상"],
-}
 LIVE_RISK_WEIGHTS: dict[str, float] = {"S": 0.50, "V": 0.25, "T": 0.15, "M": 0.10}
 
 
@@ -115,6 +97,7 @@ class Mention:
     text: str
     outlet: str
     group_id: str
+    theme: str | None = None
 
 
 def _normalize_weights(weights: dict[str, float] | None) -> dict[str, float]:
@@ -144,21 +127,7 @@ def _ensure_group_sentiments(conn: sqlite3.Connection, mentions: list[Mention])
     if not group_to_mention:
         return sentiment_by_group
 
-    group_ids = sorted(group_to_mention.keys())
-    placeholders = ",".join(["?"] * len(group_ids))
-    rows = conn.execute(
-        f"""
-        SELECT source_group_id, sentiment_score, sentiment_label, confidence, analyzed_at
-        FROM sentiment_results
-        WHERE source_group_id IN ({placeholders})
-        ORDER BY analyzed_at DESC, id DESC
-        """,
-        group_ids,
-    ).fetchall()
-    for r in rows:
-        gid = str(r["source_group_id"] or "")
-        if gid in sentiment_by_group:
-            continue
+    for gid, r in latest_group_sentiments(conn, sorted(group_to_mention.keys())).items():
         sentiment_by_group[gid] = {
             "score": float(r["sentiment_score"] or 0.0),
             "label": str(r["sentiment_label"] or "uncertain"),
@@ -319,6 +288,9 @@ def run_backtest(
 
     conn = _connect()
     try:
+        # 백테스트 DB가 현재 규칙으로 태깅되어 있으면 대표 IP/테마를 태그에서 읽고,
+        # 아니면 본문에서 직접 판정한다(결과 동일, 태그 쪽이 빠름).
+        tags_ready = article_tags_ready(conn)
         rows = conn.execute(
             """
             SELECT id, title_clean, description_clean,
@@ -326,6 +298,9 @@ def run_backtest(
                    COALESCE(pub_date, '') AS pub_date,
                    COALESCE(date, '') AS date,
                    COALESCE(source_group_id, '') AS source_group_id
+            """
+            + (", " + ARTICLE_TAG_COLUMNS_SQL if tags_ready else "")
+            + """
             FROM articles
             WHERE company = ? AND date BETWEEN ? AND ? AND is_test = 0
             ORDER BY COALESCE(pub_date, date, created_at) ASC, id ASC
@@ -336,7 +311,8 @@ def run_backtest(
         scoped: list[Mention] = []
         for r in rows:
             text = f"{r['title_clean'] or ''} {r['description_clean'] or ''}"
-            if ip_resolved != "전체" and _detect_ip(text) != ip_resolved:
+            primary_ip, themes = row_article_tags(r, tags_ready)
+            if ip_resolved != "전체" and primary_ip != ip_resolved:
                 continue
             dt = _parse_article_dt(str(r["pub_date"] or ""), str(r["date"] or ""))
             if not dt:
@@ -349,6 +325,7 @@ def run_backtest(
                     text=text.lower(),
                     outlet=str(r["outlet"] or "unknown"),
                     group_id=gid,
+                    theme=themes[0] if themes else None,
                 )
             )
 
@@ -417,12 +394,10 @@ def run_backtest(
         theme_counter_heat: Counter[str] = Counter()
         theme_counter_risk: Counter[str] = Counter()
         for m in group_mentions:
-            for theme, keywords in RISK_THEME_RULES.items():
-                if any(k.lower() in m.text for k in keywords):
-                    theme_counter_heat[theme] += 1
-                    if theme in THEME_WEIGHTS_RISK:
-                        theme_counter_risk[theme] += 1
-                    break
+            if m.theme:
+                theme_counter_heat[m.theme] += 1
+                if m.theme in THEME_WEIGHTS_RISK:
+                    theme_counter_risk[m.theme] += 1
         T_heat = 0.0
         T_risk = 0.0
         if group_mentions:
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import weakref
+from pathlib import Path
+
+logger = logging.getLogger("backend.db")
+
+# 연결 공통 PRAGMA. WAL에서는 쓰기 트랜잭션이 읽기를 막지 않고, 긴 읽기도 커밋을 막지 않는다.
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL").strip().upper() or "WAL"
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_MMAP_SIZE_MB = int(os.getenv("SQLITE_MMAP_SIZE_MB", "256"))
+
+_local = threading.local()
+_connections: weakref.WeakSet[PooledConnection] = weakref.WeakSet()
+_connections_lock = threading.Lock()
+
+
+class PooledConnection(sqlite3.Connection):
+    """스레드별로 재사용하는 연결. close()는 실제로 닫지 않고 스레드 슬롯에 반납한다.
+
+    같은 스레드의 중첩 사용은 참조 수로 관리하며, 마지막 사용자가 반납할 때 커밋하지 않은
+    변경은 기존 연결 종료와 같이 롤백한다.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.users = 0
+        self.file_id: tuple[int, int] | None = None
+        self.pid = os.getpid()
+        self.closed = False
+
+    def close(self) -> None:
+        self.users = max(0, self.users - 1)
+        if self.users == 0 and self.in_transaction:
+            self.rollback()
+
+    def close_physical(self) -> None:
+        self.closed = True
+        super().close()
+
+
+def _file_id(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _open(path: Path, readonly: bool, factory: type[sqlite3.Connection] = PooledConnection) -> sqlite3.Connection:
+    if readonly:
+        conn = sqlite3.connect(
+            f"{path.resolve().as_uri()}?mode=ro", uri=True, factory=factory, check_same_thread=False
+        )
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(path, factory=factory, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA busy_timeout = {max(0, SQLITE_BUSY_TIMEOUT_MS)}")
+    if not readonly:
+        mode = str(conn.execute(f"PRAGMA journal_mode = {SQLITE_JOURNAL_MODE}").fetchone()[0]).upper()
+        if mode != SQLITE_JOURNAL_MODE:
+            logger.warning("sqlite journal_mode=%s requested but got %s: %s", SQLITE_JOURNAL_MODE, mode, path)
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute(f"PRAGMA cache_size = -{max(0, SQLITE_CACHE_SIZE_KB)}")
+    conn.execute(f"PRAGMA mmap_size = {max(0, SQLITE_MMAP_SIZE_MB) * 1024 * 1024}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA foreign_keys = ON")
+    if isinstance(conn, PooledConnection):
+        conn.file_id = _file_id(path)
+        with _connections_lock:
+            _connections.add(conn)
+    return conn
+
+
+def connect(db_path: str | Path, *, readonly: bool = False) -> sqlite3.Connection:
+    """현재 스레드의 (DB 파일, 읽기 전용 여부)별 연결을 빌려준다. 사용 후 close()로 반납한다.
+
+    readonly=True는 조회 경로용(mode=ro)이며 DB 파일이 아직 없으면 일반 연결을 준다.
+    파일이 교체/삭제됐거나 fork 이후면 새로 연다.
+    """
+    path = Path(db_path)
+    file_id = _file_id(path)
+    if file_id is None:
+        readonly = False
+    slots: dict[tuple[str, bool], PooledConnection] = getattr(_local, "slots", None) or {}
+    _local.slots = slots
+    key = (str(path), readonly)
+    conn = slots.get(key)
+    if conn is not None and (
+        conn.closed or conn.pid != os.getpid() or (conn.users == 0 and conn.file_id != file_id)
+    ):
+        if conn.pid == os.getpid() and not conn.closed:
+            conn.close_physical()
+        conn = None
+    if conn is None:
+        conn = slots[key] = _open(path, readonly)
+    conn.users += 1
+    return conn
+
+
+def connect_dedicated(db_path: str | Path, *, readonly: bool = False) -> sqlite3.Connection:
+    """스레드 슬롯에 묶이지 않은 독립 연결(PRAGMA 동일). close()가 실제로 닫는다.
+
+    스트리밍 응답처럼 한 커서를 여러 스레드에 걸쳐 오래 읽는 경우에 쓴다.
+    """
+    path = Path(db_path)
+    return _open(path, readonly and _file_id(path) is not None, factory=sqlite3.Connection)
+
+
+def close_all_connections() -> None:
+    """모든 스레드의 연결을 실제로 닫는다(종료 시점 전용)."""
+    with _connections_lock:
+        conns = list(_connections)
+        _connections.clear()
+    for conn in conns:
+        if conn.pid != os.getpid():
+            continue
+        try:
+            conn.close_physical()
+        except sqlite3.Error:
+            logger.exception("sqlite connection close failed")
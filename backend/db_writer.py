@@ -0,0 +1,334 @@
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from backend.db import connect
+
+logger = logging.getLogger("backend.db_writer")
+
+DB_WRITER_QUEUE_MAX = int(os.getenv("DB_WRITER_QUEUE_MAX", "1000"))
+DB_WRITER_BATCH_MAX = int(os.getenv("DB_WRITER_BATCH_MAX", "64"))
+DB_WRITER_BATCH_WINDOW_MS = int(os.getenv("DB_WRITER_BATCH_WINDOW_MS", "50"))
+DB_WRITER_SUBMIT_TIMEOUT_SECONDS = float(os.getenv("DB_WRITER_SUBMIT_TIMEOUT_SECONDS", "30"))
+
+
+class WriterClosed(RuntimeError):
+    """쓰기 스레드가 멈췄거나 멈추는 중이라 큐에 넣을 수 없음."""
+
+
+@dataclass
+class WriteJob:
+    db_path: str
+    fn: Callable[[sqlite3.Connection], Any] | None
+    future: Future | None
+    label: str
+
+
+class DbWriter:
+    """스케줄러 쪽 SQLite 쓰기를 전담하는 단일 쓰기 스레드.
+
+    submit()으로 받은 쓰기 함수(fn(conn))를 제한 크기 큐에 쌓고, batch_window_ms 동안 또는
+    batch_max건까지 모아 한 트랜잭션으로 커밋한다(그룹 커밋). 작업마다 SAVEPOINT를 두어
+    한 작업의 실패가 같은 묶음의 다른 작업을 되돌리지 않는다. fn 안에서는 commit()하지 않는다.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_max: int = DB_WRITER_QUEUE_MAX,
+        batch_max: int = DB_WRITER_BATCH_MAX,
+        batch_window_ms: int = DB_WRITER_BATCH_WINDOW_MS,
+    ) -> None:
+        self.queue_max = max(1, int(queue_max))
+        self.batch_max = max(1, int(batch_max))
+        self.batch_window = max(0, int(batch_window_ms)) / 1000.0
+        self._queue: queue.Queue[WriteJob | None] = queue.Queue(maxsize=self.queue_max)
+        self._thread: threading.Thread | None = None
+        self._closing = False
+        self._state_lock = threading.Lock()
+        # 큐에 넣는 중인 생산자 수. put()은 잠금 밖에서 하고 stop()은 이 값이 0이 된 뒤 종료 표시를 넣는다.
+        self._inflight = 0
+        self._drained = threading.Condition(self._state_lock)
+        self._metrics_lock = threading.Lock()
+        self._metrics: dict[str, float] = {
+            "batches": 0,
+            "jobs": 0,
+            "failed_jobs": 0,
+            "rejected_jobs": 0,
+            "max_queue_depth": 0,
+            "last_batch_size": 0,
+            "max_batch_size": 0,
+            "last_commit_ms": 0.0,
+            "max_commit_ms": 0.0,
+            "total_commit_ms": 0.0,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and not self._closing
+
+    def start(self) -> None:
+        with self._state_lock:
+            if self.running:
+                return
+            self._closing = False
+            self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+            self._thread.start()
+        logger.info(
+            "db writer started: queue_max=%s batch_max=%s batch_window_ms=%s",
+            self.queue_max,
+            self.batch_max,
+            int(self.batch_window * 1000),
+        )
+
+    def stop(self, timeout: float = 10.0) -> bool:
+        """큐에 남은 쓰기를 모두 커밋한 뒤 스레드를 멈춘다(종료 시 내구성 보장)."""
+        deadline = time.monotonic() + max(0.0, float(timeout))
+        with self._state_lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                self._thread = None
+                return True
+            self._closing = True
+            # 종료 표시 전에 받은 작업이 모두 큐에 들어간 뒤에 종료 표시를 넣는다.
+            drained = self._drained.wait_for(
+                lambda: self._inflight == 0, timeout=max(0.0, deadline - time.monotonic())
+            )
+        if not drained:
+            logger.warning("db writer stop timed out: producers=%s", self._inflight)
+            return False
+        try:
+            self._queue.put(None, timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Full:
+            logger.warning("db writer stop timed out: queue_depth=%s", self._queue.qsize())
+            return False
+        thread.join(max(0.0, deadline - time.monotonic()))
+        stopped = not thread.is_alive()
+        if stopped:
+            with self._state_lock:
+                self._thread = None
+            logger.info("db writer stopped: %s", self.metrics())
+        else:
+            logger.warning("db writer stop timed out: queue_depth=%s", self._queue.qsize())
+        return stopped
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """지금까지 넣은 쓰기가 모두 커밋될 때까지 대기."""
+        barrier = WriteJob(db_path="", fn=None, future=Future(), label="flush")
+        if not self._enter():
+            return True
+        try:
+            self._queue.put(barrier, timeout=timeout)
+        except queue.Full:
+            return False
+        finally:
+            self._leave()
+        try:
+            barrier.future.result(timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    def submit(
+        self,
+        db_path: str | Path,
+        fn: Callable[[sqlite3.Connection], Any],
+        *,
+        wait: bool = True,
+        label: str = "write",
+    ) -> Any:
+        """쓰기 함수를 큐에 넣는다. wait=True면 커밋 후 fn 반환값(또는 예외)을 돌려준다.
+
+        큐가 DB_WRITER_SUBMIT_TIMEOUT_SECONDS 동안 가득 차 있으면 queue.Full,
+        쓰기 스레드가 멈추는 중이면 WriterClosed를 던진다.
+        """
+        job = WriteJob(db_path=str(db_path), fn=fn, future=Future() if wait else None, label=label)
+        # stop()의 종료 표시보다 앞에 들어간 작업만 받는다(종료 후 유실 방지).
+        if not self._enter():
+            raise WriterClosed("db writer is not running")
+        try:
+            self._queue.put(job, timeout=DB_WRITER_SUBMIT_TIMEOUT_SECONDS)
+        except queue.Full:
+            with self._metrics_lock:
+                self._metrics["rejected_jobs"] += 1
+            raise
+        finally:
+            self._leave()
+        depth = self._queue.qsize()
+        with self._metrics_lock:
+            self._metrics["max_queue_depth"] = max(self._metrics["max_queue_depth"], depth)
+        if job.future is None:
+            return None
+        return job.future.result()
+
+    def _enter(self) -> bool:
+        """종료 중이 아니면 생산자로 등록한다. 잠금은 확인/등록에만 잡고 put() 동안에는 잡지 않는다."""
+        with self._state_lock:
+            if not self.running:
+                return False
+            self._inflight += 1
+            return True
+
+    def _leave(self) -> None:
+        with self._state_lock:
+            self._inflight -= 1
+            if self._inflight == 0:
+                self._drained.notify_all()
+
+    def is_writer_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def metrics(self) -> dict[str, Any]:
+        with self._metrics_lock:
+            m = dict(self._metrics)
+        batches = int(m["batches"])
+        return {
+            "running": self.running,
+            "queue_depth": int(self._queue.qsize()),
+            "queue_max": self.queue_max,
+            "max_queue_depth": int(m["max_queue_depth"]),
+            "batch_max": self.batch_max,
+            "batch_window_ms": int(self.batch_window * 1000),
+            "batches": batches,
+            "jobs": int(m["jobs"]),
+            "failed_jobs": int(m["failed_jobs"]),
+            "rejected_jobs": int(m["rejected_jobs"]),
+            "last_batch_size": int(m["last_batch_size"]),
+            "max_batch_size": int(m["max_batch_size"]),
+            "avg_batch_size": round(float(m["jobs"]) / batches, 2) if batches else 0.0,
+            "last_commit_ms": round(float(m["last_commit_ms"]), 2),
+            "max_commit_ms": round(float(m["max_commit_ms"]), 2),
+            "avg_commit_ms": round(float(m["total_commit_ms"]) / batches, 2) if batches else 0.0,
+        }
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.batch_max:
+                remaining = deadline - time.monotonic()
+                try:
+                    job = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    stopping = True
+                    break
+                batch.append(job)
+            self._process(batch)
+
+    def _process(self, batch: list[WriteJob]) -> None:
+        # DB 파일이 바뀐 경우(테스트 등)를 위해 같은 경로끼리 순서대로 나눠 커밋한다.
+        run: list[WriteJob] = []
+        for job in batch:
+            if job.fn is None:
+                self._commit(run)
+                run = []
+                job.future.set_result(None)
+                continue
+            if run and run[0].db_path != job.db_path:
+                self._commit(run)
+                run = []
+            run.append(job)
+        self._commit(run)
+
+    def _commit(self, jobs: list[WriteJob]) -> None:
+        if not jobs:
+            return
+        outcomes: list[tuple[WriteJob, Any, BaseException | None]] = []
+        conn = connect(jobs[0].db_path)
+        try:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                for job in jobs:
+                    conn.execute("SAVEPOINT db_writer_job")
+                    try:
+                        result = job.fn(conn)
+                        conn.execute("RELEASE db_writer_job")
+                        outcomes.append((job, result, None))
+                    except Exception as exc:  # noqa: BLE001
+                        conn.execute("ROLLBACK TO db_writer_job")
+                        conn.execute("RELEASE db_writer_job")
+                        outcomes.append((job, None, exc))
+                started = time.perf_counter()
+                conn.commit()
+                commit_ms = (time.perf_counter() - started) * 1000
+            except Exception as exc:  # noqa: BLE001
+                if conn.in_transaction:
+                    conn.rollback()
+                logger.exception("db writer batch failed: size=%s", len(jobs))
+                outcomes = [(job, None, exc) for job in jobs]
+                commit_ms = 0.0
+        finally:
+            conn.close()
+
+        failed = 0
+        for job, result, exc in outcomes:
+            if exc is not None:
+                failed += 1
+                if job.future is None:
+                    logger.warning("db writer job failed: label=%s error=%s", job.label, exc)
+            if job.future is not None:
+                if exc is not None:
+                    job.future.set_exception(exc)
+                else:
+                    job.future.set_result(result)
+        with self._metrics_lock:
+            m = self._metrics
+            m["batches"] += 1
+            m["jobs"] += len(jobs)
+            m["failed_jobs"] += failed
+            m["last_batch_size"] = len(jobs)
+            m["max_batch_size"] = max(m["max_batch_size"], len(jobs))
+            m["last_commit_ms"] = commit_ms
+            m["max_commit_ms"] = max(m["max_commit_ms"], commit_ms)
+            m["total_commit_ms"] += commit_ms
+
+
+db_writer = DbWriter()
+
+
+def run_write(
+    db_path: str | Path,
+    fn: Callable[[sqlite3.Connection], Any],
+    *,
+    wait: bool = True,
+    label: str = "write",
+) -> Any:
+    """쓰기 스레드가 떠 있으면 큐로 보내고, 아니면(스크립트/테스트) 현재 스레드에서 바로 커밋한다."""
+    if db_writer.running and not db_writer.is_writer_thread():
+        try:
+            return db_writer.submit(db_path, fn, wait=wait, label=label)
+        except WriterClosed:
+            pass
+    conn = connect(db_path)
+    if conn.in_transaction:
+        # 쓰기 스레드 안이거나 호출자가 연 트랜잭션 안의 중첩 쓰기는 그 트랜잭션에 합류한다.
+        try:
+            return fn(conn)
+        finally:
+            conn.close()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        result = fn(conn)
+        conn.commit()
+        return result
+    except Exception:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    finally:
+        conn.close()
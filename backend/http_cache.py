@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from datetime import datetime
+from typing import Any, Callable, Hashable, Iterable
+
+from backend import storage
+
+# 대시보드 GET 응답의 조건부 요청(ETag / If-None-Match → 304).
+# 데이터 조회 API는 저장 함수를 실행하기 전에 (DB 쓰기 버전, 정규화한 쿼리)로 ETag를 만들고,
+# 클라이언트가 같은 값을 보내면 본문 계산 없이 304를 돌려준다.
+HTTP_ETAG_ENABLED = os.getenv("HTTP_ETAG_ENABLED", "1").strip() != "0"
+
+# 프로세스마다 다른 값. 배포(재기동)로 응답 형식이 바뀌어도 이전 ETag로 304가 나가지 않게 한다.
+_BOOT_ID = format(time.time_ns(), "x")
+# 저장 함수가 strip().lower()로 받는 쿼리 값
+_CASE_INSENSITIVE_PARAMS = {"ip"}
+
+
+def _today() -> str:
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _int_param(query: dict[str, str], key: str, default: int) -> int | None:
+    try:
+        return int(query.get(key) or default)
+    except ValueError:
+        return None
+
+
+def _articles_version(query: dict[str, str]) -> Hashable | None:
+    # date_from/date_to 생략 시 기본 구간이 오늘 기준이라 날짜가 바뀌면 다른 ETag가 되게 한다.
+    version = storage.current_data_version()
+    return None if version is None else (version, _today())
+
+
+def _risk_timeseries_version(query: dict[str, str]) -> Hashable | None:
+    hours = _int_param(query, "hours", 24 * 7)
+    if hours is None:
+        return None
+    return storage.risk_timeseries_version(query.get("ip") or "all", hours)
+
+
+# 본문 계산 전에 ETag를 만드는 경로: {경로: 쿼리 → 버전(None이면 ETag 없이 처리)}
+VERSIONED_ROUTES: dict[str, Callable[[dict[str, str]], Hashable | None]] = {
+    "/api/risk-dashboard": _articles_version,
+    "/api/ip-clusters": _articles_version,
+    "/api/risk-timeseries": _risk_timeseries_version,
+}
+# 스케줄러/쓰기 스레드 상태처럼 DB 밖 값이 섞인 응답은 본문 해시로 ETag를 만든다(전송량만 절약).
+CONTENT_HASH_ROUTES = {"/health", "/api/health"}
+
+
+def normalize_query(items: Iterable[tuple[str, str]]) -> dict[str, str]:
+    """쿼리 순서와 ip 값의 대소문자/공백 차이를 같은 키로 맞춘다(저장 함수도 같은 값으로 처리)."""
+    out: dict[str, str] = {}
+    for key, value in items:
+        out[key] = value.strip().lower() if key in _CASE_INSENSITIVE_PARAMS else value
+    return dict(sorted(out.items()))
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(repr((_BOOT_ID,) + parts).encode("utf-8"), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def content_etag(body: bytes) -> str:
+    return make_etag(hashlib.blake2b(body, digest_size=16).hexdigest())
+
+
+def route_etag(path: str, query: dict[str, str]) -> str | None:
+    """VERSIONED_ROUTES 경로의 ETag. 대상이 아니거나 버전을 알 수 없으면 None."""
+    version_fn = VERSIONED_ROUTES.get(path)
+    if version_fn is None:
+        return None
+    version = version_fn(query)
+    if version is None:
+        return None
+    return make_etag(path, version, tuple(query.items()))
+
+
+def matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 맞는지(약한 비교, '*' 허용)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
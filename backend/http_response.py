@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import zlib
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 표준 json으로 직렬화한다.
+    orjson = None
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 협상한다.
+    brotli = None
+
+# 응답 본문 압축(Accept-Encoding 협상). 임계값보다 작은 응답은 압축 비용이 더 커서 그대로 보낸다.
+HTTP_COMPRESSION_ENABLED = os.getenv("HTTP_COMPRESSION_ENABLED", "1").strip() != "0"
+HTTP_COMPRESS_MIN_BYTES = int(os.getenv("HTTP_COMPRESS_MIN_BYTES", "1024"))
+# 대시보드 폴링 지연을 늘리지 않는 수준(속도 우선)
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+def _encode_default(value: Any) -> Any:
+    """orjson이 직접 다루지 않는 값(pandas/numpy 스칼라 등). 나머지는 jsonable_encoder 규칙을 따른다."""
+    if value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return jsonable_encoder(value)
+
+
+def dumps(content: Any) -> bytes:
+    """응답 본문 직렬화. numpy 배열/스칼라, pandas Timestamp/NaT를 그대로 받는다(orjson은 NaN/inf를 null로 쓴다)."""
+    if orjson is not None:
+        return orjson.dumps(
+            content, default=_encode_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    custom = {np.generic: _encode_default, pd.Timestamp: _encode_default, type(pd.NaT): _encode_default}
+    return json.dumps(
+        jsonable_encoder(content, custom_encoder=custom),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson 직렬화 응답. 핸들러가 이 응답을 직접 돌려주면 FastAPI의 jsonable_encoder/검증을 건너뛴다."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _choose_encoding(accept_encoding: str) -> str | None:
+    """Accept-Encoding에서 br > gzip 순으로 고른다(q=0은 제외)."""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip()] = q
+    wildcard = accepted.get("*", 0.0)
+    if brotli is not None and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    def __init__(self, encoding: str) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._zlib = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def process(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.process(data)
+        return self._zlib.compress(data)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    """인코딩마다 본문 바이트가 달라 강한 ETag를 공유할 수 없으므로 약한 ETag(W/)로 바꾼다.
+
+    If-None-Match는 약한 비교(http_cache.matches)라 W/ 값을 돌려보내도 304로 맞는다.
+    """
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["etag"] = f"W/{etag}"
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+class CompressionMiddleware:
+    """JSON/NDJSON/CSV 응답을 Accept-Encoding에 맞춰 br 또는 gzip으로 압축한다.
+
+    HTTP_COMPRESS_MIN_BYTES 이상인 응답만 압축하고, 스트리밍 응답(내보내기)은 조각마다 압축해 흘려보낸다.
+    인코딩을 협상한 요청의 응답(200과 304)은 ETag를 약한 ETag로 바꾼다(RFC 9110 8.8.3: 강한 ETag는
+    표현 바이트마다 달라야 한다). identity 응답만 강한 ETag를 유지한다.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD" or not HTTP_COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        encoding = _choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start: Message | None = None
+        compressor: _Compressor | None = None
+        passthrough = False
+        pending: list[bytes] = []
+        pending_size = 0
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor, passthrough, pending_size
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if message["status"] == 304 and encoding is not None:
+                    _weaken_etag(MutableHeaders(raw=message["headers"]))
+                if (
+                    not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or "content-encoding" in headers
+                    or message["status"] in (204, 304)
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+                if encoding is None:
+                    passthrough = True
+                    await send(message)
+                    return
+                # 본문 크기(압축 여부)와 관계없이 약한 ETag로 둬야 같은 요청의 304와 값이 맞는다.
+                _weaken_etag(MutableHeaders(raw=message["headers"]))
+                start = message
+                return
+            if passthrough or message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            headers = MutableHeaders(raw=start["headers"])
+            if compressor is None:
+                # 임계값을 넘거나 응답이 끝날 때까지 모은다(미들웨어를 거친 응답은 한 번에 보내도 조각으로 온다).
+                pending.append(body)
+                pending_size += len(body)
+                if not more_body:
+                    body = b"".join(pending)
+                    if len(body) >= HTTP_COMPRESS_MIN_BYTES:
+                        body = compress(body, encoding)
+                        headers["content-encoding"] = encoding
+                    headers["content-length"] = str(len(body))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                if pending_size < HTTP_COMPRESS_MIN_BYTES:
+                    return
+                # 스트리밍 응답(내보내기 등)은 조각마다 압축해 흘려보낸다.
+                compressor = _Compressor(encoding)
+                headers["content-encoding"] = encoding
+                del headers["content-length"]
+                await send(start)
+                body = b"".join(pending)
+                pending.clear()
+            chunk = compressor.process(body)
+            if not more_body:
+                chunk += compressor.finish()
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
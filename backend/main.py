@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import csv
+import io
+import json
 import random
 import re
 import sys
@@ -7,12 +10,12 @@ import time
 import os
 import math
 import logging
-import sqlite3
+from collections import OrderedDict
 from threading import Lock
-from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
+from concurrent.futures import ALL_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 from urllib.parse import urlparse
 
 import pandas as pd
@@ -21,44 +24,62 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
+from starlette.concurrency import run_in_threadpool
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 if str(ROOT_DIR) not in sys.path:
     sys.path.append(str(ROOT_DIR))
 
+from backend.db import close_all_connections, connect as db_connect
+from backend import analytics_store, archive, http_cache, read_cache
+from backend.http_response import CompressionMiddleware, FastJSONResponse
+from backend.rate_limit import TokenBucketLimiter
+from backend.read_cache import approx_size
+from backend.single_flight import SingleFlight
+from backend.db_writer import db_writer
 from backend.storage import (
+    EXPORT_ARTICLE_COLUMNS,
+    EXPORT_RISK_TIMESERIES_COLUMNS,
     IP_RULES,
     OUTLET_GAME_MEDIA,
     OUTLET_TIER1,
     RISK_FORMULA_VERSION,
-    RISK_THEME_RULES,
     THEME_WEIGHTS_HEAT,
     THEME_WEIGHTS_RISK,
     cleanup_live_articles,
     cleanup_risk_timeseries,
     cleanup_scheduler_logs,
     cleanup_test_articles,
+    compact_sentiment_results,
+    detect_ip_tags,
+    detect_theme_tags,
     get_active_db_path,
     get_articles,
     get_observability_counts,
     get_latest_scheduler_log,
     get_ip_clusters,
+    get_live_risk_all,
     get_live_risk_with_options,
     get_nexon_articles,
     get_nexon_dashboard,
     get_recent_burst_events,
     get_recent_risk_scores,
+    get_risk_snapshot,
     get_risk_timeseries,
     get_risk_dashboard,
     get_risk_ip_catalog,
     init_db,
+    iter_export_articles,
+    iter_export_risk_timeseries,
     force_burst_test_articles,
     record_burst_event,
     record_scheduler_log,
     get_scheduler_log_fallback_count,
     repair_article_outlets,
     save_articles,
+    save_risk_snapshot,
     upsert_risk_daily_summary,
 )
 from backend.analysis_project import CORE_IPS, build_project_snapshot
@@ -85,7 +106,8 @@ class NexonClusterRequest(BaseModel):
     total_articles: int = Field(default=300, ge=50, le=1000)
 
 
-app = FastAPI(title="NEXON PR API", version="1.0.0")
+# 응답은 orjson으로 직렬화한다. 큰 응답 API는 FastJSONResponse를 직접 돌려줘 FastAPI 인코딩 단계를 건너뛴다.
+app = FastAPI(title="NEXON PR API", version="1.0.0", default_response_class=FastJSONResponse)
 logger = logging.getLogger("backend.main")
 
 MONITOR_IPS = list(CORE_IPS)
@@ -100,6 +122,24 @@ LIVE_COLLECT_INCLUDE_SIM = os.getenv("LIVE_COLLECT_INCLUDE_SIM", "1") == "1"
 COLLECT_ZERO_STREAK_WARN_THRESHOLD = int(os.getenv("COLLECT_ZERO_STREAK_WARN_THRESHOLD", "10"))
 COMPARE_LIVE_RATE_LIMIT_PER_MIN = int(os.getenv("COMPARE_LIVE_RATE_LIMIT_PER_MIN", "30"))
 COMPARE_LIVE_CACHE_TTL_SECONDS = int(os.getenv("COMPARE_LIVE_CACHE_TTL_SECONDS", "45"))
+# 공개 엔드포인트라 클라이언트 IP/파라미터 조합이 끝없이 늘 수 있다. 요청 제한 상태와 결과 캐시는 상한을 두고 밀어낸다.
+COMPARE_LIVE_RATE_MAX_CLIENTS = int(os.getenv("COMPARE_LIVE_RATE_MAX_CLIENTS", "20000"))
+COMPARE_LIVE_CACHE_MAX_ENTRIES = int(os.getenv("COMPARE_LIVE_CACHE_MAX_ENTRIES", "256"))
+COMPARE_LIVE_CACHE_MAX_MB = int(os.getenv("COMPARE_LIVE_CACHE_MAX_MB", "64"))
+# 마지막으로 만든 지 이 시간이 지난 항목은 fallback으로도 쓰지 않고 지운다.
+COMPARE_LIVE_CACHE_MAX_AGE_SECONDS = int(os.getenv("COMPARE_LIVE_CACHE_MAX_AGE_SECONDS", "86400"))
+# 조회 실패 직후 이 시간 동안은 다시 만들지 않고 마지막 성공 결과(없으면 502)로 응답한다.
+COMPARE_LIVE_ERROR_BACKOFF_SECONDS = int(os.getenv("COMPARE_LIVE_ERROR_BACKOFF_SECONDS", "5"))
+# TTL이 지난 뒤에도 이 시간 동안은 이전 결과로 바로 응답하고 백그라운드에서 새로 만든다(stale-while-revalidate).
+COMPARE_LIVE_STALE_GRACE_SECONDS = int(os.getenv("COMPARE_LIVE_STALE_GRACE_SECONDS", "600"))
+# collect-competitors 실행 뒤 미리 만들어 두는 기본 비교 조합(화면 기본값과 같은 회사 순서)
+COMPARE_LIVE_DEFAULT_COMPANIES = "넥슨,NC소프트,넷마블,크래프톤"
+COMPARE_LIVE_PREWARM_COMPANIES = os.getenv("COMPARE_LIVE_PREWARM_COMPANIES", COMPARE_LIVE_DEFAULT_COMPANIES)
+COMPARE_LIVE_PREWARM_WINDOWS = [
+    int(v) for v in os.getenv("COMPARE_LIVE_PREWARM_WINDOWS", "24,72,168").split(",") if v.strip().isdigit()
+]
+# collect-competitors가 꺼져 있을 때 기본 조합만 따로 다시 만드는 주기(TTL + 유예 구간보다 짧아야 요청 경로에서 계산하지 않는다)
+COMPARE_LIVE_PREWARM_INTERVAL_SECONDS = int(os.getenv("COMPARE_LIVE_PREWARM_INTERVAL_SECONDS", "300"))
 COMPARE_LIVE_COMPANY_TIMEOUT_SECONDS = int(os.getenv("COMPARE_LIVE_COMPANY_TIMEOUT_SECONDS", "10"))
 COMPARE_LIVE_MAX_WORKERS = int(os.getenv("COMPARE_LIVE_MAX_WORKERS", "4"))
 ENABLE_COMPETITOR_AUTO_COLLECT = os.getenv("ENABLE_COMPETITOR_AUTO_COLLECT", "1") == "1"
@@ -150,6 +190,9 @@ RISK_DASHBOARD_DEFAULT_LOOKBACK_DAYS = max(7, int(os.getenv("RISK_DASHBOARD_DEFA
 CLEANUP_DRY_RUN = os.getenv("CLEANUP_DRY_RUN", "0") == "1"
 CLEANUP_MAX_DELETE_ROWS = int(os.getenv("CLEANUP_MAX_DELETE_ROWS", "5000"))
 ENABLE_DEBUG_ENDPOINTS = os.getenv("ENABLE_DEBUG_ENDPOINTS", "0") == "1"
+RISK_SNAPSHOT_TTL_SECONDS = int(os.getenv("RISK_SNAPSHOT_TTL_SECONDS", "30"))
+# 모니터 틱이 멈추거나 계속 실패해도 오래된 점수를 그대로 내보내지 않도록, 이보다 오래된 스냅샷은 기록 없이 다시 계산한다.
+RISK_SNAPSHOT_MAX_AGE_SECONDS = int(os.getenv("RISK_SNAPSHOT_MAX_AGE_SECONDS", str(BASE_INTERVAL_SECONDS * 3)))
 DISABLE_COMPETITOR_COMPARE = os.getenv("DISABLE_COMPETITOR_COMPARE", "1") == "1"
 ENABLE_MANUAL_COLLECTION = os.getenv("ENABLE_MANUAL_COLLECTION", "0") == "1"
 CORS_ALLOW_ORIGINS_RAW = os.getenv(
@@ -174,9 +217,18 @@ last_burst_state: dict[str, dict[str, Any]] = {}
 scheduler_job_state: dict[str, dict[str, Any]] = {}
 collect_zero_insert_streak: dict[str, int] = {ip_id: 0 for ip_id in MONITOR_IPS}
 _last_zero_alert_signature: tuple[str, ...] = ()
-compare_live_rate_state: dict[str, list[float]] = {}
-compare_live_cache: dict[str, dict[str, Any]] = {}
+compare_live_rate_limiter = TokenBucketLimiter(COMPARE_LIVE_RATE_LIMIT_PER_MIN, COMPARE_LIVE_RATE_MAX_CLIENTS)
+# 최근 사용 순서(LRU). 항목 추가/삭제는 _compare_live_cache_get/_compare_live_cache_put으로 한다.
+compare_live_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+risk_snapshot_cache: dict[tuple[str, int, bool], dict[str, Any]] = {}
+risk_snapshot_lock = Lock()
 compare_live_cache_lock = Lock()
+# 캐시 만료 직후 몰린 요청은 키별로 한 번만 만든다(나머지는 같은 결과/오류를 받는다).
+compare_live_flight = SingleFlight()
+# 만료 직후(유예 구간) 요청이 맡기는 백그라운드 갱신. 키별로 한 번만 예약한다(cache entry의 "refreshing").
+compare_live_refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="compare-live-refresh")
+# 예약된 기본 조합 미리 만들기(_schedule_compare_live_prewarm). 끝나기 전에는 다시 예약하지 않는다.
+compare_live_prewarm_future: Future | None = None
 compare_live_rate_lock = Lock()
 compare_live_metrics = {
     "requests": 0,
@@ -184,12 +236,19 @@ compare_live_metrics = {
     "cache_hits": 0,
     "cache_misses": 0,
     "cache_fallback_hits": 0,
+    "coalesced": 0,
+    "stale_hits": 0,
+    "background_refreshes": 0,
+    "prewarmed": 0,
+    "cache_evictions": 0,
+    "cache_expired": 0,
 }
 cleanup_last_result = {
     "deleted_scheduler_logs": 0,
     "deleted_test_articles": 0,
     "deleted_live_articles": 0,
     "deleted_risk_rows": 0,
+    "deleted_sentiment_rows": 0,
     "summary_rows_upserted": 0,
     "updated_at": "",
 }
@@ -246,13 +305,52 @@ for warning in cors_validation_warnings:
         ",".join(cors_allow_origins),
     )
 
+# CORS 미들웨어보다 먼저 등록해 안쪽에서 실행한다(304 응답에도 CORS 헤더가 붙는다).
+@app.middleware("http")
+async def conditional_get(request: Request, call_next):
+    path = request.url.path
+    versioned = path in http_cache.VERSIONED_ROUTES
+    if (
+        not http_cache.HTTP_ETAG_ENABLED
+        or request.method not in {"GET", "HEAD"}
+        or not (versioned or path in http_cache.CONTENT_HASH_ROUTES)
+    ):
+        return await call_next(request)
+
+    if_none_match = request.headers.get("if-none-match")
+    etag = None
+    if versioned:
+        # 버전은 본문 계산 전에 읽는다. 계산 중 쓰기가 들어오면 다음 요청의 ETag가 달라 다시 계산한다.
+        query = http_cache.normalize_query(request.query_params.multi_items())
+        etag = await run_in_threadpool(http_cache.route_etag, path, query)
+        if etag is not None and http_cache.matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+
+    response = await call_next(request)
+    if response.status_code != 200:
+        return response
+    if etag is None:
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = http_cache.content_etag(body)
+        headers = {k: v for k, v in response.headers.items() if k.lower() != "content-length"}
+        if http_cache.matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+        response = Response(content=body, status_code=200, headers=headers, media_type=response.media_type)
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_allow_origins,
     allow_credentials=cors_allow_credentials,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
+# 가장 바깥에서 압축한다(ETag 비교/CORS 헤더 처리는 압축 전 응답 기준).
+app.add_middleware(CompressionMiddleware)
 
 
 @app.on_event("startup")
@@ -277,6 +375,8 @@ def on_startup() -> None:
         raise RuntimeError(f"missing required env keys: {','.join(missing_env)}")
     init_db()
     repair_article_outlets(remove_placeholder=True)
+    # 스케줄러 쪽 쓰기(기사 적재/리스크/로그)는 단일 쓰기 스레드가 그룹 커밋한다.
+    db_writer.start()
     _start_monitoring_scheduler()
 
 
@@ -285,6 +385,10 @@ def on_shutdown() -> None:
     if scheduler.running:
         scheduler.shutdown(wait=False)
         logger.info("scheduler shutdown requested")
+    compare_live_refresh_executor.shutdown(wait=False)
+    # 큐에 남은 쓰기를 모두 커밋한 뒤 연결을 닫는다.
+    db_writer.stop()
+    close_all_connections()
 
 
 def _job_id(ip_id: str) -> str:
@@ -363,21 +467,58 @@ def _compare_live_client_ip(request: Request) -> str:
 
 
 def _check_compare_live_rate_limit(client_ip: str) -> int:
+    retry_after = compare_live_rate_limiter.hit(client_ip)
     with compare_live_rate_lock:
         compare_live_metrics["requests"] = int(compare_live_metrics.get("requests", 0)) + 1
-        now_ts = time.time()
-        window_start = now_ts - 60.0
-        reqs = [ts for ts in compare_live_rate_state.get(client_ip, []) if ts >= window_start]
-        limit = max(1, int(COMPARE_LIVE_RATE_LIMIT_PER_MIN))
-        if len(reqs) >= limit:
-            oldest = min(reqs) if reqs else now_ts
-            retry_after = max(1, int(round(60 - (now_ts - oldest))))
-            compare_live_rate_state[client_ip] = reqs
+        if retry_after > 0:
             compare_live_metrics["rate_limited"] = int(compare_live_metrics.get("rate_limited", 0)) + 1
-            return retry_after
-        reqs.append(now_ts)
-        compare_live_rate_state[client_ip] = reqs
-        return 0
+    return retry_after
+
+
+def _compare_live_cache_get(key: str, now_ts: float) -> dict[str, Any] | None:
+    """캐시 항목을 꺼내 최근 사용으로 표시한다. compare_live_cache_lock을 잡은 상태에서 부른다."""
+    entry = compare_live_cache.get(key)
+    if entry is None:
+        return None
+    if float(entry.get("stored_at", now_ts)) + max(1, int(COMPARE_LIVE_CACHE_MAX_AGE_SECONDS)) < now_ts:
+        del compare_live_cache[key]
+        _increment_compare_live_metric("cache_expired")
+        return None
+    compare_live_cache.move_to_end(key)
+    return entry
+
+
+def _compare_live_cache_put(key: str, entry: dict[str, Any]) -> None:
+    """항목을 넣고 개수/크기 상한을 넘으면 가장 오래 쓰지 않은 항목부터 지운다. compare_live_cache_lock을 잡고 부른다."""
+    payload = entry.get("payload")
+    fallback = entry.get("last_success_payload")
+    size = approx_size(payload) + (approx_size(fallback) if fallback is not payload else 0)
+    entry["size"] = int(size)
+    entry.setdefault("stored_at", time.time())
+    compare_live_cache.pop(key, None)
+    compare_live_cache[key] = entry
+    max_bytes = max(0, int(COMPARE_LIVE_CACHE_MAX_MB)) * 1024 * 1024
+    total = sum(int(e.get("size", 0)) for e in compare_live_cache.values())
+    while len(compare_live_cache) > 1 and (
+        len(compare_live_cache) > max(1, int(COMPARE_LIVE_CACHE_MAX_ENTRIES)) or total > max_bytes
+    ):
+        _, evicted = compare_live_cache.popitem(last=False)
+        total -= int(evicted.get("size", 0))
+        _increment_compare_live_metric("cache_evictions")
+
+
+def _compare_live_cache_metrics() -> dict[str, int]:
+    with compare_live_cache_lock:
+        entries = len(compare_live_cache)
+        size = sum(int(e.get("size", 0)) for e in compare_live_cache.values())
+    return {
+        "entries": int(entries),
+        "bytes": int(size),
+        "max_entries": int(COMPARE_LIVE_CACHE_MAX_ENTRIES),
+        "max_bytes": int(max(0, COMPARE_LIVE_CACHE_MAX_MB) * 1024 * 1024),
+        "evictions": int(compare_live_metrics.get("cache_evictions", 0)),
+        "expired": int(compare_live_metrics.get("cache_expired", 0)),
+    }
 
 
 def _increment_compare_live_metric(metric_key: str) -> None:
@@ -472,23 +613,26 @@ def _build_compare_live_payload_from_db(selected: list[str], window_hours: int)
         FROM articles
         WHERE is_test = 0
           AND company = ?
-          AND datetime(COALESCE(NULLIF(pub_date, ''), NULLIF(created_at, ''), date || ' 00:00:00')) >= datetime('now', ?)
-        ORDER BY datetime(COALESCE(NULLIF(pub_date, ''), NULLIF(created_at, ''), date || ' 00:00:00')) DESC, id DESC
+          AND event_ts >= CAST(strftime('%s', 'now', ?) AS INTEGER)
+        ORDER BY event_ts DESC, id DESC
     """
 
-    conn = sqlite3.connect(str(db_path))
+    conn = db_connect(db_path, readonly=True)
     try:
         for company in selected:
             part = pd.read_sql_query(query, conn, params=[company, window_mod])
             if part.empty:
                 continue
+            # 기사 시각은 DB 필터(event_ts)와 같은 pub_date → date → created_at 순이다.
             part["pubDate_parsed"] = pd.to_datetime(
-                part["pub_date"].where(part["pub_date"].astype(str).str.len() > 0, part["created_at"]),
+                part["pub_date"].where(part["pub_date"].astype(str).str.len() > 0, part["date"]),
                 errors="coerce",
             )
             missing_pub = part["pubDate_parsed"].isna()
             if missing_pub.any():
-                part.loc[missing_pub, "pubDate_parsed"] = pd.to_datetime(part.loc[missing_pub, "date"], errors="coerce")
+                part.loc[missing_pub, "pubDate_parsed"] = pd.to_datetime(
+                    part.loc[missing_pub, "created_at"], errors="coerce"
+                )
             frames.append(part)
     finally:
         conn.close()
@@ -511,16 +655,164 @@ def _build_compare_live_payload_from_db(selected: list[str], window_hours: int)
     return payload
 
 
-def _with_compare_live_meta(payload: dict[str, Any], *, cache_hit: bool, cache_fallback: bool) -> dict[str, Any]:
+def _with_compare_live_meta(
+    payload: dict[str, Any], *, cache_hit: bool, cache_fallback: bool, cache_stale: bool = False
+) -> dict[str, Any]:
     out = dict(payload or {})
     meta = dict(out.get("meta") or {})
     meta["cache_hit"] = bool(cache_hit)
     meta["cache_fallback"] = bool(cache_fallback)
+    meta["cache_stale"] = bool(cache_stale)
     meta["cache_ttl_seconds"] = int(COMPARE_LIVE_CACHE_TTL_SECONDS)
     out["meta"] = meta
     return out
 
 
+def _refresh_compare_live_cache(selected: list[str], window_hours: int, *, force: bool = False) -> dict[str, Any]:
+    """DB에서 비교 결과를 만들어 캐시에 넣는다. force가 아니면 방금 채워진 캐시를 그대로 쓴다."""
+    key = _compare_live_cache_key(selected, window_hours=window_hours)
+    if not force:
+        # 앞선 리더가 방금 채운 캐시가 있으면 다시 만들지 않는다.
+        with compare_live_cache_lock:
+            cached = _compare_live_cache_get(key, time.time())
+            if cached and float(cached.get("expires_at", 0)) > time.time():
+                return _with_compare_live_meta(dict(cached.get("payload") or {}), cache_hit=True, cache_fallback=False)
+    try:
+        payload = _build_compare_live_payload_from_db(selected=selected, window_hours=window_hours)
+    except Exception:
+        with compare_live_cache_lock:
+            failed_until = time.time() + max(0, int(COMPARE_LIVE_ERROR_BACKOFF_SECONDS))
+            entry = _compare_live_cache_get(key, time.time())
+            if entry is None:
+                _compare_live_cache_put(key, {"failed_until": failed_until})
+            else:
+                entry["failed_until"] = failed_until
+        raise
+    payload = _with_compare_live_meta(payload, cache_hit=False, cache_fallback=False)
+    with compare_live_cache_lock:
+        _compare_live_cache_put(
+            key,
+            {
+                "payload": payload,
+                "expires_at": time.time() + max(1, int(COMPARE_LIVE_CACHE_TTL_SECONDS)),
+                "last_success_payload": payload,
+                "last_success_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            },
+        )
+    return payload
+
+
+def _refresh_compare_live_in_background(key: str, selected: list[str], window_hours: int) -> None:
+    """유예 구간 응답 뒤 캐시를 새로 만든다. 실패하면 이전 결과를 유지한다(다음 요청이 다시 예약)."""
+    try:
+        compare_live_flight.do(key, lambda: _refresh_compare_live_cache(selected, window_hours))
+        _increment_compare_live_metric("background_refreshes")
+    except Exception:  # noqa: BLE001
+        logger.exception("compare_live background refresh failed key=%s", key)
+    finally:
+        with compare_live_cache_lock:
+            entry = compare_live_cache.get(key)
+            if entry is not None:
+                entry.pop("refreshing", None)
+
+
+def _prewarm_compare_live() -> int:
+    """기본 비교 조합(COMPARE_LIVE_PREWARM_*)을 미리 만들어 요청 경로에서 계산하지 않게 한다."""
+    selected = _parse_companies(COMPARE_LIVE_PREWARM_COMPANIES)
+    if not selected:
+        return 0
+    warmed = 0
+    for window_hours in COMPARE_LIVE_PREWARM_WINDOWS:
+        if not 1 <= window_hours <= 168:
+            continue
+        key = _compare_live_cache_key(selected, window_hours=window_hours)
+        try:
+            # 수집 직후라 TTL이 남아 있어도 새 기사로 다시 만든다.
+            compare_live_flight.do(key, lambda: _refresh_compare_live_cache(selected, window_hours, force=True))
+        except Exception:  # noqa: BLE001
+            logger.warning("compare_live prewarm failed key=%s", key, exc_info=True)
+            continue
+        warmed += 1
+        _increment_compare_live_metric("prewarmed")
+    logger.info("compare_live prewarm done: warmed=%s/%s", warmed, len(COMPARE_LIVE_PREWARM_WINDOWS))
+    return warmed
+
+
+def _schedule_compare_live_prewarm() -> Future | None:
+    """기본 조합 미리 만들기를 백그라운드 갱신 스레드에 맡긴다(수집 틱/서버 시작을 막지 않는다)."""
+    global compare_live_prewarm_future
+    with compare_live_cache_lock:
+        if compare_live_prewarm_future is not None and not compare_live_prewarm_future.done():
+            return compare_live_prewarm_future
+        try:
+            compare_live_prewarm_future = compare_live_refresh_executor.submit(_prewarm_compare_live)
+        except RuntimeError:
+            # 종료 중(executor shutdown)에는 예약하지 않는다.
+            logger.warning("compare_live prewarm not scheduled: executor is shut down")
+            return None
+        return compare_live_prewarm_future
+
+
+def _risk_snapshot_key(ip: str, window_hours: int = 24, include_test: bool = False) -> tuple[str, int, bool]:
+    return ((ip or "all").strip().lower(), int(window_hours), bool(include_test))
+
+
+def _publish_risk_snapshot(ip_id: str, risk: dict[str, Any]) -> None:
+    # 모니터 틱 결과만 기준 스냅샷으로 게시한다(메모리 + DB, 다른 워커/재시작 대비).
+    key = _risk_snapshot_key(ip_id)
+    with risk_snapshot_lock:
+        risk_snapshot_cache[key] = {"payload": risk, "loaded_at": time.time(), "owned": True}
+    try:
+        save_risk_snapshot(ip_id, risk)
+    except Exception:  # noqa: BLE001
+        logger.exception("risk snapshot persist failed: ip_id=%s", ip_id)
+
+
+def _risk_snapshot_age_seconds(payload: dict[str, Any], now_ts: float) -> float | None:
+    """스냅샷 계산 시각(meta.ts) 기준 경과 초. 시각을 읽을 수 없으면 None."""
+    try:
+        computed = datetime.strptime(str((payload.get("meta") or {}).get("ts") or ""), "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        return None
+    return max(0.0, now_ts - computed.timestamp())
+
+
+def _risk_snapshot_expired(payload: dict[str, Any], now_ts: float) -> bool:
+    age = _risk_snapshot_age_seconds(payload, now_ts)
+    return age is None or age > max(1, int(RISK_SNAPSHOT_MAX_AGE_SECONDS))
+
+
+def _get_risk_snapshot(ip: str, window_hours: int = 24, include_test: bool = False) -> tuple[dict[str, Any], str]:
+    """최신 리스크 스냅샷 조회. (payload, source) 반환.
+
+    source: snapshot(모니터 틱 결과) / on_demand(스냅샷이 없거나 RISK_SNAPSHOT_MAX_AGE_SECONDS보다 오래된 조합을
+    기록 없이 계산). DB에서 읽은 값과 on_demand 결과는 RISK_SNAPSHOT_TTL_SECONDS 동안 메모리에서 재사용한다.
+    """
+    key = _risk_snapshot_key(ip, window_hours, include_test)
+    now_ts = time.time()
+    with risk_snapshot_lock:
+        cached = risk_snapshot_cache.get(key)
+    if cached and (cached["owned"] or now_ts - float(cached["loaded_at"]) < RISK_SNAPSHOT_TTL_SECONDS):
+        source = str(cached.get("source", "snapshot"))
+        if source != "snapshot" or not _risk_snapshot_expired(cached["payload"], now_ts):
+            return cached["payload"], source
+
+    payload = get_risk_snapshot(key[0], window_hours=key[1], include_test=key[2])
+    source = "snapshot"
+    if payload is not None and _risk_snapshot_expired(payload, now_ts):
+        logger.warning("risk snapshot stale, computing on demand: key=%s ts=%s", key, (payload.get("meta") or {}).get("ts"))
+        payload = None
+    if payload is None:
+        payload = get_live_risk_with_options(ip=ip, window_hours=window_hours, include_test=include_test, persist=False)
+        source = "on_demand"
+    with risk_snapshot_lock:
+        current = risk_snapshot_cache.get(key)
+        # 모니터 틱이 게시한 스냅샷은 만료 전까지 덮어쓰지 않는다.
+        if not (current and current["owned"] and not _risk_snapshot_expired(current["payload"], now_ts)):
+            risk_snapshot_cache[key] = {"payload": payload, "loaded_at": now_ts, "owned": False, "source": source}
+    return payload, source
+
+
 def _run_monitor_tick(ip_id: str) -> None:
     job_id = _job_id(ip_id)
     run_ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -530,6 +822,7 @@ def _run_monitor_tick(ip_id: str) -> None:
     for i in range(attempts):
         try:
             risk = get_live_risk_with_options(ip=ip_id, window_hours=24, include_test=False)
+            _publish_risk_snapshot(ip_id, risk)
             risk_score = float(risk.get("risk_score", 0.0))
             z_score = float(risk.get("z_score", 0.0))
             history_30m = get_recent_risk_scores(ip_id=ip_id, minutes=30)
@@ -763,6 +1056,10 @@ def _run_maintenance_cleanup() -> None:
             max_delete_rows=delete_cap,
             dry_run=CLEANUP_DRY_RUN,
         )
+        deleted_sentiment_rows = compact_sentiment_results(
+            max_delete_rows=delete_cap,
+            dry_run=CLEANUP_DRY_RUN,
+        )
         summary_rows_upserted = upsert_risk_daily_summary()
         cleanup_last_result.update(
             {
@@ -770,6 +1067,7 @@ def _run_maintenance_cleanup() -> None:
                 "deleted_test_articles": int(deleted_tests),
                 "deleted_live_articles": int(deleted_live_articles),
                 "deleted_risk_rows": int(deleted_risk_rows),
+                "deleted_sentiment_rows": int(deleted_sentiment_rows),
                 "summary_rows_upserted": int(summary_rows_upserted),
                 "dry_run": bool(CLEANUP_DRY_RUN),
                 "max_delete_rows": int(delete_cap or 0),
@@ -780,10 +1078,13 @@ def _run_maintenance_cleanup() -> None:
             "last_run_time": run_ts,
             "last_status": "success",
             "last_error": "",
-            "last_collect_count": int(deleted_logs + deleted_tests + deleted_live_articles + deleted_risk_rows),
+            "last_collect_count": int(
+                deleted_logs + deleted_tests + deleted_live_articles + deleted_risk_rows + deleted_sentiment_rows
+            ),
             "last_group_count": int(summary_rows_upserted),
             "deleted_live_articles": int(deleted_live_articles),
             "deleted_risk_rows": int(deleted_risk_rows),
+            "deleted_sentiment_rows": int(deleted_sentiment_rows),
             "summary_rows_upserted": int(summary_rows_upserted),
             "last_collect_duration_ms": int((time.time() - started) * 1000),
         }
@@ -794,6 +1095,7 @@ def _run_maintenance_cleanup() -> None:
             error_message=(
                 f"deleted_logs={deleted_logs},deleted_tests={deleted_tests},"
                 f"deleted_live_articles={deleted_live_articles},deleted_risk_rows={deleted_risk_rows},"
+                f"deleted_sentiment_rows={deleted_sentiment_rows},"
                 f"summary_rows_upserted={summary_rows_upserted},dry_run={int(CLEANUP_DRY_RUN)},"
                 f"max_delete_rows={int(delete_cap or 0)}"
             ),
@@ -811,35 +1113,54 @@ def _run_maintenance_cleanup() -> None:
         record_scheduler_log(job_id=job_id, status="error", run_time=run_ts, error_message=str(exc))
 
 
+def _run_analytics_store_refresh() -> None:
+    job_id = "analytics-store"
+    run_ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    started = time.time()
+    try:
+        result = analytics_store.refresh_store()
+        scheduler_job_state[job_id] = {
+            "last_run_time": run_ts,
+            "last_status": "success" if result.get("status") == "ok" else "skipped",
+            "last_error": str(result.get("reason", "")),
+            "last_collect_count": int(result.get("rows_written", 0)),
+            "last_group_count": int(result.get("files_written", 0)),
+            "rewritten_months": int(result.get("rewritten_months", 0)),
+            "watermark": int(result.get("watermark", 0)),
+            "last_collect_duration_ms": int((time.time() - started) * 1000),
+        }
+        record_scheduler_log(
+            job_id=job_id,
+            status="success",
+            run_time=run_ts,
+            error_message=",".join(f"{k}={v}" for k, v in result.items()),
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("analytics store refresh failed")
+        scheduler_job_state[job_id] = {
+            "last_run_time": run_ts,
+            "last_status": "error",
+            "last_error": str(exc),
+            "last_collect_count": 0,
+            "last_group_count": 0,
+            "last_collect_duration_ms": int((time.time() - started) * 1000),
+        }
+        record_scheduler_log(job_id=job_id, status="error", run_time=run_ts, error_message=str(exc))
+
+
 def _clean_html_local(text: str) -> str:
     t = re.sub(r"<[^>]+>", "", text or "")
     t = re.sub(r"&[a-zA-Z]+;", " ", t)
     return " ".join(t.split())
 
 
-def _detect_ip_slug_local(text: str) -> str:
-    low = (text or "").lower()
-    for _, meta in IP_RULES.items():
-        slug = str(meta.get("slug", ""))
-        if slug in {"", "all"}:
-            continue
-        keywords = meta.get("keywords", []) or []
-        if any(str(k).lower() in low for k in keywords):
-            return slug
-    return "other"
-
-
 def _matches_ip_slug_local(text: str, ip_id: str) -> bool:
     target = (ip_id or "").strip().lower()
     if target in {"", "all"}:
         return True
-    low = (text or "").lower()
-    for _, meta in IP_RULES.items():
-        slug = str(meta.get("slug", "")).strip().lower()
-        if slug != target:
-            continue
-        keywords = meta.get("keywords", []) or []
-        return any(str(k).lower() in low for k in keywords)
+    for name, meta in IP_RULES.items():
+        if str(meta.get("slug", "")).strip().lower() == target:
+            return name in detect_ip_tags(text)
     return False
 
 
@@ -910,10 +1231,9 @@ def _run_backfill_tick() -> None:
     run_ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     started = time.time()
     try:
-        ip_counts: list[tuple[str, int]] = []
-        for ip_id in MONITOR_IPS:
-            risk = get_live_risk_with_options(ip=ip_id, window_hours=24, include_test=False)
-            ip_counts.append((ip_id, int(risk.get("article_count_window", 0))))
+        # 모든 IP 리스크를 기사 1회 스캔으로 계산(기록 없음)해 수집량이 적은 IP를 고른다.
+        risks = get_live_risk_all(window_hours=24, include_test=False, persist=False)
+        ip_counts = [(ip_id, int(risks[ip_id].get("article_count_window", 0))) for ip_id in MONITOR_IPS]
         ip_counts.sort(key=lambda x: x[1])
         target_ips = [ip for ip, cnt in ip_counts if cnt < BACKFILL_LOW_COUNT_THRESHOLD][: max(1, BACKFILL_MAX_IPS_PER_RUN)]
         total_calls = 0
@@ -1069,6 +1389,9 @@ def _run_competitor_collect_tick() -> None:
             "last_collect_duration_ms": int((time.time() - started) * 1000),
         }
         record_scheduler_log(job_id=job_id, status="error", run_time=run_ts, error_message=str(exc))
+    finally:
+        # 수집 결과와 관계없이(구간도 시간에 따라 밀린다) 기본 비교 조합을 새로 만들어 둔다.
+        _schedule_compare_live_prewarm()
 
 
 def _start_monitoring_scheduler() -> None:
@@ -1103,6 +1426,16 @@ def _start_monitoring_scheduler() -> None:
         coalesce=True,
         replace_existing=True,
     )
+    if analytics_store.available():
+        scheduler.add_job(
+            _run_analytics_store_refresh,
+            trigger=IntervalTrigger(minutes=max(1, analytics_store.ANALYTICS_STORE_REFRESH_MINUTES)),
+            id="analytics-store",
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+            next_run_time=datetime.now(),
+        )
     scheduler.add_job(
         _run_backfill_tick,
         trigger=IntervalTrigger(seconds=BACKFILL_INTERVAL_SECONDS),
@@ -1120,6 +1453,17 @@ def _start_monitoring_scheduler() -> None:
             coalesce=True,
             replace_existing=True,
         )
+    else:
+        # 수집 틱이 없으면 기본 비교 조합만 주기적으로 다시 만든다(첫 실행은 바로).
+        scheduler.add_job(
+            _schedule_compare_live_prewarm,
+            trigger=IntervalTrigger(seconds=max(1, COMPARE_LIVE_PREWARM_INTERVAL_SECONDS)),
+            id="prewarm-compare-live",
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+            next_run_time=datetime.now(),
+        )
     scheduler.start()
     logger.info("scheduler started: jobs=%s", [job.id for job in scheduler.get_jobs()])
     for ip_id in MONITOR_IPS:
@@ -1131,14 +1475,43 @@ def _start_monitoring_scheduler() -> None:
         _run_competitor_collect_tick()
 
 
+def _export_chunks(batches: Iterator[list[dict[str, Any]]], fmt: str, columns: list[str]) -> Iterator[bytes]:
+    """청크(행 묶음)마다 NDJSON/CSV 바이트를 하나씩 만든다. CSV는 엑셀 호환을 위해 BOM + 헤더로 시작한다."""
+    if fmt == "csv":
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=columns, extrasaction="ignore")
+        buf.write("\ufeff")
+        writer.writeheader()
+        yield buf.getvalue().encode("utf-8")
+        for batch in batches:
+            buf.seek(0)
+            buf.truncate()
+            writer.writerows(batch)
+            yield buf.getvalue().encode("utf-8")
+        return
+    for batch in batches:
+        yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in batch).encode("utf-8")
+
+
+def _export_response(batches: Iterator[list[dict[str, Any]]], fmt: str, columns: list[str], name: str) -> StreamingResponse:
+    ext, media_type = ("csv", "text/csv; charset=utf-8") if fmt == "csv" else ("ndjson", "application/x-ndjson")
+    return StreamingResponse(
+        _export_chunks(batches, fmt, columns),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{name}.{ext}"'},
+    )
+
+
 def _to_records(df: pd.DataFrame) -> list[dict]:
+    # 프레임 전체를 복사하지 않고 시각 열만 문자열로 바꾼다(numpy 스칼라 등은 응답 직렬화가 처리).
     if df.empty:
         return []
-    out = df.copy()
-    for col in out.columns:
-        if pd.api.types.is_datetime64_any_dtype(out[col]):
-            out[col] = out[col].dt.strftime("%Y-%m-%d %H:%M:%S")
-    return out.to_dict(orient="records")
+    records = df.to_dict(orient="records")
+    for col in df.columns:
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            for record, value in zip(records, df[col].dt.strftime("%Y-%m-%d %H:%M:%S").tolist()):
+                record[col] = value
+    return records
 
 
 def _generate_demo_data() -> pd.DataFrame:
@@ -1429,12 +1802,12 @@ def _build_payload(df: pd.DataFrame, selected: list[str]) -> dict:
                 theme_counter_heat: dict[str, int] = {}
                 theme_counter_risk: dict[str, int] = {}
                 for text in day_df["text"].tolist():
-                    for theme, keywords in RISK_THEME_RULES.items():
-                        if any(kw.lower() in text for kw in keywords):
-                            theme_counter_heat[theme] = int(theme_counter_heat.get(theme, 0)) + 1
-                            if theme in THEME_WEIGHTS_RISK:
-                                theme_counter_risk[theme] = int(theme_counter_risk.get(theme, 0)) + 1
-                            break
+                    themes = detect_theme_tags(text)
+                    if themes:
+                        theme = themes[0]
+                        theme_counter_heat[theme] = int(theme_counter_heat.get(theme, 0)) + 1
+                        if theme in THEME_WEIGHTS_RISK:
+                            theme_counter_risk[theme] = int(theme_counter_risk.get(theme, 0)) + 1
 
                 t_heat = 0.0
                 t_risk = 0.0
@@ -1569,19 +1942,30 @@ def health() -> dict:
         "scheduler_running": bool(scheduler.running),
         "scheduler_job_count": len(scheduler.get_jobs()) if scheduler.running else 0,
         "scheduler_log_fallback_count": get_scheduler_log_fallback_count(),
+        "db_writer": db_writer.metrics(),
         "compare_live_rate_limit_per_min": int(COMPARE_LIVE_RATE_LIMIT_PER_MIN),
         "compare_live_cache_ttl_seconds": int(COMPARE_LIVE_CACHE_TTL_SECONDS),
         "compare_live_cache_entries": int(len(compare_live_cache)),
         "compare_live_cache_hits": int(compare_live_metrics.get("cache_hits", 0)),
         "compare_live_cache_misses": int(compare_live_metrics.get("cache_misses", 0)),
         "compare_live_rate_limited": int(compare_live_metrics.get("rate_limited", 0)),
+        "compare_live_coalesced": int(compare_live_metrics.get("coalesced", 0)),
+        "compare_live_stale_grace_seconds": int(COMPARE_LIVE_STALE_GRACE_SECONDS),
+        "compare_live_stale_hits": int(compare_live_metrics.get("stale_hits", 0)),
+        "compare_live_background_refreshes": int(compare_live_metrics.get("background_refreshes", 0)),
+        "compare_live_prewarmed": int(compare_live_metrics.get("prewarmed", 0)),
+        "compare_live_cache": _compare_live_cache_metrics(),
+        "compare_live_rate_limiter": compare_live_rate_limiter.metrics(),
         "live_article_retention_days": int(LIVE_ARTICLE_RETENTION_DAYS),
         "risk_timeseries_retention_days": int(RISK_TIMESERIES_RETENTION_DAYS),
         "cleanup_dry_run": bool(CLEANUP_DRY_RUN),
         "cleanup_max_delete_rows": int(CLEANUP_MAX_DELETE_ROWS),
         "deleted_live_articles": int(cleanup_last_result.get("deleted_live_articles", 0)),
         "deleted_risk_rows": int(cleanup_last_result.get("deleted_risk_rows", 0)),
+        "deleted_sentiment_rows": int(cleanup_last_result.get("deleted_sentiment_rows", 0)),
         "summary_rows_upserted": int(cleanup_last_result.get("summary_rows_upserted", 0)),
+        "article_archive": archive.archive_stats(db_path),
+        "read_cache": read_cache.metrics(),
         "cleanup_last_updated_at": str(cleanup_last_result.get("updated_at", "")),
         "collect_zero_streak_threshold": int(COLLECT_ZERO_STREAK_WARN_THRESHOLD),
         "collect_zero_insert_streaks": {ip_id: int(streak) for ip_id, streak in collect_zero_insert_streak.items()},
@@ -1630,8 +2014,12 @@ def articles(
     sentiment: str | None = Query(default=None),
     limit: int = Query(default=50, ge=10, le=200),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
 ) -> dict:
-    return get_articles(company=company, sentiment=sentiment, limit=limit, offset=offset)
+    try:
+        return get_articles(company=company, sentiment=sentiment, limit=limit, offset=offset, cursor=cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
 @app.get("/api/nexon-articles")
@@ -1639,9 +2027,10 @@ def nexon_articles(
     ip: str = Query(default="all"),
     limit: int = Query(default=20, ge=10, le=100),
     offset: int = Query(default=0, ge=0),
+    cursor: str | None = Query(default=None),
 ) -> dict:
     try:
-        return get_nexon_articles(ip=ip, limit=limit, offset=offset)
+        return get_nexon_articles(ip=ip, limit=limit, offset=offset, cursor=cursor)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -1668,7 +2057,7 @@ def project_snapshot(
     date_from: str = Query(default="2024-01-01"),
     date_to: str = Query(default="2026-12-31"),
     ips: str = Query(default=",".join(CORE_IPS)),
-) -> dict:
+) -> FastJSONResponse:
     try:
         start = datetime.strptime(date_from, "%Y-%m-%d")
         end = datetime.strptime(date_to, "%Y-%m-%d")
@@ -1680,7 +2069,7 @@ def project_snapshot(
 
     ip_list = [x.strip().lower() for x in ips.split(",") if x.strip()]
     try:
-        return build_project_snapshot(date_from=date_from, date_to=date_to, ips=ip_list or CORE_IPS)
+        return FastJSONResponse(build_project_snapshot(date_from=date_from, date_to=date_to, ips=ip_list or CORE_IPS))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -1720,11 +2109,27 @@ def risk_score(
     ip: str = Query(default="all"),
     window_hours: int = Query(default=24, ge=1, le=72),
     include_test: bool = Query(default=False),
+    recompute: bool = Query(default=False),
 ) -> dict:
+    # 기본은 모니터 틱이 게시한 스냅샷 조회(쓰기 없음). recompute=1은 디버그 모드에서만 재계산 후 risk_timeseries에 기록한다.
+    if recompute and not ENABLE_DEBUG_ENDPOINTS:
+        raise HTTPException(status_code=403, detail="debug endpoints are disabled")
     try:
-        return get_live_risk_with_options(ip=ip, window_hours=window_hours, include_test=bool(include_test))
+        if recompute:
+            payload = get_live_risk_with_options(ip=ip, window_hours=window_hours, include_test=bool(include_test))
+            source = "recompute"
+        else:
+            payload, source = _get_risk_snapshot(ip, window_hours=window_hours, include_test=bool(include_test))
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    out = dict(payload)
+    meta = dict(out.get("meta") or {})
+    meta["source"] = source
+    if source == "snapshot":
+        age = _risk_snapshot_age_seconds(out, time.time())
+        meta["snapshot_age_seconds"] = None if age is None else int(age)
+    out["meta"] = meta
+    return out
 
 
 @app.get("/api/risk-timeseries")
@@ -1732,11 +2137,43 @@ def risk_timeseries(
     ip: str = Query(default="all"),
     hours: int = Query(default=24 * 7, ge=24, le=24 * 30),
     limit: int = Query(default=2000, ge=50, le=10000),
-) -> dict:
+) -> FastJSONResponse:
+    try:
+        return FastJSONResponse(get_risk_timeseries(ip_id=ip, hours=hours, limit=limit))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+
+@app.get("/api/export/articles")
+def export_articles(
+    company: str | None = Query(default=None),
+    ip: str = Query(default="all"),
+    date_from: str | None = Query(default=None),
+    date_to: str | None = Query(default=None),
+    include_test: bool = Query(default=False),
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$"),
+) -> StreamingResponse:
+    try:
+        batches = iter_export_articles(
+            company=company, ip=ip, date_from=date_from, date_to=date_to, include_test=include_test
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _export_response(batches, format, EXPORT_ARTICLE_COLUMNS, "articles")
+
+
+@app.get("/api/export/risk-timeseries")
+def export_risk_timeseries(
+    ip: str = Query(default="all"),
+    date_from: str | None = Query(default=None),
+    date_to: str | None = Query(default=None),
+    format: str = Query(default="ndjson", pattern="^(ndjson|csv)$"),
+) -> StreamingResponse:
     try:
-        return get_risk_timeseries(ip_id=ip, hours=hours, limit=limit)
+        batches = iter_export_risk_timeseries(ip=ip, date_from=date_from, date_to=date_to)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _export_response(batches, format, EXPORT_RISK_TIMESERIES_COLUMNS, f"risk_timeseries_{ip}")
 
 
 @app.get("/api/burst-status")
@@ -1784,7 +2221,8 @@ def scheduler_status() -> dict:
         [_collect_job_id(ip_id) for ip_id in MONITOR_IPS]
         + [_job_id(ip_id) for ip_id in MONITOR_IPS]
         + ["backfill-collector", "maintenance-cleanup"]
-        + (["collect-competitors"] if ENABLE_COMPETITOR_AUTO_COLLECT else [])
+        + (["analytics-store"] if analytics_store.available() else [])
+        + (["collect-competitors"] if ENABLE_COMPETITOR_AUTO_COLLECT else ["prewarm-compare-live"])
     )
     for job_id in job_ids:
         ip_id = job_id.replace("risk-monitor-", "").replace("collect-news-", "")
@@ -1951,9 +2389,9 @@ def backtest(
 @app.get("/api/compare-live")
 def compare_live(
     request: Request,
-    companies: str = Query(default="넥슨,NC소프트,넷마블,크래프톤"),
+    companies: str = Query(default=COMPARE_LIVE_DEFAULT_COMPANIES),
     window_hours: int = Query(default=24, ge=1, le=168),
-) -> dict:
+) -> FastJSONResponse:
     selected = _parse_companies(companies)
     if not selected:
         raise HTTPException(status_code=400, detail="최소 1개 이상의 유효한 회사를 선택해 주세요.")
@@ -1970,34 +2408,54 @@ def compare_live(
     key = _compare_live_cache_key(selected, window_hours=window_hours)
     now_ts = time.time()
     with compare_live_cache_lock:
-        cached = compare_live_cache.get(key)
+        cached = _compare_live_cache_get(key, now_ts)
         if cached and float(cached.get("expires_at", 0)) > now_ts:
             _increment_compare_live_metric("cache_hits")
             logger.info("compare_live cache hit key=%s", key)
-            return _with_compare_live_meta(dict(cached.get("payload") or {}), cache_hit=True, cache_fallback=False)
+            return FastJSONResponse(
+                _with_compare_live_meta(dict(cached.get("payload") or {}), cache_hit=True, cache_fallback=False)
+            )
+        stale = (
+            bool(cached)
+            and bool(cached.get("payload"))
+            and float(cached.get("expires_at", 0)) + max(0, int(COMPARE_LIVE_STALE_GRACE_SECONDS)) > now_ts
+        )
+        backoff = bool(cached) and float(cached.get("failed_until", 0)) > now_ts
+        schedule_refresh = stale and not backoff and not cached.get("refreshing")
+        if schedule_refresh:
+            cached["refreshing"] = True
+        stale_payload = dict(cached.get("payload") or {}) if stale else {}
+
+    if stale:
+        # 유예 구간: 이전 결과로 바로 응답하고, 새로 만드는 일은 백그라운드에 맡긴다.
+        _increment_compare_live_metric("stale_hits")
+        logger.info("compare_live stale hit key=%s refresh=%s", key, schedule_refresh)
+        if schedule_refresh:
+            compare_live_refresh_executor.submit(_refresh_compare_live_in_background, key, selected, window_hours)
+        return FastJSONResponse(
+            _with_compare_live_meta(stale_payload, cache_hit=True, cache_fallback=False, cache_stale=True)
+        )
 
     _increment_compare_live_metric("cache_misses")
     logger.info("compare_live cache miss key=%s", key)
+
     try:
-        payload = _build_compare_live_payload_from_db(selected=selected, window_hours=window_hours)
-        payload = _with_compare_live_meta(payload, cache_hit=False, cache_fallback=False)
-        with compare_live_cache_lock:
-            compare_live_cache[key] = {
-                "payload": payload,
-                "expires_at": now_ts + max(1, int(COMPARE_LIVE_CACHE_TTL_SECONDS)),
-                "last_success_payload": payload,
-                "last_success_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            }
-        return payload
+        if backoff:
+            raise RuntimeError("직전 조회 실패 후 재시도 대기 중입니다.")
+        payload, coalesced = compare_live_flight.do(key, lambda: _refresh_compare_live_cache(selected, window_hours))
+        if coalesced:
+            _increment_compare_live_metric("coalesced")
+        return FastJSONResponse(payload)
     except Exception as exc:  # noqa: BLE001
-        logger.exception("compare_live fetch failed key=%s", key)
+        if not backoff:
+            logger.exception("compare_live fetch failed key=%s", key)
         with compare_live_cache_lock:
-            cached = compare_live_cache.get(key)
+            cached = _compare_live_cache_get(key, time.time())
             fallback = dict(cached.get("last_success_payload") or {}) if cached else {}
         if fallback:
             _increment_compare_live_metric("cache_fallback_hits")
             logger.warning("compare_live fallback cache used key=%s", key)
-            return _with_compare_live_meta(fallback, cache_hit=False, cache_fallback=True)
+            return FastJSONResponse(_with_compare_live_meta(fallback, cache_hit=False, cache_fallback=True))
         raise HTTPException(status_code=502, detail=get_last_api_error() or f"비교 라이브 조회 실패: {exc}") from exc
 
 
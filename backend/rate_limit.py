@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import math
+import sys
+import time
+from collections import OrderedDict
+from threading import Lock
+
+# 클라이언트 하나의 버킷 값((남은 토큰, 마지막 갱신 시각) 튜플과 float 두 개)의 대략적인 크기.
+# 키 문자열 크기는 넣을 때 따로 더한다.
+_BUCKET_BYTES = sys.getsizeof((0.0, 0.0)) + 2 * sys.getsizeof(0.0)
+
+
+class TokenBucketLimiter:
+    """클라이언트별 토큰 버킷 요청 제한. 메모리는 max_clients개 버킷으로 고정된다.
+
+    버킷은 분당 limit_per_min개까지 쌓이고 초당 limit_per_min/60개씩 다시 찬다. 갱신은 O(1)이다.
+    다 찬 버킷은 없는 버킷과 같으므로 오래 쉰 클라이언트부터 지우고(expired), 그래도 max_clients를
+    넘으면 가장 오래 요청하지 않은 클라이언트를 밀어낸다(evictions, 다음 요청은 새 버킷으로 시작).
+    """
+
+    def __init__(self, limit_per_min: int, max_clients: int) -> None:
+        self.limit_per_min = max(1, int(limit_per_min))
+        self.max_clients = max(1, int(max_clients))
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
+        self._metrics = {"allowed": 0, "limited": 0, "expired": 0, "evictions": 0}
+
+    @property
+    def _rate(self) -> float:
+        return self.limit_per_min / 60.0
+
+    def _pop_oldest(self) -> None:
+        key, _ = self._buckets.popitem(last=False)
+        self._bytes -= sys.getsizeof(key) + _BUCKET_BYTES
+
+    def hit(self, client: str, now: float | None = None) -> int:
+        """요청 하나를 센다. 허용이면 0, 제한이면 재시도까지 기다릴 초(1 이상)를 돌려준다."""
+        now = time.monotonic() if now is None else float(now)
+        capacity = float(self.limit_per_min)
+        rate = self._rate
+        refill_seconds = capacity / rate
+        with self._lock:
+            bucket = self._buckets.get(client)
+            if bucket is None:
+                tokens = capacity
+                self._bytes += sys.getsizeof(client) + _BUCKET_BYTES
+            else:
+                tokens = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+                self._buckets.move_to_end(client)
+            if tokens >= 1.0:
+                tokens -= 1.0
+                retry_after = 0
+                self._metrics["allowed"] += 1
+            else:
+                retry_after = max(1, math.ceil((1.0 - tokens) / rate))
+                self._metrics["limited"] += 1
+            self._buckets[client] = (tokens, now)
+            # 맨 앞(가장 오래 쉰) 버킷이 다 찼으면 지운다. 요청마다 최대 두 개라 갱신 비용은 일정하다.
+            for _ in range(2):
+                oldest = next(iter(self._buckets.values()))
+                if len(self._buckets) <= 1 or now - oldest[1] < refill_seconds:
+                    break
+                self._pop_oldest()
+                self._metrics["expired"] += 1
+            while len(self._buckets) > self.max_clients:
+                self._pop_oldest()
+                self._metrics["evictions"] += 1
+            return retry_after
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._bytes = 0
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "clients": len(self._buckets),
+                "max_clients": int(self.max_clients),
+                "bytes": int(self._bytes + sys.getsizeof(self._buckets)),
+                **{k: int(v) for k, v in self._metrics.items()},
+            }
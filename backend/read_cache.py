@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import os
+import sys
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Hashable, TypeVar
+
+# storage 조회 함수 결과 메모이제이션. 키는 (함수, 인자, 데이터 버전)이라 기사 쓰기가 없으면 같은 결과를 재사용하고,
+# 쓰기로 버전이 바뀌면 이전 항목은 더 이상 조회되지 않다가 LRU로 밀려난다(명시적 무효화 없음).
+READ_CACHE_ENABLED = os.getenv("READ_CACHE_ENABLED", "1").strip() != "0"
+READ_CACHE_MAX_ENTRIES = int(os.getenv("READ_CACHE_MAX_ENTRIES", "256"))
+READ_CACHE_MAX_MB = int(os.getenv("READ_CACHE_MAX_MB", "64"))
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_cache: OrderedDict[tuple[Any, ...], tuple[Any, int]] = OrderedDict()
+_cache_bytes = 0
+_cache_lock = Lock()
+_metrics = {"hits": 0, "misses": 0, "evictions": 0, "bypassed": 0}
+
+
+def approx_size(value: Any) -> int:
+    """결과(dict/list/str/숫자 중첩)의 대략적인 메모리 크기(바이트)."""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(approx_size(k) + approx_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set)):
+        size += sum(approx_size(v) for v in value)
+    return size
+
+
+def _freeze(value: Any) -> Any:
+    """list/dict 인자도 키로 쓸 수 있게 바꾼다(ips=["maplestory", "dnf"] 등)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def _store(key: tuple[Any, ...], value: Any) -> None:
+    global _cache_bytes
+    size = approx_size(value)
+    limit = max(0, READ_CACHE_MAX_MB) * 1024 * 1024
+    if size > limit:
+        return
+    with _cache_lock:
+        previous = _cache.pop(key, None)
+        if previous is not None:
+            _cache_bytes -= previous[1]
+        _cache[key] = (value, size)
+        _cache_bytes += size
+        while _cache and (len(_cache) > max(1, READ_CACHE_MAX_ENTRIES) or _cache_bytes > limit):
+            _, (_, evicted) = _cache.popitem(last=False)
+            _cache_bytes -= evicted
+            _metrics["evictions"] += 1
+
+
+def memoize(version: Callable[[], Hashable | None]) -> Callable[[F], F]:
+    """조회 함수 결과를 (인자, version()) 키로 캐시하는 데코레이터.
+
+    version()이 None이면(버전 표가 없는 DB 등) 캐시하지 않는다. 예외는 캐시하지 않는다.
+    결과 객체는 호출자 사이에 공유되므로 호출자는 결과를 수정하지 않는다.
+    """
+
+    def decorate(fn: F) -> F:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not READ_CACHE_ENABLED:
+                return fn(*args, **kwargs)
+            current = version()
+            # 위치/키워드 인자와 기본값 생략을 같은 키로 맞춘다.
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = tuple((k, _freeze(v)) for k, v in bound.arguments.items())
+            key = (fn.__module__, fn.__qualname__, current, arguments)
+            try:
+                hash(key)
+            except TypeError:
+                current = None
+            if current is None:
+                with _cache_lock:
+                    _metrics["bypassed"] += 1
+                return fn(*args, **kwargs)
+            with _cache_lock:
+                cached = _cache.get(key)
+                if cached is not None:
+                    _cache.move_to_end(key)
+                    _metrics["hits"] += 1
+                    return cached[0]
+                _metrics["misses"] += 1
+            # 계산 중에 쓰기가 들어와도 계산 전에 읽은 버전으로 저장하므로 다음 조회는 새 버전으로 다시 계산한다.
+            result = fn(*args, **kwargs)
+            _store(key, result)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def clear() -> None:
+    global _cache_bytes
+    with _cache_lock:
+        _cache.clear()
+        _cache_bytes = 0
+
+
+def metrics() -> dict[str, Any]:
+    with _cache_lock:
+        hits, misses = _metrics["hits"], _metrics["misses"]
+        return {
+            "enabled": READ_CACHE_ENABLED,
+            "entries": len(_cache),
+            "bytes": int(_cache_bytes),
+            "max_entries": int(READ_CACHE_MAX_ENTRIES),
+            "max_bytes": int(max(0, READ_CACHE_MAX_MB) * 1024 * 1024),
+            "hits": int(hits),
+            "misses": int(misses),
+            "evictions": int(_metrics["evictions"]),
+            "bypassed": int(_metrics["bypassed"]),
+            "hit_ratio": round(hits / max(hits + misses, 1), 3),
+        }
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from fractions import Fraction
+
+
+@dataclass(frozen=True)
+class WindowArticle:
+    article_id: int
+    dt: datetime
+    date: str
+    group_id: str
+    theme: str | None
+    outlet: str
+    ip_names: tuple[str, ...] = ()
+
+
+@dataclass
+class RiskWindowState:
+    scoped_count: int
+    recent_count: int
+    recent_group_count: int
+    count_1h: int
+    negative_group_count: int
+    weighted_negative_sum: float
+    hourly_counts: dict[datetime, int]
+    theme_counts: dict[str, int]
+    outlet_counts: dict[str, int]
+
+
+def hour_bucket(dt: datetime) -> datetime:
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def is_legacy_group(group_id: str) -> bool:
+    return group_id.startswith("legacy:")
+
+
+class RiskWindow:
+    """IP 하나의 리스크 계산용 슬라이딩 윈도우.
+
+    기준 구간(date >= 오늘-baseline_days) 기사를 시간순으로 들고, 최근 window_hours 구간의
+    그룹/부정 그룹/테마/언론사 카운터와 시간대별 건수를 누적 관리한다.
+    add()는 신규 기사만, advance()는 만료/구간 이탈분만 처리하므로 틱 비용은 O(신규 + 만료)다.
+    그룹 대표 기사는 (date, id)가 가장 앞선 최근 기사이며 테마는 대표 기사 기준으로 센다.
+    """
+
+    def __init__(self, *, window_hours: int = 24, baseline_days: int = 7) -> None:
+        self.window_hours = max(1, int(window_hours))
+        self.baseline_days = int(baseline_days)
+        self.now: datetime | None = None
+        self.last_article_id = 0
+        self._articles: dict[int, WindowArticle] = {}
+        self._by_date: dict[str, list[int]] = {}
+        self._timeline: list[tuple[datetime, int]] = []
+        self._hourly: Counter[datetime] = Counter()
+        self._recent_since: datetime | None = None
+        self._recent_count = 0
+        self._recent_outlets: Counter[str] = Counter()
+        self._recent_groups: dict[str, dict[int, WindowArticle]] = {}
+        self._group_theme: dict[str, str | None] = {}
+        self._theme_counts: Counter[str] = Counter()
+        self._group_sentiment: dict[str, tuple[float, bool]] = {}
+        self._pending_sentiment: set[str] = set()
+        self._negative_groups = 0
+        # 부동소수 누적 오차 없이 전체 재계산(math.fsum)과 같은 값을 내기 위해 유리수로 합산한다.
+        self._weighted_sum = Fraction(0)
+
+    def baseline_date(self, now: datetime) -> str:
+        return (now - timedelta(days=self.baseline_days)).strftime("%Y-%m-%d")
+
+    def add(self, articles: list[WindowArticle]) -> None:
+        cutoff = self.baseline_date(self.now) if self.now else ""
+        for a in articles:
+            self.last_article_id = max(self.last_article_id, int(a.article_id))
+            if a.article_id in self._articles or a.date < cutoff:
+                continue
+            self._articles[a.article_id] = a
+            self._by_date.setdefault(a.date, []).append(a.article_id)
+            insort(self._timeline, (a.dt, a.article_id))
+            self._hourly[hour_bucket(a.dt)] += 1
+            if self._recent_since is not None and a.dt >= self._recent_since:
+                self._enter_recent(a)
+
+    def advance(self, now: datetime) -> None:
+        cutoff = self.baseline_date(now)
+        expired_dates = [d for d in self._by_date if d < cutoff]
+        if expired_dates:
+            expired: set[int] = set()
+            for d in expired_dates:
+                for article_id in self._by_date.pop(d):
+                    a = self._articles.pop(article_id)
+                    expired.add(article_id)
+                    self._hourly[hour_bucket(a.dt)] -= 1
+                    if self._hourly[hour_bucket(a.dt)] <= 0:
+                        del self._hourly[hour_bucket(a.dt)]
+                    if self._recent_since is not None and a.dt >= self._recent_since:
+                        self._leave_recent(a)
+            self._timeline = [item for item in self._timeline if item[1] not in expired]
+
+        since = now - timedelta(hours=self.window_hours)
+        if self._recent_since is None:
+            for _, article_id in self._timeline[bisect_left(self._timeline, (since,)) :]:
+                self._enter_recent(self._articles[article_id])
+        elif since > self._recent_since:
+            lo = bisect_left(self._timeline, (self._recent_since,))
+            hi = bisect_left(self._timeline, (since,))
+            for _, article_id in self._timeline[lo:hi]:
+                self._leave_recent(self._articles[article_id])
+        elif since < self._recent_since:
+            lo = bisect_left(self._timeline, (since,))
+            hi = bisect_left(self._timeline, (self._recent_since,))
+            for _, article_id in self._timeline[lo:hi]:
+                self._enter_recent(self._articles[article_id])
+        self._recent_since = since
+        self.now = now
+
+    def pending_sentiment_groups(self) -> list[str]:
+        return sorted(self._pending_sentiment)
+
+    def set_group_sentiment(self, group_id: str, weighted_negative: float, is_negative: bool) -> None:
+        if group_id in self._recent_groups and group_id not in self._pending_sentiment:
+            self._apply_sentiment(group_id, -1)
+        self._group_sentiment[group_id] = (float(weighted_negative), bool(is_negative))
+        self._pending_sentiment.discard(group_id)
+        if group_id in self._recent_groups:
+            self._apply_sentiment(group_id, 1)
+
+    def state(self, now: datetime) -> RiskWindowState:
+        if self._pending_sentiment:
+            raise RuntimeError("감성 값이 없는 그룹이 남아 있습니다(set_group_sentiment 필요).")
+        hour_start = now - timedelta(hours=1)
+        count_1h = len(self._timeline) - bisect_left(self._timeline, (hour_start,))
+        hourly = dict(self._hourly)
+        for dt, _ in self._timeline[bisect_left(self._timeline, (now,)) :]:
+            bucket = hour_bucket(dt)
+            hourly[bucket] -= 1
+            if hourly[bucket] <= 0:
+                del hourly[bucket]
+        return RiskWindowState(
+            scoped_count=len(self._articles),
+            recent_count=self._recent_count,
+            recent_group_count=len(self._recent_groups),
+            count_1h=count_1h,
+            negative_group_count=self._negative_groups,
+            weighted_negative_sum=float(self._weighted_sum),
+            hourly_counts=hourly,
+            theme_counts=dict(self._theme_counts),
+            outlet_counts=dict(self._recent_outlets),
+        )
+
+    def _apply_sentiment(self, group_id: str, sign: int) -> None:
+        weighted_negative, is_negative = self._group_sentiment[group_id]
+        self._weighted_sum += sign * Fraction(weighted_negative)
+        if is_negative:
+            self._negative_groups += sign
+
+    def _enter_recent(self, a: WindowArticle) -> None:
+        self._recent_count += 1
+        self._recent_outlets[a.outlet] += 1
+        members = self._recent_groups.get(a.group_id)
+        if members is None:
+            members = self._recent_groups[a.group_id] = {}
+            if a.group_id in self._group_sentiment:
+                self._apply_sentiment(a.group_id, 1)
+            elif is_legacy_group(a.group_id):
+                self._group_sentiment[a.group_id] = (0.0, False)
+                self._apply_sentiment(a.group_id, 1)
+            else:
+                self._pending_sentiment.add(a.group_id)
+        members[a.article_id] = a
+        self._update_group_theme(a.group_id)
+
+    def _leave_recent(self, a: WindowArticle) -> None:
+        self._recent_count -= 1
+        self._recent_outlets[a.outlet] -= 1
+        if self._recent_outlets[a.outlet] <= 0:
+            del self._recent_outlets[a.outlet]
+        members = self._recent_groups[a.group_id]
+        del members[a.article_id]
+        if not members:
+            del self._recent_groups[a.group_id]
+            if a.group_id in self._pending_sentiment:
+                self._pending_sentiment.discard(a.group_id)
+            else:
+                self._apply_sentiment(a.group_id, -1)
+            self._group_sentiment.pop(a.group_id, None)
+        self._update_group_theme(a.group_id)
+
+    def _update_group_theme(self, group_id: str) -> None:
+        members = self._recent_groups.get(group_id)
+        new_theme = min(members.values(), key=lambda m: (m.date, m.article_id)).theme if members else None
+        old_theme = self._group_theme.pop(group_id, None)
+        if members:
+            self._group_theme[group_id] = new_theme
+        if old_theme == new_theme:
+            return
+        if old_theme:
+            self._theme_counts[old_theme] -= 1
+            if self._theme_counts[old_theme] <= 0:
+                del self._theme_counts[old_theme]
+        if new_theme:
+            self._theme_counts[new_theme] += 1
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Hashable
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """같은 키의 동시 호출을 하나로 합친다.
+
+    먼저 들어온 호출(리더)만 fn()을 실행하고, 실행 중에 같은 키로 들어온 호출은 리더가 끝날 때까지
+    기다렸다가 같은 결과를 받는다. 리더가 예외로 끝나면 기다리던 호출도 같은 예외를 받는다.
+    결과를 보관하지 않으므로(캐시 아님) 리더가 끝난 뒤 들어온 호출은 다시 실행한다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._metrics = {"leaders": 0, "coalesced": 0, "errors": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """(결과, 다른 호출의 결과를 받았는지)를 돌려준다."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._metrics["leaders"] += 1
+            else:
+                self._metrics["coalesced"] += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+        try:
+            call.result = fn()
+            return call.result, False
+        except BaseException as exc:
+            call.error = exc
+            with self._lock:
+                self._metrics["errors"] += 1
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def metrics(self) -> dict[str, int]:
+        with self._lock:
+            return {**{k: int(v) for k, v in self._metrics.items()}, "in_flight": len(self._calls)}
@@ -1,22 +1,35 @@
 from __future__ import annotations
 
+import base64
 import hashlib
+import heapq
+import json
 import math
 import os
+import queue
+import random
 import re
 import sqlite3
 import logging
 import sys
 from threading import Lock
-from collections import Counter
+from collections import Counter, OrderedDict
 from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import islice
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+import zlib
 
+import numpy as np
 import pandas as pd
-from utils.sentiment import analyze_sentiment_rule_v1
+from utils.sentiment import analyze_sentiment_rule_v1, SENTIMENT_RESULT_COLUMNS
+from backend.db import connect as db_connect, connect_dedicated
+from backend import read_cache
+from backend.db_writer import run_write
+from backend.risk_window import RiskWindow, RiskWindowState, WindowArticle, hour_bucket, is_legacy_group
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 DEFAULT_DB_PATH = ROOT_DIR / "backend" / "data" / "articles.db"
@@ -45,6 +58,25 @@ THEME_WEIGHTS_RISK: dict[str, float] = {
     k: v for k, v in THEME_WEIGHTS.items() if k != "신작/성과"
 }
 RISK_FORMULA_VERSION = "v2"
+# 대량 적재 시 쓰기 잠금을 짧게 유지하기 위한 청크 크기(트랜잭션 단위)
+SAVE_ARTICLES_CHUNK_SIZE = 500
+# 재배포(근접중복) 판정 임계값(SequenceMatcher ratio)과 후보 상한
+SYNDICATION_RATIO_THRESHOLD = 0.985
+SYNDICATION_CANDIDATE_LIMIT = 500
+# 제목 MinHash/LSH 파라미터(20밴드 x 5행 = 해시 100개, 문자 3-gram).
+# 0.985 재배포 쌍(자카드 ~0.88 이상)의 후보 누락 확률이 1e-6 수준이 되도록 잡았다.
+# 값을 바꾸면 저장된 밴드 키와 호환되지 않으므로 rebuild_title_lsh_index()를 다시 실행한다.
+TITLE_LSH_BANDS = 20
+TITLE_LSH_ROWS = 5
+TITLE_LSH_SHINGLE = 3
+_TITLE_LSH_PRIME = (1 << 31) - 1
+_title_lsh_rng = random.Random(20240101)
+_TITLE_LSH_A = np.array(
+    [_title_lsh_rng.randrange(1, _TITLE_LSH_PRIME) for _ in range(TITLE_LSH_BANDS * TITLE_LSH_ROWS)], dtype=np.uint64
+)
+_TITLE_LSH_B = np.array(
+    [_title_lsh_rng.randrange(0, _TITLE_LSH_PRIME) for _ in range(TITLE_LSH_BANDS * TITLE_LSH_ROWS)], dtype=np.uint64
+)
 IP_RULES: dict[str, dict[str, Any]] = {
     "전체": {"slug": "all", "keywords": []},
     "메이플스토리": {"slug": "maplestory", "keywords": ["메이플스토리", "maplestory"]},
@@ -184,194 +216,883 @@ def get_active_db_path() -> Path:
 
 
 def _connect() -> sqlite3.Connection:
-    db_path = _resolve_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+    # 스레드별 재사용 연결(WAL/PRAGMA 적용). close()는 반납이다.
+    return db_connect(_resolve_db_path())
+
+
+def _connect_readonly() -> sqlite3.Connection:
+    """조회 경로 전용 연결(mode=ro). WAL에서 스케줄러 쓰기와 서로 막지 않는다."""
+    return db_connect(_resolve_db_path(), readonly=True)
+
+
+def _open_archives(date_from: str, date_to: str) -> dict[str, sqlite3.Connection]:
+    """조회 구간이 걸친 월 아카이브 읽기 연결({월: 연결}). 사용 후 각각 close()로 반납한다."""
+    from backend import archive
+
+    return archive.open_archives(date_from, date_to, _resolve_db_path())
+
 
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    return conn
+def _write(fn: Callable[[sqlite3.Connection], Any], *, wait: bool = True, label: str = "write") -> Any:
+    """쓰기 함수 fn(conn)을 단일 쓰기 스레드로 보낸다(스레드가 없으면 현재 스레드에서 커밋).
+
+    fn은 열린 쓰기 트랜잭션 안에서 실행되며 commit()하지 않는다.
+    """
+    return run_write(_resolve_db_path(), fn, wait=wait, label=label)
+
+
+# 기사 시각(UTC epoch초). 기존 기사 목록 정렬 COALESCE(pub_date, date, created_at)와 같은 우선순위다.
+# pub_date가 없는 행은 적재 시각보다 기사 날짜(00:00:00)를 먼저 보므로, 예전 시각 조건
+# (pub_date → created_at → date)을 쓰던 보존 정리·/health 24시간 건수·compare DB 조회도 이 기준을 따른다.
+_ARTICLE_EVENT_TS_SQL = (
+    "CAST(strftime('%s', COALESCE(NULLIF({pub_date}, ''), NULLIF({date}, '') || ' 00:00:00', NULLIF({created_at}, ''))) AS INTEGER)"
+)
+# 분석 스토어 월 파티션 키(YYYY-MM, 형식이 다른 date는 'other')
+_ARTICLE_MONTH_SQL = "CASE WHEN {date} GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]*' THEN substr({date}, 1, 7) ELSE 'other' END"
+_ARTICLE_FTS_BODY_SQL = "LOWER(COALESCE({row}.title_clean, '') || ' ' || COALESCE({row}.description_clean, ''))"
 
 
 def init_db() -> None:
+    """스키마 마이그레이션 적용 후 파생 색인/태그/롤업의 누락분만 증분 보정한다.
+
+    적용이 끝난 DB에서는 버전 확인과 색인/메타 조회뿐이라 기사 수와 무관하게 빠르게 끝난다.
+    """
     conn = _connect()
     try:
+        changed = bool(_apply_schema_migrations(conn))
+        # 트리거 도입 이전 기사를 증분 색인한다.
         conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS articles (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                company TEXT NOT NULL,
-                title_clean TEXT NOT NULL,
-                description_clean TEXT,
-                originallink TEXT,
-                link TEXT,
-                outlet TEXT,
-                pub_date TEXT,
-                date TEXT,
-                sentiment TEXT,
-                is_test INTEGER NOT NULL DEFAULT 0,
-                content_hash TEXT NOT NULL UNIQUE,
-                created_at TEXT NOT NULL
-            )
+            f"""
+            INSERT INTO articles_fts (rowid, body)
+            SELECT id, {_ARTICLE_FTS_BODY_SQL.format(row="articles")}
+            FROM articles
+            WHERE id > (SELECT COALESCE(MAX(rowid), 0) FROM articles_fts)
             """
         )
-        cols = {r["name"] for r in conn.execute("PRAGMA table_info(articles)").fetchall()}
-        if "outlet" not in cols:
-            conn.execute("ALTER TABLE articles ADD COLUMN outlet TEXT")
-        if "source_group_id" not in cols:
-            conn.execute("ALTER TABLE articles ADD COLUMN source_group_id TEXT")
-        if "is_test" not in cols:
-            conn.execute("ALTER TABLE articles ADD COLUMN is_test INTEGER NOT NULL DEFAULT 0")
+        # 색인 도입 이전 기사(또는 색인 이후 추가된 누락분)를 증분 색인한다.
+        last_indexed = conn.execute("SELECT COALESCE(MAX(article_id), 0) AS last_id FROM title_lsh_index").fetchone()
+        _index_article_titles(conn, after_id=int(last_indexed["last_id"] or 0))
+        # IP_RULES/RISK_THEME_RULES가 바뀌었거나 태그 도입 이전 DB면 전체 재태깅한다.
+        if not article_tags_ready(conn):
+            _retag_articles(conn)
+            changed = True
+        if _get_storage_meta(conn, "article_daily_rollup_fingerprint") != _daily_rollup_fingerprint():
+            _rebuild_daily_rollup(conn)
+        else:
+            _refresh_daily_rollup(conn)
+        if changed:
+            _bump_data_version(conn)
+            _bump_data_version(conn, "risk_timeseries")
+        conn.commit()
+    finally:
+        conn.close()
 
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS source_groups (
-                group_id TEXT PRIMARY KEY,
-                canonical_article_id INTEGER,
-                repost_count INTEGER NOT NULL DEFAULT 1,
-                first_seen_at TEXT NOT NULL,
-                last_seen_at TEXT NOT NULL,
-                FOREIGN KEY(canonical_article_id) REFERENCES articles(id) ON DELETE SET NULL
-            )
-            """
+
+def _migrate_base_schema(conn: sqlite3.Connection) -> None:
+    """테이블/컬럼/트리거/색인 생성. 모두 IF NOT EXISTS라 버전 도입 이전 DB에도 그대로 적용된다."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            company TEXT NOT NULL,
+            title_clean TEXT NOT NULL,
+            description_clean TEXT,
+            originallink TEXT,
+            link TEXT,
+            outlet TEXT,
+            pub_date TEXT,
+            date TEXT,
+            sentiment TEXT,
+            is_test INTEGER NOT NULL DEFAULT 0,
+            content_hash TEXT NOT NULL UNIQUE,
+            created_at TEXT NOT NULL
         )
+        """
+    )
+    cols = {r["name"] for r in conn.execute("PRAGMA table_info(articles)").fetchall()}
+    if "outlet" not in cols:
+        conn.execute("ALTER TABLE articles ADD COLUMN outlet TEXT")
+    if "source_group_id" not in cols:
+        conn.execute("ALTER TABLE articles ADD COLUMN source_group_id TEXT")
+    if "is_test" not in cols:
+        conn.execute("ALTER TABLE articles ADD COLUMN is_test INTEGER NOT NULL DEFAULT 0")
+    if "event_ts" not in cols:
+        conn.execute("ALTER TABLE articles ADD COLUMN event_ts INTEGER")
 
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sentiment_results (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                article_id INTEGER NOT NULL,
-                source_group_id TEXT,
-                sentiment_score REAL NOT NULL,
-                sentiment_label TEXT NOT NULL,
-                confidence REAL NOT NULL,
-                method TEXT NOT NULL,
-                analyzed_at TEXT NOT NULL,
-                FOREIGN KEY(article_id) REFERENCES articles(id) ON DELETE CASCADE,
-                FOREIGN KEY(source_group_id) REFERENCES source_groups(group_id) ON DELETE SET NULL
-            )
-            """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS source_groups (
+            group_id TEXT PRIMARY KEY,
+            canonical_article_id INTEGER,
+            repost_count INTEGER NOT NULL DEFAULT 1,
+            first_seen_at TEXT NOT NULL,
+            last_seen_at TEXT NOT NULL,
+            FOREIGN KEY(canonical_article_id) REFERENCES articles(id) ON DELETE SET NULL
         )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS risk_timeseries (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ip_id TEXT NOT NULL,
-                ts TEXT NOT NULL,
-                risk_raw REAL NOT NULL,
-                risk_score REAL NOT NULL,
-                issue_heat REAL NOT NULL DEFAULT 0,
-                s_comp REAL NOT NULL,
-                v_comp REAL NOT NULL,
-                t_comp REAL NOT NULL,
-                m_comp REAL NOT NULL,
-                alert_level TEXT NOT NULL,
-                sample_size INTEGER NOT NULL,
-                uncertain_ratio REAL NOT NULL,
-                quality_flag TEXT NOT NULL DEFAULT 'OK',
-                risk_formula_version TEXT NOT NULL DEFAULT 'v1'
-            )
-            """
+        """
+    )
+
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS sentiment_results (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            article_id INTEGER NOT NULL,
+            source_group_id TEXT,
+            sentiment_score REAL NOT NULL,
+            sentiment_label TEXT NOT NULL,
+            confidence REAL NOT NULL,
+            method TEXT NOT NULL,
+            analyzed_at TEXT NOT NULL,
+            FOREIGN KEY(article_id) REFERENCES articles(id) ON DELETE CASCADE,
+            FOREIGN KEY(source_group_id) REFERENCES source_groups(group_id) ON DELETE SET NULL
         )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS burst_events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ip_name TEXT NOT NULL,
-                event_type TEXT NOT NULL,
-                trigger_reason TEXT NOT NULL,
-                risk_at_event REAL NOT NULL,
-                occurred_at TEXT NOT NULL
-            )
-            """
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS risk_timeseries (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ip_id TEXT NOT NULL,
+            ts TEXT NOT NULL,
+            risk_raw REAL NOT NULL,
+            risk_score REAL NOT NULL,
+            issue_heat REAL NOT NULL DEFAULT 0,
+            s_comp REAL NOT NULL,
+            v_comp REAL NOT NULL,
+            t_comp REAL NOT NULL,
+            m_comp REAL NOT NULL,
+            alert_level TEXT NOT NULL,
+            sample_size INTEGER NOT NULL,
+            uncertain_ratio REAL NOT NULL,
+            quality_flag TEXT NOT NULL DEFAULT 'OK',
+            risk_formula_version TEXT NOT NULL DEFAULT 'v1'
         )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS scheduler_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id TEXT NOT NULL,
-                run_time TEXT NOT NULL,
-                status TEXT NOT NULL,
-                error_message TEXT
+        """
+    )
+    # IP별 최신 리스크 계산 결과(스케줄러 모니터 틱이 갱신, /api/risk-score가 조회)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS risk_snapshots (
+            ip_id TEXT NOT NULL,
+            window_hours INTEGER NOT NULL,
+            include_test INTEGER NOT NULL,
+            payload TEXT NOT NULL,
+            computed_at TEXT NOT NULL,
+            PRIMARY KEY (ip_id, window_hours, include_test)
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS burst_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ip_name TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            trigger_reason TEXT NOT NULL,
+            risk_at_event REAL NOT NULL,
+            occurred_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS scheduler_logs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            run_time TEXT NOT NULL,
+            status TEXT NOT NULL,
+            error_message TEXT
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS risk_daily_summary (
+            ip_id TEXT NOT NULL,
+            date TEXT NOT NULL,
+            avg_risk REAL NOT NULL,
+            max_risk REAL NOT NULL,
+            article_count INTEGER NOT NULL,
+            sample_size_avg REAL NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (ip_id, date)
+        )
+        """
+    )
+
+    sentiment_cols = {r["name"] for r in conn.execute("PRAGMA table_info(sentiment_results)").fetchall()}
+    if "source_group_id" not in sentiment_cols:
+        conn.execute("ALTER TABLE sentiment_results ADD COLUMN source_group_id TEXT")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS title_lsh_index (
+            band_key INTEGER NOT NULL,
+            company TEXT NOT NULL,
+            date TEXT NOT NULL,
+            article_id INTEGER NOT NULL,
+            FOREIGN KEY(article_id) REFERENCES articles(id) ON DELETE CASCADE
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS storage_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS article_tags (
+            article_id INTEGER NOT NULL,
+            tag_type TEXT NOT NULL,
+            tag TEXT NOT NULL,
+            is_primary INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (article_id, tag_type, tag),
+            FOREIGN KEY(article_id) REFERENCES articles(id) ON DELETE CASCADE
+        ) WITHOUT ROWID
+        """
+    )
+    # IP 키워드 필터용 본문 색인(LOWER(제목 || ' ' || 요약)), rowid = articles.id
+    conn.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts
+        USING fts5(body, tokenize = 'trigram case_sensitive 1')
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_articles_fts_insert AFTER INSERT ON articles BEGIN
+            INSERT INTO articles_fts (rowid, body) VALUES (new.id, {_ARTICLE_FTS_BODY_SQL.format(row="new")});
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_articles_fts_delete AFTER DELETE ON articles BEGIN
+            DELETE FROM articles_fts WHERE rowid = old.id;
+        END
+        """
+    )
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_articles_fts_update AFTER UPDATE OF title_clean, description_clean ON articles BEGIN
+            UPDATE articles_fts SET body = {_ARTICLE_FTS_BODY_SQL.format(row="new")} WHERE rowid = new.id;
+        END
+        """
+    )
+    # 대시보드 일별 롤업: ip=''는 전체 범위, theme=''는 기사당 1행(기본 행)이다.
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS article_daily_rollup (
+            company TEXT NOT NULL,
+            ip TEXT NOT NULL,
+            date TEXT NOT NULL,
+            outlet TEXT NOT NULL,
+            theme TEXT NOT NULL,
+            sentiment TEXT NOT NULL,
+            primary_ip TEXT NOT NULL,
+            article_count INTEGER NOT NULL,
+            first_article_id INTEGER NOT NULL,
+            PRIMARY KEY (company, ip, date, outlet, theme, sentiment, primary_ip)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS article_daily_rollup_groups (
+            company TEXT NOT NULL,
+            ip TEXT NOT NULL,
+            date TEXT NOT NULL,
+            group_id TEXT NOT NULL,
+            article_count INTEGER NOT NULL,
+            PRIMARY KEY (company, ip, date, group_id)
+        ) WITHOUT ROWID
+        """
+    )
+    # 기사 삭제/수정으로 다시 집계해야 하는 (company, date)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS article_daily_rollup_dirty (
+            company TEXT NOT NULL,
+            date TEXT NOT NULL,
+            PRIMARY KEY (company, date)
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_articles_rollup_delete AFTER DELETE ON articles BEGIN
+            INSERT OR IGNORE INTO article_daily_rollup_dirty (company, date) VALUES (old.company, COALESCE(old.date, ''));
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_articles_rollup_update
+        AFTER UPDATE OF company, date, outlet, sentiment, is_test, source_group_id ON articles BEGIN
+            INSERT OR IGNORE INTO article_daily_rollup_dirty (company, date) VALUES (old.company, COALESCE(old.date, ''));
+            INSERT OR IGNORE INTO article_daily_rollup_dirty (company, date) VALUES (new.company, COALESCE(new.date, ''));
+        END
+        """
+    )
+    risk_cols = {r["name"] for r in conn.execute("PRAGMA table_info(risk_timeseries)").fetchall()}
+    if "quality_flag" not in risk_cols:
+        conn.execute("ALTER TABLE risk_timeseries ADD COLUMN quality_flag TEXT NOT NULL DEFAULT 'OK'")
+    if "issue_heat" not in risk_cols:
+        conn.execute("ALTER TABLE risk_timeseries ADD COLUMN issue_heat REAL NOT NULL DEFAULT 0")
+    if "risk_formula_version" not in risk_cols:
+        conn.execute("ALTER TABLE risk_timeseries ADD COLUMN risk_formula_version TEXT NOT NULL DEFAULT 'v1'")
+
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_company ON articles(company)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_company_test_date ON articles(company, is_test, date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_sentiment ON articles(sentiment)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_pub_date ON articles(pub_date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_test_event_ts ON articles(is_test, event_ts)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_articles_company_test_event_ts ON articles(company, is_test, event_ts)"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_test_created ON articles(is_test, created_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_outlet ON articles(outlet)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_source_group ON articles(source_group_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_source_groups_canonical ON source_groups(canonical_article_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_source_groups_last_seen ON source_groups(last_seen_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_article ON sentiment_results(article_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_group ON sentiment_results(source_group_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_method ON sentiment_results(method)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_analyzed_at ON sentiment_results(analyzed_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_risk_ip_ts ON risk_timeseries(ip_id, ts)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_risk_daily_date ON risk_daily_summary(date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_burst_ip_time ON burst_events(ip_name, occurred_at)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_scheduler_job_time ON scheduler_logs(job_id, run_time)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_title_lsh_lookup ON title_lsh_index(company, band_key, date)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_title_lsh_article ON title_lsh_index(article_id)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_article_tags_lookup ON article_tags(tag_type, tag, article_id)")
+
+
+def _migrate_sentiment_labels(conn: sqlite3.Connection) -> None:
+    """v2 sentiment: uncertain 라벨 제거(3-class 고정), 기사 라벨을 한글 3-class로 정규화."""
+    conn.execute(
+        """
+        UPDATE sentiment_results
+        SET sentiment_label = 'neutral'
+        WHERE sentiment_label = 'uncertain'
+        """
+    )
+    # 기사 라벨도 3-class 한글 라벨로 정규화(수집 기사 목록 표시값 정합성)
+    conn.execute(
+        """
+        UPDATE articles
+        SET sentiment = CASE
+            WHEN sentiment IN ('긍정', '중립', '부정') THEN sentiment
+            WHEN lower(COALESCE(sentiment, '')) = 'positive' THEN '긍정'
+            WHEN lower(COALESCE(sentiment, '')) = 'negative' THEN '부정'
+            WHEN sentiment = '불확실' OR lower(COALESCE(sentiment, '')) IN ('neutral', 'uncertain') THEN '중립'
+            ELSE '중립'
+        END
+        WHERE sentiment IS NULL OR sentiment NOT IN ('긍정', '중립', '부정')
+        """
+    )
+
+
+def _migrate_risk_timeseries_unique(conn: sqlite3.Connection) -> None:
+    """(ip_id, ts) 중복 이력을 최신 1건만 남기고 UNIQUE 색인을 건다(이후 적재는 UPSERT)."""
+    conn.execute(
+        """
+        DELETE FROM risk_timeseries
+        WHERE id NOT IN (
+            SELECT MAX(id)
+            FROM risk_timeseries
+            GROUP BY ip_id, ts
+        )
+        """
+    )
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS uq_risk_ip_ts ON risk_timeseries(ip_id, ts)")
+
+
+def _migrate_event_ts_backfill(conn: sqlite3.Connection) -> None:
+    """event_ts 컬럼 추가 이전 행 보정(이후 적재분은 INSERT 시 계산)."""
+    conn.execute(
+        "UPDATE articles SET event_ts = "
+        + _ARTICLE_EVENT_TS_SQL.format(pub_date="pub_date", created_at="created_at", date="date")
+        + " WHERE event_ts IS NULL"
+    )
+
+
+def _migrate_article_keyset_indexes(conn: sqlite3.Connection) -> None:
+    """기사 목록 커서 페이지네이션((event_ts, id) 내림차순)용 색인. rowid(id)는 색인 끝에 포함된다."""
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_event_ts ON articles(event_ts)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_company_event_ts ON articles(company, event_ts)")
+
+
+def _migrate_analytics_dirty_months(conn: sqlite3.Connection) -> None:
+    """Parquet 분석 스토어(backend.analytics_store)의 재작성 대상 월 표시.
+
+    이미 내보낸 기사가 삭제/수정되면 해당 월을 표시하고 seq를 올린다. 스토어 갱신 작업은
+    읽은 시점의 seq와 같을 때만 표시를 지워, 갱신 중 다시 바뀐 월을 놓치지 않는다.
+    (AUTOINCREMENT라 신규 기사는 워터마크 id 이후로만 들어오므로 INSERT는 표시하지 않는다.)
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS analytics_dirty_months (
+            month TEXT PRIMARY KEY,
+            seq INTEGER NOT NULL DEFAULT 1
+        ) WITHOUT ROWID
+        """
+    )
+    mark = """
+            INSERT INTO analytics_dirty_months (month, seq) VALUES ({month}, 1)
+            ON CONFLICT(month) DO UPDATE SET seq = seq + 1;
+    """
+    conn.execute(
+        "CREATE TRIGGER IF NOT EXISTS trg_articles_analytics_delete AFTER DELETE ON articles BEGIN"
+        + mark.format(month=_ARTICLE_MONTH_SQL.format(date="old.date"))
+        + "END"
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_articles_analytics_update
+        AFTER UPDATE OF company, date, outlet, sentiment, is_test, source_group_id, title_clean, description_clean
+        ON articles BEGIN"""
+        + mark.format(month=_ARTICLE_MONTH_SQL.format(date="old.date"))
+        + mark.format(month=_ARTICLE_MONTH_SQL.format(date="new.date"))
+        + "END"
+    )
+
+
+def _migrate_group_sentiment_latest(conn: sqlite3.Connection) -> None:
+    """그룹·방식별 최신 감성 결과 1건(analyzed_at, id 최댓값)을 sentiment_results 트리거로 유지한다.
+
+    리스크/백테스트는 그룹 id 목록을 이 표와 조인해 읽고, 최신이 아닌 sentiment_results 행은
+    compact_sentiment_results()가 지운다. 최신 행이 삭제/수정되면 남은 행에서 다시 고른다.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS group_sentiment_latest (
+            source_group_id TEXT NOT NULL,
+            method TEXT NOT NULL,
+            result_id INTEGER NOT NULL,
+            sentiment_score REAL NOT NULL,
+            sentiment_label TEXT NOT NULL,
+            confidence REAL NOT NULL,
+            analyzed_at TEXT NOT NULL,
+            PRIMARY KEY (source_group_id, method)
+        ) WITHOUT ROWID
+        """
+    )
+    # 최신 행을 다시 고를 때 정렬 없이 색인 끝 1건만 읽는다(method 단독 색인으로 빠지지 않게).
+    # 그룹 단독 색인은 이 색인의 앞부분과 같아 지운다.
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sentiment_group_method_latest "
+        "ON sentiment_results(source_group_id, method, analyzed_at, id)"
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_sentiment_group")
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO group_sentiment_latest (
+            source_group_id, method, result_id, sentiment_score, sentiment_label, confidence, analyzed_at
+        )
+        SELECT source_group_id, method, id, sentiment_score, sentiment_label, confidence, analyzed_at
+        FROM (
+            SELECT
+                *,
+                ROW_NUMBER() OVER (
+                    PARTITION BY source_group_id, method ORDER BY analyzed_at DESC, id DESC
+                ) AS rn
+            FROM sentiment_results
+            WHERE COALESCE(source_group_id, '') != ''
+        )
+        WHERE rn = 1
+        """
+    )
+    recompute = """
+            DELETE FROM group_sentiment_latest WHERE source_group_id = {row}.source_group_id AND method = {row}.method;
+            INSERT INTO group_sentiment_latest (
+                source_group_id, method, result_id, sentiment_score, sentiment_label, confidence, analyzed_at
             )
-            """
+            SELECT source_group_id, method, id, sentiment_score, sentiment_label, confidence, analyzed_at
+            FROM sentiment_results
+            WHERE source_group_id = {row}.source_group_id AND method = {row}.method
+            ORDER BY analyzed_at DESC, id DESC
+            LIMIT 1;
+    """
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_sentiment_latest_insert AFTER INSERT ON sentiment_results
+        WHEN COALESCE(new.source_group_id, '') != '' BEGIN
+            INSERT INTO group_sentiment_latest (
+                source_group_id, method, result_id, sentiment_score, sentiment_label, confidence, analyzed_at
+            ) VALUES (
+                new.source_group_id, new.method, new.id, new.sentiment_score, new.sentiment_label,
+                new.confidence, new.analyzed_at
+            )
+            ON CONFLICT(source_group_id, method) DO UPDATE SET
+                result_id = excluded.result_id,
+                sentiment_score = excluded.sentiment_score,
+                sentiment_label = excluded.sentiment_label,
+                confidence = excluded.confidence,
+                analyzed_at = excluded.analyzed_at
+            WHERE (excluded.analyzed_at, excluded.result_id)
+                > (group_sentiment_latest.analyzed_at, group_sentiment_latest.result_id);
+        END
+        """
+    )
+    # 최신이 아닌 행 삭제(정리 작업)는 표를 건드리지 않는다.
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_sentiment_latest_delete AFTER DELETE ON sentiment_results
+        WHEN EXISTS (
+            SELECT 1 FROM group_sentiment_latest
+            WHERE source_group_id = old.source_group_id AND method = old.method AND result_id = old.id
+        ) BEGIN"""
+        + recompute.format(row="old")
+        + "END"
+    )
+    # source_groups 삭제 시 FK(ON DELETE SET NULL)로 그룹 id가 비는 경우도 여기서 처리된다.
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_sentiment_latest_update
+        AFTER UPDATE OF source_group_id, method, sentiment_score, sentiment_label, confidence, analyzed_at
+        ON sentiment_results BEGIN"""
+        + recompute.format(row="old")
+        + recompute.format(row="new")
+        + "END"
+    )
+
+
+def _migrate_data_version(conn: sqlite3.Connection) -> None:
+    """조회 결과 캐시(backend.read_cache)의 무효화 기준이 되는 데이터 버전.
+
+    기사/태그/재배포 그룹을 바꾸는 쓰기 경로(적재, 정리, 아카이브 이동, 재태깅, 점검기 보정)가
+    커밋 전에 트랜잭션마다 한 번 _bump_data_version()으로 version을 올린다.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS data_version (
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        """
+    )
+    conn.execute("INSERT OR IGNORE INTO data_version (name, version) VALUES ('articles', 0)")
+
+
+def _migrate_risk_timeseries_version(conn: sqlite3.Connection) -> None:
+    """리스크 시계열 쓰기(모니터 틱 기록, 보존 정리)마다 오르는 버전(HTTP ETag용).
+
+    기사 버전과 따로 두어 모니터 틱이 기사 조회 캐시를 무효화하지 않게 한다.
+    """
+    conn.execute("INSERT OR IGNORE INTO data_version (name, version) VALUES ('risk_timeseries', 0)")
+
+
+def _bump_data_version(conn: sqlite3.Connection, name: str = "articles") -> None:
+    """name 데이터를 바꾼 쓰기 트랜잭션에서 커밋 전에 한 번 호출한다(조회 캐시/ETag 무효화)."""
+    conn.execute("UPDATE data_version SET version = version + 1 WHERE name = ?", (name,))
+
+
+# (버전, 이름, 적용 함수). 번호 순으로 한 번씩만 적용하며 이미 배포된 항목은 수정하지 않고 새 번호를 추가한다.
+_SCHEMA_MIGRATIONS: list[tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "base_schema", _migrate_base_schema),
+    (2, "sentiment_3class_labels", _migrate_sentiment_labels),
+    (3, "risk_timeseries_unique_ip_ts", _migrate_risk_timeseries_unique),
+    (4, "articles_event_ts_backfill", _migrate_event_ts_backfill),
+    (5, "articles_keyset_indexes", _migrate_article_keyset_indexes),
+    (6, "analytics_dirty_months", _migrate_analytics_dirty_months),
+    (7, "group_sentiment_latest", _migrate_group_sentiment_latest),
+    (8, "data_version", _migrate_data_version),
+    (9, "risk_timeseries_data_version", _migrate_risk_timeseries_version),
+]
+SCHEMA_VERSION = _SCHEMA_MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    try:
+        row = conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations").fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return int(row[0] or 0)
+
+
+def _apply_schema_migrations(conn: sqlite3.Connection) -> list[int]:
+    """미적용 마이그레이션을 한 트랜잭션으로 적용하고 적용한 버전 목록을 반환한다."""
+    if get_schema_version(conn) >= SCHEMA_VERSION:
+        return []
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name TEXT NOT NULL,
+            applied_at TEXT NOT NULL
         )
-        conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS risk_daily_summary (
-                ip_id TEXT NOT NULL,
-                date TEXT NOT NULL,
-                avg_risk REAL NOT NULL,
-                max_risk REAL NOT NULL,
-                article_count INTEGER NOT NULL,
-                sample_size_avg REAL NOT NULL,
-                updated_at TEXT NOT NULL,
-                PRIMARY KEY (ip_id, date)
+        """
+    )
+    # 여러 프로세스가 동시에 기동해도 쓰기 잠금을 먼저 잡은 쪽만 적용한다.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        applied_versions = {int(r[0]) for r in conn.execute("SELECT version FROM schema_migrations").fetchall()}
+        applied: list[int] = []
+        for version, name, migrate in _SCHEMA_MIGRATIONS:
+            if version in applied_versions:
+                continue
+            migrate(conn)
+            conn.execute(
+                "INSERT INTO schema_migrations (version, name, applied_at) VALUES (?, ?, ?)",
+                (version, name, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
             )
-            """
+            applied.append(version)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    if applied:
+        logger.info("schema migrations applied: %s", applied)
+    return applied
+
+
+def _get_storage_meta(conn: sqlite3.Connection, key: str) -> str | None:
+    try:
+        row = conn.execute("SELECT value FROM storage_meta WHERE key = ?", (key,)).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return str(row["value"]) if row else None
+
+
+def _set_storage_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+    conn.execute(
+        """
+        INSERT INTO storage_meta (key, value, updated_at) VALUES (?, ?, ?)
+        ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+        """,
+        (key, value, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+    )
+
+
+def get_data_version(conn: sqlite3.Connection, name: str = "articles") -> int | None:
+    """name 쓰기마다 오르는 버전('articles': 기사/태그/재배포 그룹, 'risk_timeseries'). 마이그레이션 전 DB면 None."""
+    try:
+        row = conn.execute("SELECT version FROM data_version WHERE name = ?", (name,)).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return int(row[0]) if row else None
+
+
+def current_data_version(name: str = "articles") -> tuple[str, int] | None:
+    """활성 DB의 (경로, 데이터 버전). 조회 결과 캐시 키와 HTTP ETag에 쓴다."""
+    conn = _connect_readonly()
+    try:
+        version = get_data_version(conn, name)
+    finally:
+        conn.close()
+    return None if version is None else (str(_resolve_db_path()), version)
+
+
+_cached_read = read_cache.memoize(current_data_version)
+
+
+def _index_article_titles(conn: sqlite3.Connection, after_id: int = 0) -> int:
+    rows = conn.execute(
+        """
+        SELECT id, company, date, title_clean
+        FROM articles
+        WHERE id > ?
+        ORDER BY id
+        """,
+        (int(after_id),),
+    ).fetchall()
+    entries: list[tuple[int, str, str, int]] = []
+    for r in rows:
+        bands = _title_band_keys(_normalize_title(str(r["title_clean"] or "")))
+        entries.extend((key, str(r["company"]), str(r["date"] or ""), int(r["id"])) for key in bands)
+    conn.executemany(
+        "INSERT INTO title_lsh_index (band_key, company, date, article_id) VALUES (?, ?, ?, ?)",
+        entries,
+    )
+    if rows:
+        logger.info("title_lsh_index backfilled articles=%s", len(rows))
+    return len(rows)
+
+
+def _article_tag_fingerprint() -> str:
+    rules = {
+        "ip": [[name, list(meta.get("keywords", []) or [])] for name, meta in IP_RULES.items() if meta.get("slug") != "all"],
+        "theme": [[theme, list(kws)] for theme, kws in RISK_THEME_RULES.items()],
+    }
+    return hashlib.sha1(json.dumps(rules, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def article_tags_ready(conn: sqlite3.Connection) -> bool:
+    """저장된 태그가 현재 IP_RULES/RISK_THEME_RULES로 만들어졌는지 확인."""
+    return _get_storage_meta(conn, "article_tags_fingerprint") == _article_tag_fingerprint()
+
+
+def _article_tag_rows(title: str, desc: str) -> list[tuple[str, str, int]]:
+    """(tag_type, tag, is_primary) 목록. 대표 태그는 규칙 순서상 첫 매칭 항목이다."""
+    text = f"{title or ''} {desc or ''}"
+    out: list[tuple[str, str, int]] = []
+    for tag_type, tags in (("ip", detect_ip_tags(text)), ("theme", detect_theme_tags(text))):
+        out.extend((tag_type, tag, 1 if i == 0 else 0) for i, tag in enumerate(tags))
+    return out
+
+
+def _rewrite_article_tags(conn: sqlite3.Connection) -> tuple[int, int]:
+    """article_tags를 현재 규칙으로 다시 쓴다(운영 DB/아카이브 공통). (기사 수, 태그 수) 반환."""
+    conn.execute("DELETE FROM article_tags")
+    rows = conn.execute("SELECT id, title_clean, description_clean FROM articles").fetchall()
+    entries: list[tuple[int, str, str, int]] = []
+    for r in rows:
+        tags = _article_tag_rows(str(r["title_clean"] or ""), str(r["description_clean"] or ""))
+        entries.extend((int(r["id"]), tag_type, tag, is_primary) for tag_type, tag, is_primary in tags)
+    conn.executemany(
+        "INSERT INTO article_tags (article_id, tag_type, tag, is_primary) VALUES (?, ?, ?, ?)",
+        entries,
+    )
+    _set_storage_meta(conn, "article_tags_fingerprint", _article_tag_fingerprint())
+    return len(rows), len(entries)
+
+
+def _retag_articles(conn: sqlite3.Connection) -> int:
+    tagged, tag_count = _rewrite_article_tags(conn)
+    # 태그만 바뀌어 기사 트리거가 돌지 않으므로 분석 스토어의 모든 월을 재작성 대상으로 표시한다.
+    conn.execute(
+        f"""
+        INSERT INTO analytics_dirty_months (month, seq)
+        SELECT DISTINCT {_ARTICLE_MONTH_SQL.format(date="date")}, 1 FROM articles WHERE 1 = 1
+        ON CONFLICT(month) DO UPDATE SET seq = seq + 1
+        """
+    )
+    if tagged:
+        logger.info("article_tags rebuilt articles=%s tags=%s", tagged, tag_count)
+    # 롤업은 태그 기준으로 집계되므로 함께 다시 만든다.
+    _rebuild_daily_rollup(conn)
+    return tagged
+
+
+DAILY_ROLLUP_VERSION = "v1"
+
+
+def _daily_rollup_fingerprint() -> str:
+    return f"{DAILY_ROLLUP_VERSION}:{_article_tag_fingerprint()}"
+
+
+def _daily_rollup_cte(scope_sql: str) -> str:
+    # 기사 1건은 (전체 + 소속 IP) x (기본 행 + 소속 테마) 조합으로 펼쳐 집계된다.
+    # ip_scope가 기사 컬럼을 그대로 들고 있어야 색인 없는 CTE끼리의 중첩 스캔(O(n^2))을 피한다.
+    return f"""
+        WITH scoped AS (
+            SELECT a.id, a.company, a.date,
+                   COALESCE(NULLIF(a.outlet, ''), 'unknown') AS outlet,
+                   COALESCE(a.sentiment, '') AS sentiment,
+                   COALESCE(NULLIF(a.source_group_id, ''), 'legacy:' || a.id) AS group_id,
+                   COALESCE(
+                       (SELECT t.tag FROM article_tags t
+                        WHERE t.article_id = a.id AND t.tag_type = 'ip' AND t.is_primary = 1),
+                       '기타'
+                   ) AS primary_ip
+            FROM articles a
+            WHERE a.is_test = 0 AND a.date IS NOT NULL AND ({scope_sql})
+        ),
+        ip_scope AS (
+            SELECT s.*, '' AS ip FROM scoped s
+            UNION ALL
+            SELECT s.*, t.tag FROM scoped s JOIN article_tags t ON t.article_id = s.id WHERE t.tag_type = 'ip'
+        ),
+        theme_scope AS (
+            SELECT id, '' AS theme FROM scoped
+            UNION ALL
+            SELECT t.article_id, t.tag FROM article_tags t JOIN scoped s ON s.id = t.article_id WHERE t.tag_type = 'theme'
         )
+    """
 
-        sentiment_cols = {r["name"] for r in conn.execute("PRAGMA table_info(sentiment_results)").fetchall()}
-        if "source_group_id" not in sentiment_cols:
-            conn.execute("ALTER TABLE sentiment_results ADD COLUMN source_group_id TEXT")
-        # v2 sentiment migration: uncertain 라벨 제거(3-class 고정)
-        conn.execute(
-            """
-            UPDATE sentiment_results
-            SET sentiment_label = 'neutral'
-            WHERE sentiment_label = 'uncertain'
-            """
-        )
-        # 기사 라벨도 3-class 한글 라벨로 정규화(수집 기사 목록 표시값 정합성)
-        conn.execute(
-            """
-            UPDATE articles
-            SET sentiment = CASE
-                WHEN sentiment IN ('긍정', '중립', '부정') THEN sentiment
-                WHEN lower(COALESCE(sentiment, '')) = 'positive' THEN '긍정'
-                WHEN lower(COALESCE(sentiment, '')) = 'negative' THEN '부정'
-                WHEN sentiment = '불확실' OR lower(COALESCE(sentiment, '')) IN ('neutral', 'uncertain') THEN '중립'
-                ELSE '중립'
-            END
-            """
+
+def _apply_daily_rollup(conn: sqlite3.Connection, scope_sql: str, params: list[Any]) -> None:
+    """scope_sql에 해당하는 기사(a)를 롤업에 더한다(기존 행은 누적)."""
+    conn.execute(
+        _daily_rollup_cte(scope_sql)
+        + """
+        INSERT INTO article_daily_rollup (
+            company, ip, date, outlet, theme, sentiment, primary_ip, article_count, first_article_id
         )
-        risk_cols = {r["name"] for r in conn.execute("PRAGMA table_info(risk_timeseries)").fetchall()}
-        if "quality_flag" not in risk_cols:
-            conn.execute("ALTER TABLE risk_timeseries ADD COLUMN quality_flag TEXT NOT NULL DEFAULT 'OK'")
-        if "issue_heat" not in risk_cols:
-            conn.execute("ALTER TABLE risk_timeseries ADD COLUMN issue_heat REAL NOT NULL DEFAULT 0")
-        if "risk_formula_version" not in risk_cols:
-            conn.execute("ALTER TABLE risk_timeseries ADD COLUMN risk_formula_version TEXT NOT NULL DEFAULT 'v1'")
+        SELECT i.company, i.ip, i.date, i.outlet, th.theme, i.sentiment, i.primary_ip, COUNT(1), MIN(i.id)
+        FROM ip_scope i
+        JOIN theme_scope th ON th.id = i.id
+        WHERE 1 = 1
+        GROUP BY i.company, i.ip, i.date, i.outlet, th.theme, i.sentiment, i.primary_ip
+        ON CONFLICT(company, ip, date, outlet, theme, sentiment, primary_ip) DO UPDATE SET
+            article_count = article_count + excluded.article_count,
+            first_article_id = MIN(first_article_id, excluded.first_article_id)
+        """,
+        params,
+    )
+    conn.execute(
+        _daily_rollup_cte(scope_sql)
+        + """
+        INSERT INTO article_daily_rollup_groups (company, ip, date, group_id, article_count)
+        SELECT i.company, i.ip, i.date, i.group_id, COUNT(1)
+        FROM ip_scope i
+        WHERE 1 = 1
+        GROUP BY i.company, i.ip, i.date, i.group_id
+        ON CONFLICT(company, ip, date, group_id) DO UPDATE SET
+            article_count = article_count + excluded.article_count
+        """,
+        params,
+    )
 
+
+def _refresh_daily_rollup(conn: sqlite3.Connection) -> int:
+    """삭제/수정 트리거가 표시한 (company, date)만 다시 집계한다."""
+    dirty = int(conn.execute("SELECT COUNT(1) FROM article_daily_rollup_dirty").fetchone()[0])
+    if not dirty:
+        return 0
+    for table in ("article_daily_rollup", "article_daily_rollup_groups"):
         conn.execute(
-            """
-            DELETE FROM risk_timeseries
-            WHERE id NOT IN (
-                SELECT MAX(id)
-                FROM risk_timeseries
-                GROUP BY ip_id, ts
-            )
+            f"""
+            DELETE FROM {table}
+            WHERE (company, date) IN (SELECT company, date FROM article_daily_rollup_dirty)
             """
         )
+    _apply_daily_rollup(conn, "(a.company, a.date) IN (SELECT company, date FROM article_daily_rollup_dirty)", [])
+    conn.execute("DELETE FROM article_daily_rollup_dirty")
+    _bump_articles_epoch(conn)
+    return dirty
+
+
+def _rebuild_daily_rollup(conn: sqlite3.Connection) -> None:
+    conn.execute("DELETE FROM article_daily_rollup")
+    conn.execute("DELETE FROM article_daily_rollup_groups")
+    conn.execute("DELETE FROM article_daily_rollup_dirty")
+    _apply_daily_rollup(conn, "1 = 1", [])
+    _set_storage_meta(conn, "article_daily_rollup_fingerprint", _daily_rollup_fingerprint())
+    _bump_articles_epoch(conn)
+
+
+def daily_rollup_ready(conn: sqlite3.Connection) -> bool:
+    """롤업이 현재 태그 규칙으로 만들어졌고 재집계 대기분이 없는지 확인."""
+    if _get_storage_meta(conn, "article_daily_rollup_fingerprint") != _daily_rollup_fingerprint():
+        return False
+    return conn.execute("SELECT 1 FROM article_daily_rollup_dirty LIMIT 1").fetchone() is None
+
+
+def rebuild_article_tags() -> int:
+    """IP/테마 태그를 현재 규칙으로 전체 재생성한다(규칙 변경 또는 수동 복구용)."""
+    conn = _connect()
+    try:
+        tagged = _retag_articles(conn)
+        _bump_data_version(conn)
+        conn.commit()
+        return tagged
+    finally:
+        conn.close()
+
 
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_company ON articles(company)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_company_test_date ON articles(company, is_test, date)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_sentiment ON articles(sentiment)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_pub_date ON articles(pub_date)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_outlet ON articles(outlet)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_source_group ON articles(source_group_id)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_source_groups_canonical ON source_groups(canonical_article_id)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_source_groups_last_seen ON source_groups(last_seen_at)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_article ON sentiment_results(article_id)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_group ON sentiment_results(source_group_id)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_method ON sentiment_results(method)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_sentiment_analyzed_at ON sentiment_results(analyzed_at)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_risk_ip_ts ON risk_timeseries(ip_id, ts)")
-        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS uq_risk_ip_ts ON risk_timeseries(ip_id, ts)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_risk_daily_date ON risk_daily_summary(date)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_burst_ip_time ON burst_events(ip_name, occurred_at)")
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_scheduler_job_time ON scheduler_logs(job_id, run_time)")
+def rebuild_title_lsh_index() -> int:
+    """제목 LSH 색인을 전체 재생성한다(TITLE_LSH_* 파라미터 변경 시)."""
+    conn = _connect()
+    try:
+        conn.execute("DELETE FROM title_lsh_index")
+        indexed = _index_article_titles(conn)
         conn.commit()
+        return indexed
     finally:
         conn.close()
 
@@ -382,6 +1103,32 @@ def _normalize_title(text: str) -> str:
     return "".join(ch for ch in t if ch.isalnum() or ch.isspace())
 
 
+def _title_band_keys(title_norm: str) -> list[int]:
+    """정규화 제목의 MinHash 서명을 밴드별 64bit 키로 접는다(빈 제목은 색인하지 않음)."""
+    if not title_norm:
+        return []
+    size = TITLE_LSH_SHINGLE
+    if len(title_norm) <= size:
+        shingles = {title_norm}
+    else:
+        shingles = {title_norm[i : i + size] for i in range(len(title_norm) - size + 1)}
+    hashed = np.array([zlib.crc32(sh.encode("utf-8")) % _TITLE_LSH_PRIME for sh in shingles], dtype=np.uint64)
+    # (a*x+b) mod p 는 a,x < 2^31 이므로 uint64에서 넘치지 않는다.
+    signature = ((np.outer(_TITLE_LSH_A, hashed) + _TITLE_LSH_B[:, None]) % _TITLE_LSH_PRIME).min(axis=1)
+    bands = signature.reshape(TITLE_LSH_BANDS, TITLE_LSH_ROWS)
+    keys: list[int] = []
+    for band in range(TITLE_LSH_BANDS):
+        digest = hashlib.blake2b(band.to_bytes(2, "big") + bands[band].tobytes(), digest_size=8).digest()
+        keys.append(int.from_bytes(digest, "big", signed=True))
+    return keys
+
+
+@lru_cache(maxsize=65536)
+def _normalize_title_cached(text: str) -> str:
+    # LSH 후보 검증 시 같은 기사 제목이 반복 조회되므로 정규화 결과를 재사용한다.
+    return _normalize_title(text)
+
+
 def _normalize_url(url: str) -> str:
     raw = (url or "").strip()
     if not raw:
@@ -462,122 +1209,124 @@ def _resolve_outlet_value(outlet: str, originallink: str, link: str) -> str:
     return _extract_outlet(originallink, link)
 
 
-def _is_near_duplicate(conn: sqlite3.Connection, company: str, title: str, date: str, source_group_id: str) -> bool:
-    """동일 회사/일자/소스그룹 내 유사 제목 중복 제거."""
-    title_norm = _normalize_title(title)
-    if not title_norm:
-        return False
+def _lookup_title_candidates(
+    conn: sqlite3.Connection,
+    company: str,
+    dates: set[str],
+    band_keys: list[int],
+) -> list[tuple[str, str]]:
+    """LSH 밴드가 하나라도 겹치는 기사를 (group_id, 정규화 제목)으로 최신순 조회."""
+    if not band_keys or not dates:
+        return []
+    key_ph = ",".join(["?"] * len(band_keys))
+    date_ph = ",".join(["?"] * len(dates))
+    params: list[Any] = [company, *band_keys, *sorted(dates), SYNDICATION_CANDIDATE_LIMIT]
     rows = conn.execute(
-        """
-        SELECT title_clean
-        FROM articles
-        WHERE company = ? AND date = ? AND COALESCE(source_group_id, '') = COALESCE(?, '')
-        ORDER BY id DESC
-        LIMIT 200
+        f"""
+        SELECT COALESCE(a.source_group_id, '') AS source_group_id, a.title_clean, MAX(a.id) AS last_id
+        FROM articles a
+        WHERE a.id IN (
+            SELECT t.article_id
+            FROM title_lsh_index t
+            WHERE t.company = ? AND t.band_key IN ({key_ph}) AND t.date IN ({date_ph})
+        )
+        AND COALESCE(a.source_group_id, '') != ''
+        GROUP BY COALESCE(a.source_group_id, ''), a.title_clean
+        ORDER BY last_id DESC
+        LIMIT ?
         """,
-        (company, date, source_group_id),
+        params,
     ).fetchall()
+    out: list[tuple[str, str]] = []
     for r in rows:
-        existing = _normalize_title(r["title_clean"])
-        if not existing:
-            continue
-        if title_norm == existing:
-            return True
-        if SequenceMatcher(None, title_norm, existing).ratio() >= 0.96:
-            return True
-    return False
+        existing_norm = _normalize_title_cached(str(r["title_clean"] or ""))
+        if existing_norm:
+            out.append((str(r["source_group_id"] or ""), existing_norm))
+    return out
 
 
-def _resolve_syndicated_group_id(
-    conn: sqlite3.Connection,
-    company: str,
-    title: str,
-    date: str,
+def _pick_syndicated_group_id(
+    title_norm: str,
+    candidates: list[tuple[str, str]],
     source_group_id: str,
+    threshold: float = SYNDICATION_RATIO_THRESHOLD,
 ) -> str:
-    """재배포 가능성이 높은 기사의 소스 그룹을 기존 그룹으로 정규화."""
-    if not source_group_id:
-        return source_group_id
-
-    exists = conn.execute("SELECT 1 FROM source_groups WHERE group_id = ? LIMIT 1", (source_group_id,)).fetchone()
-    if exists is not None:
-        return source_group_id
-
-    title_norm = _normalize_title(title)
-    if not title_norm or not date:
-        return source_group_id
-
-    try:
-        base_date = datetime.strptime(date, "%Y-%m-%d")
-    except ValueError:
-        return source_group_id
-
-    start_date = (base_date - timedelta(days=1)).strftime("%Y-%m-%d")
-    end_date = (base_date + timedelta(days=1)).strftime("%Y-%m-%d")
-    rows = conn.execute(
-        """
-        SELECT COALESCE(source_group_id, '') AS source_group_id, title_clean
-        FROM articles
-        WHERE company = ?
-          AND date BETWEEN ? AND ?
-          AND COALESCE(source_group_id, '') != ''
-        ORDER BY id DESC
-        LIMIT 500
-        """,
-        (company, start_date, end_date),
-    ).fetchall()
-
     best_gid = source_group_id
     best_ratio = 0.0
-    for r in rows:
-        gid = str(r["source_group_id"] or "")
-        if not gid:
-            continue
-        existing_norm = _normalize_title(str(r["title_clean"] or ""))
-        if not existing_norm:
-            continue
+    title_len = len(title_norm)
+    matcher = SequenceMatcher(None, title_norm, "")
+    for gid, existing_norm in candidates:
         if existing_norm == title_norm:
             return gid
-        ratio = SequenceMatcher(None, title_norm, existing_norm).ratio()
-        if ratio >= 0.985 and ratio > best_ratio:
+        # 길이 상한(2*min/(a+b))과 quick_ratio는 ratio의 상한이므로
+        # 임계값 미만 후보를 정확도 손실 없이 건너뛴다.
+        existing_len = len(existing_norm)
+        if 2.0 * min(title_len, existing_len) / (title_len + existing_len) < threshold:
+            continue
+        matcher.set_seq2(existing_norm)
+        if matcher.quick_ratio() < threshold:
+            continue
+        ratio = matcher.ratio()
+        if ratio >= threshold and ratio > best_ratio:
             best_ratio = ratio
             best_gid = gid
     return best_gid
 
 
-def _increment_group_repost(conn: sqlite3.Connection, source_group_id: str, now: str) -> None:
-    if not source_group_id:
-        return
-    row = conn.execute(
-        "SELECT repost_count FROM source_groups WHERE group_id = ?",
-        (source_group_id,),
-    ).fetchone()
-    if row is None:
-        existing_mentions = conn.execute(
-            "SELECT COUNT(1) AS cnt FROM articles WHERE COALESCE(source_group_id, '') = COALESCE(?, '')",
-            (source_group_id,),
-        ).fetchone()
-        base_count = int(existing_mentions["cnt"] or 0)
-        conn.execute(
-            """
-            INSERT INTO source_groups (group_id, canonical_article_id, repost_count, first_seen_at, last_seen_at)
-            VALUES (?, NULL, ?, ?, ?)
-            """,
-            (source_group_id, max(2, base_count + 1), now, now),
-        )
-        return
-    conn.execute(
-        """
-        UPDATE source_groups
-        SET repost_count = COALESCE(repost_count, 0) + 1,
-            last_seen_at = ?
-        WHERE group_id = ?
-        """,
-        (now, source_group_id),
-    )
+def _resolve_syndicated_group_ids(conn: sqlite3.Connection, rows: list[dict[str, Any]]) -> None:
+    """재배포 가능성이 높은 기사의 소스 그룹을 기존 그룹으로 정규화(청크 단위).
+
+    후보는 제목 LSH 밴드가 겹치는 기사만 조회하고 ratio로 최종 검증한다.
+    같은 청크에서 먼저 적재될 기사도 메모리 밴드 색인으로 후보에 포함한다.
+    """
+    gids = sorted({str(r["source_group_id"]) for r in rows if r["source_group_id"]})
+    known_groups: set[str] = set()
+    if gids:
+        placeholders = ",".join(["?"] * len(gids))
+        known_groups = {
+            str(r["group_id"])
+            for r in conn.execute(f"SELECT group_id FROM source_groups WHERE group_id IN ({placeholders})", gids)
+        }
+
+    batch_rows: list[tuple[str, str, str, str]] = []
+    batch_bands: dict[int, list[int]] = {}
+    for row in rows:
+        gid = str(row["source_group_id"] or "")
+        company = str(row["company"])
+        date = str(row["date"])
+        title_norm = str(row["title_norm"])
+        band_keys = row["title_bands"]
+        if gid and gid not in known_groups and title_norm and date:
+            near = _nearby_dates(date)
+            batch_idx = sorted({i for key in band_keys for i in batch_bands.get(key, ())}, reverse=True)
+            batch_candidates = [
+                (batch_rows[i][2], batch_rows[i][3])
+                for i in batch_idx
+                if batch_rows[i][0] == company and batch_rows[i][1] in near
+            ]
+            db_candidates = _lookup_title_candidates(conn, company, near, band_keys)
+            candidates = (batch_candidates + db_candidates)[:SYNDICATION_CANDIDATE_LIMIT]
+            if candidates:
+                gid = _pick_syndicated_group_id(title_norm, candidates, gid)
+                row["source_group_id"] = gid
+        known_groups.add(gid)
+        if title_norm:
+            for key in band_keys:
+                batch_bands.setdefault(key, []).append(len(batch_rows))
+            batch_rows.append((company, date, gid, title_norm))
+
+
+def _nearby_dates(date: str) -> set[str]:
+    try:
+        base_date = datetime.strptime(date, "%Y-%m-%d")
+    except ValueError:
+        return {date}
+    return {(base_date + timedelta(days=d)).strftime("%Y-%m-%d") for d in (-1, 0, 1)}
 
 
-def _compute_group_volume(conn: sqlite3.Connection, group_ids: set[str]) -> dict[str, float | int]:
+def _compute_group_volume(
+    conn: sqlite3.Connection, group_ids: set[str], archives: dict[str, sqlite3.Connection] | None = None
+) -> dict[str, float | int]:
     # 운영 지표 정의:
     # - unique_articles: source_group 기준 고유 기사 수
     # - total_mentions: 재배포 포함 노출량(repost_count 합)
@@ -593,16 +1342,24 @@ def _compute_group_volume(conn: sqlite3.Connection, group_ids: set[str]) -> dict
             "repost_multiplier": round(float(unique_articles) / max(unique_articles, 1), 3),
         }
 
-    placeholders = ",".join(["?"] * len(effective_groups))
-    rows = conn.execute(
-        f"""
-        SELECT group_id, repost_count
-        FROM source_groups
-        WHERE group_id IN ({placeholders})
-        """,
-        sorted(effective_groups),
-    ).fetchall()
-    repost_by_group = {str(r["group_id"]): max(1, int(r["repost_count"] or 1)) for r in rows}
+    # 장기 구간은 그룹 수가 SQLite 바인드 변수 상한(32766)을 넘을 수 있어 나눠 조회한다.
+    # 아카이브로 옮겨진 기사는 아카이브 쪽 source_groups에 세어져 있으므로 더한다.
+    ordered = sorted(effective_groups)
+    repost_by_group: dict[str, int] = {}
+    for source in [conn, *(archives or {}).values()]:
+        for i in range(0, len(ordered), 10000):
+            chunk = ordered[i : i + 10000]
+            placeholders = ",".join(["?"] * len(chunk))
+            for r in source.execute(
+                f"""
+                SELECT group_id, repost_count
+                FROM source_groups
+                WHERE group_id IN ({placeholders})
+                """,
+                chunk,
+            ):
+                gid = str(r["group_id"])
+                repost_by_group[gid] = repost_by_group.get(gid, 0) + int(r["repost_count"] or 0)
     total_mentions = 0
     for gid in group_ids:
         if not gid:
@@ -610,7 +1367,7 @@ def _compute_group_volume(conn: sqlite3.Connection, group_ids: set[str]) -> dict
         if gid.startswith("legacy:"):
             total_mentions += 1
             continue
-        total_mentions += repost_by_group.get(gid, 1)
+        total_mentions += max(1, repost_by_group.get(gid, 1))
 
     total_mentions = int(total_mentions)
     return {
@@ -620,89 +1377,321 @@ def _compute_group_volume(conn: sqlite3.Connection, group_ids: set[str]) -> dict
     }
 
 
-def save_articles(df: pd.DataFrame) -> int:
+def _format_pub_date(value: Any) -> str:
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    try:
+        return pd.to_datetime(value).strftime("%Y-%m-%d %H:%M:%S")
+    except Exception:
+        return ""
+
+
+def _is_missing(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return not value.strip()
+    try:
+        return bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def _resolve_row_sentiment(record: dict[str, Any], title: str, desc: str) -> dict[str, Any]:
+    """프레임에 감성 결과(SENTIMENT_RESULT_COLUMNS)가 모두 있으면 재사용하고, 없을 때만 채점한다."""
+    if not any(_is_missing(record.get(col)) for col in SENTIMENT_RESULT_COLUMNS):
+        try:
+            return {
+                "sentiment_score": float(record["sentiment_score"]),
+                "sentiment_label": str(record["sentiment_label_en"]),
+                "sentiment_kr": str(record["sentiment"]),
+                "confidence": float(record["sentiment_confidence"]),
+                "method": str(record["sentiment_method"]),
+            }
+        except (TypeError, ValueError):
+            pass
+    return analyze_sentiment_rule_v1(title, desc)
+
+
+def _prepare_article_rows(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """적재 전 해시/그룹/언론사/감성을 프레임 단위로 미리 계산한다(DB 미접근)."""
+    rows: list[dict[str, Any]] = []
+    seen_hashes: set[str] = set()
+    for record in df.to_dict(orient="records"):
+        company = str(record.get("company", "") or "")
+        title = str(record.get("title_clean", "") or "")
+        desc = str(record.get("description_clean", "") or "")
+        originallink = str(record.get("originallink", "") or "")
+        link = str(record.get("link", "") or "")
+        date = str(record.get("date", "") or "")
+        content_hash = _to_hash(company, originallink, link, title, date)
+        if content_hash in seen_hashes:
+            continue
+        seen_hashes.add(content_hash)
+
+        analyzed = _resolve_row_sentiment(record, title, desc)
+        title_norm = _normalize_title(title)
+        rows.append(
+            {
+                "company": company,
+                "title_clean": title,
+                "description_clean": desc,
+                "originallink": originallink,
+                "link": link,
+                "outlet": _extract_outlet(originallink, link),
+                "pub_date": _format_pub_date(record.get("pubDate_parsed")),
+                "date": date,
+                "sentiment": _normalize_sentiment_label(str(record.get("sentiment", "") or "") or analyzed["sentiment_kr"]),
+                "is_test": 1 if int(record.get("is_test", 0) or 0) else 0,
+                "content_hash": content_hash,
+                "source_group_id": _to_source_group_id(originallink, link, title, date),
+                "title_norm": title_norm,
+                "title_bands": _title_band_keys(title_norm),
+                "tags": _article_tag_rows(title, desc),
+                "analyzed": analyzed,
+            }
+        )
+    return rows
+
+
+def _write_article_chunk(conn: sqlite3.Connection, rows: list[dict[str, Any]], now: str) -> int:
+    """청크 하나를 적재하고 신규 기사 수를 반환한다.
+
+    호출자(쓰기 스레드 또는 run_write)가 연 쓰기 트랜잭션 안에서 실행되며 직접 커밋하지 않는다.
+    """
+    hashes = [r["content_hash"] for r in rows]
+    placeholders = ",".join(["?"] * len(hashes))
+    existing = {
+        str(r["content_hash"])
+        for r in conn.execute(f"SELECT content_hash FROM articles WHERE content_hash IN ({placeholders})", hashes)
+    }
+    pending = [r for r in rows if r["content_hash"] not in existing]
+    if not pending:
+        return 0
+
+    _resolve_syndicated_group_ids(conn, pending)
+    conn.executemany(
+        """
+        INSERT INTO articles (
+            company, title_clean, description_clean, originallink, link, outlet, pub_date, date, sentiment, is_test, content_hash, created_at, source_group_id, event_ts
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, """
+        + _ARTICLE_EVENT_TS_SQL.format(pub_date="?", created_at="?", date="?")
+        + """)
+        """,
+        [
+            (
+                r["company"],
+                r["title_clean"],
+                r["description_clean"],
+                r["originallink"],
+                r["link"],
+                r["outlet"],
+                r["pub_date"],
+                r["date"],
+                r["sentiment"],
+                r["is_test"],
+                r["content_hash"],
+                now,
+                r["source_group_id"],
+                r["pub_date"],
+                r["date"],
+                now,
+            )
+            for r in pending
+        ],
+    )
+    pending_hashes = [r["content_hash"] for r in pending]
+    placeholders = ",".join(["?"] * len(pending_hashes))
+    id_by_hash = {
+        str(r["content_hash"]): int(r["id"])
+        for r in conn.execute(
+            f"SELECT id, content_hash FROM articles WHERE content_hash IN ({placeholders})",
+            pending_hashes,
+        )
+    }
+
+    members_by_group: dict[str, list[dict[str, Any]]] = {}
+    for r in pending:
+        r["article_id"] = id_by_hash[r["content_hash"]]
+        members_by_group.setdefault(str(r["source_group_id"]), []).append(r)
+    conn.executemany(
+        "INSERT INTO title_lsh_index (band_key, company, date, article_id) VALUES (?, ?, ?, ?)",
+        [(key, r["company"], r["date"], r["article_id"]) for r in pending for key in r["title_bands"]],
+    )
+    conn.executemany(
+        "INSERT INTO article_tags (article_id, tag_type, tag, is_primary) VALUES (?, ?, ?, ?)",
+        [
+            (r["article_id"], tag_type, tag, is_primary)
+            for r in pending
+            for tag_type, tag, is_primary in r["tags"]
+        ],
+    )
+    # 쓰기 트랜잭션 안에서 한 번에 넣었으므로 이번 청크의 id는 연속 구간이다.
+    new_ids = [r["article_id"] for r in pending]
+    _apply_daily_rollup(conn, "a.id BETWEEN ? AND ?", [min(new_ids), max(new_ids)])
+    group_ids = sorted(members_by_group)
+    placeholders = ",".join(["?"] * len(group_ids))
+    existing_groups = {
+        str(r["group_id"])
+        for r in conn.execute(f"SELECT group_id FROM source_groups WHERE group_id IN ({placeholders})", group_ids)
+    }
+
+    # 신규 그룹: 첫 기사를 canonical로 두고 감성 결과를 1회 기록한다.
+    # 기존 그룹: 이번 청크의 재배포 건수만큼 repost_count를 올린다.
+    new_groups = [(gid, members) for gid, members in members_by_group.items() if gid not in existing_groups]
+    conn.executemany(
+        """
+        INSERT INTO source_groups (group_id, canonical_article_id, repost_count, first_seen_at, last_seen_at)
+        VALUES (?, ?, ?, ?, ?)
+        """,
+        [(gid, members[0]["article_id"], len(members), now, now) for gid, members in new_groups],
+    )
+    conn.executemany(
+        """
+        INSERT INTO sentiment_results (
+            article_id, source_group_id, sentiment_score, sentiment_label, confidence, method, analyzed_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """,
+        [
+            (
+                members[0]["article_id"],
+                gid,
+                float(members[0]["analyzed"]["sentiment_score"]),
+                str(members[0]["analyzed"]["sentiment_label"]),
+                float(members[0]["analyzed"]["confidence"]),
+                str(members[0]["analyzed"]["method"]),
+                now,
+            )
+            for gid, members in new_groups
+        ],
+    )
+    conn.executemany(
+        """
+        UPDATE source_groups
+        SET repost_count = COALESCE(repost_count, 0) + ?,
+            last_seen_at = ?
+        WHERE group_id = ?
+        """,
+        [(len(members), now, gid) for gid, members in members_by_group.items() if gid in existing_groups],
+    )
+    _bump_data_version(conn)
+    return len(pending)
+
+
+def save_articles(df: pd.DataFrame, chunk_size: int = SAVE_ARTICLES_CHUNK_SIZE) -> int:
+    """수집 프레임을 set 기반으로 적재한다.
+
+    해시/그룹/감성 계산은 쓰기 잠금 밖에서 한 번에 끝내고,
+    DB 쓰기는 chunk_size 단위로 나눠 쓰기 큐(backend.db_writer)에 넣어 다른 작업의 대기를 줄인다.
+    """
     if df.empty:
         return 0
 
+    rows = _prepare_article_rows(df)
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    conn = _connect()
-    try:
-        before = conn.execute("SELECT COUNT(1) AS cnt FROM articles").fetchone()["cnt"]
-        seen_hashes: set[str] = set()
-        for _, row in df.iterrows():
-            company = str(row.get("company", "") or "")
-            title = str(row.get("title_clean", "") or "")
-            desc = str(row.get("description_clean", "") or "")
-            originallink = str(row.get("originallink", "") or "")
-            link = str(row.get("link", "") or "")
-            pub_raw = row.get("pubDate_parsed")
-            pub_date = ""
-            if pd.notna(pub_raw):
-                try:
-                    pub_date = pd.to_datetime(pub_raw).strftime("%Y-%m-%d %H:%M:%S")
-                except Exception:
-                    pub_date = ""
-            date = str(row.get("date", "") or "")
-            analyzed = analyze_sentiment_rule_v1(title, desc)
-            sentiment = _normalize_sentiment_label(str(row.get("sentiment", "") or "") or analyzed["sentiment_kr"])
-            is_test = 1 if int(row.get("is_test", 0) or 0) else 0
-            outlet = _extract_outlet(originallink, link)
-            content_hash = _to_hash(company, originallink, link, title, date)
-            source_group_id = _to_source_group_id(originallink, link, title, date)
-            source_group_id = _resolve_syndicated_group_id(conn, company, title, date, source_group_id)
-
-            if content_hash in seen_hashes:
-                continue
-            seen_hashes.add(content_hash)
+    size = max(1, int(chunk_size))
+    inserted = 0
+    for i in range(0, len(rows), size):
+        chunk = rows[i : i + size]
+        inserted += int(
+            _write(lambda conn, chunk=chunk: _write_article_chunk(conn, chunk, now), label="save_articles") or 0
+        )
+    return inserted
+
+
+# 기사 목록 총건수 캐시: (DB, 조회 종류, 필터) -> (articles_epoch, 집계한 MAX(id), 건수).
+# 신규 적재분은 id 구간(PK 범위)만 더해 갱신하고, 삭제/수정 재집계(epoch 변경) 후에만 전체를 다시 센다.
+ARTICLE_COUNT_CACHE_MAX_ENTRIES = int(os.getenv("ARTICLE_COUNT_CACHE_MAX_ENTRIES", "256"))
+_article_count_cache: OrderedDict[tuple[Any, ...], tuple[str, int, int]] = OrderedDict()
+_article_count_cache_lock = Lock()
+
+
+def _cached_article_count(conn: sqlite3.Connection, key: tuple[Any, ...], from_where_sql: str, params: list[Any]) -> int:
+    """from_where_sql(FROM ... WHERE ...)에 해당하는 기사 수. 재집계 대기분이 있으면 캐시하지 않고 센다."""
+    max_id = int(conn.execute("SELECT COALESCE(MAX(id), 0) FROM articles").fetchone()[0])
+    dirty = conn.execute("SELECT 1 FROM article_daily_rollup_dirty LIMIT 1").fetchone() is not None
+    if dirty:
+        return int(conn.execute(f"SELECT COUNT(1) {from_where_sql} AND id <= ?", [*params, max_id]).fetchone()[0])
+    epoch = _articles_epoch(conn)
+    cache_key = (str(_resolve_db_path()), *key)
+    with _article_count_cache_lock:
+        cached = _article_count_cache.get(cache_key)
+    if cached and cached[0] == epoch and cached[1] == max_id:
+        total = cached[2]
+    elif cached and cached[0] == epoch and cached[1] < max_id:
+        delta = conn.execute(
+            f"SELECT COUNT(1) {from_where_sql} AND id > ? AND id <= ?", [*params, cached[1], max_id]
+        ).fetchone()[0]
+        total = cached[2] + int(delta)
+    else:
+        total = int(conn.execute(f"SELECT COUNT(1) {from_where_sql} AND id <= ?", [*params, max_id]).fetchone()[0])
+    with _article_count_cache_lock:
+        _article_count_cache[cache_key] = (epoch, max_id, total)
+        _article_count_cache.move_to_end(cache_key)
+        while len(_article_count_cache) > max(1, ARTICLE_COUNT_CACHE_MAX_ENTRIES):
+            _article_count_cache.popitem(last=False)
+    return total
 
-            cur = conn.execute(
-                """
-                INSERT OR IGNORE INTO articles (
-                    company, title_clean, description_clean, originallink, link, outlet, pub_date, date, sentiment, is_test, content_hash, created_at, source_group_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (company, title, desc, originallink, link, outlet, pub_date, date, sentiment, is_test, content_hash, now, source_group_id),
-            )
 
-            if cur.rowcount == 0:
-                continue
+def _encode_article_cursor(event_ts: Any, article_id: int) -> str:
+    raw = f"{'' if event_ts is None else int(event_ts)}:{int(article_id)}"
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")
 
-            article_id = int(cur.lastrowid)
-            existing_group = conn.execute(
-                "SELECT canonical_article_id, repost_count FROM source_groups WHERE group_id = ?",
-                (source_group_id,),
-            ).fetchone()
-            if existing_group is None:
-                conn.execute(
-                    """
-                    INSERT INTO source_groups (group_id, canonical_article_id, repost_count, first_seen_at, last_seen_at)
-                    VALUES (?, ?, 1, ?, ?)
-                    """,
-                    (source_group_id, article_id, now, now),
-                )
-                conn.execute(
-                    """
-                    INSERT INTO sentiment_results (
-                        article_id, source_group_id, sentiment_score, sentiment_label, confidence, method, analyzed_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        article_id,
-                        source_group_id,
-                        float(analyzed["sentiment_score"]),
-                        str(analyzed["sentiment_label"]),
-                        float(analyzed["confidence"]),
-                        str(analyzed["method"]),
-                        now,
-                    ),
-                )
-            else:
-                _increment_group_repost(conn, source_group_id, now)
-        conn.commit()
-        after = conn.execute("SELECT COUNT(1) AS cnt FROM articles").fetchone()["cnt"]
-        return int(after) - int(before)
-    finally:
-        conn.close()
+
+def _decode_article_cursor(cursor: str) -> tuple[int | None, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("ascii")
+        ts_text, id_text = raw.split(":")
+        ts, article_id = (int(ts_text) if ts_text else None), int(id_text)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("cursor 형식이 올바르지 않습니다.") from exc
+    # SQLite INTEGER(64비트) 범위를 넘으면 바인딩 때 OverflowError(500)가 나므로 여기서 거른다.
+    if any(v is not None and not -(1 << 63) <= v < (1 << 63) for v in (ts, article_id)):
+        raise ValueError("cursor 형식이 올바르지 않습니다.")
+    return ts, article_id
+
+
+def _article_page_rows(
+    conn: sqlite3.Connection,
+    select_sql: str,
+    from_where_sql: str,
+    params: list[Any],
+    *,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+) -> tuple[list[sqlite3.Row], str | None]:
+    """(event_ts DESC, id DESC) 순 기사 한 페이지와 다음 페이지 커서.
+
+    cursor가 있으면 offset을 무시하고 색인 위치에서 바로 이어 읽는다(깊은 페이지도 일정 비용).
+    event_ts가 없는 행은 정렬상 맨 뒤라 시각이 있는 행을 다 읽은 뒤 id 순으로 잇는다.
+    select_sql은 id, event_ts 컬럼을 포함해야 한다.
+    """
+    order_sql = " ORDER BY event_ts DESC, id DESC LIMIT ?"
+    want = int(limit) + 1
+    if not cursor:
+        rows = conn.execute(
+            select_sql + from_where_sql + order_sql + " OFFSET ?", [*params, want, max(0, int(offset))]
+        ).fetchall()
+    else:
+        ts, last_id = _decode_article_cursor(cursor)
+        rows = []
+        if ts is not None:
+            # event_ts <= ?는 색인 범위 조회, 같은 시각 안에서는 id로 이어간다.
+            rows = conn.execute(
+                select_sql + from_where_sql + " AND event_ts <= ? AND (event_ts < ? OR id < ?)" + order_sql,
+                [*params, ts, ts, last_id, want],
+            ).fetchall()
+        if len(rows) < want:
+            null_sql = " AND event_ts IS NULL" + (" AND id < ?" if ts is None else "")
+            null_params = [*params, last_id] if ts is None else list(params)
+            rows += conn.execute(
+                select_sql + from_where_sql + null_sql + " ORDER BY id DESC LIMIT ?",
+                [*null_params, want - len(rows)],
+            ).fetchall()
+    page = rows[: int(limit)]
+    next_cursor = _encode_article_cursor(page[-1]["event_ts"], page[-1]["id"]) if len(rows) > len(page) else None
+    return page, next_cursor
 
 
 def get_articles(
@@ -711,6 +1700,7 @@ def get_articles(
     sentiment: str | None = None,
     limit: int = 50,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     company_val = (company or "").strip()
     sentiment_val = (sentiment or "").strip()
@@ -726,27 +1716,30 @@ def get_articles(
         where.append("sentiment = ?")
         params.append(sentiment_val)
 
-    where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+    from_where_sql = " FROM articles WHERE 1 = 1" + "".join(f" AND {w}" for w in where)
 
-    conn = _connect()
+    conn = _connect_readonly()
     try:
-        total = conn.execute(f"SELECT COUNT(1) AS cnt FROM articles {where_sql}", params).fetchone()["cnt"]
-        rows = conn.execute(
-            f"""
-            SELECT company, title_clean AS title, sentiment, date,
+        total = _cached_article_count(conn, ("articles", company_val, sentiment_val), from_where_sql, params)
+        rows, next_cursor = _article_page_rows(
+            conn,
+            """
+            SELECT id, event_ts, company, title_clean AS title, sentiment, date,
                    outlet,
                    CASE WHEN originallink IS NOT NULL AND originallink != '' THEN originallink ELSE link END AS url
-            FROM articles
-            {where_sql}
-            ORDER BY COALESCE(pub_date, date, created_at) DESC, id DESC
-            LIMIT ? OFFSET ?
             """,
-            [*params, int(limit), int(offset)],
-        ).fetchall()
+            from_where_sql,
+            params,
+            limit=int(limit),
+            offset=int(offset),
+            cursor=cursor,
+        )
 
         items = []
         for r in rows:
             item = dict(r)
+            item.pop("id")
+            item.pop("event_ts")
             item["sentiment"] = _normalize_sentiment_label(item.get("sentiment"))
             items.append(item)
         return {
@@ -754,26 +1747,31 @@ def get_articles(
             "total": int(total),
             "offset": int(offset),
             "limit": int(limit),
-            "has_more": int(offset) + len(items) < int(total),
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
         }
     finally:
         conn.close()
 
 
+@_cached_read
 def get_nexon_articles(
     *,
     ip: str = "all",
     limit: int = 20,
     offset: int = 0,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     ip_name = _resolve_ip_name(ip)
     if not ip_name:
         raise ValueError("지원하지 않는 IP입니다.")
 
-    ip_where_sql, ip_where_params = _build_ip_sql_filter(ip_name)
-
-    conn = _connect()
+    start = max(0, int(offset))
+    page_limit = max(1, int(limit))
+    conn = _connect_readonly()
     try:
+        tags_ready = article_tags_ready(conn)
+        ip_where_sql, ip_where_params = _build_ip_sql_filter(ip_name, tags_ready)
         where_sql = f"""
             FROM articles
             WHERE company = ?
@@ -781,30 +1779,29 @@ def get_nexon_articles(
               {ip_where_sql}
         """
         base_params: list[Any] = ["넥슨", *ip_where_params]
-        total_row = conn.execute(f"SELECT COUNT(1) AS cnt {where_sql}", base_params).fetchone()
-        total = int(total_row["cnt"] if total_row else 0)
-        rows = conn.execute(
+        total = _cached_article_count(conn, ("nexon", ip_name, tags_ready), where_sql, base_params)
+        rows, next_cursor = _article_page_rows(
+            conn,
             """
-            SELECT id, company, title_clean, description_clean, sentiment, date,
+            SELECT id, event_ts, company, title_clean, description_clean, sentiment, date,
                    COALESCE(NULLIF(outlet, ''), 'unknown') AS outlet,
                    COALESCE(originallink, '') AS originallink,
                    COALESCE(link, '') AS link,
-                   CASE WHEN originallink IS NOT NULL AND originallink != '' THEN originallink ELSE link END AS url
+                   CASE WHEN originallink IS NOT NULL AND originallink != '' THEN originallink ELSE link END AS url,
             """
-            + where_sql
-            + """
-            ORDER BY COALESCE(pub_date, date, created_at) DESC, id DESC
-            LIMIT ? OFFSET ?
-            """,
-            [*base_params, max(1, int(limit)), max(0, int(offset))],
-        ).fetchall()
+            + ARTICLE_TAG_COLUMNS_SQL,
+            where_sql,
+            base_params,
+            limit=page_limit,
+            offset=start,
+            cursor=cursor,
+        )
     finally:
         conn.close()
 
     items: list[dict[str, Any]] = []
     for r in rows:
-        text = f"{r['title_clean'] or ''} {r['description_clean'] or ''}"
-        detected_ip = _detect_ip(text)
+        detected_ip, _ = row_article_tags(r, tags_ready)
         items.append(
             {
                 "id": int(r["id"]),
@@ -819,29 +1816,214 @@ def get_nexon_articles(
             }
         )
 
-    start = max(0, int(offset))
-    page_limit = max(1, int(limit))
-    end = start + page_limit
     return {
         "items": items,
         "total": int(total),
         "offset": int(start),
         "limit": int(page_limit),
-        "has_more": end < total,
+        "has_more": next_cursor is not None,
+        "next_cursor": next_cursor,
+    }
+
+
+# 내보내기(스트리밍) 1회 fetchmany 행 수. 메모리 사용량은 결과 크기와 무관하게 이 값에 비례한다.
+EXPORT_FETCH_SIZE = int(os.getenv("EXPORT_FETCH_SIZE", "2000"))
+EXPORT_ARTICLE_COLUMNS = [
+    "id", "company", "title", "description", "sentiment", "date", "pub_date", "outlet", "url",
+    "is_test", "source_group_id", "ip", "themes",
+]
+EXPORT_RISK_TIMESERIES_COLUMNS = [
+    "ip_id", "ts", "risk_score", "risk_raw", "issue_heat", "alert_level", "s_comp", "v_comp", "t_comp", "m_comp",
+    "sample_size", "uncertain_ratio", "quality_flag", "risk_formula_version",
+]
+
+
+def _export_day_bounds(date_from: str | None, date_to: str | None) -> tuple[str | None, str | None]:
+    """YYYY-MM-DD 기간을 [시작 00:00:00, 종료 다음날 00:00:00) 경계 문자열로 바꾼다."""
+    bounds: list[str | None] = []
+    for value, shift in ((date_from, 0), (date_to, 1)):
+        text = (value or "").strip()
+        if not text:
+            bounds.append(None)
+            continue
+        try:
+            day = datetime.strptime(text, "%Y-%m-%d")
+        except ValueError as exc:
+            raise ValueError("date_from/date_to 형식은 YYYY-MM-DD여야 합니다.") from exc
+        bounds.append((day + timedelta(days=shift)).strftime("%Y-%m-%d %H:%M:%S"))
+    return bounds[0], bounds[1]
+
+
+def _iter_export_rows(
+    sql: str, params: list[Any], batch_size: int, db_path: Path | None = None
+) -> Iterator[list[sqlite3.Row]]:
+    # 스트리밍 응답은 청크마다 다른 스레드에서 이어 읽으므로 스레드별 재사용 연결 대신 독립 연결을 쓴다.
+    conn = connect_dedicated(db_path or _resolve_db_path(), readonly=True)
+    try:
+        cur = conn.execute(sql, params)
+        while True:
+            rows = cur.fetchmany(max(1, int(batch_size)))
+            if not rows:
+                break
+            yield rows
+    finally:
+        conn.close()
+
+
+def _export_article_item(r: sqlite3.Row, tags_ready: bool) -> dict[str, Any]:
+    originallink = str(r["originallink"] or "")
+    link = str(r["link"] or "")
+    primary_ip, themes = row_article_tags(r, tags_ready)
+    return {
+        "id": int(r["id"]),
+        "company": str(r["company"] or ""),
+        "title": str(r["title_clean"] or ""),
+        "description": str(r["description_clean"] or ""),
+        "sentiment": _normalize_sentiment_label(r["sentiment"]),
+        "date": str(r["date"] or ""),
+        "pub_date": str(r["pub_date"] or ""),
+        "outlet": _resolve_outlet_value(str(r["outlet"] or ""), originallink, link),
+        "url": originallink or link,
+        "is_test": bool(r["is_test"]),
+        "source_group_id": str(r["source_group_id"] or ""),
+        "ip": primary_ip,
+        "themes": "|".join(themes),
     }
 
 
+def iter_export_articles(
+    *,
+    company: str | None = None,
+    ip: str = "all",
+    date_from: str | None = None,
+    date_to: str | None = None,
+    include_test: bool = False,
+    batch_size: int = EXPORT_FETCH_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """기사를 기사 시각(event_ts) 오름차순으로 batch_size씩 내보내는 이터레이터(서버 측 커서, 메모리 일정).
+
+    인자 검증은 호출 즉시 하고(ValueError), DB 읽기는 첫 청크를 꺼낼 때 시작한다.
+    IP 필터는 넥슨 기사 목록과 같은 태그/FTS 조건이며, 기간은 event_ts 기준이다.
+    구간이 걸친 월 아카이브도 같은 SQL로 읽어 (event_ts, id) 순으로 병합한다(대시보드와 같은 범위).
+    """
+    ip_name = _resolve_ip_name(ip)
+    if not ip_name:
+        raise ValueError("지원하지 않는 IP입니다.")
+    start, end = _export_day_bounds(date_from, date_to)
+    company_val = (company or "").strip()
+    return _iter_export_article_batches(
+        ip_name,
+        company_val,
+        start,
+        end,
+        (date_from or "").strip() or "0000-01-01",
+        (date_to or "").strip() or "9999-12-31",
+        include_test,
+        batch_size,
+    )
+
+
+def _iter_export_article_batches(
+    ip_name: str,
+    company_val: str,
+    start: str | None,
+    end: str | None,
+    date_from: str,
+    date_to: str,
+    include_test: bool,
+    batch_size: int,
+) -> Iterator[list[dict[str, Any]]]:
+    from backend import archive
+
+    db_path = _resolve_db_path()
+    sources: list[tuple[Path, bool]] = []
+    conn = _connect_readonly()
+    try:
+        sources.append((db_path, article_tags_ready(conn)))
+    finally:
+        conn.close()
+    for path in archive.archive_files_in_range(date_from, date_to, db_path).values():
+        # 규칙이 바뀐 아카이브는 여기서 태그/롤업을 다시 만든 뒤 독립 연결로 읽는다.
+        archive_conn = archive.open_archive(path)
+        try:
+            sources.append((path, article_tags_ready(archive_conn)))
+        finally:
+            archive_conn.close()
+
+    streams = []
+    for path, tags_ready in sources:
+        sql, params = _export_article_sql(ip_name, company_val, start, end, include_test, tags_ready)
+        streams.append(_iter_export_source_rows(sql, params, batch_size, path, tags_ready))
+    # SQLite ASC와 같이 event_ts가 없는 행이 먼저다.
+    merged = heapq.merge(
+        *streams, key=lambda x: (x[0]["event_ts"] is not None, x[0]["event_ts"] or 0, x[0]["id"])
+    )
+    while True:
+        batch = list(islice(merged, max(1, int(batch_size))))
+        if not batch:
+            return
+        yield [_export_article_item(r, tags_ready) for r, tags_ready in batch]
+
+
+def _iter_export_source_rows(
+    sql: str, params: list[Any], batch_size: int, db_path: Path, tags_ready: bool
+) -> Iterator[tuple[sqlite3.Row, bool]]:
+    for rows in _iter_export_rows(sql, params, batch_size, db_path):
+        for r in rows:
+            yield r, tags_ready
+
+
+def _export_article_sql(
+    ip_name: str, company_val: str, start: str | None, end: str | None, include_test: bool, tags_ready: bool
+) -> tuple[str, list[Any]]:
+    ip_where_sql, ip_where_params = _build_ip_sql_filter(ip_name, tags_ready)
+    where = ["1 = 1"]
+    params: list[Any] = []
+    if company_val and company_val != "전체":
+        where.append("company = ?")
+        params.append(company_val)
+    if not include_test:
+        where.append("is_test = 0")
+    if start:
+        where.append("event_ts >= CAST(strftime('%s', ?) AS INTEGER)")
+        params.append(start)
+    if end:
+        where.append("event_ts < CAST(strftime('%s', ?) AS INTEGER)")
+        params.append(end)
+    sql = (
+        """
+        SELECT id, event_ts, company, title_clean, description_clean, sentiment, date, pub_date,
+               COALESCE(NULLIF(outlet, ''), 'unknown') AS outlet,
+               COALESCE(originallink, '') AS originallink,
+               COALESCE(link, '') AS link,
+               is_test, source_group_id,
+        """
+        + ARTICLE_TAG_COLUMNS_SQL
+        + f"""
+        FROM articles
+        WHERE {' AND '.join(where)}
+        {ip_where_sql}
+        ORDER BY event_ts ASC, id ASC
+        """
+    )
+    return sql, [*params, *ip_where_params]
+
+
 def clear_articles(company: str | None = None) -> int:
     conn = _connect()
     try:
         if company:
             before = conn.execute("SELECT COUNT(1) AS cnt FROM articles WHERE company = ?", (company,)).fetchone()["cnt"]
             conn.execute("DELETE FROM articles WHERE company = ?", (company,))
+            _refresh_daily_rollup(conn)
+            _bump_data_version(conn)
             conn.commit()
             after = conn.execute("SELECT COUNT(1) AS cnt FROM articles WHERE company = ?", (company,)).fetchone()["cnt"]
             return int(before) - int(after)
         before = conn.execute("SELECT COUNT(1) AS cnt FROM articles").fetchone()["cnt"]
         conn.execute("DELETE FROM articles")
+        _refresh_daily_rollup(conn)
+        _bump_data_version(conn)
         conn.commit()
         return int(before)
     finally:
@@ -860,44 +2042,80 @@ def _resolve_ip_name(ip: str) -> str:
     return ""
 
 
-def _detect_ip(text: str) -> str:
+def detect_ip_tags(text: str) -> list[str]:
+    """본문에 키워드가 포함된 IP 이름 목록(IP_RULES 순서, 첫 항목이 대표 IP)."""
     low = (text or "").lower()
-    for name, meta in IP_RULES.items():
-        if meta["slug"] == "all":
-            continue
-        if any(k.lower() in low for k in meta["keywords"]):
-            return name
-    return "기타"
+    return [
+        name
+        for name, meta in IP_RULES.items()
+        if meta["slug"] != "all" and any(str(k).lower() in low for k in meta.get("keywords", []) or [])
+    ]
+
+
+def detect_theme_tags(text: str) -> list[str]:
+    """본문에 키워드가 포함된 리스크 테마 목록(RISK_THEME_RULES 순서, 첫 항목이 대표 테마)."""
+    low = (text or "").lower()
+    return [theme for theme, kws in RISK_THEME_RULES.items() if any(k.lower() in low for k in kws)]
+
+
+def _detect_ip(text: str) -> str:
+    ips = detect_ip_tags(text)
+    return ips[0] if ips else "기타"
 
 
 def _matches_ip_name(text: str, ip_name: str) -> bool:
     target = (ip_name or "").strip()
     if target in {"", "전체"}:
         return True
-    meta = IP_RULES.get(target, {})
-    keywords = meta.get("keywords", []) or []
-    low = (text or "").lower()
-    return any(str(k).lower() in low for k in keywords)
+    return target in detect_ip_tags(text)
+
 
+# 조회 SELECT에 붙여 쓰는 기사별 태그 컬럼(articles 테이블 기준)
+ARTICLE_TAG_COLUMNS_SQL = """
+    (SELECT t.tag FROM article_tags t
+     WHERE t.article_id = articles.id AND t.tag_type = 'ip' AND t.is_primary = 1) AS primary_ip,
+    (SELECT group_concat(t.tag, '|') FROM article_tags t
+     WHERE t.article_id = articles.id AND t.tag_type = 'theme') AS themes
+"""
 
-def _build_ip_sql_filter(ip_name: str) -> tuple[str, list[str]]:
+
+def row_article_tags(row: sqlite3.Row, tags_ready: bool) -> tuple[str, list[str]]:
+    """(대표 IP, 테마 목록)을 태그 컬럼에서 읽는다. 태그가 최신이 아니면 본문에서 다시 계산한다."""
+    if tags_ready:
+        found = set(str(row["themes"] or "").split("|"))
+        return str(row["primary_ip"] or "기타"), [theme for theme in RISK_THEME_RULES if theme in found]
+    text = f"{row['title_clean'] or ''} {row['description_clean'] or ''}"
+    return _detect_ip(text), detect_theme_tags(text)
+
+
+def _build_ip_sql_filter(ip_name: str, tags_ready: bool = False) -> tuple[str, list[str]]:
     if ip_name == "전체":
         return "", []
     meta = IP_RULES.get(ip_name, {})
     keywords = [str(k).strip().lower() for k in meta.get("keywords", []) if str(k).strip()]
     if not keywords:
         return " AND 1 = 0", []
-
-    # 운영 조회 성능 개선:
-    # IP 필터를 Python 후처리가 아니라 SQL WHERE 단계에서 처리한다.
+    if tags_ready:
+        return " AND id IN (SELECT article_id FROM article_tags WHERE tag_type = 'ip' AND tag = ?)", [ip_name]
+
+    # 태그가 최신이 아닐 때(규칙 변경 후 재태깅 전)의 대체 경로:
+    # IP 필터를 articles_fts(trigram) 색인 조회로 처리한다.
+    # 본문은 LOWER(제목 || ' ' || 요약)로 저장되어 있어 기존 LIKE '%kw%'와 같은 부분 문자열 의미를 갖는다.
+    # trigram은 3글자 미만 키워드(예: 던파)를 색인으로 찾을 수 없으므로 해당 키워드만 색인 본문을 GLOB로 훑는다
+    # (+body: FTS5가 GLOB 조건을 색인 조회로 가져가면 빈 결과가 나오므로 색인 사용을 막는다).
     # 주의:
     # 다중 IP 키워드가 함께 포함된 기사도 조회 대상에 포함된다.
-    clauses: list[str] = []
+    long_keywords = [k for k in keywords if len(k) >= 3]
+    short_keywords = [k for k in keywords if len(k) < 3]
+    selects: list[str] = []
     params: list[str] = []
-    for keyword in keywords:
-        clauses.append("LOWER(COALESCE(title_clean, '') || ' ' || COALESCE(description_clean, '')) LIKE ?")
-        params.append(f"%{keyword}%")
-    return f" AND ({' OR '.join(clauses)})", params
+    if long_keywords:
+        selects.append("SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?")
+        params.append(" OR ".join('"' + k.replace('"', '""') + '"' for k in long_keywords))
+    for keyword in short_keywords:
+        selects.append("SELECT rowid FROM articles_fts WHERE +body GLOB ?")
+        params.append("*" + re.sub(r"([*?\[])", r"[\1]", keyword) + "*")
+    return f" AND id IN ({' UNION '.join(selects)})", params
 
 
 def _extract_cluster_tokens(text: str, ip_name: str) -> list[str]:
@@ -924,64 +2142,77 @@ def _extract_cluster_tokens(text: str, ip_name: str) -> list[str]:
     return out
 
 
-def get_ip_clusters(
+def _nexon_article_rows(
+    conn: sqlite3.Connection,
+    ip_name: str,
+    date_from: str,
+    date_to: str,
     *,
-    date_from: str = "2024-01-01",
-    date_to: str = "2026-12-31",
-    ip: str = "maplestory",
-    limit: int = 6,
-) -> dict[str, Any]:
-    ip_name = _resolve_ip_name(ip)
-    if not ip_name:
-        raise ValueError("지원하지 않는 IP입니다.")
+    descending: bool = False,
+    archives: dict[str, sqlite3.Connection] | None = None,
+) -> tuple[list[sqlite3.Row], bool]:
+    """대시보드/클러스터 집계용 기사 행을 (date, id) 순으로 읽는다. (행, 운영 DB 태그 준비 여부) 반환.
 
-    ip_where_sql, ip_where_params = _build_ip_sql_filter(ip_name)
-    params = ["넥슨", date_from, date_to, *ip_where_params]
-    conn = _connect()
-    try:
-        rows = conn.execute(
-            """
-            SELECT id, date, title_clean, description_clean, sentiment,
-                   COALESCE(source_group_id, '') AS source_group_id,
-                   COALESCE(NULLIF(outlet, ''), 'unknown') AS outlet
-            FROM articles
-            WHERE company = ? AND is_test = 0 AND date BETWEEN ? AND ?
-            """
-            + ip_where_sql
-            + """
-            ORDER BY date DESC, id DESC
-            """,
-            params,
-        ).fetchall()
-    finally:
-        conn.close()
+    월 아카이브는 파일마다 같은 SQL로 읽고 (date, id) 순으로 병합한다.
+    """
+    tags_ready = article_tags_ready(conn)
+    order = "DESC" if descending else "ASC"
+    out = []
+    for source in [conn, *(archives or {}).values()]:
+        ip_where_sql, ip_where_params = _build_ip_sql_filter(
+            ip_name, tags_ready if source is conn else article_tags_ready(source)
+        )
+        out.append(
+            source.execute(
+                """
+                SELECT id, date, title_clean, description_clean, sentiment,
+                       COALESCE(source_group_id, '') AS source_group_id,
+                       COALESCE(NULLIF(outlet, ''), 'unknown') AS outlet,
+                """
+                + ARTICLE_TAG_COLUMNS_SQL
+                + """
+                FROM articles
+                WHERE company = ? AND is_test = 0 AND date BETWEEN ? AND ?
+                """
+                + ip_where_sql
+                + f"""
+                ORDER BY date {order}, id {order}
+                """,
+                ["넥슨", date_from, date_to, *ip_where_params],
+            ).fetchall()
+        )
+    if len(out) == 1:
+        return out[0], tags_ready
+    return list(heapq.merge(*out, key=lambda r: (r["date"], r["id"]), reverse=descending)), tags_ready
+
+
+def _ip_cluster_acc_from_articles(
+    conn: sqlite3.Connection,
+    ip_name: str,
+    date_from: str,
+    date_to: str,
+    archives: dict[str, sqlite3.Connection] | None = None,
+) -> dict[str, Any]:
+    """기사 행을 최신순(date, id 내림차순)으로 훑어 클러스터/키워드 집계를 만든다."""
+    rows, tags_ready = _nexon_article_rows(conn, ip_name, date_from, date_to, descending=True, archives=archives)
+    volume = _compute_group_volume(
+        conn, {str(r["source_group_id"] or "") or f"legacy:{int(r['id'])}" for r in rows}, archives
+    )
 
     buckets: dict[str, dict[str, Any]] = {}
     overall_keywords = Counter()
     overall_doc_freq = Counter()
     overall_negative = Counter()
-    total = 0
     outlets = Counter()
-    group_ids: set[str] = set()
-    doc_total = 0
 
     for r in rows:
         text = f"{r['title_clean'] or ''} {r['description_clean'] or ''}"
-        detected_ip = _detect_ip(text)
-        if ip_name != "전체" and not _matches_ip_name(text, ip_name):
-            continue
+        _, themes = row_article_tags(r, tags_ready)
 
-        total += 1
-        gid = str(r["source_group_id"] or "") or f"legacy:{int(r['id'])}"
-        group_ids.add(gid)
         sentiment = str(r["sentiment"] or "")
         outlets[str(r["outlet"] or "unknown")] += 1
 
-        cluster_label = "기타 이슈"
-        for theme, kws in RISK_THEME_RULES.items():
-            if any(k.lower() in text.lower() for k in kws):
-                cluster_label = theme
-                break
+        cluster_label = themes[0] if themes else "기타 이슈"
 
         if cluster_label not in buckets:
             buckets[cluster_label] = {
@@ -1006,10 +2237,158 @@ def get_ip_clusters(
         overall_doc_freq.update(uniq_tokens)
         if sentiment == "부정":
             overall_negative.update(uniq_tokens)
-        doc_total += 1
         if len(bucket["samples"]) < 3 and r["title_clean"]:
             bucket["samples"].append(str(r["title_clean"]))
 
+    return {
+        "total": len(rows),
+        "buckets": buckets,
+        "keywords": overall_keywords,
+        "doc_freq": overall_doc_freq,
+        "negative": overall_negative,
+        "outlets": outlets,
+        "volume": volume,
+    }
+
+
+def _first_seen_counts(keys: Any) -> tuple[np.ndarray, np.ndarray]:
+    """(고유값, 건수)를 최초 등장 순으로 돌려준다(dict/Counter 삽입 순서 재현)."""
+    codes, uniques = pd.factorize(keys)
+    return np.asarray(uniques), np.bincount(codes, minlength=len(uniques))
+
+
+def _ip_cluster_acc_from_columnar(
+    conn: sqlite3.Connection,
+    ip_name: str,
+    date_from: str,
+    date_to: str,
+    archives: dict[str, sqlite3.Connection] | None = None,
+) -> dict[str, Any] | None:
+    """_ip_cluster_acc_from_articles와 같은 집계를 Parquet 스토어의 열 단위 연산으로 만든다.
+
+    Counter/dict의 동률 순서(최초 등장 순)까지 같게 재현한다. 스토어를 쓸 수 없으면 None.
+    """
+    from backend import analytics_store
+
+    data = analytics_store.load_articles(
+        conn,
+        columns=["id", "title", "sentiment", "source_group_id", "outlet", "themes", "tokens"],
+        company="넥슨",
+        date_from=date_from,
+        date_to=date_to,
+        ip_name=ip_name,
+        descending=True,
+        archives=archives,
+    )
+    if data is None:
+        return None
+    frame = data.frame
+    total = len(frame)
+    volume = _compute_group_volume(
+        conn,
+        {gid or f"legacy:{rid}" for gid, rid in zip(frame["source_group_id"].tolist(), frame["id"].tolist())},
+        archives,
+    )
+
+    negative = (frame["sentiment"] == "부정").to_numpy()
+    # 테마 조합 종류만큼만 대표 테마(첫 테마)를 계산해 행으로 펼친다.
+    theme_codes, combos = pd.factorize(frame["themes"].to_numpy(dtype=object))
+    labels = np.array([str(c).split("|", 1)[0] or "기타 이슈" for c in combos], dtype=object)[theme_codes]
+    # factorize 코드는 최초 등장 순이라 행 경로의 buckets 삽입 순서와 같다.
+    row_bucket, label_values = pd.factorize(labels)
+
+    # 대상 IP 키워드는 질의 시점에 제외한다(스토어 토큰은 IP 무관 공통 토큰).
+    vocab = data.vocab or []
+    ip_stop = {k.lower() for k in IP_RULES[ip_name]["keywords"]} if ip_name in IP_RULES else set()
+    keep = np.array([token not in ip_stop for token in vocab], dtype=bool)
+    codes = data.token_codes if data.token_codes is not None else np.empty(0, dtype=np.int64)
+    token_rows = data.token_rows if data.token_rows is not None else np.empty(0, dtype=np.int64)
+    if len(codes) and not keep.all():
+        mask = keep[codes]
+        codes, token_rows = codes[mask], token_rows[mask]
+    codes = codes.astype(np.int64)
+    token_rows = token_rows.astype(np.int64)
+    width = max(len(vocab), 1)
+
+    token_codes, token_counts = _first_seen_counts(codes)
+    overall_keywords = Counter(dict(zip([vocab[c] for c in token_codes], token_counts.tolist())))
+    # 기사당 한 번씩 센 문서 빈도(df)와 부정 기사 문서 빈도
+    doc_pairs = np.unique(token_rows * width + codes)
+    doc_codes = doc_pairs % width
+    neg_codes = doc_codes[negative[doc_pairs // width]]
+    doc_values, doc_counts = np.unique(doc_codes, return_counts=True)
+    neg_values, neg_counts = np.unique(neg_codes, return_counts=True)
+    overall_doc_freq = Counter(dict(zip([vocab[c] for c in doc_values], doc_counts.tolist())))
+    overall_negative = Counter(dict(zip([vocab[c] for c in neg_values], neg_counts.tolist())))
+
+    bucket_keys, bucket_counts = _first_seen_counts(row_bucket[token_rows] * width + codes)
+    bucket_keywords: list[list[tuple[str, int]]] = [[] for _ in label_values]
+    for key, count in zip(bucket_keys.tolist(), bucket_counts.tolist()):
+        bucket_keywords[key // width].append((vocab[key % width], count))
+
+    sentiments = frame["sentiment"].to_numpy(dtype=object)
+    titles = frame["title"].to_numpy(dtype=object)
+    buckets: dict[str, dict[str, Any]] = {}
+    for i, label in enumerate(label_values):
+        in_bucket = row_bucket == i
+        bucket_sentiments = sentiments[in_bucket]
+        buckets[label] = {
+            "cluster": label,
+            "article_count": int(in_bucket.sum()),
+            "negative_count": int((bucket_sentiments == "부정").sum()),
+            "sentiments": {k: int((bucket_sentiments == k).sum()) for k in ("긍정", "중립", "부정")},
+            "keywords": Counter(dict(bucket_keywords[i])),
+            "samples": list(islice((str(t) for t in titles[in_bucket] if t), 3)),
+        }
+
+    outlet_values, outlet_counts = _first_seen_counts(frame["outlet"].to_numpy(dtype=object))
+    return {
+        "total": total,
+        "buckets": buckets,
+        "keywords": overall_keywords,
+        "doc_freq": overall_doc_freq,
+        "negative": overall_negative,
+        "outlets": Counter(dict(zip(outlet_values.tolist(), outlet_counts.tolist()))),
+        "volume": volume,
+    }
+
+
+@_cached_read
+def get_ip_clusters(
+    *,
+    date_from: str = "2024-01-01",
+    date_to: str = "2026-12-31",
+    ip: str = "maplestory",
+    limit: int = 6,
+    columnar: bool | None = None,
+) -> dict[str, Any]:
+    """columnar: None이면 Parquet 스토어를 쓸 수 있을 때 열 단위 경로, False면 항상 SQLite 행 경로."""
+    ip_name = _resolve_ip_name(ip)
+    if not ip_name:
+        raise ValueError("지원하지 않는 IP입니다.")
+
+    conn = _connect_readonly()
+    archives = _open_archives(date_from, date_to)
+    try:
+        acc = None
+        if columnar is not False:
+            acc = _ip_cluster_acc_from_columnar(conn, ip_name, date_from, date_to, archives)
+        if acc is None:
+            acc = _ip_cluster_acc_from_articles(conn, ip_name, date_from, date_to, archives)
+    finally:
+        conn.close()
+        for archive_conn in archives.values():
+            archive_conn.close()
+
+    buckets = acc["buckets"]
+    overall_keywords = acc["keywords"]
+    overall_doc_freq = acc["doc_freq"]
+    overall_negative = acc["negative"]
+    outlets = acc["outlets"]
+    volume = acc["volume"]
+    total = acc["total"]
+    doc_total = total
+
     clusters = []
     for bucket in buckets.values():
         cnt = int(bucket["article_count"])
@@ -1061,12 +2440,6 @@ def get_ip_clusters(
         for word, tf, score in top_keyword_counts
     ]
 
-    conn = _connect()
-    try:
-        volume = _compute_group_volume(conn, group_ids)
-    finally:
-        conn.close()
-
     return {
         "meta": {
             "company": "넥슨",
@@ -1090,62 +2463,40 @@ def get_ip_clusters(
     }
 
 
-def get_risk_dashboard(date_from: str = "2024-01-01", date_to: str = "2026-12-31", ip: str = "all") -> dict[str, Any]:
-    ip_name = _resolve_ip_name(ip)
-    if not ip_name:
-        raise ValueError("지원하지 않는 IP입니다.")
+def _empty_theme_counts() -> dict[str, dict[str, float]]:
+    return {
+        k: {"article_count": 0, "negative_count": 0, "negative_ratio": 0.0, "risk_score": 0.0}
+        for k in RISK_THEME_RULES
+    }
 
-    ip_where_sql, ip_where_params = _build_ip_sql_filter(ip_name)
-    params = ["넥슨", date_from, date_to, *ip_where_params]
-    conn = _connect()
-    try:
-        rows = conn.execute(
-            """
-            SELECT id, date,
-                   title_clean,
-                   description_clean,
-                   sentiment,
-                   COALESCE(source_group_id, '') AS source_group_id,
-                   COALESCE(NULLIF(outlet, ''), 'unknown') AS outlet
-            FROM articles
-            WHERE company = ? AND is_test = 0 AND date BETWEEN ? AND ?
-            """
-            + ip_where_sql
-            + """
-            """,
-            params,
-        ).fetchall()
-    finally:
-        conn.close()
 
-    daily_acc: dict[str, dict[str, Any]] = {}
+def _risk_dashboard_acc_from_articles(
+    conn: sqlite3.Connection,
+    ip_name: str,
+    date_from: str,
+    date_to: str,
+    archives: dict[str, sqlite3.Connection] | None = None,
+) -> dict[str, Any]:
+    """롤업을 쓸 수 없을 때(태그 재생성/재집계 전) 기사 전체를 읽어 집계."""
+    rows, tags_ready = _nexon_article_rows(conn, ip_name, date_from, date_to, archives=archives)
+
+    daily_acc: dict[str, dict[str, int]] = {}
     outlet_acc: dict[str, dict[str, int]] = {}
     ip_breakdown_acc: dict[str, int] = {}
-    theme_counts: dict[str, dict[str, float]] = {
-        k: {"article_count": 0, "negative_count": 0, "negative_ratio": 0.0, "risk_score": 0.0}
-        for k in RISK_THEME_RULES
-    }
+    theme_counts = _empty_theme_counts()
     group_ids: set[str] = set()
-
-    total = 0
     for r in rows:
         date = str(r["date"] or "")
-        text = f"{r['title_clean'] or ''} {r['description_clean'] or ''}".lower()
         sentiment = str(r["sentiment"] or "")
         outlet = str(r["outlet"] or "unknown")
-        detected_ip = _detect_ip(text)
+        detected_ip, themes = row_article_tags(r, tags_ready)
         ip_breakdown_acc[detected_ip] = ip_breakdown_acc.get(detected_ip, 0) + 1
 
-        if ip_name != "전체" and not _matches_ip_name(text, ip_name):
-            continue
-
-        total += 1
         gid = str(r["source_group_id"] or "") or f"legacy:{int(r['id'])}"
         group_ids.add(gid)
         if date not in daily_acc:
-            daily_acc[date] = {"article_count": 0, "negative_count": 0, "group_ids": set()}
+            daily_acc[date] = {"article_count": 0, "negative_count": 0}
         daily_acc[date]["article_count"] += 1
-        daily_acc[date]["group_ids"].add(gid)
         if sentiment == "부정":
             daily_acc[date]["negative_count"] += 1
 
@@ -1159,11 +2510,252 @@ def get_risk_dashboard(date_from: str = "2024-01-01", date_to: str = "2026-12-31
         elif sentiment == "부정":
             outlet_acc[outlet]["negative"] += 1
 
-        for theme, kws in RISK_THEME_RULES.items():
-            if any(k.lower() in text for k in kws):
-                theme_counts[theme]["article_count"] += 1
-                if sentiment == "부정":
-                    theme_counts[theme]["negative_count"] += 1
+        for theme in themes:
+            theme_counts[theme]["article_count"] += 1
+            if sentiment == "부정":
+                theme_counts[theme]["negative_count"] += 1
+
+    return {
+        "total": len(rows),
+        "daily": daily_acc,
+        "outlets": outlet_acc,
+        "ip_breakdown": ip_breakdown_acc,
+        "themes": theme_counts,
+        "volume": _compute_group_volume(conn, group_ids, archives),
+    }
+
+
+def _risk_dashboard_acc_from_columnar(
+    conn: sqlite3.Connection,
+    ip_name: str,
+    date_from: str,
+    date_to: str,
+    archives: dict[str, sqlite3.Connection] | None = None,
+) -> dict[str, Any] | None:
+    """_risk_dashboard_acc_from_articles와 같은 집계를 Parquet 스토어에서 만든다(스캔 순서 date, id).
+
+    스토어를 쓸 수 없으면 None.
+    """
+    from backend import analytics_store
+
+    data = analytics_store.load_articles(
+        conn,
+        columns=["id", "date", "sentiment", "source_group_id", "outlet", "primary_ip", "themes"],
+        company="넥슨",
+        date_from=date_from,
+        date_to=date_to,
+        ip_name=ip_name,
+        archives=archives,
+    )
+    if data is None:
+        return None
+    frame = data.frame
+    sentiment = frame["sentiment"]
+    flags = pd.DataFrame(
+        {
+            "date": frame["date"],
+            "outlet": frame["outlet"],
+            "article_count": 1,
+            "positive": (sentiment == "긍정").astype(int),
+            "neutral": (sentiment == "중립").astype(int),
+            "negative": (sentiment == "부정").astype(int),
+        }
+    )
+    daily = flags.groupby("date", sort=False)[["article_count", "negative"]].sum()
+    daily_acc = {
+        str(date): {"article_count": int(count), "negative_count": int(neg)}
+        for date, count, neg in zip(daily.index, daily["article_count"], daily["negative"])
+    }
+    # groupby(sort=False)는 최초 등장 순이라 행 경로 dict의 삽입 순서(동률 정렬)와 같다.
+    columns = ["article_count", "positive", "neutral", "negative"]
+    outlet_sums = flags.groupby("outlet", sort=False)[columns].sum()
+    outlet_acc = {
+        str(outlet): dict(zip(columns, map(int, values)))
+        for outlet, values in zip(outlet_sums.index, outlet_sums.to_numpy())
+    }
+    ip_breakdown_acc = {str(k): int(v) for k, v in frame.groupby("primary_ip", sort=False).size().items()}
+    theme_counts = _empty_theme_counts()
+    # 테마 조합("a|b")의 종류는 적으므로 조합별로 센 뒤 테마로 나눠 더한다.
+    combos = flags["negative"].groupby(frame["themes"]).agg(["size", "sum"])
+    for combo, count, neg in zip(combos.index, combos["size"], combos["sum"]):
+        for theme in str(combo).split("|"):
+            if theme in theme_counts:
+                theme_counts[theme]["article_count"] += int(count)
+                theme_counts[theme]["negative_count"] += int(neg)
+    group_ids = {
+        gid or f"legacy:{rid}" for gid, rid in zip(frame["source_group_id"].tolist(), frame["id"].tolist())
+    }
+    return {
+        "total": len(frame),
+        "daily": daily_acc,
+        "outlets": outlet_acc,
+        "ip_breakdown": ip_breakdown_acc,
+        "themes": theme_counts,
+        "volume": _compute_group_volume(conn, group_ids, archives),
+    }
+
+
+def _risk_dashboard_acc_from_rollup(
+    conn: sqlite3.Connection,
+    ip_name: str,
+    date_from: str,
+    date_to: str,
+    archives: dict[str, sqlite3.Connection] | None = None,
+) -> dict[str, Any]:
+    """article_daily_rollup 기반 집계. 결과는 _risk_dashboard_acc_from_articles와 동일하다.
+
+    언론사/IP 분포는 기사 스캔 시 처음 등장한 순서(date, id)로 돌려줘야 동률 정렬이 같아지므로
+    first_article_id로 최초 등장 시점을 재현한다. 월 아카이브의 롤업은 파일별로 읽어 더한다
+    (건수는 합, 최초 등장 시점은 최솟값).
+    """
+    scope = ("넥슨", "" if ip_name == "전체" else ip_name, date_from, date_to)
+    where = "company = ? AND ip = ? AND date BETWEEN ? AND ?"
+    first_seen = "MIN(date || '|' || printf('%012d', first_article_id))"
+    sources = [conn, *(archives or {}).values()]
+
+    daily_acc: dict[str, dict[str, int]] = {}
+    outlet_acc: dict[str, dict[str, int]] = {}
+    ip_breakdown_acc: dict[str, int] = {}
+    first_seen_at: dict[tuple[str, str], str] = {}
+    theme_counts = _empty_theme_counts()
+    for source in sources:
+        for r in source.execute(
+            f"""
+            SELECT date, SUM(article_count) AS article_count,
+                   SUM(CASE WHEN sentiment = '부정' THEN article_count ELSE 0 END) AS negative_count
+            FROM article_daily_rollup
+            WHERE {where} AND theme = ''
+            GROUP BY date
+            """,
+            scope,
+        ):
+            row = daily_acc.setdefault(str(r["date"]), {"article_count": 0, "negative_count": 0})
+            row["article_count"] += int(r["article_count"])
+            row["negative_count"] += int(r["negative_count"])
+        for r in source.execute(
+            f"""
+            SELECT outlet, SUM(article_count) AS article_count,
+                   SUM(CASE WHEN sentiment = '긍정' THEN article_count ELSE 0 END) AS positive,
+                   SUM(CASE WHEN sentiment = '중립' THEN article_count ELSE 0 END) AS neutral,
+                   SUM(CASE WHEN sentiment = '부정' THEN article_count ELSE 0 END) AS negative,
+                   {first_seen} AS first_seen
+            FROM article_daily_rollup
+            WHERE {where} AND theme = ''
+            GROUP BY outlet
+            """,
+            scope,
+        ):
+            outlet = str(r["outlet"])
+            row = outlet_acc.setdefault(outlet, {"article_count": 0, "positive": 0, "neutral": 0, "negative": 0})
+            for key in row:
+                row[key] += int(r[key])
+            seen = first_seen_at.get(("outlet", outlet))
+            first_seen_at[("outlet", outlet)] = min(seen, str(r["first_seen"])) if seen else str(r["first_seen"])
+        for r in source.execute(
+            f"""
+            SELECT primary_ip, SUM(article_count) AS article_count, {first_seen} AS first_seen
+            FROM article_daily_rollup
+            WHERE {where} AND theme = ''
+            GROUP BY primary_ip
+            """,
+            scope,
+        ):
+            primary_ip = str(r["primary_ip"])
+            ip_breakdown_acc[primary_ip] = ip_breakdown_acc.get(primary_ip, 0) + int(r["article_count"])
+            seen = first_seen_at.get(("ip", primary_ip))
+            first_seen_at[("ip", primary_ip)] = min(seen, str(r["first_seen"])) if seen else str(r["first_seen"])
+        for r in source.execute(
+            f"""
+            SELECT theme, SUM(article_count) AS article_count,
+                   SUM(CASE WHEN sentiment = '부정' THEN article_count ELSE 0 END) AS negative_count
+            FROM article_daily_rollup
+            WHERE {where} AND theme != ''
+            GROUP BY theme
+            """,
+            scope,
+        ):
+            if str(r["theme"]) in theme_counts:
+                theme_counts[str(r["theme"])]["article_count"] += int(r["article_count"])
+                theme_counts[str(r["theme"])]["negative_count"] += int(r["negative_count"])
+    outlet_acc = dict(sorted(outlet_acc.items(), key=lambda kv: first_seen_at[("outlet", kv[0])]))
+    ip_breakdown_acc = dict(sorted(ip_breakdown_acc.items(), key=lambda kv: first_seen_at[("ip", kv[0])]))
+
+    if archives:
+        # 같은 그룹이 여러 파일에 걸칠 수 있어 그룹 id를 모아 _compute_group_volume으로 센다.
+        group_ids: set[str] = set()
+        for source in sources:
+            group_ids.update(
+                str(r[0])
+                for r in source.execute(
+                    f"SELECT DISTINCT group_id FROM article_daily_rollup_groups WHERE {where}", scope
+                )
+            )
+        volume = _compute_group_volume(conn, group_ids, archives)
+    else:
+        # _compute_group_volume과 같은 정의(legacy 그룹은 1건, 그 외 repost_count 최소 1)
+        vol = conn.execute(
+            f"""
+            SELECT COUNT(1) AS unique_articles,
+                   COALESCE(SUM(
+                       CASE WHEN g.group_id LIKE 'legacy:%' THEN 1 ELSE MAX(1, COALESCE(sg.repost_count, 1)) END
+                   ), 0) AS total_mentions
+            FROM (SELECT DISTINCT group_id FROM article_daily_rollup_groups WHERE {where}) g
+            LEFT JOIN source_groups sg ON sg.group_id = g.group_id
+            """,
+            scope,
+        ).fetchone()
+        unique_articles = int(vol["unique_articles"])
+        total_mentions = int(vol["total_mentions"])
+        volume = {
+            "unique_articles": unique_articles,
+            "total_mentions": total_mentions,
+            "repost_multiplier": round(float(total_mentions) / max(unique_articles, 1), 3),
+        }
+    return {
+        "total": sum(v["article_count"] for v in daily_acc.values()),
+        "daily": daily_acc,
+        "outlets": outlet_acc,
+        "ip_breakdown": ip_breakdown_acc,
+        "themes": theme_counts,
+        "volume": volume,
+    }
+
+
+@_cached_read
+def get_risk_dashboard(
+    date_from: str = "2024-01-01",
+    date_to: str = "2026-12-31",
+    ip: str = "all",
+    columnar: bool | None = None,
+) -> dict[str, Any]:
+    """columnar: None이면 롤업 → Parquet 스토어 → 기사 스캔 순, True면 스토어 우선, False면 스토어를 쓰지 않는다."""
+    ip_name = _resolve_ip_name(ip)
+    if not ip_name:
+        raise ValueError("지원하지 않는 IP입니다.")
+
+    conn = _connect_readonly()
+    archives = _open_archives(date_from, date_to)
+    try:
+        acc = None
+        if columnar:
+            acc = _risk_dashboard_acc_from_columnar(conn, ip_name, date_from, date_to, archives)
+        if acc is None and daily_rollup_ready(conn):
+            acc = _risk_dashboard_acc_from_rollup(conn, ip_name, date_from, date_to, archives)
+        if acc is None and columnar is None:
+            acc = _risk_dashboard_acc_from_columnar(conn, ip_name, date_from, date_to, archives)
+        if acc is None:
+            acc = _risk_dashboard_acc_from_articles(conn, ip_name, date_from, date_to, archives)
+    finally:
+        conn.close()
+        for archive_conn in archives.values():
+            archive_conn.close()
+
+    daily_acc = acc["daily"]
+    outlet_acc = acc["outlets"]
+    ip_breakdown_acc = acc["ip_breakdown"]
+    theme_counts = acc["themes"]
+    volume = acc["volume"]
+    total = acc["total"]
 
     daily = []
     for date in sorted(daily_acc.keys()):
@@ -1220,12 +2812,6 @@ def get_risk_dashboard(date_from: str = "2024-01-01", date_to: str = "2026-12-31
         for ip_name_key, count in sorted(ip_breakdown_acc.items(), key=lambda kv: kv[1], reverse=True)
     ]
 
-    conn = _connect()
-    try:
-        volume = _compute_group_volume(conn, group_ids)
-    finally:
-        conn.close()
-
     return {
         "meta": {
             "company": "넥슨",
@@ -1335,6 +2921,7 @@ def _upsert_risk_timeseries(
             str(risk_formula_version),
         ),
     )
+    _bump_data_version(conn, "risk_timeseries")
 
 
 def _parse_article_dt(pub_date: str, date_only: str) -> datetime | None:
@@ -1346,499 +2933,556 @@ def _parse_article_dt(pub_date: str, date_only: str) -> datetime | None:
     return dt.to_pydatetime().replace(tzinfo=None)
 
 
-def get_live_risk(ip: str = "all", window_hours: int = 24) -> dict[str, Any]:
+def _live_risk_articles(
+    conn: sqlite3.Connection,
+    ip_name: str | None,
+    *,
+    baseline_date: str,
+    include_test: bool,
+    tags_ready: bool,
+    after_id: int = 0,
+    until_id: int | None = None,
+) -> list[WindowArticle]:
+    """리스크 기준 구간 기사를 (date, id) 순으로 읽어 WindowArticle로 변환.
+
+    ip_name=None이면 IP 필터 없이 한 번에 읽고 기사별 소속 IP 목록(ip_names)을 채운다.
+    """
+    ip_where_sql, ip_where_params = _build_ip_sql_filter(ip_name, tags_ready) if ip_name is not None else ("", [])
+    tag_columns_sql = ARTICLE_TAG_COLUMNS_SQL
+    if ip_name is None and tags_ready:
+        tag_columns_sql += """,
+    (SELECT group_concat(t.tag, '|') FROM article_tags t
+     WHERE t.article_id = articles.id AND t.tag_type = 'ip') AS ip_tags
+"""
+    where = ["company = ?", "date >= ?"]
+    params: list[Any] = ["넥슨", baseline_date]
+    if not include_test:
+        where.append("is_test = 0")
+    if after_id:
+        where.append("id > ?")
+        params.append(int(after_id))
+    if until_id is not None:
+        where.append("id <= ?")
+        params.append(int(until_id))
+    rows = conn.execute(
+        """
+        SELECT id, title_clean, description_clean,
+               COALESCE(NULLIF(outlet, ''), 'unknown') AS outlet,
+               COALESCE(pub_date, '') AS pub_date,
+               COALESCE(date, '') AS date,
+               COALESCE(source_group_id, '') AS source_group_id,
+        """
+        + tag_columns_sql
+        + f"""
+        FROM articles
+        WHERE {" AND ".join(where)}
+        """
+        + ip_where_sql
+        + """
+        ORDER BY date, id
+        """,
+        [*params, *ip_where_params],
+    ).fetchall()
+
+    out: list[WindowArticle] = []
+    for r in rows:
+        dt = _parse_article_dt(str(r["pub_date"] or ""), str(r["date"] or ""))
+        if not dt:
+            continue
+        _, themes = row_article_tags(r, tags_ready)
+        ip_names: tuple[str, ...] = ()
+        if ip_name is None:
+            if tags_ready:
+                found = set(str(r["ip_tags"] or "").split("|"))
+                ip_names = tuple(name for name in IP_RULES if name in found)
+            else:
+                ip_names = tuple(detect_ip_tags(f"{r['title_clean'] or ''} {r['description_clean'] or ''}"))
+        out.append(
+            WindowArticle(
+                article_id=int(r["id"]),
+                dt=dt,
+                date=str(r["date"] or ""),
+                group_id=str(r["source_group_id"] or "") or f"legacy:{int(r['id'])}",
+                theme=themes[0] if themes else None,
+                outlet=str(r["outlet"] or "unknown"),
+                ip_names=ip_names,
+            )
+        )
+    return out
+
+
+def latest_group_sentiments(conn: sqlite3.Connection, group_ids: list[str]) -> dict[str, sqlite3.Row]:
+    """그룹별 최신 감성 결과 행(sentiment_score, sentiment_label, confidence). 결과가 없는 그룹은 빠진다.
+
+    group_sentiment_latest를 id 목록(JSON 1개 파라미터)과 조인해 읽는다. 여러 방식(method)의 결과가
+    있으면 analyzed_at, id가 가장 늦은 것을 쓴다. 표가 없는 예전 DB는 sentiment_results를 직접 읽는다.
+    """
+    out: dict[str, sqlite3.Row] = {}
+    if not group_ids:
+        return out
+    try:
+        rows = conn.execute(
+            """
+            SELECT l.source_group_id, l.sentiment_score, l.sentiment_label, l.confidence
+            FROM json_each(?) AS g
+            JOIN group_sentiment_latest AS l ON l.source_group_id = g.value
+            ORDER BY l.analyzed_at DESC, l.result_id DESC
+            """,
+            (json.dumps(sorted(set(group_ids)), ensure_ascii=False),),
+        ).fetchall()
+    except sqlite3.OperationalError:
+        rows = []
+        ids = sorted(set(group_ids))
+        for i in range(0, len(ids), 500):
+            chunk = ids[i : i + 500]
+            placeholders = ",".join(["?"] * len(chunk))
+            rows.extend(
+                conn.execute(
+                    f"""
+                    SELECT source_group_id, sentiment_score, sentiment_label, confidence
+                    FROM sentiment_results
+                    WHERE source_group_id IN ({placeholders})
+                    ORDER BY analyzed_at DESC, id DESC
+                    """,
+                    chunk,
+                ).fetchall()
+            )
+    for r in rows:
+        out.setdefault(str(r["source_group_id"] or ""), r)
+    return out
+
+
+def _group_sentiment_values(conn: sqlite3.Connection, group_ids: list[str]) -> dict[str, tuple[float, bool]]:
+    """그룹별 최신 감성 결과 -> (신뢰도 가중 부정값, 부정 여부). 결과가 없으면 (0.0, False)."""
+    out: dict[str, tuple[float, bool]] = {}
+    latest = latest_group_sentiments(conn, [g for g in group_ids if not is_legacy_group(g)])
+    for gid, sr in latest.items():
+        weight = max(0.2, float(sr["confidence"] or 0.0))
+        negative_value = max(0.0, -float(sr["sentiment_score"] or 0.0))
+        out[gid] = (negative_value * weight, str(sr["sentiment_label"] or "neutral") == "negative")
+    for gid in group_ids:
+        out.setdefault(gid, (0.0, False))
+    return out
+
+
+def _risk_window_state_full(
+    conn: sqlite3.Connection,
+    ip_name: str,
+    *,
+    window_hours: int,
+    include_test: bool,
+    tags_ready: bool,
+    now: datetime,
+) -> RiskWindowState:
+    """기준 구간 기사 전체를 읽어 리스크 입력값을 새로 계산(슬라이딩 윈도우 미사용 경로)."""
+    start_window = now - timedelta(hours=max(1, int(window_hours)))
+    baseline_date = (now - timedelta(days=7)).strftime("%Y-%m-%d")
+    scoped = _live_risk_articles(
+        conn, ip_name, baseline_date=baseline_date, include_test=include_test, tags_ready=tags_ready
+    )
+
+    recent = [a for a in scoped if a.dt >= start_window]
+    recent_group_items: dict[str, WindowArticle] = {}
+    for a in recent:
+        if a.group_id not in recent_group_items:
+            recent_group_items[a.group_id] = a
+    sentiment = _group_sentiment_values(conn, list(recent_group_items))
+
+    hour_start = now - timedelta(hours=1)
+    hourly_counter: Counter[datetime] = Counter(hour_bucket(a.dt) for a in scoped if a.dt < now)
+    theme_counter: Counter[str] = Counter(a.theme for a in recent_group_items.values() if a.theme)
+    return RiskWindowState(
+        scoped_count=len(scoped),
+        recent_count=len(recent),
+        recent_group_count=len(recent_group_items),
+        count_1h=sum(1 for a in scoped if a.dt >= hour_start),
+        negative_group_count=sum(1 for value in sentiment.values() if value[1]),
+        weighted_negative_sum=math.fsum(value[0] for value in sentiment.values()),
+        hourly_counts=dict(hourly_counter),
+        theme_counts=dict(theme_counter),
+        outlet_counts=dict(Counter(a.outlet for a in recent)),
+    )
+
+
+LIVE_RISK_WINDOW_ENABLED = os.getenv("LIVE_RISK_WINDOW_ENABLED", "1") == "1"
+LIVE_RISK_WINDOW_MAX_ENTRIES = int(os.getenv("LIVE_RISK_WINDOW_MAX_ENTRIES", "8"))
+# 슬라이딩 윈도우 엔진은 스케줄러(모니터 틱/백필) 조합인 24시간·테스트 기사 제외만 DB별로 유지한다.
+# 조회 요청의 다른 window_hours/include_test 조합은 엔진을 밀어내지 않도록 캐시 없이 전체 재계산한다.
+LIVE_RISK_WINDOW_HOURS = 24
+_risk_engines: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_risk_engines_lock = Lock()
+
+
+def _articles_epoch(conn: sqlite3.Connection) -> str:
+    return _get_storage_meta(conn, "articles_epoch") or "0"
+
+
+def _bump_articles_epoch(conn: sqlite3.Connection) -> None:
+    # 기사 삭제/수정/재태깅 시 증가 -> 메모리 슬라이딩 윈도우를 다시 적재하게 한다.
+    _set_storage_meta(conn, "articles_epoch", str(int(_articles_epoch(conn)) + 1))
+
+
+def _risk_engine_states(
+    conn: sqlite3.Connection,
+    ip_names: list[str],
+    *,
+    now: datetime,
+) -> dict[str, RiskWindowState] | None:
+    """모든 IP(+전체) 슬라이딩 윈도우를 신규 기사 1회 조회로 갱신하고 요청 IP의 리스크 입력값 반환.
+
+    엔진은 DB별로 하나(LIVE_RISK_WINDOW_HOURS, 테스트 기사 제외)이며, 신규 기사는 IP 필터 없이 한 번 읽어
+    article_tags 소속 IP별 윈도우로 분배한다. 미확정 그룹 감성도 모든 윈도우를 합쳐 한 번에 조회한다.
+    기사 삭제/수정(articles_epoch 변경)이나 시각 역행 시에는 엔진을 새로 적재한다.
+    DB 조회는 _risk_engines_lock 밖에서 하고 잠금 안에서는 엔진만 갱신한다. 그 사이 다른 호출이 엔진을
+    새로 적재했거나 더 늦은 시각으로 옮겼으면 None을 반환한다(호출자가 전체 재계산).
+    """
+    key = str(get_active_db_path())
+    epoch = _articles_epoch(conn)
+    max_row = conn.execute("SELECT MAX(id) FROM articles").fetchone()
+    max_id = int(max_row[0] or 0) if max_row else 0
+    with _risk_engines_lock:
+        entry = _risk_engines.get(key)
+        if entry is None or entry["epoch"] != epoch or (entry["now"] and now < entry["now"]):
+            entry = {
+                "epoch": epoch,
+                "now": None,
+                "last_article_id": 0,
+                "windows": {name: RiskWindow(window_hours=LIVE_RISK_WINDOW_HOURS) for name in IP_RULES},
+            }
+            _risk_engines[key] = entry
+        _risk_engines.move_to_end(key)
+        while len(_risk_engines) > max(1, LIVE_RISK_WINDOW_MAX_ENTRIES):
+            _risk_engines.popitem(last=False)
+        after_id = int(entry["last_article_id"])
+        baseline_date = entry["windows"]["전체"].baseline_date(now)
+
+    articles: list[WindowArticle] = []
+    if max_id > after_id:
+        articles = _live_risk_articles(
+            conn,
+            None,
+            baseline_date=baseline_date,
+            include_test=False,
+            tags_ready=True,
+            after_id=after_id,
+            until_id=max_id,
+        )
+
+    with _risk_engines_lock:
+        if _risk_engines.get(key) is not entry or (entry["now"] and now < entry["now"]):
+            return None
+        windows: dict[str, RiskWindow] = entry["windows"]
+        last_id = int(entry["last_article_id"])
+        if max_id > last_id:
+            # 다른 호출이 먼저 일부를 더했으면 그 뒤 기사만 더한다.
+            fresh = [a for a in articles if a.article_id > last_id]
+            routed: dict[str, list[WindowArticle]] = {name: [] for name in windows}
+            routed["전체"] = fresh
+            for a in fresh:
+                for name in a.ip_names:
+                    if name in routed and name != "전체":
+                        routed[name].append(a)
+            for name, window in windows.items():
+                window.add(routed[name])
+                window.last_article_id = max_id
+            entry["last_article_id"] = max_id
+        for window in windows.values():
+            window.advance(now)
+        entry["now"] = now
+
+    values: dict[str, tuple[float, bool]] = {}
+    while True:
+        with _risk_engines_lock:
+            if _risk_engines.get(key) is not entry or entry["now"] != now:
+                return None
+            missing: set[str] = set()
+            for window in windows.values():
+                for gid in window.pending_sentiment_groups():
+                    if gid in values:
+                        window.set_group_sentiment(gid, *values[gid])
+                    else:
+                        missing.add(gid)
+            if not missing:
+                return {name: windows[name].state(now) for name in ip_names}
+        values.update(_group_sentiment_values(conn, sorted(missing)))
+
+
+def _live_risk_components(state: RiskWindowState, now: datetime) -> dict[str, float]:
+    group_count = int(state.recent_group_count)
+    S_t = float(state.weighted_negative_sum / max(group_count, 1))
+    uncertain_ratio = 0.0  # 3-class 전환 이후 레거시 필드 호환용(항상 0)
+    negative_ratio_window = float(state.negative_group_count / max(group_count, 1))
+
+    hourly = sorted(state.hourly_counts.items())
+    same_hour_values = [value for bucket, value in hourly if bucket.hour == now.hour]
+    baseline_values = same_hour_values if len(same_hour_values) >= 3 else [value for _, value in hourly]
+    baseline_mean = float(sum(baseline_values) / max(len(baseline_values), 1))
+    baseline_std = float(pd.Series(baseline_values).std(ddof=0)) if baseline_values else 0.0
+    count_1h = int(state.count_1h)
+    z_score = (float(count_1h) - baseline_mean) / max(baseline_std, 1.0)
+    V_heat = float(_sigmoid(z_score))
+    V_risk = float(V_heat * negative_ratio_window)
+
+    T_heat = 0.0
+    T_risk = 0.0
+    if group_count:
+        total_groups = float(group_count)
+        T_heat = math.fsum(
+            float(cnt) / total_groups * float(THEME_WEIGHTS_HEAT.get(theme, 0.4))
+            for theme, cnt in state.theme_counts.items()
+        )
+        T_risk = math.fsum(
+            float(cnt) / total_groups * float(THEME_WEIGHTS_RISK.get(theme, 0.0))
+            for theme, cnt in state.theme_counts.items()
+            if theme in THEME_WEIGHTS_RISK
+        )
+
+    M_t = 0.0
+    if state.recent_count:
+        total_recent = float(state.recent_count)
+        M_t = math.fsum(float(cnt) / total_recent * _outlet_weight(outlet) for outlet, cnt in state.outlet_counts.items())
+
+    spread_ratio = float(state.recent_count / max(group_count, 1))
+
+    if not state.scoped_count:
+        S_t = V_heat = V_risk = T_heat = T_risk = M_t = 0.0
+        uncertain_ratio = negative_ratio_window = spread_ratio = z_score = 0.0
+        count_1h = 0
+    return {
+        "S": S_t,
+        "V_heat": V_heat,
+        "V_risk": V_risk,
+        "T_heat": T_heat,
+        "T_risk": T_risk,
+        "M": M_t,
+        "uncertain_ratio": uncertain_ratio,
+        "negative_ratio_window": negative_ratio_window,
+        "spread_ratio": spread_ratio,
+        "z_score": z_score,
+        "count_1h": count_1h,
+    }
+
+
+def _compute_live_risk(
+    ip: str,
+    *,
+    window_hours: int,
+    include_test: bool,
+    persist: bool,
+    incremental: bool | None = None,
+    now: datetime | None = None,
+) -> dict[str, Any]:
     ip_name = _resolve_ip_name(ip)
     if not ip_name:
         raise ValueError("지원하지 않는 IP입니다.")
 
-    now = datetime.now()
-    start_window = now - timedelta(hours=max(1, int(window_hours)))
-    start_baseline = now - timedelta(days=7)
-    baseline_date = start_baseline.strftime("%Y-%m-%d")
-
+    now = now or datetime.now()
     conn = _connect()
     try:
-        rows = conn.execute(
-            """
-            SELECT id, title_clean, description_clean,
-                   COALESCE(NULLIF(outlet, ''), 'unknown') AS outlet,
-                   COALESCE(pub_date, '') AS pub_date,
-                   COALESCE(date, '') AS date,
-                   COALESCE(source_group_id, '') AS source_group_id
-            FROM articles
-            WHERE company = ? AND date >= ? AND is_test = 0
-            """,
-            ("넥슨", baseline_date),
-        ).fetchall()
-
-        scoped = []
-        for r in rows:
-            text = f"{r['title_clean'] or ''} {r['description_clean'] or ''}"
-            if ip_name != "전체" and not _matches_ip_name(text, ip_name):
-                continue
-            dt = _parse_article_dt(str(r["pub_date"] or ""), str(r["date"] or ""))
-            if not dt:
-                continue
-            scoped.append(
-                {
-                    "id": int(r["id"]),
-                    "dt": dt,
-                    "text": text.lower(),
-                    "outlet": str(r["outlet"] or "unknown"),
-                    "source_group_id": str(r["source_group_id"] or ""),
-                }
-            )
-
-        recent = [r for r in scoped if r["dt"] >= start_window]
-        recent_group_items: dict[str, dict[str, Any]] = {}
-        for r in recent:
-            gid = str(r["source_group_id"] or "") or f"legacy:{int(r['id'])}"
-            if gid not in recent_group_items:
-                recent_group_items[gid] = r
-        recent_groups = sorted(recent_group_items.keys())
-        recent_real_group_ids = sorted(g for g in recent_groups if not g.startswith("legacy:"))
-
-        sentiment_by_group: dict[str, dict[str, float | str]] = {}
-        if recent_real_group_ids:
-            placeholders = ",".join(["?"] * len(recent_real_group_ids))
-            srows = conn.execute(
-                f"""
-                SELECT source_group_id, sentiment_score, sentiment_label, confidence, analyzed_at
-                FROM sentiment_results
-                WHERE source_group_id IN ({placeholders})
-                ORDER BY analyzed_at DESC, id DESC
-                """,
-                recent_real_group_ids,
-            ).fetchall()
-            for sr in srows:
-                gid = str(sr["source_group_id"] or "")
-                if gid in sentiment_by_group:
-                    continue
-                sentiment_by_group[gid] = {
-                    "score": float(sr["sentiment_score"] or 0.0),
-                    "label": str(sr["sentiment_label"] or "neutral"),
-                    "confidence": float(sr["confidence"] or 0.0),
-                }
-
-        weighted_scores = []
-        uncertain_count = 0  # 3-class 전환 이후 레거시 필드 호환용(항상 0)
-        negative_group_count = 0
-        for gid in recent_groups:
-            entry = sentiment_by_group.get(gid, {"score": 0.0, "label": "neutral", "confidence": 0.0})
-            label = str(entry["label"])
-            confidence = float(entry["confidence"])
-            weight = max(0.2, confidence)
-            negative_value = max(0.0, -float(entry["score"]))
-            weighted_scores.append(negative_value * weight)
-            if label == "negative":
-                negative_group_count += 1
-        S_t = float(sum(weighted_scores) / max(len(weighted_scores), 1))
-        uncertain_ratio = float(uncertain_count / max(len(recent_groups), 1))
-        negative_ratio_window = float(negative_group_count / max(len(recent_groups), 1))
-
-        hour_start = now - timedelta(hours=1)
-        count_1h = sum(1 for r in scoped if r["dt"] >= hour_start)
-        hourly_counter: Counter[str] = Counter()
-        for r in scoped:
-            if r["dt"] >= now:
-                continue
-            bucket = r["dt"].strftime("%Y-%m-%d %H")
-            hourly_counter[bucket] += 1
-        same_hour_values = []
-        current_hour = now.hour
-        for key, value in hourly_counter.items():
-            dt_key = datetime.strptime(key, "%Y-%m-%d %H")
-            if dt_key.hour == current_hour:
-                same_hour_values.append(value)
-        baseline_values = same_hour_values if len(same_hour_values) >= 3 else list(hourly_counter.values())
-        baseline_mean = float(sum(baseline_values) / max(len(baseline_values), 1))
-        baseline_std = float(pd.Series(baseline_values).std(ddof=0)) if baseline_values else 0.0
-        z_score = (float(count_1h) - baseline_mean) / max(baseline_std, 1.0)
-        V_heat = float(_sigmoid(z_score))
-        V_risk = float(V_heat * negative_ratio_window)
-
-        theme_counter_heat: Counter[str] = Counter()
-        theme_counter_risk: Counter[str] = Counter()
-        for r in recent_group_items.values():
-            for theme, keywords in RISK_THEME_RULES.items():
-                if any(k.lower() in r["text"] for k in keywords):
-                    theme_counter_heat[theme] += 1
-                    if theme in THEME_WEIGHTS_RISK:
-                        theme_counter_risk[theme] += 1
-                    break
-        T_heat = 0.0
-        T_risk = 0.0
-        if recent_group_items:
-            total_recent = float(len(recent_group_items))
-            for theme, cnt in theme_counter_heat.items():
-                share = float(cnt) / total_recent
-                T_heat += share * float(THEME_WEIGHTS_HEAT.get(theme, 0.4))
-            for theme, cnt in theme_counter_risk.items():
-                share = float(cnt) / total_recent
-                T_risk += share * float(THEME_WEIGHTS_RISK.get(theme, 0.0))
-
-        outlet_counter: Counter[str] = Counter(r["outlet"] for r in recent)
-        M_t = 0.0
-        if recent:
-            total_recent = float(len(recent))
-            for outlet, cnt in outlet_counter.items():
-                share = float(cnt) / total_recent
-                M_t += share * _outlet_weight(outlet)
-
-        spread_ratio = float(len(recent) / max(len(recent_groups), 1))
-
-        if not scoped:
-            S_t = 0.0
-            V_heat = 0.0
-            V_risk = 0.0
-            T_heat = 0.0
-            T_risk = 0.0
-            M_t = 0.0
-            uncertain_ratio = 0.0
-            negative_ratio_window = 0.0
-            spread_ratio = 0.0
-            z_score = 0.0
-            count_1h = 0
-
-        raw_issue_heat = 100.0 * (0.45 * V_heat + 0.35 * T_heat + 0.20 * M_t)
-        raw_risk = 100.0 * (0.50 * S_t + 0.25 * V_risk + 0.15 * T_risk + 0.10 * (M_t * negative_ratio_window))
-        ip_id = (ip or "all").strip().lower()
-        prev = conn.execute(
-            """
-            SELECT risk_score
-            FROM risk_timeseries
-            WHERE ip_id = ?
-            ORDER BY ts DESC, id DESC
-            LIMIT 1
-            """,
-            (ip_id,),
-        ).fetchone()
-        prev_risk = float(prev["risk_score"]) if prev else None
-        ema_alpha = 0.3
-        if not scoped:
-            smoothed = 0.0
-            ema_alpha = 1.0
-            prev_risk = None
-        else:
-            smoothed = (0.7 * prev_risk + 0.3 * raw_risk) if prev_risk is not None else raw_risk
-            if prev_risk is not None and count_1h < 10:
-                ema_alpha = 0.1
-                smoothed = 0.9 * prev_risk + 0.1 * raw_risk
-
-        score = round(float(max(0.0, min(100.0, smoothed))), 1)
-        issue_heat = round(float(max(0.0, min(100.0, raw_issue_heat))), 1)
-        alert = _alert_level(score)
-        ts = now.strftime("%Y-%m-%d %H:%M:%S")
-        sample_size = int(len(recent_groups))
-        quality_flag = _risk_quality_flag(sample_size)
-        confidence = max(0.0, min(1.0, (sample_size / 20.0) * (1.0 - min(0.7, uncertain_ratio * 0.7))))
-        if quality_flag == "LOW_SAMPLE":
-            confidence = min(confidence, 0.25)
-        _upsert_risk_timeseries(
+        states = _live_risk_states(
+            conn, [ip_name], window_hours=window_hours, include_test=include_test, incremental=incremental, now=now
+        )
+        return _live_risk_payload(
             conn,
-            ip_id=ip_id,
-            ts=ts,
-            raw_risk=float(raw_risk),
-            score=float(score),
-            issue_heat=float(issue_heat),
-            s_comp=float(S_t),
-            v_comp=float(V_risk),
-            t_comp=float(T_risk),
-            m_comp=float(M_t),
-            alert_level=alert,
-            sample_size=sample_size,
-            uncertain_ratio=float(uncertain_ratio),
-            quality_flag=quality_flag,
-            risk_formula_version=RISK_FORMULA_VERSION,
+            (ip or "all").strip().lower(),
+            ip_name,
+            states[ip_name],
+            window_hours=window_hours,
+            include_test=include_test,
+            persist=persist,
+            now=now,
         )
-        conn.commit()
+    finally:
+        conn.close()
+
 
+def _compute_live_risk_all(
+    *,
+    window_hours: int,
+    include_test: bool,
+    persist: bool,
+    incremental: bool | None = None,
+    now: datetime | None = None,
+) -> dict[str, dict[str, Any]]:
+    now = now or datetime.now()
+    conn = _connect()
+    try:
+        states = _live_risk_states(
+            conn, list(IP_RULES), window_hours=window_hours, include_test=include_test, incremental=incremental, now=now
+        )
         return {
-            "meta": {"ip": ip_name, "ip_id": ip_id, "window_hours": int(window_hours), "ts": ts},
-            "risk_score": score,
-            "raw_risk": round(float(raw_risk), 3),
-            "ema_prev": round(float(prev_risk), 3) if prev_risk is not None else None,
-            "ema_alpha": float(ema_alpha) if prev_risk is not None else 1.0,
-            "components": {
-                "S": round(float(S_t), 3),
-                "V": round(float(V_risk), 3),
-                "T": round(float(T_risk), 3),
-                "M": round(float(M_t), 3),
-            },
-            "issue_heat": issue_heat,
-            "negative_ratio_window": round(float(negative_ratio_window), 3),
-            "confidence": round(float(confidence), 3),
-            "risk_formula_version": RISK_FORMULA_VERSION,
-            "alert_level": alert,
-            "alert": alert,
-            "sample_size": sample_size,
-            "data_quality_flag": quality_flag,
-            "article_count_window": int(len(recent)),
-            "group_count_window": int(len(recent_groups)),
-            "mention_count_window": int(len(recent)),
-            "exposure_count_window": int(len(recent)),
-            "count_1h": int(count_1h),
-            "z_score": round(float(z_score), 3),
-            "uncertain_ratio": round(float(uncertain_ratio), 3),
-            "spread_ratio": round(float(spread_ratio), 3),
+            meta["slug"]: _live_risk_payload(
+                conn,
+                meta["slug"],
+                name,
+                states[name],
+                window_hours=window_hours,
+                include_test=include_test,
+                persist=persist,
+                now=now,
+            )
+            for name, meta in IP_RULES.items()
         }
     finally:
         conn.close()
 
 
-def get_live_risk_with_options(ip: str = "all", window_hours: int = 24, include_test: bool = False) -> dict[str, Any]:
-    if not include_test:
-        return get_live_risk(ip=ip, window_hours=window_hours)
+def _live_risk_states(
+    conn: sqlite3.Connection,
+    ip_names: list[str],
+    *,
+    window_hours: int,
+    include_test: bool,
+    incremental: bool | None,
+    now: datetime,
+) -> dict[str, RiskWindowState]:
+    use_window = LIVE_RISK_WINDOW_ENABLED if incremental is None else bool(incremental)
+    use_window = use_window and int(window_hours) == LIVE_RISK_WINDOW_HOURS and not include_test
+    tags_ready = article_tags_ready(conn)
+    # 태그/롤업 재생성 대기 중에는 윈도우가 옛 태그를 들고 있을 수 있어 전체 재계산한다.
+    if use_window and tags_ready and daily_rollup_ready(conn):
+        states = _risk_engine_states(conn, ip_names, now=now)
+        if states is not None:
+            return states
+    return {
+        name: _risk_window_state_full(
+            conn, name, window_hours=window_hours, include_test=include_test, tags_ready=tags_ready, now=now
+        )
+        for name in ip_names
+    }
 
-    ip_name = _resolve_ip_name(ip)
-    if not ip_name:
-        raise ValueError("지원하지 않는 IP입니다.")
 
-    now = datetime.now()
-    start_window = now - timedelta(hours=max(1, int(window_hours)))
-    start_baseline = now - timedelta(days=7)
-    baseline_date = start_baseline.strftime("%Y-%m-%d")
+def _live_risk_payload(
+    conn: sqlite3.Connection,
+    ip_id: str,
+    ip_name: str,
+    state: RiskWindowState,
+    *,
+    window_hours: int,
+    include_test: bool,
+    persist: bool,
+    now: datetime,
+) -> dict[str, Any]:
+    """리스크 입력값 -> EMA 평활 점수/응답 payload. persist=True면 risk_timeseries에 기록."""
+    comp = _live_risk_components(state, now)
+    S_t = comp["S"]
+    V_risk = comp["V_risk"]
+    T_risk = comp["T_risk"]
+    M_t = comp["M"]
+    uncertain_ratio = comp["uncertain_ratio"]
+    negative_ratio_window = comp["negative_ratio_window"]
+    count_1h = int(comp["count_1h"])
+
+    raw_issue_heat = 100.0 * (0.45 * comp["V_heat"] + 0.35 * comp["T_heat"] + 0.20 * M_t)
+    raw_risk = 100.0 * (0.50 * S_t + 0.25 * V_risk + 0.15 * T_risk + 0.10 * (M_t * negative_ratio_window))
+    prev = conn.execute(
+        """
+        SELECT risk_score
+        FROM risk_timeseries
+        WHERE ip_id = ?
+        ORDER BY ts DESC, id DESC
+        LIMIT 1
+        """,
+        (ip_id,),
+    ).fetchone()
+    prev_risk = float(prev["risk_score"]) if prev else None
+    ema_alpha = 0.3
+    if not state.scoped_count:
+        smoothed = 0.0
+        ema_alpha = 1.0
+        prev_risk = None
+    else:
+        smoothed = (0.7 * prev_risk + 0.3 * raw_risk) if prev_risk is not None else raw_risk
+        if prev_risk is not None and count_1h < 10:
+            ema_alpha = 0.1
+            smoothed = 0.9 * prev_risk + 0.1 * raw_risk
+
+    score = round(float(max(0.0, min(100.0, smoothed))), 1)
+    issue_heat = round(float(max(0.0, min(100.0, raw_issue_heat))), 1)
+    alert = _alert_level(score)
+    ts = now.strftime("%Y-%m-%d %H:%M:%S")
+    sample_size = int(state.recent_group_count)
+    quality_flag = _risk_quality_flag(sample_size)
+    confidence = max(0.0, min(1.0, (sample_size / 20.0) * (1.0 - min(0.7, uncertain_ratio * 0.7))))
+    if quality_flag == "LOW_SAMPLE":
+        confidence = min(confidence, 0.25)
+    # persist=False: 조회 전용 계산(risk_timeseries EMA 이력에 쓰지 않음)
+    # persist=True는 다음 틱 EMA가 이 값을 읽으므로 커밋까지 기다린다.
+    if persist:
+        _write(
+            lambda wconn: _upsert_risk_timeseries(
+                wconn,
+                ip_id=ip_id,
+                ts=ts,
+                raw_risk=float(raw_risk),
+                score=float(score),
+                issue_heat=float(issue_heat),
+                s_comp=float(S_t),
+                v_comp=float(V_risk),
+                t_comp=float(T_risk),
+                m_comp=float(M_t),
+                alert_level=alert,
+                sample_size=sample_size,
+                uncertain_ratio=float(uncertain_ratio),
+                quality_flag=quality_flag,
+                risk_formula_version=RISK_FORMULA_VERSION,
+            ),
+            label="risk_timeseries",
+        )
 
-    conn = _connect()
-    try:
-        rows = conn.execute(
-            """
-            SELECT id, title_clean, description_clean,
-                   COALESCE(NULLIF(outlet, ''), 'unknown') AS outlet,
-                   COALESCE(pub_date, '') AS pub_date,
-                   COALESCE(date, '') AS date,
-                   COALESCE(source_group_id, '') AS source_group_id
-            FROM articles
-            WHERE company = ? AND date >= ?
-            """,
-            ("넥슨", baseline_date),
-        ).fetchall()
+    meta: dict[str, Any] = {"ip": ip_name, "ip_id": ip_id, "window_hours": int(window_hours), "ts": ts}
+    if include_test:
+        meta["include_test"] = True
+    return {
+        "meta": meta,
+        "risk_score": score,
+        "raw_risk": round(float(raw_risk), 3),
+        "ema_prev": round(float(prev_risk), 3) if prev_risk is not None else None,
+        "ema_alpha": float(ema_alpha) if prev_risk is not None else 1.0,
+        "components": {
+            "S": round(float(S_t), 3),
+            "V": round(float(V_risk), 3),
+            "T": round(float(T_risk), 3),
+            "M": round(float(M_t), 3),
+        },
+        "issue_heat": issue_heat,
+        "negative_ratio_window": round(float(negative_ratio_window), 3),
+        "confidence": round(float(confidence), 3),
+        "risk_formula_version": RISK_FORMULA_VERSION,
+        "alert_level": alert,
+        "alert": alert,
+        "sample_size": sample_size,
+        "data_quality_flag": quality_flag,
+        "article_count_window": int(state.recent_count),
+        "group_count_window": int(state.recent_group_count),
+        "mention_count_window": int(state.recent_count),
+        "exposure_count_window": int(state.recent_count),
+        "count_1h": int(count_1h),
+        "z_score": round(float(comp["z_score"]), 3),
+        "uncertain_ratio": round(float(uncertain_ratio), 3),
+        "spread_ratio": round(float(comp["spread_ratio"]), 3),
+    }
 
-        scoped = []
-        for r in rows:
-            text = f"{r['title_clean'] or ''} {r['description_clean'] or ''}"
-            if ip_name != "전체" and not _matches_ip_name(text, ip_name):
-                continue
-            dt = _parse_article_dt(str(r["pub_date"] or ""), str(r["date"] or ""))
-            if not dt:
-                continue
-            scoped.append(
-                {
-                    "id": int(r["id"]),
-                    "dt": dt,
-                    "text": text.lower(),
-                    "outlet": str(r["outlet"] or "unknown"),
-                    "source_group_id": str(r["source_group_id"] or ""),
-                }
-            )
 
-        recent = [r for r in scoped if r["dt"] >= start_window]
-        recent_group_items: dict[str, dict[str, Any]] = {}
-        for r in recent:
-            gid = str(r["source_group_id"] or "") or f"legacy:{int(r['id'])}"
-            if gid not in recent_group_items:
-                recent_group_items[gid] = r
-        recent_groups = sorted(recent_group_items.keys())
-        recent_real_group_ids = sorted(g for g in recent_groups if not g.startswith("legacy:"))
-
-        sentiment_by_group: dict[str, dict[str, float | str]] = {}
-        if recent_real_group_ids:
-            placeholders = ",".join(["?"] * len(recent_real_group_ids))
-            srows = conn.execute(
-                f"""
-                SELECT source_group_id, sentiment_score, sentiment_label, confidence, analyzed_at
-                FROM sentiment_results
-                WHERE source_group_id IN ({placeholders})
-                ORDER BY analyzed_at DESC, id DESC
-                """,
-                recent_real_group_ids,
-            ).fetchall()
-            for sr in srows:
-                gid = str(sr["source_group_id"] or "")
-                if gid in sentiment_by_group:
-                    continue
-                sentiment_by_group[gid] = {
-                    "score": float(sr["sentiment_score"] or 0.0),
-                    "label": str(sr["sentiment_label"] or "neutral"),
-                    "confidence": float(sr["confidence"] or 0.0),
-                }
+def get_live_risk(ip: str = "all", window_hours: int = 24, persist: bool = True) -> dict[str, Any]:
+    return _compute_live_risk(ip, window_hours=window_hours, include_test=False, persist=persist)
 
-        weighted_scores = []
-        uncertain_count = 0  # 3-class 전환 이후 레거시 필드 호환용(항상 0)
-        negative_group_count = 0
-        for gid in recent_groups:
-            entry = sentiment_by_group.get(gid, {"score": 0.0, "label": "neutral", "confidence": 0.0})
-            label = str(entry["label"])
-            confidence = float(entry["confidence"])
-            weight = max(0.2, confidence)
-            negative_value = max(0.0, -float(entry["score"]))
-            weighted_scores.append(negative_value * weight)
-            if label == "negative":
-                negative_group_count += 1
-        S_t = float(sum(weighted_scores) / max(len(weighted_scores), 1))
-        uncertain_ratio = float(uncertain_count / max(len(recent_groups), 1))
-        negative_ratio_window = float(negative_group_count / max(len(recent_groups), 1))
-
-        hour_start = now - timedelta(hours=1)
-        count_1h = sum(1 for r in scoped if r["dt"] >= hour_start)
-        hourly_counter: Counter[str] = Counter()
-        for r in scoped:
-            if r["dt"] >= now:
-                continue
-            bucket = r["dt"].strftime("%Y-%m-%d %H")
-            hourly_counter[bucket] += 1
-        same_hour_values = []
-        current_hour = now.hour
-        for key, value in hourly_counter.items():
-            dt_key = datetime.strptime(key, "%Y-%m-%d %H")
-            if dt_key.hour == current_hour:
-                same_hour_values.append(value)
-        baseline_values = same_hour_values if len(same_hour_values) >= 3 else list(hourly_counter.values())
-        baseline_mean = float(sum(baseline_values) / max(len(baseline_values), 1))
-        baseline_std = float(pd.Series(baseline_values).std(ddof=0)) if baseline_values else 0.0
-        z_score = (float(count_1h) - baseline_mean) / max(baseline_std, 1.0)
-        V_heat = float(_sigmoid(z_score))
-        V_risk = float(V_heat * negative_ratio_window)
-
-        theme_counter_heat: Counter[str] = Counter()
-        theme_counter_risk: Counter[str] = Counter()
-        for r in recent_group_items.values():
-            for theme, keywords in RISK_THEME_RULES.items():
-                if any(k.lower() in r["text"] for k in keywords):
-                    theme_counter_heat[theme] += 1
-                    if theme in THEME_WEIGHTS_RISK:
-                        theme_counter_risk[theme] += 1
-                    break
-        T_heat = 0.0
-        T_risk = 0.0
-        if recent_group_items:
-            total_recent = float(len(recent_group_items))
-            for theme, cnt in theme_counter_heat.items():
-                share = float(cnt) / total_recent
-                T_heat += share * float(THEME_WEIGHTS_HEAT.get(theme, 0.4))
-            for theme, cnt in theme_counter_risk.items():
-                share = float(cnt) / total_recent
-                T_risk += share * float(THEME_WEIGHTS_RISK.get(theme, 0.0))
-
-        outlet_counter: Counter[str] = Counter(r["outlet"] for r in recent)
-        M_t = 0.0
-        if recent:
-            total_recent = float(len(recent))
-            for outlet, cnt in outlet_counter.items():
-                share = float(cnt) / total_recent
-                M_t += share * _outlet_weight(outlet)
-
-        spread_ratio = float(len(recent) / max(len(recent_groups), 1))
-
-        if not scoped:
-            S_t = 0.0
-            V_heat = 0.0
-            V_risk = 0.0
-            T_heat = 0.0
-            T_risk = 0.0
-            M_t = 0.0
-            uncertain_ratio = 0.0
-            negative_ratio_window = 0.0
-            spread_ratio = 0.0
-            z_score = 0.0
-            count_1h = 0
-
-        raw_issue_heat = 100.0 * (0.45 * V_heat + 0.35 * T_heat + 0.20 * M_t)
-        raw_risk = 100.0 * (0.50 * S_t + 0.25 * V_risk + 0.15 * T_risk + 0.10 * (M_t * negative_ratio_window))
-        ip_id = (ip or "all").strip().lower()
-        prev = conn.execute(
-            """
-            SELECT risk_score
-            FROM risk_timeseries
-            WHERE ip_id = ?
-            ORDER BY ts DESC, id DESC
-            LIMIT 1
-            """,
-            (ip_id,),
-        ).fetchone()
-        prev_risk = float(prev["risk_score"]) if prev else None
-        ema_alpha = 0.3
-        if not scoped:
-            smoothed = 0.0
-            ema_alpha = 1.0
-            prev_risk = None
-        else:
-            smoothed = (0.7 * prev_risk + 0.3 * raw_risk) if prev_risk is not None else raw_risk
-            if prev_risk is not None and count_1h < 10:
-                ema_alpha = 0.1
-                smoothed = 0.9 * prev_risk + 0.1 * raw_risk
-
-        score = round(float(max(0.0, min(100.0, smoothed))), 1)
-        issue_heat = round(float(max(0.0, min(100.0, raw_issue_heat))), 1)
-        alert = _alert_level(score)
-        ts = now.strftime("%Y-%m-%d %H:%M:%S")
-        sample_size = int(len(recent_groups))
-        quality_flag = _risk_quality_flag(sample_size)
-        confidence = max(0.0, min(1.0, (sample_size / 20.0) * (1.0 - min(0.7, uncertain_ratio * 0.7))))
-        if quality_flag == "LOW_SAMPLE":
-            confidence = min(confidence, 0.25)
-        _upsert_risk_timeseries(
-            conn,
-            ip_id=ip_id,
-            ts=ts,
-            raw_risk=float(raw_risk),
-            score=float(score),
-            issue_heat=float(issue_heat),
-            s_comp=float(S_t),
-            v_comp=float(V_risk),
-            t_comp=float(T_risk),
-            m_comp=float(M_t),
-            alert_level=alert,
-            sample_size=sample_size,
-            uncertain_ratio=float(uncertain_ratio),
-            quality_flag=quality_flag,
-            risk_formula_version=RISK_FORMULA_VERSION,
-        )
-        conn.commit()
 
-        return {
-            "meta": {
-                "ip": ip_name,
-                "ip_id": ip_id,
-                "window_hours": int(window_hours),
-                "ts": ts,
-                "include_test": True,
-            },
-            "risk_score": score,
-            "raw_risk": round(float(raw_risk), 3),
-            "ema_prev": round(float(prev_risk), 3) if prev_risk is not None else None,
-            "ema_alpha": float(ema_alpha) if prev_risk is not None else 1.0,
-            "components": {
-                "S": round(float(S_t), 3),
-                "V": round(float(V_risk), 3),
-                "T": round(float(T_risk), 3),
-                "M": round(float(M_t), 3),
-            },
-            "issue_heat": issue_heat,
-            "negative_ratio_window": round(float(negative_ratio_window), 3),
-            "confidence": round(float(confidence), 3),
-            "risk_formula_version": RISK_FORMULA_VERSION,
-            "alert_level": alert,
-            "alert": alert,
-            "sample_size": sample_size,
-            "data_quality_flag": quality_flag,
-            "article_count_window": int(len(recent)),
-            "group_count_window": int(len(recent_groups)),
-            "mention_count_window": int(len(recent)),
-            "exposure_count_window": int(len(recent)),
-            "count_1h": int(count_1h),
-            "z_score": round(float(z_score), 3),
-            "uncertain_ratio": round(float(uncertain_ratio), 3),
-            "spread_ratio": round(float(spread_ratio), 3),
-        }
-    finally:
-        conn.close()
+def get_live_risk_with_options(
+    ip: str = "all", window_hours: int = 24, include_test: bool = False, persist: bool = True
+) -> dict[str, Any]:
+    return _compute_live_risk(ip, window_hours=window_hours, include_test=bool(include_test), persist=persist)
+
+
+def get_live_risk_all(window_hours: int = 24, include_test: bool = False, persist: bool = True) -> dict[str, dict[str, Any]]:
+    """모든 IP(+all)의 리스크를 기사 1회 스캔으로 계산. ip_id -> get_live_risk_with_options와 같은 payload."""
+    return _compute_live_risk_all(window_hours=window_hours, include_test=bool(include_test), persist=persist)
 
 
 def get_recent_risk_scores(ip_id: str, minutes: int = 30) -> list[float]:
     ip_val = (ip_id or "all").strip().lower()
     since = (datetime.now() - timedelta(minutes=max(1, int(minutes)))).strftime("%Y-%m-%d %H:%M:%S")
-    conn = _connect()
+    conn = _connect_readonly()
     try:
         rows = conn.execute(
             """
@@ -1857,7 +3501,7 @@ def get_recent_risk_scores(ip_id: str, minutes: int = 30) -> list[float]:
 def get_risk_timeseries(ip_id: str = "all", hours: int = 24 * 7, limit: int = 600) -> dict[str, Any]:
     ip_val = (ip_id or "all").strip().lower()
     since = (datetime.now() - timedelta(hours=max(1, int(hours)))).strftime("%Y-%m-%d %H:%M:%S")
-    conn = _connect()
+    conn = _connect_readonly()
     try:
         rows = conn.execute(
             """
@@ -1897,25 +3541,121 @@ def get_risk_timeseries(ip_id: str = "all", hours: int = 24 * 7, limit: int = 60
         conn.close()
 
 
-def record_burst_event(ip_name: str, event_type: str, trigger_reason: str, risk_at_event: float) -> None:
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    conn = _connect()
+def risk_timeseries_version(ip_id: str = "all", hours: int = 24 * 7) -> tuple[str, int, str] | None:
+    """get_risk_timeseries 결과가 바뀌었는지 판단하는 값(경로, 시계열 버전, 구간 안 가장 오래된 ts).
+
+    쓰기가 없어도 시간이 지나 구간 밖으로 밀려나는 행이 있으면 가장 오래된 ts가 바뀐다.
+    """
+    ip_val = (ip_id or "all").strip().lower()
+    since = (datetime.now() - timedelta(hours=max(1, int(hours)))).strftime("%Y-%m-%d %H:%M:%S")
+    conn = _connect_readonly()
     try:
-        conn.execute(
+        version = get_data_version(conn, "risk_timeseries")
+        if version is None:
+            return None
+        oldest = conn.execute(
+            "SELECT MIN(ts) FROM risk_timeseries WHERE ip_id = ? AND ts >= ?", (ip_val, since)
+        ).fetchone()[0]
+    finally:
+        conn.close()
+    return str(_resolve_db_path()), version, str(oldest or "")
+
+
+def iter_export_risk_timeseries(
+    *,
+    ip: str = "all",
+    date_from: str | None = None,
+    date_to: str | None = None,
+    batch_size: int = EXPORT_FETCH_SIZE,
+) -> Iterator[list[dict[str, Any]]]:
+    """risk_timeseries를 ts 오름차순으로 batch_size씩 내보내는 이터레이터(행 수 상한 없음, 메모리 일정)."""
+    ip_val = (ip or "all").strip().lower()
+    if not _resolve_ip_name(ip_val):
+        raise ValueError("지원하지 않는 IP입니다.")
+    start, end = _export_day_bounds(date_from, date_to)
+    where = ["ip_id = ?"]
+    params: list[Any] = [ip_val]
+    if start:
+        where.append("ts >= ?")
+        params.append(start)
+    if end:
+        where.append("ts < ?")
+        params.append(end)
+    sql = f"""
+        SELECT {', '.join(EXPORT_RISK_TIMESERIES_COLUMNS)}
+        FROM risk_timeseries
+        WHERE {' AND '.join(where)}
+        ORDER BY ts ASC
+    """
+    return ([dict(r) for r in rows] for rows in _iter_export_rows(sql, params, batch_size))
+
+
+def save_risk_snapshot(
+    ip_id: str, payload: dict[str, Any], *, window_hours: int = 24, include_test: bool = False
+) -> None:
+    ip_val = (ip_id or "all").strip().lower()
+    computed_at = str((payload.get("meta") or {}).get("ts") or datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    params = (ip_val, int(window_hours), int(bool(include_test)), json.dumps(payload, ensure_ascii=False), computed_at)
+    _write(
+        lambda conn: conn.execute(
             """
-            INSERT INTO burst_events (ip_name, event_type, trigger_reason, risk_at_event, occurred_at)
+            INSERT INTO risk_snapshots (ip_id, window_hours, include_test, payload, computed_at)
             VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(ip_id, window_hours, include_test) DO UPDATE SET
+                payload = excluded.payload,
+                computed_at = excluded.computed_at
             """,
-            (ip_name, event_type, trigger_reason, float(risk_at_event), now),
-        )
-        conn.commit()
+            params,
+        ),
+        wait=False,
+        label="risk_snapshot",
+    )
+
+
+def get_risk_snapshot(ip_id: str, *, window_hours: int = 24, include_test: bool = False) -> dict[str, Any] | None:
+    ip_val = (ip_id or "all").strip().lower()
+    conn = _connect_readonly()
+    try:
+        try:
+            row = conn.execute(
+                """
+                SELECT payload
+                FROM risk_snapshots
+                WHERE ip_id = ? AND window_hours = ? AND include_test = ?
+                """,
+                (ip_val, int(window_hours), int(bool(include_test))),
+            ).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        if not row:
+            return None
+        try:
+            return json.loads(str(row["payload"]))
+        except ValueError:
+            return None
     finally:
         conn.close()
 
 
+def record_burst_event(ip_name: str, event_type: str, trigger_reason: str, risk_at_event: float) -> None:
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    params = (ip_name, event_type, trigger_reason, float(risk_at_event), now)
+    _write(
+        lambda conn: conn.execute(
+            """
+            INSERT INTO burst_events (ip_name, event_type, trigger_reason, risk_at_event, occurred_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            params,
+        ),
+        wait=False,
+        label="burst_event",
+    )
+
+
 def get_recent_burst_events(ip_name: str, limit: int = 30) -> list[dict[str, Any]]:
     ip_val = (ip_name or "").strip().lower()
-    conn = _connect()
+    conn = _connect_readonly()
     try:
         if ip_val:
             rows = conn.execute(
@@ -1943,10 +3683,29 @@ def get_recent_burst_events(ip_name: str, limit: int = 30) -> list[dict[str, Any
         conn.close()
 
 
+def _count_scheduler_log_fallback(job_id: str, status: str, exc: BaseException) -> None:
+    global _scheduler_log_fallback_count
+    with _scheduler_log_fallback_lock:
+        _scheduler_log_fallback_count += 1
+        fallback_count = _scheduler_log_fallback_count
+    logger.warning(
+        "scheduler_log_write_failed job_id=%s status=%s fallback_count=%s error=%s",
+        str(job_id),
+        str(status),
+        fallback_count,
+        str(exc),
+    )
+    print(
+        f"[WARN] scheduler_log_write_failed job_id={job_id} status={status} fallback_count={fallback_count} error={exc!r}",
+        file=sys.stderr,
+    )
+
+
 def record_scheduler_log(job_id: str, status: str, error_message: str = "", run_time: str | None = None) -> None:
+    """스케줄러 실행 로그를 쓰기 큐에 넣는다(대기하지 않음). 실패는 fallback 카운트로만 남긴다."""
     ts = run_time or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    conn = _connect()
-    try:
+
+    def write(conn: sqlite3.Connection) -> None:
         try:
             conn.execute(
                 """
@@ -1955,25 +3714,14 @@ def record_scheduler_log(job_id: str, status: str, error_message: str = "", run_
                 """,
                 (str(job_id), ts, str(status), str(error_message or "")),
             )
-            conn.commit()
         except sqlite3.OperationalError as exc:
-            global _scheduler_log_fallback_count
-            with _scheduler_log_fallback_lock:
-                _scheduler_log_fallback_count += 1
-                fallback_count = _scheduler_log_fallback_count
-            logger.warning(
-                "scheduler_log_write_failed job_id=%s status=%s fallback_count=%s error=%s",
-                str(job_id),
-                str(status),
-                fallback_count,
-                str(exc),
-            )
-            print(
-                f"[WARN] scheduler_log_write_failed job_id={job_id} status={status} fallback_count={fallback_count} error={exc}",
-                file=sys.stderr,
-            )
-    finally:
-        conn.close()
+            _count_scheduler_log_fallback(job_id, status, exc)
+
+    try:
+        _write(write, wait=False, label="scheduler_log")
+    except (sqlite3.OperationalError, queue.Full) as exc:
+        # 쓰기 잠금 대기 초과(인라인 경로) 또는 쓰기 큐 포화
+        _count_scheduler_log_fallback(job_id, status, exc)
 
 
 def get_scheduler_log_fallback_count() -> int:
@@ -1982,7 +3730,7 @@ def get_scheduler_log_fallback_count() -> int:
 
 
 def get_latest_scheduler_log(job_id: str) -> dict[str, Any] | None:
-    conn = _connect()
+    conn = _connect_readonly()
     try:
         try:
             row = conn.execute(
@@ -2133,7 +3881,7 @@ def cleanup_live_articles(retain_days: int = 30, max_delete_rows: int | None = N
     where_sql = """
         FROM articles
         WHERE is_test = 0
-          AND datetime(COALESCE(NULLIF(pub_date, ''), NULLIF(created_at, ''), date || ' 00:00:00')) < datetime(?)
+          AND event_ts < CAST(strftime('%s', ?) AS INTEGER)
     """
     conn = _connect()
     try:
@@ -2141,52 +3889,109 @@ def cleanup_live_articles(retain_days: int = 30, max_delete_rows: int | None = N
             row = conn.execute(f"SELECT COUNT(1) AS cnt {where_sql}", (cutoff,)).fetchone()
             total = int(row["cnt"] if row else 0)
             return min(total, cap) if cap else total
-        if cap:
-            cur = conn.execute(
-                f"""
-                DELETE FROM articles
-                WHERE rowid IN (
-                    SELECT rowid {where_sql}
-                    ORDER BY datetime(COALESCE(NULLIF(pub_date, ''), NULLIF(created_at, ''), date || ' 00:00:00')) ASC
-                    LIMIT ?
-                )
-                """,
-                (cutoff, cap),
+        ids = [
+            int(r[0])
+            for r in conn.execute(
+                f"SELECT id {where_sql} ORDER BY event_ts ASC" + (" LIMIT ?" if cap else ""),
+                (cutoff, cap) if cap else (cutoff,),
             )
-        else:
-            cur = conn.execute(
-                f"DELETE {where_sql}",
-                (cutoff,),
-            )
-        deleted_rows = int(cur.rowcount or 0)
+        ]
+        if not ids:
+            return 0
+        from backend import archive
+
+        if archive.ARTICLE_ARCHIVE_ENABLED:
+            # 월별 아카이브 복사를 먼저 커밋한 뒤 운영 DB에서 지운다.
+            archive.archive_articles(ids)
+        cur = conn.execute(
+            "DELETE FROM articles WHERE id IN (SELECT value FROM json_each(?)) RETURNING source_group_id",
+            (json.dumps(ids),),
+        )
+        deleted_rows, group_ids = _returned_group_ids(cur)
         if deleted_rows > 0:
-            # Keep source-group rollups consistent with the remaining article rows.
-            conn.execute(
-                """
-                UPDATE source_groups
-                SET repost_count = (
-                    SELECT COUNT(1)
-                    FROM articles
-                    WHERE COALESCE(source_group_id, '') = source_groups.group_id
-                )
-                """
-            )
-            conn.execute(
-                """
-                DELETE FROM source_groups
-                WHERE group_id NOT IN (
-                    SELECT DISTINCT COALESCE(source_group_id, '')
-                    FROM articles
-                    WHERE COALESCE(source_group_id, '') != ''
-                )
-                """
-            )
+            # 삭제된 기사가 속했던 그룹만 집계를 맞춘다(전체 그룹 재계산 없음).
+            _sync_source_groups(conn, group_ids)
+            _refresh_daily_rollup(conn)
+            _bump_data_version(conn)
         conn.commit()
         return deleted_rows
     finally:
         conn.close()
 
 
+def _returned_group_ids(cur: sqlite3.Cursor) -> tuple[int, list[str]]:
+    """DELETE ... RETURNING source_group_id 결과 -> (삭제 행 수, 그룹 id 목록)."""
+    deleted_rows = 0
+    group_ids: set[str] = set()
+    for r in cur:
+        deleted_rows += 1
+        if r[0]:
+            group_ids.add(str(r[0]))
+    return deleted_rows, sorted(group_ids)
+
+
+def _sync_source_groups(conn: sqlite3.Connection, group_ids: list[str]) -> int:
+    """지정 그룹의 repost_count를 남은 기사 수로 다시 세고, 기사가 없는 그룹은 지운다. 지운 그룹 수 반환."""
+    if not group_ids:
+        return 0
+    payload = json.dumps(group_ids, ensure_ascii=False)
+    conn.execute(
+        """
+        UPDATE source_groups
+        SET repost_count = (
+            SELECT COUNT(1)
+            FROM articles
+            WHERE source_group_id = source_groups.group_id
+        )
+        WHERE group_id IN (SELECT value FROM json_each(?))
+        """,
+        (payload,),
+    )
+    cur = conn.execute(
+        "DELETE FROM source_groups WHERE group_id IN (SELECT value FROM json_each(?)) AND repost_count = 0",
+        (payload,),
+    )
+    return int(cur.rowcount or 0)
+
+
+def check_source_group_rollups(repair: bool = False) -> dict[str, int]:
+    """source_groups 집계(repost_count)가 기사 테이블과 맞는지 전체 점검한다(오프라인 점검용).
+
+    정리 작업은 삭제된 기사의 그룹만 고치므로, 다른 경로로 어긋난 그룹은 여기서 찾는다.
+    repair=True면 어긋난 그룹만 다시 세고 기사가 없는 그룹은 지운다.
+    """
+    conn = _connect() if repair else _connect_readonly()
+    try:
+        rows = conn.execute(
+            """
+            SELECT g.group_id, COALESCE(a.cnt, 0) AS actual
+            FROM source_groups AS g
+            LEFT JOIN (
+                SELECT source_group_id, COUNT(1) AS cnt
+                FROM articles
+                WHERE source_group_id IS NOT NULL
+                GROUP BY source_group_id
+            ) AS a ON a.source_group_id = g.group_id
+            WHERE COALESCE(g.repost_count, -1) != COALESCE(a.cnt, 0)
+            """
+        ).fetchall()
+        total = conn.execute("SELECT COUNT(1) FROM source_groups").fetchone()[0]
+        result = {
+            "groups": int(total or 0),
+            "repost_count_mismatch": sum(1 for r in rows if int(r["actual"]) > 0),
+            "orphan_groups": sum(1 for r in rows if int(r["actual"]) == 0),
+            "repaired_groups": 0,
+        }
+        if repair and rows:
+            _sync_source_groups(conn, sorted(str(r["group_id"]) for r in rows))
+            _bump_data_version(conn)
+            conn.commit()
+            result["repaired_groups"] = len(rows)
+        return result
+    finally:
+        conn.close()
+
+
 def cleanup_risk_timeseries(retain_days: int = 90, max_delete_rows: int | None = None, dry_run: bool = False) -> int:
     days = int(retain_days)
     if days <= 0:
@@ -2216,12 +4021,46 @@ def cleanup_risk_timeseries(retain_days: int = 90, max_delete_rows: int | None =
             )
         else:
             cur = conn.execute("DELETE FROM risk_timeseries WHERE ts < ?", (cutoff,))
+        if cur.rowcount:
+            _bump_data_version(conn, "risk_timeseries")
         conn.commit()
         return int(cur.rowcount or 0)
     finally:
         conn.close()
 
 
+def compact_sentiment_results(max_delete_rows: int | None = None, dry_run: bool = False) -> int:
+    # 그룹·방식별 최신 결과(group_sentiment_latest)에 밀린 감성 이력을 오래된 id부터 지운다.
+    # 그룹이 없는 행(source_groups 삭제로 NULL)은 최신 판정 대상이 아니므로 남긴다.
+    cap = _normalize_delete_cap(max_delete_rows)
+    where_sql = """
+        FROM sentiment_results AS s
+        WHERE COALESCE(s.source_group_id, '') != ''
+          AND NOT EXISTS (
+              SELECT 1 FROM group_sentiment_latest AS l
+              WHERE l.source_group_id = s.source_group_id AND l.method = s.method AND l.result_id = s.id
+          )
+    """
+    conn = _connect()
+    try:
+        try:
+            if dry_run:
+                row = conn.execute(f"SELECT COUNT(1) AS cnt {where_sql}").fetchone()
+                total = int(row["cnt"] if row else 0)
+                return min(total, cap) if cap else total
+            limit_sql = "ORDER BY s.id ASC LIMIT ?" if cap else ""
+            cur = conn.execute(
+                f"DELETE FROM sentiment_results WHERE id IN (SELECT s.id {where_sql} {limit_sql})",
+                (cap,) if cap else (),
+            )
+            conn.commit()
+            return int(cur.rowcount or 0)
+        except sqlite3.OperationalError:
+            return 0
+    finally:
+        conn.close()
+
+
 def upsert_risk_daily_summary() -> int:
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     conn = _connect()
@@ -2270,10 +4109,11 @@ def cleanup_test_articles(retain_hours: int = 24, max_delete_rows: int | None =
     hours = max(1, int(retain_hours))
     cutoff = (datetime.now() - timedelta(hours=hours)).strftime("%Y-%m-%d %H:%M:%S")
     cap = _normalize_delete_cap(max_delete_rows)
+    # 테스트 데이터는 적재 시각(created_at) 기준 보존이라 event_ts 대신 idx_articles_test_created(is_test, created_at)를 쓴다.
     where_sql = """
         FROM articles
         WHERE is_test = 1
-          AND datetime(COALESCE(NULLIF(created_at, ''), NULLIF(pub_date, ''), date || ' 00:00:00')) < datetime(?)
+          AND created_at < ?
     """
     conn = _connect()
     try:
@@ -2288,19 +4128,25 @@ def cleanup_test_articles(retain_hours: int = 24, max_delete_rows: int | None =
                     DELETE FROM articles
                     WHERE rowid IN (
                         SELECT rowid {where_sql}
-                        ORDER BY datetime(COALESCE(NULLIF(created_at, ''), NULLIF(pub_date, ''), date || ' 00:00:00')) ASC
+                        ORDER BY created_at ASC
                         LIMIT ?
                     )
+                    RETURNING source_group_id
                     """,
                     (cutoff, cap),
                 )
             else:
                 cur = conn.execute(
-                    f"DELETE {where_sql}",
+                    f"DELETE {where_sql} RETURNING source_group_id",
                     (cutoff,),
                 )
+            deleted_rows, group_ids = _returned_group_ids(cur)
+            _sync_source_groups(conn, group_ids)
+            _refresh_daily_rollup(conn)
+            if deleted_rows > 0:
+                _bump_data_version(conn)
             conn.commit()
-            return int(cur.rowcount or 0)
+            return deleted_rows
         except sqlite3.OperationalError:
             return 0
     finally:
@@ -2338,6 +4184,9 @@ def repair_article_outlets(remove_placeholder: bool = True) -> dict[str, int]:
             )
             removed_placeholder = int(cur.rowcount or 0)
 
+        _refresh_daily_rollup(conn)
+        if repaired or removed_placeholder:
+            _bump_data_version(conn)
         conn.commit()
         return {"repaired_outlets": int(repaired), "removed_placeholder_rows": int(removed_placeholder)}
     finally:
@@ -2346,7 +4195,7 @@ def repair_article_outlets(remove_placeholder: bool = True) -> dict[str, int]:
 
 def get_observability_counts() -> dict[str, int]:
     since_24h = (datetime.now() - timedelta(hours=24)).strftime("%Y-%m-%d %H:%M:%S")
-    conn = _connect()
+    conn = _connect_readonly()
     try:
         total_articles = int(conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0])
         total_live_articles = int(conn.execute("SELECT COUNT(*) FROM articles WHERE is_test = 0").fetchone()[0])
@@ -2357,7 +4206,7 @@ def get_observability_counts() -> dict[str, int]:
                 SELECT COUNT(*)
                 FROM articles
                 WHERE is_test = 0
-                  AND datetime(COALESCE(NULLIF(pub_date, ''), NULLIF(created_at, ''), date || ' 00:00:00')) >= datetime(?)
+                  AND event_ts >= CAST(strftime('%s', ?) AS INTEGER)
                 """,
                 (since_24h,),
             ).fetchone()[0]
@@ -192,6 +192,7 @@ export default function NexonPage() {
   const [articleItems, setArticleItems] = useState([]);
   const [articleTotal, setArticleTotal] = useState(0);
   const [articleOffset, setArticleOffset] = useState(0);
+  const [articleCursor, setArticleCursor] = useState("");
   const [articleHasMore, setArticleHasMore] = useState(false);
   const [articleLoading, setArticleLoading] = useState(false);
   const [articleError, setArticleError] = useState("");
@@ -333,6 +334,7 @@ export default function NexonPage() {
     if (!reset && (articleLoading || !articleHasMore)) return;
     const reqSeq = ++articleReqSeqRef.current;
     const nextOffset = reset ? 0 : articleOffset;
+    const nextCursor = reset ? "" : articleCursor;
     if (articleAbortRef.current) articleAbortRef.current.abort();
     const controller = new AbortController();
     articleAbortRef.current = controller;
@@ -343,7 +345,8 @@ export default function NexonPage() {
     setArticleLoading(true);
     try {
       const payload = await apiGet(
-        `/api/nexon-articles?ip=${encodeURIComponent(targetIp)}&limit=${ARTICLE_PAGE_SIZE}&offset=${nextOffset}`,
+        `/api/nexon-articles?ip=${encodeURIComponent(targetIp)}&limit=${ARTICLE_PAGE_SIZE}` +
+          (nextCursor ? `&cursor=${encodeURIComponent(nextCursor)}` : `&offset=${nextOffset}`),
         { signal: controller.signal }
       );
       if (reqSeq !== articleReqSeqRef.current) return;
@@ -351,6 +354,7 @@ export default function NexonPage() {
       setArticleItems((prev) => (reset ? nextItems : [...prev, ...nextItems]));
       setArticleTotal(Number(payload?.total || 0));
       setArticleOffset(nextOffset + nextItems.length);
+      setArticleCursor(String(payload?.next_cursor || ""));
       setArticleHasMore(Boolean(payload?.has_more));
     } catch (e) {
       if (e?.name === "AbortError") return;
@@ -365,6 +369,7 @@ export default function NexonPage() {
         setArticleItems([]);
         setArticleTotal(0);
         setArticleOffset(0);
+        setArticleCursor("");
         setArticleHasMore(false);
       }
     } finally {
@@ -378,6 +383,7 @@ export default function NexonPage() {
     setArticleItems([]);
     setArticleTotal(0);
     setArticleOffset(0);
+    setArticleCursor("");
     setArticleHasMore(true);
     setArticleLoading(false);
     setArticleError("");
@@ -1,5 +1,16 @@
 const DEFAULT_TIMEOUT_MS = 12000;
 const LOCALHOST_HOST_RE = /^(localhost|127\.\d+\.\d+\.\d+|0\.0\.0\.0)$/i;
+// GET 응답의 ETag와 본문을 URL별로 보관했다가 If-None-Match로 다시 보내고, 304면 보관한 본문을 돌려준다.
+const VALIDATOR_CACHE_MAX_ENTRIES = 64;
+const validatorCache = new Map();
+
+function rememberValidator(url, etag, data) {
+  validatorCache.delete(url);
+  validatorCache.set(url, { etag, data });
+  while (validatorCache.size > VALIDATOR_CACHE_MAX_ENTRIES) {
+    validatorCache.delete(validatorCache.keys().next().value);
+  }
+}
 
 function trimTrailingSlash(value) {
   return String(value || "").replace(/\/+$/, "");
@@ -142,21 +153,31 @@ async function request(path, options = {}) {
     ...rest
   } = options;
   const url = buildApiUrl(path);
+  const conditional = String(rest.method || "GET").toUpperCase() === "GET";
 
   for (let attempt = 0; attempt <= retries; attempt += 1) {
     const controller = new AbortController();
     const detach = attachAbortSignal(signal, controller);
     const timer = setTimeout(() => controller.abort(), timeoutMs);
+    const validator = conditional ? validatorCache.get(url) : undefined;
     try {
       const res = await fetch(url, {
         ...rest,
+        // 검증값은 여기서 직접 관리하므로 브라우저 HTTP 캐시와 이중으로 보관하지 않는다.
+        ...(validator ? { cache: "no-store" } : {}),
         headers: {
           Accept: "application/json",
+          ...(validator ? { "If-None-Match": validator.etag } : {}),
           ...headers,
         },
         signal: controller.signal,
       });
 
+      if (res.status === 304 && validator) {
+        rememberValidator(url, validator.etag, validator.data);
+        return validator.data;
+      }
+
       if (!res.ok) {
         const retryAfter = parseRetryAfter(res.headers.get("retry-after"));
         const rawText = await res.text();
@@ -177,7 +198,10 @@ async function request(path, options = {}) {
       if (res.status === 204) return null;
       const contentType = res.headers.get("content-type") || "";
       if (contentType.includes("application/json")) {
-        return res.json();
+        const data = await res.json();
+        const etag = conditional ? res.headers.get("etag") : null;
+        if (etag) rememberValidator(url, etag, data);
+        return data;
       }
       return res.text();
     } catch (error) {
@@ -0,0 +1,99 @@
+"""scripts/test_*.py가 함께 쓰는 수집 기사 프레임/임시 live DB 헬퍼."""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import sys
+import tempfile
+from typing import Callable, Iterator, Sequence
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import db, storage
+
+
+def hours_ago(span: int, *, first: int = 1) -> Callable[[int], datetime]:
+    """i번째 기사를 지금부터 first + i % span 시간 전에 발행한 것으로 둔다."""
+    now = datetime.now()
+    return lambda i: now - timedelta(hours=first + i % span)
+
+
+def minutes_ago(span: int, *, first: int = 0) -> Callable[[int], datetime]:
+    now = datetime.now()
+    return lambda i: now - timedelta(minutes=first + i % span)
+
+
+def days_ago(days: int) -> Callable[[int], datetime]:
+    """모든 기사를 days일 전 같은 시각에 발행한 것으로 둔다."""
+    day = datetime.now() - timedelta(days=days)
+    return lambda i: day
+
+
+def issue_title(subject: str = "메이플스토리") -> Callable[[int], str]:
+    return lambda i: f"{subject} {'확률 논란' if i % 2 else '업데이트 소식'} {i}"
+
+
+def negative_every_third(i: int) -> str:
+    return "부정" if i % 3 == 0 else "중립"
+
+
+def neutral(i: int) -> str:
+    return "중립"
+
+
+def article_frame(
+    start: int,
+    rows: int,
+    *,
+    companies: Sequence[str] = ("넥슨",),
+    title: Callable[[int], str] | None = None,
+    description: Callable[[int], str] | None = None,
+    published: Callable[[int], datetime] | None = None,
+    missing_pub_date: Callable[[int], bool] | None = None,
+    sentiment: Callable[[int], str] | None = negative_every_third,
+) -> pd.DataFrame:
+    """save_articles 입력 프레임(기사 id start ~ start + rows - 1, URL은 id마다 고유).
+
+    기본값은 넥슨 메이플스토리 기사, 1~40시간 전 발행, 세 건마다 부정이다.
+    missing_pub_date(i)가 참인 기사는 발행 시각 파싱 실패(pubDate_parsed 없음)로 기사 날짜만 남긴다.
+    sentiment가 None이면 감성 열을 넣지 않는다(호출자가 채운다).
+    """
+    title = title or issue_title()
+    published = published or hours_ago(40)
+    records = []
+    for i in range(start, start + rows):
+        pub = published(i)
+        record = {
+            "company": companies[i % len(companies)],
+            "title_clean": title(i),
+            "description_clean": description(i) if description else "이용자 반응",
+            "originallink": f"https://www.inven.co.kr/news/{i}",
+            "link": f"https://www.inven.co.kr/news/{i}",
+            "pubDate_parsed": None
+            if missing_pub_date and missing_pub_date(i)
+            else pub.strftime("%Y-%m-%d %H:%M:%S"),
+            "date": pub.strftime("%Y-%m-%d"),
+        }
+        if sentiment is not None:
+            record["sentiment"] = sentiment(i)
+        records.append(record)
+    return pd.DataFrame(records)
+
+
+@contextmanager
+def temp_live_db(name: str) -> Iterator[Path]:
+    """임시 디렉터리의 live DB를 LIVE_DB_PATH로 두고 스키마를 만든다. 끝나면 연결을 모두 닫는다."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / name
+        os.environ["LIVE_DB_PATH"] = str(path)
+        storage.init_db()
+        try:
+            yield path
+        finally:
+            db.close_all_connections()
@@ -0,0 +1,783 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+
+TITLE_PREFIXES = [
+    "메이플스토리 업데이트",
+    "던전앤파이터 신규 던전",
+    "FC온라인 보상 지급",
+    "블루아카이브 확률 논란",
+    "아크레이더스 서버 점검",
+    "넥슨 신작 출시 예고",
+]
+HEADLINE_WORDS = [
+    "업데이트", "신규", "던전", "보상", "지급", "확률", "논란", "서버", "점검", "연장", "이용자", "반발",
+    "사과문", "공개", "쇼케이스", "흥행", "매출", "순위", "역주행", "시즌", "패스", "출시", "사전예약",
+    "돌파", "공정위", "제재", "환불", "요구", "개발자", "간담회", "로드맵", "발표", "글로벌", "서비스",
+    "종료", "이벤트", "캐릭터", "밸런스", "조정", "오류", "긴급", "대응", "커뮤니티", "여론", "악화",
+]
+COMPARE_COMPANIES = ["넥슨", "NC소프트", "넷마블", "크래프톤"]
+# event_ts 도입 이전 /health, compare(DB) 조건식(비교 기준)
+LEGACY_EVENT_EXPR = "datetime(COALESCE(NULLIF(pub_date, ''), NULLIF(created_at, ''), date || ' 00:00:00'))"
+LEGACY_HEALTH_SQL = f"SELECT COUNT(*) FROM articles WHERE is_test = 0 AND {LEGACY_EVENT_EXPR} >= datetime(?)"
+LEGACY_COMPARE_SQL = f"""
+    SELECT company, title_clean, description_clean, originallink, link, pub_date, date, sentiment, created_at
+    FROM articles
+    WHERE is_test = 0 AND company = ? AND {LEGACY_EVENT_EXPR} >= datetime('now', ?)
+    ORDER BY {LEGACY_EVENT_EXPR} DESC, id DESC
+"""
+EVENT_TS_COMPARE_SQL = """
+    SELECT company, title_clean, description_clean, originallink, link, pub_date, date, sentiment, created_at
+    FROM articles
+    WHERE is_test = 0 AND company = ? AND event_ts >= CAST(strftime('%s', 'now', ?) AS INTEGER)
+    ORDER BY event_ts DESC, id DESC
+"""
+# 스키마 마이그레이션 도입 이전 init_db가 기동마다 무조건 실행하던 전체 테이블 재기록(비교 기준)
+LEGACY_STARTUP_SQL = [
+    "UPDATE sentiment_results SET sentiment_label = 'neutral' WHERE sentiment_label = 'uncertain'",
+    """
+    UPDATE articles
+    SET sentiment = CASE
+        WHEN sentiment IN ('긍정', '중립', '부정') THEN sentiment
+        WHEN lower(COALESCE(sentiment, '')) = 'positive' THEN '긍정'
+        WHEN lower(COALESCE(sentiment, '')) = 'negative' THEN '부정'
+        WHEN sentiment = '불확실' OR lower(COALESCE(sentiment, '')) IN ('neutral', 'uncertain') THEN '중립'
+        ELSE '중립'
+    END
+    """,
+    "DELETE FROM risk_timeseries WHERE id NOT IN (SELECT MAX(id) FROM risk_timeseries GROUP BY ip_id, ts)",
+]
+# 증분 그룹 보정 도입 이전 cleanup_live_articles가 삭제 후 실행하던 전체 source_groups 재계산(비교 기준)
+LEGACY_CLEANUP_GROUP_SQL = [
+    """
+    UPDATE source_groups
+    SET repost_count = (
+        SELECT COUNT(1)
+        FROM articles
+        WHERE COALESCE(source_group_id, '') = source_groups.group_id
+    )
+    """,
+    """
+    DELETE FROM source_groups
+    WHERE group_id NOT IN (
+        SELECT DISTINCT COALESCE(source_group_id, '')
+        FROM articles
+        WHERE COALESCE(source_group_id, '') != ''
+    )
+    """,
+]
+OUTLETS = ["yna.co.kr", "inven.co.kr", "thisisgame.com", "gamemeca.com", "news.example.org", "chosun.com"]
+
+
+def build_synthetic_frame(rows: int, *, seed: int = 7, syndication_ratio: float = 0.3) -> pd.DataFrame:
+    """재배포(동일/유사 제목) 비율을 포함한 합성 수집 프레임을 만든다."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    records: list[dict] = []
+    originals: list[str] = []
+    for i in range(int(rows)):
+        pub = now - timedelta(minutes=rng.randint(0, 60 * 24 * 20))
+        if originals and rng.random() < syndication_ratio:
+            title = rng.choice(originals)
+            if rng.random() < 0.5:
+                title = f"{title}!"
+        else:
+            title = f"{rng.choice(TITLE_PREFIXES)} {i} 관련 이용자 반응 {rng.randint(0, 999)}"
+            originals.append(title)
+        outlet = rng.choice(OUTLETS)
+        url = f"https://{outlet}/news/{i}"
+        records.append(
+            {
+                "company": "넥슨",
+                "title_clean": title,
+                "description_clean": f"{title} 상세 내용 기사 본문 요약",
+                "originallink": url,
+                "link": url,
+                "pubDate_parsed": pub,
+                "date": pub.strftime("%Y-%m-%d"),
+            }
+        )
+    return pd.DataFrame(records)
+
+
+def build_syndication_corpus(rows: int, *, seed: int = 11, syndication_ratio: float = 0.4) -> list[dict]:
+    """재배포 판정 품질 측정용 코퍼스. story 필드가 정답 군집(원문 기사 번호)이다.
+
+    재배포본은 원문 전후 1일 안에 배치되며 70%는 동일 제목, 30%는 한 글자 삽입 변형이다.
+    """
+    rng = random.Random(seed)
+    base_day = datetime(2026, 1, 1)
+    out: list[dict] = []
+    originals: list[dict] = []
+    for i in range(int(rows)):
+        if originals and rng.random() < syndication_ratio:
+            src = rng.choice(originals[-300:])
+            title = src["title"]
+            if rng.random() < 0.3:
+                pos = rng.randint(0, len(title))
+                title = f"{title[:pos]}{rng.choice('가나다라마바사0123456789')}{title[pos:]}"
+            day = src["day"] + rng.choice((-1, 0, 0, 1))
+            story = src["story"]
+        else:
+            words = rng.sample(HEADLINE_WORDS, rng.randint(6, 9))
+            title = f"{rng.choice(TITLE_PREFIXES)} {' '.join(words)} {rng.randint(1, 99)}"
+            day = i * 20 // max(int(rows), 1)
+            story = i
+        item = {"title": title, "day": day, "story": story}
+        if story == i:
+            originals.append(item)
+        out.append(
+            {
+                "company": "넥슨",
+                "title_norm": storage._normalize_title(title),
+                "date": (base_day + timedelta(days=day)).strftime("%Y-%m-%d"),
+                "gid": f"g{i}",
+                "story": story,
+            }
+        )
+    return out
+
+
+def _group_linear_scan(corpus: list[dict]) -> list[str]:
+    """기존 방식: 전후 1일 최신 500건을 순차 비교."""
+    assigned: list[str] = []
+    for i, item in enumerate(corpus):
+        near = storage._nearby_dates(item["date"])
+        candidates: list[tuple[str, str]] = []
+        for j in range(i - 1, -1, -1):
+            prev = corpus[j]
+            if prev["company"] == item["company"] and prev["date"] in near:
+                candidates.append((assigned[j], prev["title_norm"]))
+                if len(candidates) >= storage.SYNDICATION_CANDIDATE_LIMIT:
+                    break
+        assigned.append(storage._pick_syndicated_group_id(item["title_norm"], candidates, item["gid"]))
+    return assigned
+
+
+def _group_lsh(corpus: list[dict]) -> list[str]:
+    """LSH 방식: 밴드 키가 겹치는 기사만 후보로 비교."""
+    assigned: list[str] = []
+    buckets: dict[int, list[int]] = {}
+    for i, item in enumerate(corpus):
+        near = storage._nearby_dates(item["date"])
+        band_keys = storage._title_band_keys(item["title_norm"])
+        hits = sorted({j for key in band_keys for j in buckets.get(key, ())}, reverse=True)
+        candidates = [
+            (assigned[j], corpus[j]["title_norm"])
+            for j in hits
+            if corpus[j]["company"] == item["company"] and corpus[j]["date"] in near
+        ][: storage.SYNDICATION_CANDIDATE_LIMIT]
+        assigned.append(storage._pick_syndicated_group_id(item["title_norm"], candidates, item["gid"]))
+        for key in band_keys:
+            buckets.setdefault(key, []).append(i)
+    return assigned
+
+
+def _pair_scores(truth: list, predicted: list[str]) -> tuple[float, float]:
+    """같은 군집으로 묶인 기사 쌍 기준 precision/recall."""
+
+    def pairs(counts: dict) -> int:
+        return sum(n * (n - 1) // 2 for n in counts.values())
+
+    both: dict = {}
+    by_truth: dict = {}
+    by_pred: dict = {}
+    for t, p in zip(truth, predicted):
+        both[(t, p)] = both.get((t, p), 0) + 1
+        by_truth[t] = by_truth.get(t, 0) + 1
+        by_pred[p] = by_pred.get(p, 0) + 1
+    tp = pairs(both)
+    return tp / max(pairs(by_pred), 1), tp / max(pairs(by_truth), 1)
+
+
+def bench_near_dup(sizes: list[int]) -> None:
+    for size in sizes:
+        corpus = build_syndication_corpus(size)
+        truth = [item["story"] for item in corpus]
+        results: dict[str, list[str]] = {}
+        for name, matcher in (("linear", _group_linear_scan), ("lsh", _group_lsh)):
+            started = time.perf_counter()
+            results[name] = matcher(corpus)
+            elapsed = time.perf_counter() - started
+            precision, recall = _pair_scores(truth, results[name])
+            print(
+                f"[near-dup] rows={size} matcher={name} elapsed={elapsed:.2f}s "
+                f"rows_per_sec={size / max(elapsed, 1e-9):.0f} precision={precision:.4f} recall={recall:.4f}",
+                flush=True,
+            )
+        agree = sum(1 for a, b in zip(results["linear"], results["lsh"]) if a == b)
+        print(f"[near-dup] rows={size} decision_agreement={agree / max(size, 1):.4f}", flush=True)
+
+
+def _use_temp_db(tmp_dir: str, name: str) -> Path:
+    db_path = Path(tmp_dir) / name
+    os.environ["LIVE_DB_PATH"] = str(db_path)
+    storage.init_db()
+    return db_path
+
+
+def bench_ingest(sizes: list[int]) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            _use_temp_db(tmp_dir, f"bench_ingest_{size}.db")
+            df = build_synthetic_frame(size)
+            started = time.perf_counter()
+            inserted = storage.save_articles(df)
+            elapsed = time.perf_counter() - started
+            print(
+                f"[ingest] rows={size} inserted={inserted} elapsed={elapsed:.2f}s "
+                f"rows_per_sec={size / max(elapsed, 1e-9):.0f}",
+                flush=True,
+            )
+
+
+def _seed_articles_bulk(rows: int, *, seed: int = 13, days: int = 90) -> None:
+    """save_articles를 거치지 않고 articles에 직접 대량 적재(시각 필터 측정용)."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    created = now.strftime("%Y-%m-%d %H:%M:%S")
+    sql = (
+        """
+        INSERT INTO articles (
+            company, title_clean, description_clean, originallink, link, outlet, pub_date, date,
+            sentiment, is_test, content_hash, created_at, event_ts
+        ) VALUES (?, ?, '', ?, ?, ?, ?, ?, '중립', ?, ?, ?, """
+        + storage._ARTICLE_EVENT_TS_SQL.format(pub_date="?", created_at="?", date="?")
+        + ")"
+    )
+    conn = storage._connect()
+    try:
+        batch: list[tuple] = []
+        for i in range(int(rows)):
+            pub = now - timedelta(minutes=rng.randint(0, 60 * 24 * days))
+            pub_date = pub.strftime("%Y-%m-%d %H:%M:%S") if rng.random() < 0.95 else ""
+            date = pub.strftime("%Y-%m-%d")
+            outlet = rng.choice(OUTLETS)
+            url = f"https://{outlet}/bulk/{i}"
+            batch.append(
+                (
+                    rng.choice(COMPARE_COMPANIES),
+                    f"{rng.choice(TITLE_PREFIXES)} {i}",
+                    url,
+                    url,
+                    outlet,
+                    pub_date,
+                    date,
+                    int(rng.random() < 0.05),
+                    f"bulk-{i}",
+                    created,
+                    pub_date,
+                    date,
+                    created,
+                )
+            )
+            if len(batch) >= 50000:
+                conn.executemany(sql, batch)
+                batch.clear()
+        if batch:
+            conn.executemany(sql, batch)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _timed(fn, repeat: int = 5) -> float:
+    """repeat회 실행 중 최소 시간(초)."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_event_ts(sizes: list[int], window_hours: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            _use_temp_db(tmp_dir, f"bench_event_ts_{size}.db")
+            started = time.perf_counter()
+            _seed_articles_bulk(size)
+            print(f"[event-ts] rows={size} seeded elapsed={time.perf_counter() - started:.1f}s", flush=True)
+
+            from backend import main as api
+
+            since = (datetime.now() - timedelta(hours=24)).strftime("%Y-%m-%d %H:%M:%S")
+            window_mod = f"-{max(1, int(window_hours))} hours"
+
+            def legacy_health() -> None:
+                conn = storage._connect()
+                try:
+                    conn.execute(LEGACY_HEALTH_SQL, (since,)).fetchone()
+                finally:
+                    conn.close()
+
+            def compare_query(sql: str):
+                def run() -> None:
+                    conn = storage._connect()
+                    try:
+                        for company in COMPARE_COMPANIES:
+                            pd.read_sql_query(sql, conn, params=[company, window_mod])
+                    finally:
+                        conn.close()
+
+                return run
+
+            cases = (
+                ("health_counts", legacy_health, storage.get_observability_counts),
+                ("health_endpoint", None, api.health),
+                ("compare_db_query", compare_query(LEGACY_COMPARE_SQL), compare_query(EVENT_TS_COMPARE_SQL)),
+                (
+                    "compare_db_payload",
+                    None,
+                    lambda: api._build_compare_live_payload_from_db(COMPARE_COMPANIES, window_hours),
+                ),
+            )
+            for name, legacy_fn, current_fn in cases:
+                parts = [f"[event-ts] rows={size} case={name}"]
+                if legacy_fn is not None:
+                    parts.append(f"legacy_ms={_timed(legacy_fn) * 1000:.1f}")
+                if current_fn is not None:
+                    parts.append(f"event_ts_ms={_timed(current_fn) * 1000:.1f}")
+                print(" ".join(parts), flush=True)
+
+
+def _seed_risk_timeseries(rows: int, *, seed: int = 17) -> None:
+    rng = random.Random(seed)
+    start = datetime.now() - timedelta(minutes=rows)
+    ip_ids = [meta["slug"] for meta in storage.IP_RULES.values()]
+    conn = storage._connect()
+    try:
+        conn.executemany(
+            """
+            INSERT INTO risk_timeseries (
+                ip_id, ts, risk_raw, risk_score, issue_heat, s_comp, v_comp, t_comp, m_comp,
+                alert_level, sample_size, uncertain_ratio, quality_flag, risk_formula_version
+            ) VALUES (?, ?, ?, ?, 0, 0, 0, 0, 0, 'P3', 10, 0, 'OK', ?)
+            """,
+            [
+                (
+                    ip_ids[i % len(ip_ids)],
+                    (start + timedelta(minutes=i // len(ip_ids))).strftime("%Y-%m-%d %H:%M:%S"),
+                    rng.random() * 100,
+                    rng.random() * 100,
+                    storage.RISK_FORMULA_VERSION,
+                )
+                for i in range(int(rows))
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def bench_startup(sizes: list[int]) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            _use_temp_db(tmp_dir, f"bench_startup_{size}.db")
+            started = time.perf_counter()
+            _seed_articles_bulk(size)
+            _seed_risk_timeseries(max(1, size // 10))
+            # 대량 적재분의 제목/태그/롤업 색인을 한 번 채운다(이후 기동은 누락분만 확인).
+            storage.init_db()
+            print(f"[startup] rows={size} seeded elapsed={time.perf_counter() - started:.1f}s", flush=True)
+
+            def legacy_rewrites() -> None:
+                conn = storage._connect()
+                try:
+                    for sql in LEGACY_STARTUP_SQL:
+                        conn.execute(sql)
+                    conn.commit()
+                finally:
+                    conn.close()
+
+            def migrate_from_scratch() -> None:
+                conn = storage._connect()
+                try:
+                    conn.execute("DELETE FROM schema_migrations")
+                    conn.commit()
+                finally:
+                    conn.close()
+                storage.init_db()
+
+            legacy_ms = _timed(legacy_rewrites, repeat=3) * 1000
+            migrate_ms = _timed(migrate_from_scratch, repeat=1) * 1000
+            fast_ms = _timed(storage.init_db) * 1000
+            print(
+                f"[startup] rows={size} legacy_rewrites_ms={legacy_ms:.1f} "
+                f"first_migration_ms={migrate_ms:.1f} init_db_ms={fast_ms:.1f}",
+                flush=True,
+            )
+
+
+def _seed_source_groups(group_size: int = 3) -> None:
+    """직접 적재한 기사에 재배포 그룹(group_size건씩)과 source_groups 행을 붙인다."""
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn = storage._connect()
+    try:
+        conn.execute(f"UPDATE articles SET source_group_id = 'bulk-group-' || (id / {max(1, int(group_size))})")
+        conn.execute(
+            """
+            INSERT INTO source_groups (group_id, canonical_article_id, repost_count, first_seen_at, last_seen_at)
+            SELECT source_group_id, MIN(id), COUNT(1), ?, ?
+            FROM articles
+            GROUP BY source_group_id
+            """,
+            (now, now),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def bench_cleanup(sizes: list[int], retain_days: int) -> None:
+    from backend import archive
+
+    # 그룹 집계 보정만 비교한다(월별 아카이브 복사는 제외).
+    archive.ARTICLE_ARCHIVE_ENABLED = False
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            _use_temp_db(tmp_dir, f"bench_cleanup_{size}.db")
+            started = time.perf_counter()
+            _seed_articles_bulk(size)
+            _seed_source_groups()
+            print(f"[cleanup] rows={size} seeded elapsed={time.perf_counter() - started:.1f}s", flush=True)
+            cutoff = (datetime.now() - timedelta(days=retain_days)).strftime("%Y-%m-%d %H:%M:%S")
+            delete_sql = """
+                DELETE FROM articles
+                WHERE is_test = 0 AND event_ts < CAST(strftime('%s', ?) AS INTEGER)
+                RETURNING source_group_id
+            """
+            deleted = {"rows": 0}
+
+            def run(incremental: bool):
+                def inner() -> None:
+                    # 같은 만료분을 반복 측정하도록 매번 롤백한다.
+                    conn = storage._connect()
+                    try:
+                        deleted["rows"], group_ids = storage._returned_group_ids(conn.execute(delete_sql, (cutoff,)))
+                        if incremental:
+                            storage._sync_source_groups(conn, group_ids)
+                        else:
+                            for sql in LEGACY_CLEANUP_GROUP_SQL:
+                                conn.execute(sql)
+                    finally:
+                        conn.rollback()
+                        conn.close()
+
+                return inner
+
+            legacy_ms = _timed(run(False), repeat=3) * 1000
+            incremental_ms = _timed(run(True), repeat=3) * 1000
+            print(
+                f"[cleanup] rows={size} retain_days={retain_days} deleted={deleted['rows']} "
+                f"legacy_ms={legacy_ms:.1f} incremental_ms={incremental_ms:.1f}",
+                flush=True,
+            )
+
+
+def bench_columnar(sizes: list[int], years: int) -> None:
+    from backend import analytics_store
+    from backend.analysis_project import build_project_snapshot
+
+    from backend import read_cache
+
+    # 같은 인자를 반복 호출하므로 조회 결과 캐시는 끄고 잰다.
+    read_cache.READ_CACHE_ENABLED = False
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        analytics_store.ANALYTICS_STORE_DIR = str(Path(tmp_dir) / "analytics")
+        for size in sizes:
+            _use_temp_db(tmp_dir, f"bench_columnar_{size}.db")
+            started = time.perf_counter()
+            _seed_articles_bulk(size, days=365 * max(1, years))
+            storage.init_db()
+            # 직접 적재한 기사는 태그가 없으므로 한 번 전체 태깅한다.
+            storage.rebuild_article_tags()
+            print(f"[columnar] rows={size} seeded elapsed={time.perf_counter() - started:.1f}s", flush=True)
+            refresh = analytics_store.refresh_store()
+            print(
+                f"[columnar] rows={size} refresh_full_ms={refresh['elapsed_ms']} files={refresh['files_written']} "
+                f"partitions={refresh['partitions']}",
+                flush=True,
+            )
+
+            date_from = (datetime.now() - timedelta(days=365 * max(1, years))).strftime("%Y-%m-%d")
+            date_to = datetime.now().strftime("%Y-%m-%d")
+
+            def dashboard_acc(loader):
+                def run() -> None:
+                    conn = storage._connect_readonly()
+                    try:
+                        loader(conn, "메이플스토리", date_from, date_to)
+                    finally:
+                        conn.close()
+
+                return run
+
+            cases = (
+                (
+                    "ip_clusters",
+                    lambda: storage.get_ip_clusters(date_from=date_from, date_to=date_to, columnar=False),
+                    lambda: storage.get_ip_clusters(date_from=date_from, date_to=date_to, columnar=True),
+                ),
+                (
+                    "risk_dashboard_scan",
+                    dashboard_acc(storage._risk_dashboard_acc_from_articles),
+                    dashboard_acc(storage._risk_dashboard_acc_from_columnar),
+                ),
+                (
+                    "project_snapshot",
+                    lambda: build_project_snapshot(date_from=date_from, date_to=date_to, columnar=False),
+                    lambda: build_project_snapshot(date_from=date_from, date_to=date_to, columnar=True),
+                ),
+            )
+            for name, row_fn, columnar_fn in cases:
+                row_ms = _timed(row_fn, repeat=2) * 1000
+                columnar_ms = _timed(columnar_fn, repeat=2) * 1000
+                print(
+                    f"[columnar] rows={size} years={years} case={name} rows_ms={row_ms:.1f} "
+                    f"columnar_ms={columnar_ms:.1f} speedup={row_ms / max(columnar_ms, 1e-9):.1f}x",
+                    flush=True,
+                )
+
+
+def bench_read_cache(sizes: list[int], years: int) -> None:
+    from backend import read_cache
+    from backend.analysis_project import build_project_snapshot
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            _use_temp_db(tmp_dir, f"bench_read_cache_{size}.db")
+            _seed_articles_bulk(size, days=365 * max(1, years))
+            storage.init_db()
+            storage.rebuild_article_tags()
+            date_from = (datetime.now() - timedelta(days=365 * max(1, years))).strftime("%Y-%m-%d")
+            date_to = datetime.now().strftime("%Y-%m-%d")
+            cases = (
+                ("risk_dashboard", lambda: storage.get_risk_dashboard(date_from=date_from, date_to=date_to)),
+                ("ip_clusters", lambda: storage.get_ip_clusters(date_from=date_from, date_to=date_to)),
+                ("nexon_articles", lambda: storage.get_nexon_articles(ip="maplestory", limit=50)),
+                ("project_snapshot", lambda: build_project_snapshot(date_from=date_from, date_to=date_to)),
+            )
+            for name, fn in cases:
+
+                def miss(fn=fn) -> None:
+                    read_cache.clear()
+                    fn()
+
+                miss_ms = _timed(miss, repeat=2) * 1000
+                fn()
+                hit_ms = _timed(fn, repeat=20) * 1000
+                print(
+                    f"[read-cache] rows={size} case={name} miss_ms={miss_ms:.1f} hit_ms={hit_ms:.3f} "
+                    f"speedup={miss_ms / max(hit_ms, 1e-9):.0f}x",
+                    flush=True,
+                )
+            print(f"[read-cache] rows={size} metrics={read_cache.metrics()}", flush=True)
+
+
+def bench_http_etag(sizes: list[int], tabs: int, rounds: int, tick_every: int) -> None:
+    """tabs개 탭이 대시보드 GET 4종을 rounds회 폴링하고 tick_every회마다 수집 틱(기사/리스크 쓰기)이 든다."""
+    from fastapi.testclient import TestClient
+
+    from backend import http_cache
+    from backend import main as api
+
+    ips = ["all", "maplestory", "dnf", "arcraiders"]
+
+    def tab_urls(tab: int) -> list[str]:
+        ip = ips[tab % len(ips)]
+        cluster_ip = ip if ip != "all" else "maplestory"
+        return [
+            f"/api/risk-dashboard?ip={ip}",
+            f"/api/ip-clusters?ip={cluster_ip}&limit=6",
+            f"/api/risk-timeseries?ip={ip}&hours=168&limit=2000",
+            "/api/health",
+        ]
+
+    def collect_tick(tick: int) -> None:
+        frame = build_synthetic_frame(20, seed=1000 + tick)
+        frame["originallink"] = frame["link"] = [f"https://bench.example/tick{tick}/{i}" for i in range(len(frame))]
+        storage.save_articles(frame)
+        conn = storage._connect()
+        try:
+            for ip in ips:
+                storage._upsert_risk_timeseries(
+                    conn, ip_id=ip, ts=datetime.now().strftime("%Y-%m-%d %H:%M:%S"), raw_risk=30.0, score=30.0,
+                    issue_heat=10.0, s_comp=0.1, v_comp=0.2, t_comp=0.3, m_comp=0.4, alert_level="P3",
+                    sample_size=5, uncertain_ratio=0.1, quality_flag="OK",
+                    risk_formula_version=storage.RISK_FORMULA_VERSION,
+                )
+            conn.commit()
+        finally:
+            conn.close()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            _use_temp_db(tmp_dir, f"bench_http_etag_{size}.db")
+            _seed_articles_bulk(size, days=90)
+            storage.init_db()
+            storage.rebuild_article_tags()
+            client = TestClient(api.app)
+            for mode in ("full", "etag"):
+                http_cache.HTTP_ETAG_ENABLED = mode == "etag"
+                validators: dict[tuple[int, str], str] = {}
+                latencies: list[float] = []
+                served = not_modified = 0
+                for round_no in range(rounds):
+                    if round_no % max(1, tick_every) == 0:
+                        collect_tick(round_no)
+                    for tab in range(tabs):
+                        for url in tab_urls(tab):
+                            headers = {"If-None-Match": validators[(tab, url)]} if (tab, url) in validators else {}
+                            started = time.perf_counter()
+                            res = client.get(url, headers=headers)
+                            latencies.append(time.perf_counter() - started)
+                            served += len(res.content)
+                            not_modified += res.status_code == 304
+                            if mode == "etag" and "etag" in res.headers:
+                                validators[(tab, url)] = res.headers["etag"]
+                latencies.sort()
+                print(
+                    f"[http-etag] rows={size} tabs={tabs} rounds={rounds} mode={mode} requests={len(latencies)} "
+                    f"not_modified={not_modified} served_kb={served / 1024:.0f} "
+                    f"p50_ms={latencies[len(latencies) // 2] * 1000:.2f} "
+                    f"p95_ms={latencies[int(len(latencies) * 0.95)] * 1000:.2f}",
+                    flush=True,
+                )
+            http_cache.HTTP_ETAG_ENABLED = True
+
+
+def bench_serialize(sizes: list[int]) -> None:
+    """큰 응답 API 본문: 기존 jsonable_encoder + 표준 json vs orjson, 압축 전후 전송 크기."""
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+
+    from backend import http_response
+    from backend import main as api
+    from backend.analysis_project import build_project_snapshot
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for size in sizes:
+            _use_temp_db(tmp_dir, f"bench_serialize_{size}.db")
+            _seed_articles_bulk(size, days=90)
+            storage.init_db()
+            storage.rebuild_article_tags()
+            now = datetime.now()
+            conn = storage._connect()
+            try:
+                conn.executemany(
+                    """
+                    INSERT INTO risk_timeseries (
+                        ip_id, ts, risk_raw, risk_score, issue_heat, s_comp, v_comp, t_comp, m_comp,
+                        alert_level, sample_size, uncertain_ratio
+                    ) VALUES ('maplestory', ?, 10.0, ?, 3.0, 0.1, 0.2, 0.3, 0.4, 'P3', 20, 0.1)
+                    """,
+                    [
+                        ((now - timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S"), float(i % 100))
+                        for i in range(10000)
+                    ],
+                )
+                conn.commit()
+            finally:
+                conn.close()
+            date_from = (now - timedelta(days=90)).strftime("%Y-%m-%d")
+            cases = (
+                ("risk_timeseries", storage.get_risk_timeseries(ip_id="maplestory", hours=24 * 30, limit=10000)),
+                ("compare_live", api._build_compare_live_payload_from_db(COMPARE_COMPANIES, 168)),
+                ("project_snapshot", build_project_snapshot(date_from=date_from, date_to=now.strftime("%Y-%m-%d"))),
+            )
+            for name, payload in cases:
+                body = http_response.dumps(payload)
+                stdlib_ms = _timed(lambda: JSONResponse(jsonable_encoder(payload)).body) * 1000
+                orjson_ms = _timed(lambda: http_response.FastJSONResponse(payload).body) * 1000
+                sizes_kb = {"raw": len(body) / 1024}
+                encodings = ["gzip"] + (["br"] if http_response.brotli is not None else [])
+                compress_ms = {}
+                for encoding in encodings:
+                    sizes_kb[encoding] = len(http_response.compress(body, encoding)) / 1024
+                    compress_ms[encoding] = _timed(lambda: http_response.compress(body, encoding)) * 1000
+                print(
+                    f"[serialize] rows={size} case={name} stdlib_ms={stdlib_ms:.2f} orjson_ms={orjson_ms:.2f} "
+                    f"speedup={stdlib_ms / max(orjson_ms, 1e-9):.1f}x "
+                    + " ".join(f"{k}_kb={v:.1f}" for k, v in sizes_kb.items())
+                    + " "
+                    + " ".join(f"{k}_ms={v:.2f}" for k, v in compress_ms.items()),
+                    flush=True,
+                )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="storage 계층 성능 벤치마크(임시 DB 사용)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    ingest = sub.add_parser("ingest", help="save_articles 적재 처리량(rows/sec)")
+    ingest.add_argument("--rows", default="1000,10000,100000", help="쉼표 구분 행 수")
+    near_dup = sub.add_parser("near-dup", help="재배포 판정 품질/속도: 기존 순차 비교 vs 제목 LSH")
+    near_dup.add_argument("--rows", default="2000,10000", help="쉼표 구분 행 수")
+    event_ts = sub.add_parser("event-ts", help="/health, compare(DB) 시각 필터 지연: 기존 datetime() 조건 vs event_ts 색인")
+    event_ts.add_argument("--rows", default="1000000", help="쉼표 구분 행 수")
+    event_ts.add_argument("--window-hours", type=int, default=24, help="compare 조회 구간(시간)")
+    startup = sub.add_parser("startup", help="init_db 기동 시간: 기존 무조건 재기록 vs 스키마 버전 확인")
+    startup.add_argument("--rows", default="1000000", help="쉼표 구분 행 수")
+    cleanup = sub.add_parser("cleanup", help="live 기사 보존 정리: 기존 전체 그룹 재계산 vs 삭제 그룹만 보정")
+    # 기존 방식은 그룹 수 x 기사 수에 비례해 큰 행 수에서는 끝나지 않는다.
+    cleanup.add_argument("--rows", default="10000,30000", help="쉼표 구분 행 수")
+    cleanup.add_argument("--retain-days", type=int, default=89, help="보존 기간(일), 기사는 최근 90일에 분포")
+    columnar = sub.add_parser("columnar", help="장기 구간 분석: SQLite 행 스캔 vs Parquet 열 단위 스토어")
+    columnar.add_argument("--rows", default="1000000", help="쉼표 구분 행 수")
+    columnar.add_argument("--years", type=int, default=3, help="기사 분포 기간(년)")
+    read_cache = sub.add_parser("read-cache", help="조회 결과 캐시: 캐시 미스(재계산) vs 적중")
+    read_cache.add_argument("--rows", default="200000", help="쉼표 구분 행 수")
+    read_cache.add_argument("--years", type=int, default=3, help="기사 분포 기간(년)")
+    http_etag = sub.add_parser("http-etag", help="대시보드 폴링 전송량/지연: 매번 전체 응답 vs ETag 304")
+    http_etag.add_argument("--rows", default="100000", help="쉼표 구분 행 수")
+    http_etag.add_argument("--tabs", type=int, default=50, help="동시에 폴링하는 탭 수")
+    http_etag.add_argument("--rounds", type=int, default=20, help="탭별 폴링 횟수")
+    http_etag.add_argument("--tick-every", type=int, default=5, help="수집 틱(기사/리스크 쓰기) 간격(폴링 횟수)")
+    serialize = sub.add_parser("serialize", help="큰 응답 API 직렬화 시간/전송 크기: 표준 json vs orjson, 압축 전후")
+    serialize.add_argument("--rows", default="100000", help="쉼표 구분 행 수")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.command == "ingest":
+        bench_ingest([int(x) for x in args.rows.split(",") if x.strip()])
+    elif args.command == "near-dup":
+        bench_near_dup([int(x) for x in args.rows.split(",") if x.strip()])
+    elif args.command == "event-ts":
+        bench_event_ts([int(x) for x in args.rows.split(",") if x.strip()], args.window_hours)
+    elif args.command == "startup":
+        bench_startup([int(x) for x in args.rows.split(",") if x.strip()])
+    elif args.command == "cleanup":
+        bench_cleanup([int(x) for x in args.rows.split(",") if x.strip()], args.retain_days)
+    elif args.command == "columnar":
+        bench_columnar([int(x) for x in args.rows.split(",") if x.strip()], args.years)
+    elif args.command == "read-cache":
+        bench_read_cache([int(x) for x in args.rows.split(",") if x.strip()], args.years)
+    elif args.command == "serialize":
+        bench_serialize([int(x) for x in args.rows.split(",") if x.strip()])
+    elif args.command == "http-etag":
+        bench_http_etag(
+            [int(x) for x in args.rows.split(",") if x.strip()], args.tabs, args.rounds, args.tick_every
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="source_groups 집계(repost_count/고아 그룹)와 기사 테이블 정합성 점검")
+    parser.add_argument("--db-path", default="", help="대상 DB 경로(미지정 시 LIVE_DB_PATH/기본 articles.db)")
+    parser.add_argument("--repair", action="store_true", help="어긋난 그룹만 다시 세고 기사가 없는 그룹은 삭제")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.db_path:
+        os.environ["LIVE_DB_PATH"] = args.db_path
+
+    result = storage.check_source_group_rollups(repair=args.repair)
+    print(f"[ok] db: {storage.get_active_db_path()}")
+    for key, value in result.items():
+        print(f"[ok] {key}: {value}")
+    inconsistent = result["repost_count_mismatch"] + result["orphan_groups"]
+    if inconsistent and not args.repair:
+        print("[warn] 불일치 그룹이 있습니다. --repair로 보정할 수 있습니다.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="기사 IP/테마 태그(article_tags) 재생성")
+    parser.add_argument("--db-path", default="", help="대상 DB 경로(미지정 시 LIVE_DB_PATH/기본 articles.db)")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.db_path:
+        os.environ["LIVE_DB_PATH"] = args.db_path
+
+    # init_db는 규칙 지문이 다를 때만 재태깅하므로, 여기서는 무조건 전체 재생성한다.
+    storage.init_db()
+    tagged = storage.rebuild_article_tags()
+    print(f"[ok] db: {storage.get_active_db_path()}")
+    print(f"[ok] tagged_articles: {tagged}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
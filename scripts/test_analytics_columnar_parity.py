@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import analytics_store, db, storage
+
+IPS = ["all", "maplestory", "dnf", "arcraiders", "fconline", "bluearchive"]
+RANGES = [
+    ("2024-01-01", "2026-12-31"),
+    ("2024-03-15", "2025-02-10"),
+    ("2025-06-01", "2025-06-30"),
+    ("2026-01-01", "2026-12-31"),
+]
+OUTLETS = ["inven.co.kr", "thisisgame.com", "gamemeca.com", "news.naver.com", "ruliweb.com"]
+SUBJECTS = ["메이플스토리", "던파", "아크 레이더스", "FC온라인", "블루아카이브", "넥슨", "신규 게임"]
+ISSUES = ["확률 논란", "서버 장애 점검", "보상 지급", "공정위 제재", "이용자 불만", "신작 출시 흥행", "업데이트 소식"]
+
+
+def _build_frame(start: int, rows: int, seed: int) -> pd.DataFrame:
+    rng = random.Random(seed)
+    records = []
+    for i in range(start, start + rows):
+        day = pd.Timestamp("2024-01-01") + pd.Timedelta(days=rng.randrange(0, 1080))
+        subject = rng.choice(SUBJECTS)
+        issue = rng.choice(ISSUES)
+        outlet = rng.choice(OUTLETS)
+        # 같은 제목을 여러 언론사가 재배포한 경우(source_group 묶음)도 섞는다.
+        title = f"{subject} {issue} {i // 3 if i % 5 == 0 else i}"
+        records.append(
+            {
+                "company": "넥슨" if i % 7 else "넷마블",
+                "title_clean": title,
+                "description_clean": f"{rng.choice(SUBJECTS)} 관련 {rng.choice(ISSUES)} 소식을 전했다",
+                "originallink": f"https://www.{outlet}/news/{i}",
+                "link": f"https://www.{outlet}/news/{i}",
+                "pubDate_parsed": f"{day:%Y-%m-%d} {rng.randrange(24):02d}:00:00",
+                "date": f"{day:%Y-%m-%d}",
+                "sentiment": rng.choice(["긍정", "중립", "부정", "부정"]),
+            }
+        )
+    return pd.DataFrame(records)
+
+
+def _assert_parity(label: str, *, expect_columnar: bool = True) -> None:
+    conn = storage._connect_readonly()
+    try:
+        for ip in IPS:
+            ip_name = storage._resolve_ip_name(ip)
+            for date_from, date_to in RANGES:
+                case = f"[{label}] {ip} {date_from}~{date_to}"
+                columnar = storage._risk_dashboard_acc_from_columnar(conn, ip_name, date_from, date_to)
+                assert (columnar is not None) == expect_columnar, case
+                if columnar is None:
+                    continue
+                rows = storage._risk_dashboard_acc_from_articles(conn, ip_name, date_from, date_to)
+                assert columnar == rows, case
+                # 동률 정렬을 좌우하는 최초 등장 순서까지 같아야 한다.
+                for key in ("outlets", "ip_breakdown"):
+                    assert list(columnar[key]) == list(rows[key]), f"{case} {key}"
+                if ip != "all":
+                    assert storage.get_ip_clusters(
+                        date_from=date_from, date_to=date_to, ip=ip, limit=12, columnar=True
+                    ) == storage.get_ip_clusters(date_from=date_from, date_to=date_to, ip=ip, limit=12, columnar=False), case
+                assert storage.get_risk_dashboard(
+                    date_from=date_from, date_to=date_to, ip=ip, columnar=True
+                ) == storage.get_risk_dashboard(date_from=date_from, date_to=date_to, ip=ip, columnar=False), case
+    finally:
+        conn.close()
+
+
+def _dirty_months() -> int:
+    conn = storage._connect_readonly()
+    try:
+        return int(conn.execute("SELECT COUNT(*) FROM analytics_dirty_months").fetchone()[0])
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["LIVE_DB_PATH"] = str(Path(tmp_dir) / "analytics.db")
+        analytics_store.ANALYTICS_STORE_DIR = str(Path(tmp_dir) / "analytics")
+        analytics_store.ANALYTICS_STORE_PART_ROWS = 1000
+        storage.init_db()
+        storage.save_articles(_build_frame(0, 4000, seed=1))
+
+        # 스토어가 없으면 행 경로로 대체한다.
+        _assert_parity("no-store", expect_columnar=False)
+
+        result = analytics_store.refresh_store()
+        assert result["status"] == "ok" and result["full"] and result["rows_written"] == 4000, result
+        assert result["partitions"] >= 36, result
+        _assert_parity("full")
+
+        # 워터마크 이후 신규 기사: 갱신 전에는 SQLite 증분과 합치고, 갱신하면 새 파일만 추가한다.
+        storage.save_articles(_build_frame(4000, 600, seed=2))
+        _assert_parity("late-insert")
+        before = {p.name for p in analytics_store.store_dir().rglob("*.parquet")}
+        analytics_store.ANALYTICS_STORE_COMPACT_FILES = 1000
+        result = analytics_store.refresh_store()
+        assert not result["full"] and result["rows_written"] == 600 and result["rewritten_months"] == 0, result
+        after = {p.name for p in analytics_store.store_dir().rglob("*.parquet")}
+        assert before < after and result["files_removed"] == 0, result
+        _assert_parity("appended")
+
+        # 증분 갱신으로 쌓인 작은 파일은 다음 갱신에서 월 단위로 합친다.
+        analytics_store.ANALYTICS_STORE_COMPACT_FILES = 1
+        storage.save_articles(_build_frame(4600, 400, seed=3))
+        result = analytics_store.refresh_store()
+        assert result["files_removed"] > 0, result
+        manifest = analytics_store._load_manifest(analytics_store.store_dir())
+        assert all(len(files) <= 2 for files in manifest["partitions"].values()), manifest["partitions"]
+        analytics_store.ANALYTICS_STORE_COMPACT_FILES = 4
+        _assert_parity("compacted")
+
+        # 이미 내보낸 기사의 수정/삭제: 표시된 월은 SQLite에서 읽고, 갱신 시 그 월만 다시 쓴다.
+        conn = storage._connect()
+        try:
+            conn.execute("UPDATE articles SET sentiment = '부정' WHERE id % 11 = 0")
+            conn.execute("UPDATE articles SET date = '2025-06-15' WHERE id IN (17, 18, 19)")
+            conn.execute("DELETE FROM articles WHERE id % 13 = 0 AND date LIKE '2024-0%'")
+            conn.commit()
+        finally:
+            conn.close()
+        assert _dirty_months() > 0
+        _assert_parity("dirty")
+        result = analytics_store.refresh_store()
+        assert not result["full"] and result["rewritten_months"] > 0 and result["files_removed"] > 0, result
+        assert _dirty_months() == 0
+        _assert_parity("rewritten")
+
+        # 태그 전체 재생성은 기사 트리거를 타지 않으므로 모든 월을 다시 쓴다.
+        storage.rebuild_article_tags()
+        _assert_parity("retag-dirty")
+        result = analytics_store.refresh_store()
+        assert result["rewritten_months"] == result["partitions"], result
+        _assert_parity("retagged")
+
+        result = analytics_store.refresh_store()
+        assert result["rows_written"] == 0 and result["files_written"] == 0, result
+        db.close_all_connections()
+
+    print("PASS: Parquet 열 단위 분석 경로가 SQLite 행 경로와 같은 결과를 반환")
+
+
+if __name__ == "__main__":
+    main()
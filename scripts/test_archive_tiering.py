@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import analytics_store, archive, db, storage
+
+ROWS = 1500
+IPS = ["all", "maplestory", "dnf", "bluearchive"]
+OUTLETS = ["inven.co.kr", "thisisgame.com", "gamemeca.com", "news.naver.com", "ruliweb.com"]
+SUBJECTS = ["메이플스토리", "던파", "블루아카이브", "넥슨", "신규 게임"]
+ISSUES = ["확률 논란", "서버 장애 점검", "보상 지급", "공정위 제재", "이용자 불만", "업데이트 소식"]
+
+
+def _build_frame(rng: random.Random) -> pd.DataFrame:
+    """최근 200일에 걸친 기사. 같은 제목/일자를 여러 언론사가 재배포한 그룹을 섞는다."""
+    now = datetime.now()
+    records = []
+    for i in range(ROWS):
+        base = i // 3 if i % 4 == 0 else i
+        day = now - timedelta(days=5 + (base * 7919) % 200)
+        outlet = rng.choice(OUTLETS)
+        records.append(
+            {
+                "company": "넥슨" if i % 9 else "넷마블",
+                "title_clean": f"{SUBJECTS[base % len(SUBJECTS)]} {ISSUES[base % len(ISSUES)]} {base}",
+                "description_clean": f"{rng.choice(SUBJECTS)} 관련 {rng.choice(ISSUES)} 소식을 전했다",
+                "originallink": f"https://www.{outlet}/news/{i}",
+                "link": f"https://www.{outlet}/news/{i}",
+                "pubDate_parsed": f"{day:%Y-%m-%d} {rng.randrange(24):02d}:00:00",
+                "date": f"{day:%Y-%m-%d}",
+                "sentiment": rng.choice(["긍정", "중립", "부정", "부정"]),
+            }
+        )
+    return pd.DataFrame(records)
+
+
+def _ranges() -> list[tuple[str, str]]:
+    now = datetime.now()
+    return [
+        ("2024-01-01", "2026-12-31"),
+        ((now - timedelta(days=120)).strftime("%Y-%m-%d"), (now - timedelta(days=50)).strftime("%Y-%m-%d")),
+        ((now - timedelta(days=70)).strftime("%Y-%m-%d"), now.strftime("%Y-%m-%d")),
+    ]
+
+
+def _payloads() -> dict[tuple, dict]:
+    out = {}
+    for ip in IPS:
+        for date_from, date_to in _ranges():
+            for columnar in (False, True):
+                out[("dashboard", ip, date_from, date_to, columnar)] = storage.get_risk_dashboard(
+                    date_from=date_from, date_to=date_to, ip=ip, columnar=columnar
+                )
+                if ip != "all":
+                    out[("clusters", ip, date_from, date_to, columnar)] = storage.get_ip_clusters(
+                        date_from=date_from, date_to=date_to, ip=ip, limit=12, columnar=columnar
+                    )
+    return out
+
+
+def _exports() -> dict[tuple, list[dict]]:
+    """기사 내보내기(기간 지정/전체). 아카이브로 옮긴 기사도 같은 순서로 포함돼야 한다."""
+    out = {}
+    for ip in IPS:
+        for date_from, date_to in [*_ranges(), (None, None)]:
+            batches = storage.iter_export_articles(ip=ip, date_from=date_from, date_to=date_to, batch_size=97)
+            out[(ip, date_from, date_to)] = [item for batch in batches for item in batch]
+    return out
+
+
+def _assert_accumulators(label: str) -> None:
+    """행/롤업/열 단위 경로가 운영 DB + 아카이브를 합쳐 같은 집계를 낸다."""
+    conn = storage._connect_readonly()
+    try:
+        for ip in IPS:
+            ip_name = storage._resolve_ip_name(ip)
+            for date_from, date_to in _ranges():
+                case = f"[{label}] {ip} {date_from}~{date_to}"
+                archives = storage._open_archives(date_from, date_to)
+                try:
+                    rows = storage._risk_dashboard_acc_from_articles(conn, ip_name, date_from, date_to, archives)
+                    rollup = storage._risk_dashboard_acc_from_rollup(conn, ip_name, date_from, date_to, archives)
+                    columnar = storage._risk_dashboard_acc_from_columnar(conn, ip_name, date_from, date_to, archives)
+                finally:
+                    for archive_conn in archives.values():
+                        archive_conn.close()
+                assert columnar is not None, case
+                for acc in (rollup, columnar):
+                    assert acc == rows, case
+                    for key in ("outlets", "ip_breakdown"):
+                        assert list(acc[key]) == list(rows[key]), f"{case} {key}"
+    finally:
+        conn.close()
+
+
+def _count(sql: str, path: Path | None = None) -> int:
+    conn = db.connect(path, readonly=True) if path else storage._connect_readonly()
+    try:
+        return int(conn.execute(sql).fetchone()[0])
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["LIVE_DB_PATH"] = str(Path(tmp_dir) / "tiering.db")
+        storage.init_db()
+        storage.save_articles(_build_frame(rng))
+        analytics_store.refresh_store()
+        total = _count("SELECT COUNT(*) FROM articles")
+        mentions = _count("SELECT SUM(repost_count) FROM source_groups")
+        expected = _payloads()
+        assert any(p["meta"]["repost_multiplier"] > 1 for p in expected.values()), "재배포 그룹이 있어야 한다"
+        expected_exports = _exports()
+        assert len(expected_exports[("all", None, None)]) == total
+
+        # 보존 기간(60일) 밖 기사를 상한만큼씩 옮긴다. 중간 상태에서도 결과는 같아야 한다.
+        moved = storage.cleanup_live_articles(retain_days=60, max_delete_rows=300)
+        assert moved == 300, moved
+        assert _payloads() == expected
+        assert _exports() == expected_exports
+        _assert_accumulators("partial")
+        moved += storage.cleanup_live_articles(retain_days=60)
+        files = archive.archive_files()
+        assert len(files) >= 4, files
+        archived = sum(_count("SELECT COUNT(*) FROM articles", p) for p in files.values())
+        hot = _count("SELECT COUNT(*) FROM articles")
+        assert archived == moved and hot + archived == total, (hot, archived, total)
+        # 재배포 수는 운영 DB와 아카이브에 나뉘어 세어진다.
+        archived_mentions = sum(_count("SELECT SUM(repost_count) FROM source_groups", p) for p in files.values())
+        assert _count("SELECT COALESCE(SUM(repost_count), 0) FROM source_groups") + archived_mentions == mentions
+        for month, path in files.items():
+            assert _count(f"SELECT COUNT(*) FROM articles WHERE substr(date, 1, 7) != '{month}'", path) == 0, month
+            assert _count("SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger'", path) == 0, month
+
+        # 스토어 재작성 전(재작성 대기 월은 아카이브에서 읽음) / 증분 갱신 후 / 전체 재생성 후
+        assert _payloads() == expected
+        assert _exports() == expected_exports
+        _assert_accumulators("dirty-months")
+        analytics_store.refresh_store()
+        _assert_accumulators("refreshed")
+        (analytics_store.store_dir() / analytics_store.MANIFEST_NAME).unlink()
+        assert analytics_store.refresh_store()["full"]
+        assert _payloads() == expected
+        _assert_accumulators("rebuilt")
+
+        # 좁은 구간은 걸친 월 아카이브만 연다.
+        recent = storage._open_archives(*_ranges()[2])
+        try:
+            assert 0 < len(recent) <= 3 and set(recent) <= set(files), sorted(recent)
+        finally:
+            for archive_conn in recent.values():
+                archive_conn.close()
+
+        # 복사 후 운영 DB 삭제 전에 중단된 경우: 다시 정리하면 같은 기사를 덮어쓰고 지운다.
+        conn = storage._connect_readonly()
+        try:
+            ids = [int(r[0]) for r in conn.execute("SELECT id FROM articles ORDER BY event_ts LIMIT 50")]
+        finally:
+            conn.close()
+        archive.archive_articles(ids)
+        assert storage.cleanup_live_articles(retain_days=1, max_delete_rows=50) == 50
+        archived = sum(_count("SELECT COUNT(*) FROM articles", p) for p in archive.archive_files().values())
+        assert archived + _count("SELECT COUNT(*) FROM articles") == total
+        assert _exports() == expected_exports
+
+        # 태그 규칙이 바뀐 아카이브는 열 때 다시 태깅/집계한다.
+        stale = next(iter(files.values()))
+        conn = db.connect_dedicated(stale)
+        try:
+            conn.execute("DELETE FROM article_tags")
+            conn.execute("UPDATE storage_meta SET value = 'old' WHERE key = 'article_tags_fingerprint'")
+            conn.commit()
+        finally:
+            conn.close()
+        analytics_store.refresh_store()
+        _assert_accumulators("retagged")
+        assert _count("SELECT COUNT(*) FROM article_tags", stale) > 0
+        assert _exports() == expected_exports
+        db.close_all_connections()
+
+    print("PASS: 보존 기간 밖 기사를 월별 아카이브로 옮긴 뒤에도 대시보드/클러스터/내보내기 결과 동일")
+
+
+if __name__ == "__main__":
+    main()
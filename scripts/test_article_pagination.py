@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import base64
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+import pandas as pd
+from fastapi.testclient import TestClient
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+from backend import main as api
+from scripts.article_fixtures import article_frame, temp_live_db
+
+COMPANIES = ["넥슨", "넥슨", "넷마블", "NC소프트"]
+TITLES = ["메이플스토리 업데이트", "던전앤파이터 이벤트", "FC온라인 점검", "신작 발표"]
+# 자정(00:00:00) pub_date는 기존 문자열 정렬에서 'YYYY-MM-DD'와 순서가 갈리므로 초를 어긋나게 둔다.
+BASE_TS = datetime(2026, 10, 16, 15, 37, 13)
+
+
+def _frame(start: int, rows: int) -> pd.DataFrame:
+    return article_frame(
+        start,
+        rows,
+        companies=COMPANIES,
+        title=lambda i: f"{TITLES[i % len(TITLES)]} {i}",
+        # 5개씩 같은 발행 시각(event_ts 동률)을 갖는다.
+        published=lambda i: BASE_TS - timedelta(minutes=97 * (i // 5)),
+        # 일부는 발행 시각 파싱 실패(pub_date='')로 기사 날짜만 있다.
+        missing_pub_date=lambda i: i % 11 == 0,
+    )
+
+
+def _legacy_urls(where_sql: str, params: list) -> list[str]:
+    """기존 offset 목록 정렬(빈 pub_date는 값 없음으로 본다)."""
+    conn = storage._connect_readonly()
+    try:
+        rows = conn.execute(
+            f"""
+            SELECT CASE WHEN originallink IS NOT NULL AND originallink != '' THEN originallink ELSE link END AS url
+            {where_sql}
+            ORDER BY COALESCE(NULLIF(pub_date, ''), date, created_at) DESC, id DESC
+            """,
+            params,
+        ).fetchall()
+    finally:
+        conn.close()
+    return [str(r["url"]) for r in rows]
+
+
+def _walk(client: TestClient, url: str) -> tuple[list[str], int]:
+    """cursor로 끝까지 읽는다. 중복/누락은 호출자가 기준 순서와 비교해 확인한다."""
+    urls: list[str] = []
+    cursor = None
+    pages = 0
+    while True:
+        res = client.get(f"{url}&cursor={cursor}" if cursor else url)
+        assert res.status_code == 200, res.text
+        body = res.json()
+        urls.extend(item["url"] for item in body["items"])
+        pages += 1
+        assert body["has_more"] == (body["next_cursor"] is not None)
+        if not body["next_cursor"]:
+            break
+        cursor = body["next_cursor"]
+        assert pages < 1000, url
+    assert len(urls) == len(set(urls)), f"중복 기사: {url}"
+    return urls, body["total"]
+
+
+def _walk_offset(client: TestClient, url: str, limit: int, total: int) -> list[str]:
+    urls: list[str] = []
+    for offset in range(0, total, limit):
+        res = client.get(f"{url}&offset={offset}")
+        assert res.status_code == 200, res.text
+        urls.extend(item["url"] for item in res.json()["items"])
+    return urls
+
+
+def _cases() -> list[tuple[str, str, list]]:
+    conn = storage._connect_readonly()
+    try:
+        ip_sql, ip_params = storage._build_ip_sql_filter("메이플스토리", storage.article_tags_ready(conn))
+    finally:
+        conn.close()
+    nexon_where = "FROM articles WHERE company = ? AND is_test = 0"
+    return [
+        ("/api/articles?limit=10", "FROM articles WHERE 1 = 1", []),
+        ("/api/articles?limit=10&company=넥슨", "FROM articles WHERE company = ?", ["넥슨"]),
+        ("/api/articles?limit=10&sentiment=부정", "FROM articles WHERE sentiment = ?", ["부정"]),
+        ("/api/nexon-articles?limit=10", nexon_where, ["넥슨"]),
+        ("/api/nexon-articles?limit=10&ip=maplestory", f"{nexon_where} {ip_sql}", ["넥슨", *ip_params]),
+    ]
+
+
+def _check_pages(client: TestClient) -> dict[str, int]:
+    totals: dict[str, int] = {}
+    for url, where_sql, params in _cases():
+        expected = _legacy_urls(where_sql, params)
+        assert expected, url
+        urls, total = _walk(client, url)
+        assert urls == expected, (url, len(urls), len(expected))
+        assert total == len(expected), (url, total, len(expected))
+        assert _walk_offset(client, url, 10, total) == expected, url
+        totals[url] = total
+    return totals
+
+
+def _malformed_cursors() -> list[str]:
+    encode = lambda raw: base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii").rstrip("=")  # noqa: E731
+    return [
+        "!!!",
+        "abc",
+        "한글",
+        encode("x:y"),
+        encode("1:2:3"),
+        encode("12345"),
+        encode("99999999999999999999:1"),
+        encode("1:99999999999999999999"),
+    ]
+
+
+def main() -> None:
+    with temp_live_db("pagination.db"):
+        storage.save_articles(_frame(0, 240))
+        # 예전 적재분처럼 pub_date가 NULL인 행(기사 날짜 기준 시각)
+        conn = storage._connect()
+        try:
+            conn.execute(
+                "UPDATE articles SET pub_date = NULL, event_ts = "
+                + storage._ARTICLE_EVENT_TS_SQL.format(pub_date="NULL", created_at="created_at", date="date")
+                + " WHERE id % 7 = 0"
+            )
+            conn.commit()
+            null_pub = conn.execute("SELECT COUNT(*) FROM articles WHERE pub_date IS NULL").fetchone()[0]
+            blank_pub = conn.execute("SELECT COUNT(*) FROM articles WHERE pub_date = ''").fetchone()[0]
+            ties = conn.execute(
+                "SELECT COUNT(*) FROM (SELECT event_ts FROM articles GROUP BY event_ts HAVING COUNT(*) > 1)"
+            ).fetchone()[0]
+        finally:
+            conn.close()
+        assert null_pub > 0 and blank_pub > 0 and ties > 0, (null_pub, blank_pub, ties)
+        client = TestClient(api.app)
+
+        totals = _check_pages(client)
+
+        # 형식이 틀린 cursor는 500이 아니라 400이다.
+        for cursor in _malformed_cursors():
+            for url in ("/api/articles", "/api/nexon-articles"):
+                res = client.get(url, params={"cursor": cursor})
+                assert res.status_code == 400, (url, cursor, res.status_code, res.text)
+
+        # 신규 적재 후 캐시된 total이 늘어난 건수를 반영하고 커서 순회도 다시 일치한다.
+        storage.save_articles(_frame(240, 60))
+        refreshed = _check_pages(client)
+        assert refreshed["/api/articles?limit=10"] == totals["/api/articles?limit=10"] + 60, refreshed
+        assert all(refreshed[url] >= totals[url] for url in totals), (totals, refreshed)
+        assert refreshed["/api/articles?limit=10&company=넥슨"] > totals["/api/articles?limit=10&company=넥슨"]
+
+    print("PASS: 기사 목록 cursor 순회가 중복/누락 없이 기존 offset 정렬과 일치하고 적재 후 total 갱신")
+
+
+if __name__ == "__main__":
+    main()
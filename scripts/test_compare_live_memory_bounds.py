@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+from backend import main as api
+from backend.rate_limit import TokenBucketLimiter
+from scripts.article_fixtures import article_frame, minutes_ago, neutral, temp_live_db
+
+COMPANIES = ["넥슨", "NC소프트", "넷마블", "크래프톤"]
+CLIENTS = int(os.getenv("RATE_LIMIT_SOAK_CLIENTS", "1000000"))
+# 버킷 상한(COMPARE_LIVE_RATE_MAX_CLIENTS)에 이른 뒤의 익명 메모리(RssAnon) 증가 상한.
+# 이전 구현(IP별 타임스탬프 목록, 삭제 없음)은 1M IP 기준 200MB 이상 늘어난다.
+RSS_GROWTH_CEILING_MB = 8
+
+
+def _rss_anon_mb() -> float:
+    with open("/proc/self/status", encoding="ascii") as f:
+        for line in f:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("RssAnon을 읽을 수 없습니다.")
+
+
+def _check_token_bucket() -> None:
+    limiter = TokenBucketLimiter(limit_per_min=30, max_clients=3)
+    # 분당 30개까지 몰아서 허용하고, 이후에는 2초마다 하나씩 다시 찬다.
+    assert all(limiter.hit("a", now=0.0) == 0 for _ in range(30))
+    assert limiter.hit("a", now=0.0) == 2
+    assert limiter.hit("a", now=2.0) == 0 and limiter.hit("a", now=2.0) == 2
+    # 상한을 넘으면 가장 오래 요청하지 않은 클라이언트를 밀어낸다.
+    for client in ("b", "c", "d"):
+        assert limiter.hit(client, now=3.0) == 0
+    metrics = limiter.metrics()
+    assert metrics["clients"] == 3 and metrics["evictions"] == 1, metrics
+    # 다 찬(60초 넘게 쉰) 버킷은 다음 요청 때 지운다.
+    limiter.hit("e", now=100.0)
+    metrics = limiter.metrics()
+    assert metrics["clients"] == 2 and metrics["expired"] == 2, metrics
+
+
+def _soak_rate_limiter() -> None:
+    api.compare_live_rate_limiter.clear()
+    warmup = min(CLIENTS, max(200_000, api.COMPARE_LIVE_RATE_MAX_CLIENTS * 5))
+    started = time.perf_counter()
+    for i in range(warmup):
+        api._check_compare_live_rate_limit(f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}-{i}")
+    baseline = _rss_anon_mb()
+    for i in range(warmup, CLIENTS):
+        api._check_compare_live_rate_limit(f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}-{i}")
+    elapsed = time.perf_counter() - started
+    growth = _rss_anon_mb() - baseline
+    metrics = api.compare_live_rate_limiter.metrics()
+    print(
+        f"rate limiter: clients={CLIENTS} kept={metrics['clients']} bytes={metrics['bytes'] // 1024}KB "
+        f"evictions={metrics['evictions']} elapsed={elapsed:.1f}s "
+        f"({elapsed / max(CLIENTS, 1) * 1e6:.2f}us/req) rss_anon_growth={growth:.1f}MB"
+    )
+    assert metrics["clients"] <= api.COMPARE_LIVE_RATE_MAX_CLIENTS, metrics
+    assert metrics["evictions"] + metrics["expired"] == CLIENTS - metrics["clients"], metrics
+    assert growth < RSS_GROWTH_CEILING_MB, f"요청 제한 상태 메모리가 계속 늘었습니다: {growth:.1f}MB"
+    api.compare_live_rate_limiter.clear()
+
+
+def _check_cache_bounds(client: TestClient) -> None:
+    api.compare_live_cache.clear()
+    max_entries = api.COMPARE_LIVE_CACHE_MAX_ENTRIES
+    api.COMPARE_LIVE_CACHE_MAX_ENTRIES = 20
+    try:
+        before = api._compare_live_cache_metrics()["evictions"]
+        n = 0
+        for companies in (",".join(COMPANIES), ",".join(reversed(COMPANIES))):
+            for window_hours in range(1, 169):
+                n += 1
+                res = client.get(
+                    f"/api/compare-live?companies={companies}&window_hours={window_hours}",
+                    headers={"X-Forwarded-For": f"10.2.{n >> 8}.{n & 255}"},
+                )
+                assert res.status_code == 200, res.text
+        metrics = api._compare_live_cache_metrics()
+        assert metrics["entries"] == 20 and metrics["evictions"] - before == n - 20, metrics
+        assert 0 < metrics["bytes"] <= metrics["max_bytes"], metrics
+        # 가장 최근 조합은 남고 처음 조합은 밀려났다.
+        assert api._compare_live_cache_key(list(reversed(COMPANIES)), 168) in api.compare_live_cache
+        assert api._compare_live_cache_key(COMPANIES, 1) not in api.compare_live_cache
+
+        # 크기 상한(MB)을 넘으면 개수와 관계없이 밀어낸다(가장 최근 항목 하나는 남긴다).
+        max_mb = api.COMPARE_LIVE_CACHE_MAX_MB
+        api.COMPARE_LIVE_CACHE_MAX_MB = 0
+        try:
+            res = client.get("/api/compare-live?window_hours=24", headers={"X-Forwarded-For": "10.3.0.1"})
+            assert res.status_code == 200 and len(api.compare_live_cache) == 1
+        finally:
+            api.COMPARE_LIVE_CACHE_MAX_MB = max_mb
+
+        # 최대 보관 시간이 지난 항목은 fallback으로도 쓰지 않고 지운다.
+        key = api._compare_live_cache_key(COMPANIES, 24)
+        api.compare_live_cache[key]["stored_at"] = time.time() - api.COMPARE_LIVE_CACHE_MAX_AGE_SECONDS - 1
+        res = client.get("/api/compare-live?window_hours=24", headers={"X-Forwarded-For": "10.3.0.2"})
+        assert res.status_code == 200 and not res.json()["meta"]["cache_hit"]
+        assert api._compare_live_cache_metrics()["expired"] >= 1
+    finally:
+        api.COMPARE_LIVE_CACHE_MAX_ENTRIES = max_entries
+
+
+def main() -> None:
+    _check_token_bucket()
+    with temp_live_db("memory_bounds.db"):
+        storage.save_articles(
+            article_frame(
+                0,
+                40,
+                companies=COMPANIES,
+                title=lambda i: f"신작 업데이트 소식 {i}",
+                published=minutes_ago(40, first=10),
+                sentiment=neutral,
+            )
+        )
+        client = TestClient(api.app)
+
+        # 한 클라이언트가 분당 제한을 넘으면 429와 다음 토큰까지의 Retry-After
+        api.compare_live_rate_limiter.clear()
+        headers = {"X-Forwarded-For": "10.9.9.9"}
+        statuses = [client.get("/api/compare-live", headers=headers).status_code for _ in range(31)]
+        assert statuses == [200] * 30 + [429], statuses
+        limited = client.get("/api/compare-live", headers=headers)
+        assert limited.status_code == 429 and 1 <= int(limited.headers["retry-after"]) <= 2
+
+        _check_cache_bounds(client)
+        _soak_rate_limiter()
+        health = client.get("/api/health").json()
+        assert {"entries", "bytes", "evictions", "expired"} <= set(health["compare_live_cache"])
+        assert {"clients", "bytes", "evictions", "expired"} <= set(health["compare_live_rate_limiter"])
+
+    print("PASS: compare-live 요청 제한 상태와 결과 캐시가 상한 안에서 밀어내며 메모리를 일정하게 유지")
+
+
+if __name__ == "__main__":
+    main()
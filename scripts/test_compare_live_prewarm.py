@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+import time
+
+import pandas as pd
+from fastapi.testclient import TestClient
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+from backend import main as api
+from scripts.article_fixtures import article_frame, hours_ago, issue_title, temp_live_db
+
+COMPANIES = ["넥슨", "NC소프트", "넷마블", "크래프톤"]
+BUILD_SECONDS = 0.5
+
+
+def _frame(start: int, rows: int) -> pd.DataFrame:
+    return article_frame(start, rows, companies=COMPANIES, title=issue_title("신작"), published=hours_ago(20))
+
+
+class _SlowBuild:
+    """DB 조회 횟수를 세고, 요청 경로에서 만들면 티가 나도록 느리게 한다."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.original = api._build_compare_live_payload_from_db
+
+    def __call__(self, selected: list[str], window_hours: int) -> dict:
+        self.calls += 1
+        time.sleep(BUILD_SECONDS)
+        return self.original(selected=selected, window_hours=window_hours)
+
+
+def _url(window_hours: int) -> str:
+    return f"/api/compare-live?window_hours={window_hours}"
+
+
+def _get(client: TestClient, url: str, n: int) -> tuple[dict, float]:
+    """요청 제한에 걸리지 않게 요청마다 다른 클라이언트 IP를 쓴다."""
+    started = time.perf_counter()
+    res = client.get(url, headers={"X-Forwarded-For": f"10.1.0.{n}"})
+    elapsed = time.perf_counter() - started
+    assert res.status_code == 200, res.text
+    return res.json(), elapsed
+
+
+def _wait_refreshed(key: str, timeout: float = 10.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        entry = api.compare_live_cache.get(key) or {}
+        if float(entry.get("expires_at", 0)) > time.time() and not entry.get("refreshing"):
+            return
+        time.sleep(0.05)
+    raise AssertionError(f"백그라운드 갱신이 끝나지 않음: {key}")
+
+
+def _check_standalone_prewarm_job(build: _SlowBuild) -> None:
+    """자동 수집이 꺼져 있으면 서버 시작을 막지 않고 별도 주기 작업이 기본 조합을 다시 만든다."""
+    patched = {
+        "ENABLE_COMPETITOR_AUTO_COLLECT": False,
+        "_run_collect_ip_tick": lambda ip_id: None,
+        "_run_monitor_tick": lambda ip_id: None,
+        "_run_backfill_tick": lambda: None,
+        "_run_analytics_store_refresh": lambda: None,
+    }
+    originals = {name: getattr(api, name) for name in patched}
+    for name, value in patched.items():
+        setattr(api, name, value)
+    calls = build.calls
+    try:
+        started = time.perf_counter()
+        api._start_monitoring_scheduler()
+        assert time.perf_counter() - started < BUILD_SECONDS
+        job = api.scheduler.get_job("prewarm-compare-live")
+        assert job is not None and api.scheduler.get_job("collect-competitors") is None
+        assert job.trigger.interval.total_seconds() == api.COMPARE_LIVE_PREWARM_INTERVAL_SECONDS
+        deadline = time.time() + 10
+        while build.calls < calls + 3 and time.time() < deadline:
+            time.sleep(0.05)
+        assert build.calls == calls + 3, build.calls
+        assert api.compare_live_prewarm_future.result(timeout=10) == 3
+    finally:
+        api.scheduler.shutdown(wait=True)
+        for name, value in originals.items():
+            setattr(api, name, value)
+
+
+def main() -> None:
+    with temp_live_db("prewarm.db"):
+        storage.save_articles(_frame(0, 40))
+        api.compare_live_cache.clear()
+        client = TestClient(api.app)
+        build = _SlowBuild()
+        api._build_compare_live_payload_from_db = build
+        try:
+            # collect-competitors 틱은 미리 만들기를 백그라운드에 맡기고 바로 끝난다.
+            # 그 뒤에는 기본 조합(24/72/168시간)이 모두 캐시에 있다.
+            collected = {"selected_companies": COMPANIES, "failed_companies": [], "rows": 0, "inserted": 0}
+            original_collect = api._collect_competitor_articles_to_db
+            api._collect_competitor_articles_to_db = lambda *args, **kwargs: collected
+            try:
+                started = time.perf_counter()
+                api._run_competitor_collect_tick()
+                assert time.perf_counter() - started < BUILD_SECONDS
+            finally:
+                api._collect_competitor_articles_to_db = original_collect
+            assert api.compare_live_prewarm_future.result(timeout=10) == 3
+            assert build.calls == len(api.COMPARE_LIVE_PREWARM_WINDOWS) == 3, build.calls
+            for n, window_hours in enumerate(api.COMPARE_LIVE_PREWARM_WINDOWS):
+                payload, elapsed = _get(client, _url(window_hours), n)
+                assert payload["meta"]["cache_hit"] and not payload["meta"]["cache_stale"], payload["meta"]
+                assert payload["meta"]["total_articles"] == 40 and elapsed < BUILD_SECONDS
+            assert build.calls == 3
+
+            # TTL이 지나도 유예 구간에서는 이전 결과로 바로 응답하고 한 번만 백그라운드에서 새로 만든다.
+            storage.save_articles(_frame(40, 8))
+            key = api._compare_live_cache_key(COMPANIES, 72)
+            api.compare_live_cache[key]["expires_at"] = time.time() - 1
+            for n in range(5):
+                payload, elapsed = _get(client, _url(72), 10 + n)
+                assert payload["meta"]["cache_stale"] and payload["meta"]["total_articles"] == 40, payload["meta"]
+                assert elapsed < BUILD_SECONDS, elapsed
+            _wait_refreshed(key)
+            assert build.calls == 4, build.calls
+            payload, _ = _get(client, _url(72), 20)
+            assert payload["meta"]["cache_hit"] and not payload["meta"]["cache_stale"]
+            assert payload["meta"]["total_articles"] == 48, payload["meta"]
+
+            # 유예 구간도 지나면 요청 경로에서 새로 만든다.
+            api.compare_live_cache[key]["expires_at"] = time.time() - api.COMPARE_LIVE_STALE_GRACE_SECONDS - 1
+            payload, elapsed = _get(client, _url(72), 21)
+            assert not payload["meta"]["cache_hit"] and elapsed >= BUILD_SECONDS and build.calls == 5
+
+            # 다음 수집 뒤 미리 만들기는 TTL이 남은 캐시도 새 기사로 바꾼다. 실행 중에는 다시 예약하지 않는다.
+            future = api._schedule_compare_live_prewarm()
+            assert api._schedule_compare_live_prewarm() is future
+            assert future.result(timeout=10) == 3
+            assert build.calls == 8, build.calls
+            payload, _ = _get(client, _url(24), 22)
+            assert payload["meta"]["cache_hit"] and payload["meta"]["total_articles"] == 48
+
+            _check_standalone_prewarm_job(build)
+
+            health = api.health()
+            assert health["compare_live_stale_hits"] >= 5 and health["compare_live_background_refreshes"] >= 1
+            assert health["compare_live_prewarmed"] >= 6
+        finally:
+            api._build_compare_live_payload_from_db = build.original
+
+    print("PASS: compare-live 기본 조합은 수집 뒤(자동 수집이 꺼져 있으면 별도 주기 작업이) 백그라운드에서 미리 만들어지고, 만료 직후에는 이전 결과로 응답하며 갱신")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import sys
+import time
+
+import httpx
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+from backend import main as api
+from scripts.article_fixtures import article_frame, issue_title, temp_live_db
+
+COMPANIES = ["넥슨", "NC소프트", "넷마블", "크래프톤"]
+URL = f"/api/compare-live?companies={','.join(COMPANIES)}&window_hours=72"
+CONCURRENCY = 100
+BUILD_SECONDS = 0.5
+
+
+class _SlowBuild:
+    """DB 조회를 느리게 만들어 동시 요청이 모두 캐시 미스 구간에 겹치게 한다."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.calls = 0
+        self.fail = fail
+        self.original = api._build_compare_live_payload_from_db
+
+    def __call__(self, selected: list[str], window_hours: int) -> dict:
+        self.calls += 1
+        time.sleep(BUILD_SECONDS)
+        if self.fail:
+            raise RuntimeError("naver api down")
+        return self.original(selected=selected, window_hours=window_hours)
+
+
+async def _burst() -> list[httpx.Response]:
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(
+            *(client.get(URL, headers={"X-Forwarded-For": f"10.0.0.{i}"}) for i in range(CONCURRENCY))
+        )
+
+
+def _run(build: _SlowBuild) -> list[httpx.Response]:
+    api._build_compare_live_payload_from_db = build
+    try:
+        return asyncio.run(_burst())
+    finally:
+        api._build_compare_live_payload_from_db = build.original
+
+
+def main() -> None:
+    with temp_live_db("single_flight.db"):
+        storage.save_articles(article_frame(0, 80, companies=COMPANIES, title=issue_title("신작")))
+        api.compare_live_cache.clear()
+
+        # 캐시가 빈 상태에서 100개 동시 요청: 만들기는 한 번, 나머지는 같은 결과를 받는다.
+        before = dict(api.compare_live_metrics)
+        build = _SlowBuild()
+        responses = _run(build)
+        assert build.calls == 1, build.calls
+        assert all(r.status_code == 200 for r in responses), [r.status_code for r in responses]
+        payloads = [r.json() for r in responses]
+        articles = {str(p["latest_articles"]) for p in payloads}
+        assert len(articles) == 1 and payloads[0]["meta"]["total_articles"] == 80
+        coalesced = api.compare_live_metrics["coalesced"] - before["coalesced"]
+        hits = api.compare_live_metrics["cache_hits"] - before["cache_hits"]
+        rebuilt_hits = sum(1 for p in payloads if p["meta"]["cache_hit"])
+        assert coalesced > 0 and coalesced + rebuilt_hits == CONCURRENCY - 1, (coalesced, hits, rebuilt_hits)
+
+        # TTL 만료 후 조회가 실패하면: 만들기는 한 번, 모든 요청이 마지막 성공 결과로 대체된다
+        # (리더 실패 뒤 도착한 요청은 COMPARE_LIVE_ERROR_BACKOFF_SECONDS 동안 다시 만들지 않는다).
+        for entry in api.compare_live_cache.values():
+            entry["expires_at"] = 0
+        failing = _SlowBuild(fail=True)
+        responses = _run(failing)
+        assert failing.calls == 1, failing.calls
+        assert all(r.status_code == 200 and r.json()["meta"]["cache_fallback"] for r in responses)
+
+        # 대체할 결과도 없으면 모두 502
+        api.compare_live_cache.clear()
+        failing = _SlowBuild(fail=True)
+        responses = _run(failing)
+        assert failing.calls == 1 and all(r.status_code == 502 for r in responses), failing.calls
+        # 실패 후 대기 시간이 지나면 다시 만든다.
+        for entry in api.compare_live_cache.values():
+            entry["failed_until"] = 0
+        build = _SlowBuild()
+        responses = _run(build)
+        assert build.calls == 1 and all(r.status_code == 200 for r in responses), build.calls
+        assert api.compare_live_flight.metrics()["in_flight"] == 0
+        assert api.health()["compare_live_coalesced"] == api.compare_live_metrics["coalesced"]
+
+    print("PASS: compare-live 캐시 미스 동시 요청 100건이 한 번의 조회 결과(또는 오류 대체)를 함께 받음")
+
+
+if __name__ == "__main__":
+    main()
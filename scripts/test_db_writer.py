@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import queue
+import sys
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import db, db_writer as db_writer_module, storage
+from backend.db_writer import DbWriter, db_writer
+
+THREADS = 8
+LOGS_PER_THREAD = 50
+
+
+def _count(sql: str) -> int:
+    conn = storage._connect_readonly()
+    try:
+        return int(conn.execute(sql).fetchone()[0])
+    finally:
+        conn.close()
+
+
+def _build_frame(start: int, rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "company": "넥슨",
+                "title_clean": f"블루아카이브 업데이트 이벤트 {i}",
+                "description_clean": "보상 지급 안내",
+                "originallink": f"https://www.inven.co.kr/news/{i}",
+                "link": f"https://www.inven.co.kr/news/{i}",
+                "pubDate_parsed": "2026-01-10 09:00:00",
+                "date": "2026-01-10",
+            }
+            for i in range(start, start + rows)
+        ]
+    )
+
+
+def _check_group_commit() -> None:
+    """여러 스레드의 로그 쓰기가 소수의 커밋으로 묶이고 하나도 유실되지 않아야 한다."""
+    before = _count("SELECT COUNT(*) FROM scheduler_logs")
+
+    def worker(n: int) -> None:
+        for i in range(LOGS_PER_THREAD):
+            storage.record_scheduler_log(job_id=f"job-{n}-{i}", status="success")
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert db_writer.flush(timeout=10)
+    total = THREADS * LOGS_PER_THREAD
+    assert _count("SELECT COUNT(*) FROM scheduler_logs") == before + total
+    m = db_writer.metrics()
+    assert m["jobs"] >= total and m["failed_jobs"] == 0, m
+    assert m["batches"] < total, f"그룹 커밋으로 묶이지 않았습니다: {m}"
+    assert m["max_batch_size"] > 1 and m["max_batch_size"] <= m["batch_max"], m
+    print(f"group commit: jobs={m['jobs']} batches={m['batches']} avg_batch={m['avg_batch_size']} avg_commit_ms={m['avg_commit_ms']}")
+
+
+def _check_failure_isolation() -> None:
+    """같은 묶음 안에서 실패한 작업만 되돌리고 나머지는 커밋해야 한다."""
+    writer = DbWriter(batch_max=16, batch_window_ms=200)
+    writer.start()
+    path = storage.get_active_db_path()
+    before = _count("SELECT COUNT(*) FROM burst_events")
+
+    def insert(conn, name: str) -> None:
+        conn.execute(
+            """
+            INSERT INTO burst_events (ip_name, event_type, trigger_reason, risk_at_event, occurred_at)
+            VALUES (?, 'enter', 'test', 10.0, '2026-01-10 00:00:00')
+            """,
+            (name,),
+        )
+
+    def broken(conn) -> None:
+        insert(conn, "broken")
+        conn.execute("INSERT INTO no_such_table VALUES (1)")
+
+    errors: list[BaseException] = []
+
+    def submit_broken() -> None:
+        try:
+            writer.submit(path, broken)
+        except Exception as exc:  # noqa: BLE001
+            errors.append(exc)
+
+    writer.submit(path, lambda conn: insert(conn, "ok-1"), wait=False)
+    t = threading.Thread(target=submit_broken)
+    t.start()
+    writer.submit(path, lambda conn: insert(conn, "ok-2"), wait=False)
+    t.join()
+    assert writer.stop(timeout=10)
+    assert errors, "실패한 작업의 예외가 호출자에게 전달되어야 합니다."
+    assert _count("SELECT COUNT(*) FROM burst_events") == before + 2
+    assert _count("SELECT COUNT(*) FROM burst_events WHERE ip_name = 'broken'") == 0
+    m = writer.metrics()
+    assert m["failed_jobs"] == 1 and m["jobs"] == 3 and not m["running"], m
+
+
+def _check_full_queue() -> None:
+    """큐가 찬 동안 생산자들이 잠금을 잡고 줄 서지 않고(각자 제한 시간만 대기), 종료는 대기 중인 생산자를 기다린다."""
+    writer = DbWriter(queue_max=1, batch_max=1, batch_window_ms=0)
+    writer.start()
+    path = storage.get_active_db_path()
+    release = threading.Event()
+    before = _count("SELECT COUNT(*) FROM scheduler_logs")
+
+    def log(conn, job_id: str) -> None:
+        conn.execute(
+            "INSERT INTO scheduler_logs (job_id, run_time, status) VALUES (?, '2026-01-10 00:00:00', 'success')",
+            (job_id,),
+        )
+
+    def blocked(conn) -> None:
+        release.wait(10)
+        log(conn, "blocked")
+
+    writer.submit(path, blocked, wait=False)
+    deadline = time.monotonic() + 5
+    while writer.metrics()["queue_depth"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    writer.submit(path, lambda conn: log(conn, "queued"), wait=False)
+
+    original_timeout = db_writer_module.DB_WRITER_SUBMIT_TIMEOUT_SECONDS
+    db_writer_module.DB_WRITER_SUBMIT_TIMEOUT_SECONDS = 0.5
+    rejected: list[float] = []
+
+    def producer(n: int) -> None:
+        started = time.monotonic()
+        try:
+            writer.submit(path, lambda conn: log(conn, f"rejected-{n}"), wait=False)
+        except queue.Full:
+            rejected.append(time.monotonic() - started)
+
+    try:
+        started = time.monotonic()
+        threads = [threading.Thread(target=producer, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        time.sleep(0.1)
+        assert writer._state_lock.acquire(timeout=0.1), "put() 대기 중 상태 잠금을 잡고 있습니다."
+        writer._state_lock.release()
+        for t in threads:
+            t.join()
+        elapsed = time.monotonic() - started
+        assert len(rejected) == 4 and elapsed < 1.5, (rejected, elapsed)
+        assert not writer.flush(timeout=0.2)
+
+        # 큐가 찬 채로 기다리는 생산자가 있으면 stop()은 그 작업이 큐에 들어간 뒤 종료 표시를 넣는다.
+        db_writer_module.DB_WRITER_SUBMIT_TIMEOUT_SECONDS = 10
+        waiting = threading.Thread(
+            target=lambda: writer.submit(path, lambda conn: log(conn, "waiting"), wait=False)
+        )
+        waiting.start()
+        time.sleep(0.1)
+        stopped: list[bool] = []
+        stopper = threading.Thread(target=lambda: stopped.append(writer.stop(timeout=10)))
+        stopper.start()
+        time.sleep(0.1)
+        release.set()
+        stopper.join()
+        waiting.join()
+    finally:
+        db_writer_module.DB_WRITER_SUBMIT_TIMEOUT_SECONDS = original_timeout
+        release.set()
+        writer.stop(timeout=10)
+    assert stopped == [True], stopped
+    assert _count("SELECT COUNT(*) FROM scheduler_logs") == before + 3
+    assert _count("SELECT COUNT(*) FROM scheduler_logs WHERE job_id LIKE 'rejected-%'") == 0
+    assert writer.metrics()["rejected_jobs"] == 4
+
+
+def _check_drain_on_stop() -> None:
+    """종료 시 큐에 남은 대기 없는 쓰기(fire-and-forget)까지 모두 커밋해야 한다."""
+    before = _count("SELECT COUNT(*) FROM scheduler_logs")
+    for i in range(300):
+        storage.record_scheduler_log(job_id=f"drain-{i}", status="success")
+    assert db_writer.stop(timeout=10)
+    assert _count("SELECT COUNT(*) FROM scheduler_logs") == before + 300
+    # 멈춘 뒤에는 현재 스레드에서 바로 커밋한다(스크립트/테스트 경로).
+    storage.record_scheduler_log(job_id="after-stop", status="success")
+    assert _count("SELECT COUNT(*) FROM scheduler_logs") == before + 301
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["LIVE_DB_PATH"] = str(Path(tmp_dir) / "db_writer.db")
+        storage.init_db()
+        db_writer.start()
+        try:
+            assert storage.save_articles(_build_frame(0, 250), chunk_size=40) == 250
+            assert storage.save_articles(_build_frame(200, 100), chunk_size=40) == 50
+            assert _count("SELECT COUNT(*) FROM articles") == 300
+            _check_group_commit()
+            _check_failure_isolation()
+            _check_full_queue()
+            _check_drain_on_stop()
+        finally:
+            db_writer.stop()
+            db.close_all_connections()
+
+    print("PASS: 단일 쓰기 스레드가 그룹 커밋/실패 격리/큐 포화 시 잠금 없는 대기/종료 시 잔여 쓰기 커밋을 보장")
+
+
+if __name__ == "__main__":
+    main()
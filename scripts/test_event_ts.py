@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import calendar
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+from scripts.article_fixtures import article_frame, neutral, temp_live_db
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    now = datetime.now().replace(microsecond=0)
+    return article_frame(
+        0,
+        rows,
+        companies=("넷마블", "넥슨"),
+        title=lambda i: f"메이플스토리 업데이트 소식 {i}",
+        published=lambda i: now - timedelta(days=i % 9, minutes=7 + i % 50),
+        # 일부는 발행 시각 파싱 실패(pub_date='')로 기사 날짜만 있다.
+        missing_pub_date=lambda i: i % 4 == 0,
+        sentiment=neutral,
+    )
+
+
+def _expected_event_ts(pub_date: str | None, date: str | None, created_at: str | None) -> int | None:
+    """기사 목록 정렬 기준 COALESCE(pub_date, date, created_at)을 UTC epoch초로(빈 문자열은 값 없음)."""
+    value = pub_date or (f"{date} 00:00:00" if date else None) or created_at
+    if not value:
+        return None
+    return calendar.timegm(datetime.strptime(value, "%Y-%m-%d %H:%M:%S").timetuple())
+
+
+def _check_all(conn) -> int:
+    rows = conn.execute("SELECT id, pub_date, date, created_at, event_ts FROM articles").fetchall()
+    for r in rows:
+        expected = _expected_event_ts(r["pub_date"], r["date"], r["created_at"])
+        assert r["event_ts"] == expected, (dict(r), expected)
+    return len(rows)
+
+
+def _insert_legacy_rows(conn) -> None:
+    """event_ts 없이 적재된 예전 행(pub_date NULL/빈 값, date 없음 포함)."""
+    created = (datetime.now() - timedelta(hours=3)).strftime("%Y-%m-%d %H:%M:%S")
+    samples = [
+        (None, "2025-11-03", created),
+        ("", "2025-11-04", created),
+        (None, None, created),
+        ("2025-10-01 09:30:00", "2025-10-01", created),
+    ]
+    for i, (pub_date, date, created_at) in enumerate(samples):
+        conn.execute(
+            """
+            INSERT INTO articles (company, title_clean, description_clean, originallink, link, outlet,
+                                  pub_date, date, sentiment, is_test, content_hash, created_at)
+            VALUES ('넥슨', ?, '', ?, ?, 'legacy.example', ?, ?, '중립', 0, ?, ?)
+            """,
+            (f"예전 기사 {i}", f"https://legacy.example/{i}", f"https://legacy.example/{i}",
+             pub_date, date, f"legacy-{i}", created_at),
+        )
+
+
+def main() -> None:
+    with temp_live_db("event_ts.db"):
+        # 적재 시 계산: pub_date가 있으면 발행 시각, 없으면 기사 날짜(적재 시각보다 우선)
+        storage.save_articles(_frame(40))
+        conn = storage._connect()
+        try:
+            assert _check_all(conn) == 40
+            blank = conn.execute("SELECT COUNT(*) FROM articles WHERE pub_date = ''").fetchone()[0]
+            assert blank == 10, blank
+
+            # 마이그레이션 전 DB: event_ts 컬럼 도입 이전 행은 값이 비어 있다.
+            _insert_legacy_rows(conn)
+            conn.execute("UPDATE articles SET event_ts = NULL WHERE id % 3 = 0 OR outlet = 'legacy.example'")
+            missing = conn.execute(
+                "SELECT COUNT(*) FROM articles WHERE NULLIF(pub_date, '') IS NULL AND event_ts IS NULL"
+            ).fetchone()[0]
+            assert missing > 0
+            conn.execute("DELETE FROM schema_migrations WHERE version >= 4")
+            conn.commit()
+        finally:
+            conn.close()
+
+        # 보정: init_db(마이그레이션 4번)가 비어 있는 값을 같은 기준으로 채운다.
+        storage.init_db()
+        conn = storage._connect()
+        try:
+            assert _check_all(conn) == 44
+            assert storage.get_schema_version(conn) == storage.SCHEMA_VERSION
+            null_ts = conn.execute("SELECT COUNT(*) FROM articles WHERE event_ts IS NULL").fetchone()[0]
+            assert null_ts == 0, null_ts
+        finally:
+            conn.close()
+
+    print("PASS: event_ts가 적재 시와 보정 후 모두 COALESCE(pub_date, date, created_at) 기준과 일치")
+
+
+if __name__ == "__main__":
+    main()
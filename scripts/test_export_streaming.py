@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import db, storage
+
+ROWS = int(os.getenv("EXPORT_TEST_ROWS", "1000000"))
+# 익명 메모리(RssAnon) 증가 상한: SQLite 페이지 캐시(연결당 고정 상한, DB가 mmap 범위를 넘으면 채워짐) + 32MB.
+# 전체를 메모리에 올리면 1M행 기준 1GB 이상 증가한다.
+RSS_CEILING_MB = db.SQLITE_CACHE_SIZE_KB / 1024 + 32
+BASE_TS = 1767225600  # 2026-01-01 00:00:00 UTC
+
+
+def _rss_anon_mb() -> float:
+    with open("/proc/self/status", encoding="ascii") as f:
+        for line in f:
+            if line.startswith("RssAnon:"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError("RssAnon을 읽을 수 없습니다.")
+
+
+def _seed(rows: int) -> None:
+    """대용량 합성 기사/리스크 시계열을 생성기로 바로 적재한다(적재 자체도 메모리 일정)."""
+    conn = storage._connect()
+    try:
+        conn.execute("BEGIN")
+        conn.executemany(
+            """
+            INSERT INTO articles (
+                company, title_clean, description_clean, originallink, link, outlet, pub_date, date,
+                sentiment, is_test, content_hash, created_at, source_group_id, event_ts
+            ) VALUES (?, ?, '보상 지급 안내', ?, ?, 'inven.co.kr', ?, ?, '중립', 0, ?, ?, ?, ?)
+            """,
+            (
+                (
+                    "넥슨" if i % 4 else "넷마블",
+                    f"게임 업데이트 소식 {i}",
+                    f"https://www.inven.co.kr/news/{i}",
+                    f"https://www.inven.co.kr/news/{i}",
+                    time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(BASE_TS + i * 30)),
+                    time.strftime("%Y-%m-%d", time.gmtime(BASE_TS + i * 30)),
+                    f"hash-{i}",
+                    time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(BASE_TS + i * 30)),
+                    f"group-{i}",
+                    BASE_TS + i * 30,
+                )
+                for i in range(rows)
+            ),
+        )
+        conn.executemany(
+            """
+            INSERT INTO risk_timeseries (
+                ip_id, ts, risk_raw, risk_score, issue_heat, s_comp, v_comp, t_comp, m_comp,
+                alert_level, sample_size, uncertain_ratio
+            ) VALUES ('maplestory', ?, 10.0, 12.5, 3.0, 0.1, 0.2, 0.3, 0.4, 'P3', 20, 0.1)
+            """,
+            ((time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(BASE_TS + i * 60)),) for i in range(5000)),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+async def _consume(response, on_chunk) -> None:
+    async for chunk in response.body_iterator:
+        on_chunk(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
+
+
+def _export_articles_under_ceiling(main) -> None:
+    baseline = _rss_anon_mb()
+    state = {"rows": 0, "peak": baseline, "bytes": 0, "last_id": -1, "tail": b""}
+
+    def on_chunk(chunk: bytes) -> None:
+        data = state["tail"] + chunk
+        lines = data.split(b"\n")
+        state["tail"] = lines.pop()
+        for line in lines:
+            row_id = json.loads(line)["id"]
+            assert row_id > state["last_id"], "event_ts/id 오름차순이어야 합니다."
+            state["last_id"] = row_id
+        state["rows"] += len(lines)
+        state["bytes"] += len(chunk)
+        state["peak"] = max(state["peak"], _rss_anon_mb())
+
+    started = time.perf_counter()
+    response = main.export_articles(
+        company=None, ip="all", date_from=None, date_to=None, include_test=False, format="ndjson"
+    )
+    assert response.media_type == "application/x-ndjson"
+    asyncio.run(_consume(response, on_chunk))
+    elapsed = time.perf_counter() - started
+    growth = state["peak"] - baseline
+    print(
+        f"export articles ndjson: rows={state['rows']} bytes={state['bytes'] / 1024 / 1024:.0f}MB "
+        f"elapsed={elapsed:.1f}s rss_anon_growth={growth:.1f}MB"
+    )
+    assert state["tail"] == b""
+    assert state["rows"] == ROWS, state["rows"]
+    assert growth < RSS_CEILING_MB, f"스트리밍 내보내기 메모리 증가가 상한을 넘었습니다: {growth:.1f}MB"
+
+
+def _export_filters(main) -> None:
+    chunks: list[bytes] = []
+    response = main.export_articles(
+        company="넷마블", ip="all", date_from="2026-01-01", date_to="2026-01-01", include_test=False, format="csv"
+    )
+    asyncio.run(_consume(response, chunks.append))
+    text = b"".join(chunks).decode("utf-8")
+    assert text.startswith("\ufeff")
+    rows = list(csv.DictReader(io.StringIO(text.lstrip("\ufeff"))))
+    # 30초 간격이라 하루 2880건 중 넷마블(4건 중 1건) 720건
+    assert len(rows) == 720 and {r["company"] for r in rows} == {"넷마블"}, len(rows)
+    assert list(rows[0].keys()) == storage.EXPORT_ARTICLE_COLUMNS
+
+    chunks = []
+    response = main.export_risk_timeseries(ip="maplestory", date_from="2026-01-02", date_to=None, format="ndjson")
+    asyncio.run(_consume(response, chunks.append))
+    lines = b"".join(chunks).splitlines()
+    assert len(lines) == 5000 - 1440, len(lines)
+    first = json.loads(lines[0])
+    assert first["ts"] == "2026-01-02 00:00:00" and first["risk_score"] == 12.5, first
+
+    for kwargs in ({"ip": "unknown"}, {"date_from": "2026/01/01"}):
+        try:
+            main.export_risk_timeseries(**{"ip": "all", "date_from": None, "date_to": None, "format": "csv", **kwargs})
+            raise AssertionError(f"잘못된 인자가 허용되었습니다: {kwargs}")
+        except main.HTTPException as exc:
+            assert exc.status_code == 400
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["LIVE_DB_PATH"] = str(Path(tmp_dir) / "export.db")
+        from backend import main as app_main
+
+        storage.init_db()
+        _seed(ROWS)
+        db.close_all_connections()
+        _export_filters(app_main)
+        _export_articles_under_ceiling(app_main)
+        db.close_all_connections()
+
+    print("PASS: 스트리밍 내보내기가 결과 크기와 무관하게 일정한 메모리로 동작")
+
+
+if __name__ == "__main__":
+    main()
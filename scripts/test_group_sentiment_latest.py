@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import db, storage
+
+ROWS = 600
+METHODS = ["rule_v1", "rule_v2", "model_v1"]
+LABELS = ["positive", "neutral", "negative"]
+
+
+def _build_frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "company": "넥슨",
+                # 3건씩 같은 제목이라 재배포 그룹이 생긴다.
+                "title_clean": f"메이플스토리 확률 논란 보상 {i // 3}",
+                "description_clean": "이용자 불만과 보상 지급 안내",
+                "originallink": f"https://www.inven.co.kr/news/{i}",
+                "link": f"https://www.inven.co.kr/news/{i}",
+                "pubDate_parsed": "2026-02-10 09:00:00",
+                "date": "2026-02-10",
+            }
+            for i in range(rows)
+        ]
+    )
+
+
+def _expected(conn, group_ids: list[str]) -> dict[str, tuple]:
+    """기존 방식: sentiment_results 전체를 최신순으로 읽어 그룹별 첫 행만 남긴다."""
+    out: dict[str, tuple] = {}
+    for r in conn.execute(
+        """
+        SELECT source_group_id, sentiment_score, sentiment_label, confidence
+        FROM sentiment_results
+        ORDER BY analyzed_at DESC, id DESC
+        """
+    ):
+        gid = str(r["source_group_id"] or "")
+        if gid in group_ids and gid not in out:
+            out[gid] = (r["sentiment_score"], r["sentiment_label"], r["confidence"])
+    return out
+
+
+def _assert_latest(label: str) -> None:
+    conn = storage._connect_readonly()
+    try:
+        group_ids = [str(r[0]) for r in conn.execute("SELECT group_id FROM source_groups ORDER BY group_id")]
+        group_ids.append("missing-group")
+        latest = storage.latest_group_sentiments(conn, group_ids)
+        got = {gid: (r["sentiment_score"], r["sentiment_label"], r["confidence"]) for gid, r in latest.items()}
+        assert got == _expected(conn, group_ids), label
+        values = storage._group_sentiment_values(conn, group_ids)
+        assert set(values) == set(group_ids) and values["missing-group"] == (0.0, False), label
+        # 표 전체를 다시 계산한 결과와 트리거로 유지된 표가 같아야 한다.
+        stale = conn.execute(
+            """
+            SELECT COUNT(*) FROM group_sentiment_latest AS l
+            WHERE l.result_id != (
+                SELECT s.id FROM sentiment_results AS s
+                WHERE s.source_group_id = l.source_group_id AND s.method = l.method
+                ORDER BY s.analyzed_at DESC, s.id DESC
+                LIMIT 1
+            )
+            """
+        ).fetchone()[0]
+        missing = conn.execute(
+            """
+            SELECT COUNT(*) FROM (
+                SELECT DISTINCT source_group_id, method FROM sentiment_results
+                WHERE COALESCE(source_group_id, '') != ''
+            ) AS s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM group_sentiment_latest AS l
+                WHERE l.source_group_id = s.source_group_id AND l.method = s.method
+            )
+            """
+        ).fetchone()[0]
+        assert stale == 0 and missing == 0, (label, stale, missing)
+    finally:
+        conn.close()
+
+
+def _add_history(rng: random.Random, rows: int) -> None:
+    conn = storage._connect()
+    try:
+        groups = conn.execute("SELECT group_id, canonical_article_id FROM source_groups").fetchall()
+        conn.executemany(
+            """
+            INSERT INTO sentiment_results (
+                article_id, source_group_id, sentiment_score, sentiment_label, confidence, method, analyzed_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    int(g["canonical_article_id"]),
+                    str(g["group_id"]),
+                    round(rng.uniform(-1, 1), 3),
+                    rng.choice(LABELS),
+                    round(rng.random(), 3),
+                    rng.choice(METHODS),
+                    # 같은 시각이 자주 겹치도록 분 단위만 흔든다(동률은 id로 가른다).
+                    f"2026-02-{rng.randrange(10, 13)} 10:{rng.randrange(3):02d}:00",
+                )
+                for g in (rng.choice(groups) for _ in range(rows))
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _count(sql: str) -> int:
+    conn = storage._connect_readonly()
+    try:
+        return int(conn.execute(sql).fetchone()[0])
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["LIVE_DB_PATH"] = str(Path(tmp_dir) / "sentiment.db")
+        storage.init_db()
+        storage.save_articles(_build_frame(ROWS))
+        _assert_latest("initial")
+
+        # 마이그레이션 이전 DB: 이력이 쌓인 상태에서 적용하면 기존 행으로 채워야 한다.
+        conn = storage._connect()
+        try:
+            for name in ("insert", "delete", "update"):
+                conn.execute(f"DROP TRIGGER trg_sentiment_latest_{name}")
+            conn.execute("DROP TABLE group_sentiment_latest")
+            conn.execute("DELETE FROM schema_migrations WHERE version >= 7")
+            conn.commit()
+        finally:
+            conn.close()
+        _add_history(rng, 800)
+        storage.init_db()
+        _assert_latest("backfill")
+
+        # 적재 이후의 기록은 트리거가 반영한다(더 이른 analyzed_at은 최신을 바꾸지 않는다).
+        _add_history(rng, 800)
+        _assert_latest("insert")
+
+        conn = storage._connect_readonly()
+        try:
+            plan = " ".join(
+                str(r["detail"])
+                for r in conn.execute(
+                    """
+                    EXPLAIN QUERY PLAN
+                    SELECT l.source_group_id FROM json_each(?) AS g
+                    JOIN group_sentiment_latest AS l ON l.source_group_id = g.value
+                    """,
+                    ('["a"]',),
+                )
+            )
+        finally:
+            conn.close()
+        assert "SEARCH l USING PRIMARY KEY" in plan, plan
+
+        # 최신 행의 삭제/수정은 남은 이력에서 다시 고른다.
+        conn = storage._connect()
+        try:
+            latest_ids = [int(r[0]) for r in conn.execute("SELECT result_id FROM group_sentiment_latest LIMIT 40")]
+            conn.executemany("DELETE FROM sentiment_results WHERE id = ?", [(i,) for i in latest_ids[:20]])
+            conn.executemany(
+                "UPDATE sentiment_results SET analyzed_at = '2026-01-01 00:00:00' WHERE id = ?",
+                [(i,) for i in latest_ids[20:30]],
+            )
+            conn.executemany(
+                "UPDATE sentiment_results SET method = 'model_v2' WHERE id = ?", [(i,) for i in latest_ids[30:]]
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        _assert_latest("delete-update")
+
+        # 정리 작업: 밀린 이력만 지우고 읽기 결과는 그대로다.
+        total = _count("SELECT COUNT(*) FROM sentiment_results")
+        keep = _count("SELECT COUNT(*) FROM group_sentiment_latest")
+        superseded = storage.compact_sentiment_results(dry_run=True)
+        assert superseded == total - keep > 0, (superseded, total, keep)
+        assert storage.compact_sentiment_results(max_delete_rows=100) == 100
+        _assert_latest("compact-capped")
+        assert storage.compact_sentiment_results() == superseded - 100
+        assert _count("SELECT COUNT(*) FROM sentiment_results") == keep
+        _assert_latest("compacted")
+        assert storage.compact_sentiment_results() == 0
+
+        # 기사 TTL 삭제로 그룹과 감성 결과가 함께 사라져도 표가 따라간다.
+        conn = storage._connect()
+        try:
+            conn.execute("DELETE FROM articles WHERE id % 4 = 0")
+            conn.execute(
+                """
+                DELETE FROM source_groups
+                WHERE group_id NOT IN (SELECT DISTINCT COALESCE(source_group_id, '') FROM articles)
+                """
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        _assert_latest("article-delete")
+        db.close_all_connections()
+
+    print("PASS: 그룹별 최신 감성 표가 sentiment_results 최신 행과 일치하고 정리 후에도 결과 동일")
+
+
+if __name__ == "__main__":
+    main()
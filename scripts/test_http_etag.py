@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+from backend import main as api
+from scripts.article_fixtures import article_frame, days_ago, temp_live_db
+
+DASHBOARD = "/api/risk-dashboard?ip=maplestory&date_from=2024-01-01&date_to=2026-12-31"
+CLUSTERS = "/api/ip-clusters?ip=maplestory&date_from=2024-01-01&date_to=2026-12-31&limit=6"
+TIMESERIES = "/api/risk-timeseries?ip=maplestory&hours=72&limit=200"
+ORIGIN = "http://localhost:3000"
+
+
+def _write_risk(hours_ago: float) -> None:
+    ts = (datetime.now() - timedelta(hours=hours_ago)).strftime("%Y-%m-%d %H:%M:%S")
+    conn = storage._connect()
+    try:
+        storage._upsert_risk_timeseries(
+            conn, ip_id="maplestory", ts=ts, raw_risk=30.0, score=30.0, issue_heat=10.0, s_comp=0.1, v_comp=0.2,
+            t_comp=0.3, m_comp=0.4, alert_level="P3", sample_size=5, uncertain_ratio=0.1, quality_flag="OK",
+            risk_formula_version=storage.RISK_FORMULA_VERSION,
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class _CallCounter:
+    """backend.main 모듈이 부르는 저장 함수 호출 수(304면 호출되지 않아야 한다)."""
+
+    def __init__(self, names: list[str]) -> None:
+        self.calls = {name: 0 for name in names}
+        for name in names:
+            setattr(api, name, self._wrap(name, getattr(api, name)))
+
+    def _wrap(self, name, fn):
+        def wrapper(*args, **kwargs):
+            self.calls[name] += 1
+            return fn(*args, **kwargs)
+
+        return wrapper
+
+
+def _revalidate(client: TestClient, url: str) -> tuple[str, int]:
+    """전체 응답의 ETag로 다시 요청해 (ETag, 상태 코드)를 돌려준다."""
+    full = client.get(url)
+    assert full.status_code == 200 and full.headers["cache-control"] == "no-cache", url
+    etag = full.headers["etag"]
+    again = client.get(url, headers={"If-None-Match": etag})
+    if again.status_code == 304:
+        assert again.content == b"" and again.headers["etag"] == etag, url
+    else:
+        assert again.json() == full.json(), url
+    return etag, again.status_code
+
+
+def main() -> None:
+    with temp_live_db("etag.db"):
+        storage.save_articles(article_frame(0, 30, published=days_ago(2)))
+        _write_risk(2)
+        client = TestClient(api.app)
+        counter = _CallCounter(["get_risk_dashboard", "get_ip_clusters", "get_risk_timeseries"])
+
+        etags = {}
+        for url, name in ((DASHBOARD, "get_risk_dashboard"), (CLUSTERS, "get_ip_clusters"), (TIMESERIES, "get_risk_timeseries")):
+            before = counter.calls[name]
+            etags[url], status = _revalidate(client, url)
+            assert status == 304, url
+            # 304는 저장 함수를 부르지 않는다.
+            assert counter.calls[name] - before == 1, (url, counter.calls)
+            # 304 응답에도 CORS 헤더가 붙고 ETag를 읽을 수 있다.
+            cors = client.get(url, headers={"If-None-Match": etags[url], "Origin": ORIGIN})
+            assert cors.status_code == 304 and cors.headers["access-control-allow-origin"] == ORIGIN, url
+            assert "etag" in cors.headers["access-control-expose-headers"].lower(), url
+        assert sorted(counter.calls.values()) == [1, 1, 1], counter.calls
+
+        # 쿼리 순서/ip 대소문자는 같은 ETag, 다른 쿼리는 다른 ETag
+        reordered = "/api/risk-dashboard?date_to=2026-12-31&date_from=2024-01-01&ip=MapleStory"
+        assert client.get(reordered, headers={"If-None-Match": etags[DASHBOARD]}).status_code == 304
+        other = client.get("/api/risk-dashboard?ip=maplestory&date_from=2025-01-01&date_to=2026-12-31")
+        assert other.status_code == 200 and other.headers["etag"] != etags[DASHBOARD]
+        assert client.get(DASHBOARD, headers={"If-None-Match": f'W/{etags[DASHBOARD].removeprefix("W/")}, "x"'}).status_code == 304
+
+        # 기사 쓰기는 기사 조회 ETag만, 리스크 시계열 쓰기는 시계열 ETag만 바꾼다.
+        previous = client.get(DASHBOARD).json()["meta"]["raw_rows"]
+        storage.save_articles(article_frame(30, 5, published=days_ago(2)))
+        for url in (DASHBOARD, CLUSTERS):
+            changed = client.get(url, headers={"If-None-Match": etags[url]})
+            assert changed.status_code == 200 and changed.headers["etag"] != etags[url], url
+            etags[url] = changed.headers["etag"]
+        assert client.get(DASHBOARD).json()["meta"]["raw_rows"] == previous + 5
+        assert client.get(TIMESERIES, headers={"If-None-Match": etags[TIMESERIES]}).status_code == 304
+        _write_risk(1)
+        assert client.get(DASHBOARD, headers={"If-None-Match": etags[DASHBOARD]}).status_code == 304
+        changed = client.get(TIMESERIES, headers={"If-None-Match": etags[TIMESERIES]})
+        assert changed.status_code == 200 and changed.json()["meta"]["count"] == 2
+
+        # 쓰기가 없어도 구간 밖으로 밀려난 행이 있으면 다른 ETag다.
+        _write_risk(24 - 2 / 3600)
+        narrow = "/api/risk-timeseries?ip=maplestory&hours=24&limit=200"
+        etag_narrow, status = _revalidate(client, narrow)
+        assert status == 304
+        time.sleep(3)
+        expired = client.get(narrow, headers={"If-None-Match": etag_narrow})
+        assert expired.status_code == 200 and expired.json()["meta"]["count"] == 2, expired.json()["meta"]
+
+        # 상태 API는 본문 해시 ETag(변화 없으면 304)
+        _, status = _revalidate(client, "/api/health")
+        assert status == 304
+        # 오류 응답과 비대상 경로에는 ETag를 붙이지 않는다.
+        bad = client.get("/api/risk-dashboard?date_from=2026-12-31&date_to=2024-01-01")
+        assert bad.status_code == 400 and "etag" not in bad.headers
+        assert "etag" not in client.get("/api/risk-ips").headers
+
+        api.http_cache.HTTP_ETAG_ENABLED = False
+        try:
+            assert client.get(DASHBOARD, headers={"If-None-Match": etags[DASHBOARD]}).status_code == 200
+        finally:
+            api.http_cache.HTTP_ETAG_ENABLED = True
+
+    print("PASS: 대시보드 GET이 DB 쓰기 버전 ETag로 304를 돌려주고 쓰기 후에는 새 본문을 보냄")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import gzip
+import json
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import http_response, storage
+from backend import main as api
+from backend.analysis_project import build_project_snapshot
+from scripts.article_fixtures import article_frame, hours_ago, temp_live_db
+
+COMPANIES = ["넥슨", "NC소프트", "넷마블", "크래프톤"]
+
+
+def _seed_risk(rows: int) -> None:
+    now = datetime.now()
+    conn = storage._connect()
+    try:
+        conn.executemany(
+            """
+            INSERT INTO risk_timeseries (
+                ip_id, ts, risk_raw, risk_score, issue_heat, s_comp, v_comp, t_comp, m_comp,
+                alert_level, sample_size, uncertain_ratio
+            ) VALUES ('maplestory', ?, 10.0, ?, 3.0, 0.1, 0.2, 0.3, 0.4, 'P3', 20, 0.1)
+            """,
+            [((now - timedelta(minutes=i)).strftime("%Y-%m-%d %H:%M:%S"), float(i % 100)) for i in range(rows)],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _stdlib(payload) -> object:
+    """기존 경로(jsonable_encoder + 표준 json) 결과."""
+    return json.loads(json.dumps(jsonable_encoder(payload), ensure_ascii=False))
+
+
+def _old_to_records(df: pd.DataFrame) -> list[dict]:
+    out = df.copy()
+    for col in out.columns:
+        if pd.api.types.is_datetime64_any_dtype(out[col]):
+            out[col] = out[col].dt.strftime("%Y-%m-%d %H:%M:%S")
+    return out.to_dict(orient="records")
+
+
+def main() -> None:
+    # numpy/pandas 값도 그대로 직렬화한다.
+    mixed = {
+        "i": np.int64(3),
+        "f": np.float32(1.5),
+        "b": np.bool_(True),
+        "arr": np.arange(3),
+        "ts": pd.Timestamp("2026-01-02 03:04:05"),
+        "nat": pd.NaT,
+        "nan": float("nan"),
+        1: "정수 키",
+    }
+    assert json.loads(http_response.dumps(mixed)) == {
+        "i": 3, "f": 1.5, "b": True, "arr": [0, 1, 2], "ts": "2026-01-02T03:04:05", "nat": None, "nan": None, "1": "정수 키"
+    }
+    frame = pd.DataFrame(
+        {"company": ["넥슨", "넷마블"], "count": np.array([1, 2]), "at": pd.to_datetime(["2026-01-01 10:00", None])}
+    )
+    assert json.loads(http_response.dumps(api._to_records(frame))) == json.loads(
+        json.dumps(_old_to_records(frame)).replace("NaN", "null")
+    )
+
+    # 인코딩 협상
+    choose = http_response._choose_encoding
+    assert choose("gzip, deflate") == "gzip" and choose("identity") is None and choose("gzip;q=0") is None
+    assert choose("br;q=0, gzip") == "gzip"
+    assert choose("br, gzip") == ("br" if http_response.brotli is not None else "gzip")
+
+    with temp_live_db("response.db"):
+        storage.save_articles(article_frame(0, 120, companies=COMPANIES, published=hours_ago(60)))
+        _seed_risk(3000)
+        client = TestClient(api.app)
+
+        # 큰 응답 API는 기존 직렬화 결과와 같은 JSON을 압축해서 보낸다.
+        cases = (
+            (
+                "/api/risk-timeseries?ip=maplestory&hours=72&limit=10000",
+                lambda: storage.get_risk_timeseries(ip_id="maplestory", hours=72, limit=10000),
+            ),
+            (
+                "/api/project-snapshot?date_from=2024-01-01&date_to=2026-12-31",
+                lambda: build_project_snapshot(date_from="2024-01-01", date_to="2026-12-31", ips=api.CORE_IPS),
+            ),
+        )
+        for url, expected in cases:
+            res = client.get(url, headers={"Accept-Encoding": "gzip"})
+            assert res.status_code == 200 and res.headers["content-encoding"] == "gzip", url
+            assert "accept-encoding" in res.headers["vary"].lower(), url
+            assert res.num_bytes_downloaded < len(res.content) / 2, (url, res.num_bytes_downloaded, len(res.content))
+            assert res.json() == _stdlib(expected()), url
+            plain = client.get(url, headers={"Accept-Encoding": "identity"})
+            assert "content-encoding" not in plain.headers and plain.content == res.content, url
+
+        live = client.get(f"/api/compare-live?companies={','.join(COMPANIES)}&window_hours=72", headers={"Accept-Encoding": "gzip"})
+        assert live.status_code == 200 and live.headers["content-encoding"] == "gzip"
+        payload = live.json()
+        assert payload["meta"]["total_articles"] == 120 and len(payload["latest_articles"]) == 120
+        expected = api._build_compare_live_payload_from_db(COMPANIES, 72)
+        for key in ("company_counts", "trend", "trend_metrics", "sentiment_summary", "latest_articles"):
+            assert payload[key] == _stdlib(expected[key]), key
+
+        # 임계값보다 작은 응답과 304는 압축하지 않는다.
+        small = client.get("/api/risk-ips", headers={"Accept-Encoding": "gzip"})
+        assert len(small.content) < http_response.HTTP_COMPRESS_MIN_BYTES and "content-encoding" not in small.headers
+        timeseries = "/api/risk-timeseries?ip=maplestory&hours=72&limit=10000"
+        etag = client.get(timeseries).headers["etag"]
+        not_modified = client.get(timeseries, headers={"If-None-Match": etag, "Accept-Encoding": "gzip"})
+        assert not_modified.status_code == 304 and "content-encoding" not in not_modified.headers
+
+        # 같은 강한 ETag를 인코딩이 다른 본문에 붙이지 않는다: 압축 본문은 약한 ETag(W/)다.
+        strong = client.get(timeseries, headers={"Accept-Encoding": "identity"}).headers["etag"]
+        weak = client.get(timeseries, headers={"Accept-Encoding": "gzip"}).headers["etag"]
+        assert not strong.startswith("W/") and weak == f"W/{strong}", (strong, weak)
+        # 약한 비교라 어느 쪽 값으로 다시 물어도 304이고, 304의 ETag는 협상한 인코딩의 200과 같다.
+        for tag, accept, expected_tag in ((weak, "gzip", weak), (strong, "gzip", weak), (weak, "identity", strong)):
+            res = client.get(timeseries, headers={"If-None-Match": tag, "Accept-Encoding": accept})
+            assert res.status_code == 304 and res.headers["etag"] == expected_tag, (tag, accept, res.headers)
+
+        # 스트리밍 내보내기는 조각 단위로 압축해 보낸다.
+        export = "/api/export/risk-timeseries?ip=maplestory&format=ndjson"
+        with client.stream("GET", export, headers={"Accept-Encoding": "gzip"}) as stream:
+            assert stream.headers["content-encoding"] == "gzip" and "content-length" not in stream.headers
+            assert stream.headers.get("etag", "W/").startswith("W/")
+            raw = b"".join(stream.iter_raw())
+        identity = client.get(export, headers={"Accept-Encoding": "identity"}).content
+        assert gzip.decompress(raw) == identity and len(identity.splitlines()) == 3000
+
+    print("PASS: 큰 응답이 기존 직렬화와 같은 JSON을 orjson으로 만들고 협상한 인코딩으로 압축")
+
+
+if __name__ == "__main__":
+    main()
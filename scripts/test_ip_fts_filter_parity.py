@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+import tempfile
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+
+
+def _build_fixture_df() -> pd.DataFrame:
+    rows: list[tuple[str, str]] = [
+        ("오늘의 게임 소식", "특정 IP 언급 없음"),
+        ("arc", "raiders 제목/요약 경계에 걸친 키워드"),
+        ("던파", ""),
+        ("", "던파 요약에만 등장"),
+        ("던 파 띄어쓰기", "매칭되면 안 됨"),
+        ("FC온라인과 블루아카이브 동시 언급", "다중 IP"),
+        ("메이플 스토리 띄어쓰기", "매칭되면 안 됨"),
+        ("[속보] *가챠* 100% 확률?", "특수문자 포함"),
+    ]
+    for keywords in (v["keywords"] for v in storage.IP_RULES.values()):
+        for i, keyword in enumerate(keywords):
+            rows.append((f"{keyword} 업데이트 소식", "본문"))
+            rows.append((f"신규 시즌 {keyword.upper()}", f"대문자 변형 {i}"))
+            rows.append(("요약에서만 언급", f"xx{keyword}yy 부분 문자열"))
+    records = [
+        {
+            "company": "넥슨",
+            "title_clean": title,
+            "description_clean": desc,
+            "originallink": f"https://example.com/ip-fts/{i}",
+            "pubDate_parsed": "2026-01-10 09:00:00",
+            "date": "2026-01-10",
+            "sentiment": "중립",
+        }
+        for i, (title, desc) in enumerate(rows)
+    ]
+    return pd.DataFrame(records)
+
+
+def _ids_with_like(conn, ip_name: str) -> set[int]:
+    """기존 LOWER(...) LIKE '%kw%' 필터(기준 동작)."""
+    keywords = [str(k).strip().lower() for k in storage.IP_RULES[ip_name]["keywords"] if str(k).strip()]
+    clause = " OR ".join(
+        ["LOWER(COALESCE(title_clean, '') || ' ' || COALESCE(description_clean, '')) LIKE ?"] * len(keywords)
+    )
+    rows = conn.execute(f"SELECT id FROM articles WHERE {clause}", [f"%{k}%" for k in keywords]).fetchall()
+    return {int(r["id"]) for r in rows}
+
+
+def _ids_with_filter(conn, ip_name: str, tags_ready: bool) -> set[int]:
+    where_sql, params = storage._build_ip_sql_filter(ip_name, tags_ready)
+    rows = conn.execute(f"SELECT id FROM articles WHERE 1 = 1 {where_sql}", params).fetchall()
+    return {int(r["id"]) for r in rows}
+
+
+def _assert_parity(conn, label: str) -> None:
+    for ip_name in storage.IP_RULES:
+        if ip_name == "전체":
+            continue
+        expected = _ids_with_like(conn, ip_name)
+        assert expected, f"fixture must match {ip_name}"
+        # FTS(태그 재생성 전 대체 경로)와 article_tags 경로 모두 LIKE와 같아야 한다.
+        for tags_ready in (False, True):
+            actual = _ids_with_filter(conn, ip_name, tags_ready)
+            assert actual == expected, (
+                f"[{label}/tags={tags_ready}] {ip_name}: missing={expected - actual} extra={actual - expected}"
+            )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["LIVE_DB_PATH"] = str(Path(tmp_dir) / "ip_fts.db")
+        storage.init_db()
+        storage.save_articles(_build_fixture_df())
+
+        conn = storage._connect()
+        try:
+            _assert_parity(conn, "insert")
+
+            # 수정/삭제 동기화(FTS는 트리거, 태그는 삭제 cascade + 재태깅)
+            conn.execute("UPDATE articles SET title_clean = 'maplestory 패치' WHERE title_clean = '오늘의 게임 소식'")
+            conn.execute("DELETE FROM articles WHERE id IN (SELECT id FROM articles ORDER BY id DESC LIMIT 5)")
+            conn.commit()
+            storage.rebuild_article_tags()
+            _assert_parity(conn, "update/delete")
+
+            # 트리거 이전 DB: 색인을 비우고 init_db 증분 색인으로 복구
+            conn.execute("DELETE FROM articles_fts")
+            conn.commit()
+            storage.init_db()
+            _assert_parity(conn, "backfill")
+        finally:
+            conn.close()
+
+    print("PASS: IP 키워드 FTS/태그 필터와 LIKE 필터 결과 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+
+IP_IDS = ["all", "maplestory", "dnf", "arcraiders", "bluearchive", "fconline"]
+TITLE_WORDS = [
+    "메이플스토리", "던파", "아크레이더스", "블루아카이브", "FC온라인", "넥슨",
+    "확률", "점검", "보상", "공정위", "논란", "신작", "업데이트", "이용자", "반응", "서버",
+]
+DESC_WORDS = ["불만", "환불", "흥행", "매출", "오류", "과금", "사과", "이벤트", "시즌", "호평"]
+OUTLETS = ["yna.co.kr", "inven.co.kr", "thisisgame.com", "gamemeca.com", "local-news.kr"]
+
+
+def _build_frame(rng: random.Random, base_now: datetime, rows: int, *, start: int, span_hours: int) -> pd.DataFrame:
+    """재배포(동일 제목) 30%, pubDate 누락 5%, 미래 시각 일부를 포함한 수집 프레임."""
+    records = []
+    titles: list[str] = []
+    for i in range(start, start + rows):
+        pub = base_now - timedelta(minutes=rng.randint(-90, span_hours * 60))
+        if titles and rng.random() < 0.3:
+            title = rng.choice(titles[-40:])
+        else:
+            title = f"{' '.join(rng.sample(TITLE_WORDS, 4))} {i}"
+            titles.append(title)
+        outlet = rng.choice(OUTLETS)
+        records.append(
+            {
+                "company": "넥슨",
+                "title_clean": title,
+                "description_clean": " ".join(rng.sample(DESC_WORDS, 3)),
+                "originallink": f"https://{outlet}/news/{i}",
+                "link": f"https://{outlet}/news/{i}",
+                "pubDate_parsed": pub if rng.random() > 0.05 else None,
+                "date": pub.strftime("%Y-%m-%d"),
+                "is_test": rng.random() < 0.1,
+            }
+        )
+    return pd.DataFrame(records)
+
+
+def _assert_parity(now: datetime, label: str) -> None:
+    for include_test in (False, True):
+        kwargs = {"window_hours": 24, "include_test": include_test, "persist": False, "now": now}
+        # 단일 스캔 엔진(전 IP 일괄)과 IP별 호출이 같은 엔진 상태를 공유해도 결과가 같아야 한다.
+        batch = storage._compute_live_risk_all(incremental=True, **kwargs)
+        for ip in IP_IDS:
+            incremental = storage._compute_live_risk(ip, incremental=True, **kwargs)
+            full = storage._compute_live_risk(ip, incremental=False, **kwargs)
+            assert incremental == full, f"[{label}] {ip} include_test={include_test}\n{incremental}\n{full}"
+            assert batch[ip] == full, f"[{label}] batch {ip} include_test={include_test}\n{batch[ip]}\n{full}"
+
+
+def main() -> None:
+    rng = random.Random(9)
+    base_now = datetime.now().replace(microsecond=0)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["LIVE_DB_PATH"] = str(Path(tmp_dir) / "risk_window.db")
+        storage.init_db()
+        storage.save_articles(_build_frame(rng, base_now, 600, start=0, span_hours=24 * 9))
+
+        # 97분 간격 틱 30회(약 2일, 자정 만료 포함). 틱 사이 신규/지연 유입 기사를 적재한다.
+        for tick in range(30):
+            now = base_now + timedelta(minutes=97 * tick)
+            if tick % 2 == 1:
+                storage.save_articles(_build_frame(rng, now, 20, start=10000 + tick * 100, span_hours=30))
+            _assert_parity(now, f"tick={tick}")
+
+        # 엔진은 스케줄러 조합(24시간, 테스트 제외) 하나만 둔다. 다른 조합은 엔진 없이 계산한다.
+        db_key = str(storage.get_active_db_path())
+        for window_hours in (1, 6, 48, 72):
+            storage._compute_live_risk("all", window_hours=window_hours, include_test=False, persist=False, now=now)
+        assert list(storage._risk_engines) == [db_key], list(storage._risk_engines)
+
+        # 같은 틱을 여러 스레드가 동시에 계산해도(DB 조회는 잠금 밖) 전체 재계산과 같다.
+        now += timedelta(minutes=97)
+        storage.save_articles(_build_frame(rng, now, 20, start=90000, span_hours=30))
+        expected = storage._compute_live_risk_all(
+            window_hours=24, include_test=False, persist=False, incremental=False, now=now
+        )
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(
+                    lambda _: storage._compute_live_risk_all(
+                        window_hours=24, include_test=False, persist=False, incremental=True, now=now
+                    ),
+                    range(16),
+                )
+            )
+        assert all(result == expected for result in results)
+
+        # 삭제/수정 후 재집계(articles_epoch 증가) -> 윈도우 재적재
+        conn = storage._connect()
+        try:
+            conn.execute("DELETE FROM articles WHERE id % 7 = 0")
+            conn.execute("UPDATE articles SET outlet = 'yna.co.kr' WHERE id % 5 = 0")
+            conn.commit()
+            _assert_parity(now, "dirty")
+            storage._refresh_daily_rollup(conn)
+            conn.commit()
+        finally:
+            conn.close()
+        _assert_parity(now, "after refresh")
+
+    print("PASS: 슬라이딩 윈도우/단일 스캔 엔진 리스크 결과와 IP별 전체 재계산 결과 일치")
+
+
+if __name__ == "__main__":
+    main()
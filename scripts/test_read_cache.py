@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sys
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import read_cache, storage
+from backend.analysis_project import build_project_snapshot
+from scripts.article_fixtures import article_frame, days_ago, temp_live_db
+
+DATE_FROM, DATE_TO = "2024-01-01", "2026-12-31"
+
+
+def _frame(start: int, rows: int, days: int = 3) -> pd.DataFrame:
+    return article_frame(start, rows, published=days_ago(days))
+
+
+def _uncached(fn, **kwargs):
+    read_cache.READ_CACHE_ENABLED = False
+    try:
+        return fn(**kwargs)
+    finally:
+        read_cache.READ_CACHE_ENABLED = True
+
+
+def _assert_fresh(label: str) -> None:
+    """캐시 경로 결과가 항상 캐시 없이 다시 계산한 결과와 같다."""
+    cases = (
+        (storage.get_risk_dashboard, {"date_from": DATE_FROM, "date_to": DATE_TO, "ip": "maplestory"}),
+        (storage.get_ip_clusters, {"date_from": DATE_FROM, "date_to": DATE_TO, "ip": "maplestory"}),
+        (storage.get_nexon_articles, {"ip": "all", "limit": 5}),
+    )
+    for fn, kwargs in cases:
+        assert fn(**kwargs) == _uncached(fn, **kwargs), f"{label} {fn.__name__}"
+
+
+def _version() -> int:
+    return storage.current_data_version()[1]
+
+
+def _drift_source_group() -> None:
+    conn = storage._connect()
+    try:
+        conn.execute("UPDATE source_groups SET repost_count = 7 WHERE rowid = (SELECT MIN(rowid) FROM source_groups)")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _age_test_articles() -> None:
+    storage.save_articles(_frame(60, 4).assign(is_test=1))
+    conn = storage._connect()
+    try:
+        conn.execute("UPDATE articles SET created_at = datetime('now', '-2 days') WHERE is_test = 1")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _blank_outlet() -> None:
+    conn = storage._connect()
+    try:
+        conn.execute("UPDATE articles SET outlet = '' WHERE id = (SELECT MIN(id) FROM articles)")
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    with temp_live_db("cache.db") as path:
+        storage.save_articles(_frame(0, 40))
+        read_cache.clear()
+
+        # 같은 호출(위치/키워드/기본값 생략 차이 포함)은 재계산 없이 같은 객체를 돌려준다.
+        before = read_cache.metrics()
+        first = storage.get_risk_dashboard(DATE_FROM, DATE_TO, "all")
+        assert storage.get_risk_dashboard(date_from=DATE_FROM, date_to=DATE_TO) is first
+        assert storage.get_nexon_dashboard(DATE_FROM, DATE_TO) is first
+        after = read_cache.metrics()
+        assert after["misses"] - before["misses"] == 1 and after["hits"] - before["hits"] == 2, after
+        snapshot = build_project_snapshot(date_from=DATE_FROM, date_to=DATE_TO, ips=["maplestory", "dnf"])
+        assert build_project_snapshot(date_from=DATE_FROM, date_to=DATE_TO, ips=["maplestory", "dnf"]) is snapshot
+        _assert_fresh("initial")
+
+        # 쓰기 경로마다 데이터 버전이 오르고 다음 조회는 새로 계산한다.
+        writes = [
+            ("save_articles", None, lambda: storage.save_articles(_frame(40, 10))),
+            (
+                "cleanup_live_articles",
+                lambda: storage.save_articles(_frame(50, 5, days=400)),
+                lambda: storage.cleanup_live_articles(retain_days=300),
+            ),
+            ("rebuild_article_tags", None, storage.rebuild_article_tags),
+            ("repair_source_groups", _drift_source_group, lambda: storage.check_source_group_rollups(repair=True)),
+            ("cleanup_test_articles", _age_test_articles, lambda: storage.cleanup_test_articles(retain_hours=24)),
+            ("repair_article_outlets", _blank_outlet, lambda: storage.repair_article_outlets(remove_placeholder=False)),
+            (
+                "clear_articles",
+                lambda: storage.save_articles(_frame(70, 3).assign(company="넷마블")),
+                lambda: storage.clear_articles("넷마블"),
+            ),
+        ]
+        for label, setup, write in writes:
+            if setup:
+                setup()
+            cached = storage.get_risk_dashboard(date_from=DATE_FROM, date_to=DATE_TO)
+            version = _version()
+            write()
+            assert _version() > version, label
+            assert storage.get_risk_dashboard(date_from=DATE_FROM, date_to=DATE_TO) is not cached, label
+            _assert_fresh(label)
+        # 아카이브로 옮긴 5건도 구간 안이라 함께 집계된다.
+        assert storage.get_risk_dashboard(date_from=DATE_FROM, date_to=DATE_TO)["meta"]["raw_rows"] == 55
+
+        # 버전은 행마다가 아니라 쓰기 트랜잭션(적재 청크)마다 한 번 오른다.
+        conn = storage._connect_readonly()
+        try:
+            triggers = conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%data_version%'"
+            ).fetchone()[0]
+        finally:
+            conn.close()
+        assert triggers == 0, triggers
+        version = _version()
+        assert storage.save_articles(_frame(100, 30), chunk_size=10) == 30
+        assert _version() == version + 3, (version, _version())
+
+        # 조회만으로는 버전이 바뀌지 않는다.
+        version = _version()
+        _assert_fresh("read-only")
+        assert _version() == version
+
+        # DB가 바뀌면 같은 버전 번호여도 다른 키다.
+        os.environ["LIVE_DB_PATH"] = str(path.with_name("other.db"))
+        storage.init_db()
+        assert storage.get_risk_dashboard(date_from=DATE_FROM, date_to=DATE_TO)["meta"]["raw_rows"] == 0
+
+        # 항목 수/메모리 상한
+        read_cache.clear()
+        read_cache.READ_CACHE_MAX_ENTRIES = 3
+        for limit in range(1, 8):
+            storage.get_nexon_articles(limit=limit)
+        stats = read_cache.metrics()
+        assert stats["entries"] == 3 and stats["evictions"] >= 4, stats
+        read_cache.READ_CACHE_MAX_ENTRIES = 256
+        read_cache.READ_CACHE_MAX_MB = 0
+        storage.get_nexon_articles(limit=99)
+        assert read_cache.metrics()["entries"] == 3
+
+    print("PASS: 조회 결과 캐시가 데이터 버전이 같을 때만 재사용되고 쓰기 후에는 새로 계산")
+
+
+if __name__ == "__main__":
+    main()
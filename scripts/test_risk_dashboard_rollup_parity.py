@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import read_cache, storage
+
+ROWS = 1200
+IPS = ["all", "maplestory", "dnf", "arcraiders", "bluearchive", "fconline"]
+OUTLETS = ["inven.co.kr", "thisisgame.com", "gamemeca.com", "news.naver.com", "ruliweb.com"]
+SUBJECTS = ["메이플스토리", "던파", "블루아카이브", "FC온라인", "아크레이더스", "넥슨", "신규 게임"]
+ISSUES = ["확률 논란", "서버 장애 점검", "보상 지급", "공정위 제재", "이용자 불만", "업데이트 소식"]
+
+
+def _build_frame(rng: random.Random) -> pd.DataFrame:
+    """최근 200일에 걸친 기사. 같은 제목/일자를 여러 언론사가 재배포한 그룹을 섞는다."""
+    now = datetime.now()
+    records = []
+    for i in range(ROWS):
+        base = i // 3 if i % 4 == 0 else i
+        day = now - timedelta(days=1 + (base * 7919) % 200)
+        outlet = rng.choice(OUTLETS)
+        records.append(
+            {
+                "company": "넥슨" if i % 9 else "넷마블",
+                "title_clean": f"{SUBJECTS[base % len(SUBJECTS)]} {ISSUES[base % len(ISSUES)]} {base}",
+                "description_clean": f"{rng.choice(SUBJECTS)} 관련 {rng.choice(ISSUES)} 소식을 전했다",
+                "originallink": f"https://www.{outlet}/news/{i}",
+                "link": f"https://www.{outlet}/news/{i}",
+                "pubDate_parsed": f"{day:%Y-%m-%d} {rng.randrange(24):02d}:00:00",
+                "date": f"{day:%Y-%m-%d}",
+                "sentiment": rng.choice(["긍정", "중립", "부정", "부정"]),
+            }
+        )
+    return pd.DataFrame(records)
+
+
+def _ranges() -> list[tuple[str, str]]:
+    now = datetime.now()
+    return [
+        ("2024-01-01", "2026-12-31"),
+        ((now - timedelta(days=120)).strftime("%Y-%m-%d"), (now - timedelta(days=50)).strftime("%Y-%m-%d")),
+        ((now - timedelta(days=30)).strftime("%Y-%m-%d"), now.strftime("%Y-%m-%d")),
+        (now.strftime("%Y-%m-%d"), now.strftime("%Y-%m-%d")),
+    ]
+
+
+def _scan_payload(date_from: str, date_to: str, ip: str) -> dict:
+    """롤업을 쓰지 않는(기사 전체를 읽는) 기존 경로의 응답."""
+    original = storage.daily_rollup_ready
+    storage.daily_rollup_ready = lambda conn: False
+    try:
+        return storage.get_risk_dashboard(date_from=date_from, date_to=date_to, ip=ip)
+    finally:
+        storage.daily_rollup_ready = original
+
+
+def _assert_parity(label: str) -> None:
+    conn = storage._connect()
+    try:
+        assert storage.daily_rollup_ready(conn), f"[{label}] 롤업이 최신이어야 한다"
+        for ip in IPS:
+            ip_name = storage._resolve_ip_name(ip)
+            for date_from, date_to in _ranges():
+                case = f"[{label}] {ip} {date_from}~{date_to}"
+                rows = storage._risk_dashboard_acc_from_articles(conn, ip_name, date_from, date_to)
+                rollup = storage._risk_dashboard_acc_from_rollup(conn, ip_name, date_from, date_to)
+                assert rollup == rows, case
+                # 언론사/IP 순서(처음 나온 순서)까지 같아야 응답 목록 순서가 같다.
+                for key in ("outlets", "ip_breakdown"):
+                    assert list(rollup[key]) == list(rows[key]), f"{case} {key}"
+                payload = storage.get_risk_dashboard(date_from=date_from, date_to=date_to, ip=ip)
+                assert payload == _scan_payload(date_from, date_to, ip), case
+    finally:
+        conn.close()
+
+
+def main() -> None:
+    # 두 경로 모두 매번 계산해야 비교가 된다(조회 결과 캐시는 경로와 무관하게 같은 키를 쓴다).
+    read_cache.READ_CACHE_ENABLED = False
+    rng = random.Random(6)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["LIVE_DB_PATH"] = str(Path(tmp_dir) / "rollup.db")
+        storage.init_db()
+        storage.save_articles(_build_frame(rng))
+        _assert_parity("ingest")
+
+        # 기사 직접 수정/삭제는 트리거가 (회사, 일자)를 표시하고, 재집계 전에는 기사 스캔으로 응답한다.
+        conn = storage._connect()
+        try:
+            conn.execute("DELETE FROM articles WHERE id % 7 = 0")
+            conn.execute("UPDATE articles SET sentiment = '부정' WHERE id % 5 = 0")
+            conn.commit()
+            assert not storage.daily_rollup_ready(conn)
+        finally:
+            conn.close()
+        # 정리 작업이 표시된 일자를 재집계한다.
+        deleted = storage.cleanup_live_articles(retain_days=60)
+        assert deleted > 0, deleted
+        _assert_parity("delete+cleanup")
+
+        assert storage.clear_articles(company="넷마블") > 0
+        _assert_parity("clear")
+
+        # 추가 적재분도 같은 트랜잭션에서 롤업에 더해진다.
+        storage.save_articles(_build_frame(random.Random(7)).assign(originallink=lambda d: d["originallink"] + "?r=2"))
+        _assert_parity("re-ingest")
+
+    print("PASS: 위험 대시보드 롤업 경로가 기사 전체 스캔과 같은 응답을 반환(적재/수정/삭제/정리 후)")
+
+
+if __name__ == "__main__":
+    main()
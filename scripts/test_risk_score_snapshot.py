@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+import time
+
+from fastapi.testclient import TestClient
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+from backend import main as api
+from scripts.article_fixtures import article_frame, hours_ago, temp_live_db
+
+POLLS = 5
+
+
+def _risk_rows() -> int:
+    conn = storage._connect_readonly()
+    try:
+        return int(conn.execute("SELECT COUNT(*) FROM risk_timeseries").fetchone()[0])
+    finally:
+        conn.close()
+
+
+def _poll(client: TestClient, url: str) -> dict:
+    """같은 URL을 여러 번 조회한다. 조회는 risk_timeseries에 쓰지 않는다."""
+    before = _risk_rows()
+    payloads = []
+    for _ in range(POLLS):
+        res = client.get(url)
+        assert res.status_code == 200, res.text
+        payloads.append(res.json())
+    assert _risk_rows() == before, (url, before, _risk_rows())
+    assert all(p["meta"]["source"] == payloads[0]["meta"]["source"] for p in payloads), url
+    return payloads[-1]
+
+
+def main() -> None:
+    with temp_live_db("risk_score.db"):
+        storage.save_articles(article_frame(0, 30, published=hours_ago(20)))
+        api.risk_snapshot_cache.clear()
+        client = TestClient(api.app)
+
+        # 모니터 틱 전에는 스냅샷이 없어 기록 없이 계산한다.
+        assert _poll(client, "/api/risk-score?ip=maplestory")["meta"]["source"] == "on_demand"
+        assert _risk_rows() == 0
+
+        # 모니터 틱이 한 번 계산/기록하고 스냅샷을 게시한다. 이후 조회는 그 스냅샷을 그대로 돌려준다.
+        api._run_monitor_tick("maplestory")
+        assert _risk_rows() == 1
+        published = api.risk_snapshot_cache[api._risk_snapshot_key("maplestory")]
+        assert published["owned"] and storage.get_risk_snapshot("maplestory") == published["payload"]
+        snapshot = _poll(client, "/api/risk-score?ip=maplestory")
+        assert snapshot["meta"]["source"] == "snapshot" and 0 <= snapshot["meta"]["snapshot_age_seconds"] < 60
+        assert snapshot["risk_score"] == published["payload"]["risk_score"]
+        assert snapshot["meta"]["ts"] == published["payload"]["meta"]["ts"]
+
+        # 재시작(메모리 없음) 뒤에는 DB에 저장된 스냅샷을 읽는다.
+        api.risk_snapshot_cache.clear()
+        assert _poll(client, "/api/risk-score?ip=maplestory")["meta"]["source"] == "snapshot"
+
+        # 모니터 틱이 게시하지 않는 조합(다른 구간)은 기록 없이 계산한다.
+        assert _poll(client, "/api/risk-score?ip=maplestory&window_hours=48")["meta"]["source"] == "on_demand"
+
+        # 모니터 틱이 멈춰 스냅샷이 오래되면 얼어붙은 점수 대신 기록 없이 다시 계산한다.
+        api._run_monitor_tick("maplestory")
+        stale_ts = (datetime.now() - timedelta(seconds=api.RISK_SNAPSHOT_MAX_AGE_SECONDS + 60)).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+        stale = api.risk_snapshot_cache[api._risk_snapshot_key("maplestory")]["payload"]
+        stale["meta"]["ts"] = stale_ts
+        storage.save_risk_snapshot("maplestory", stale)
+        fresh = _poll(client, "/api/risk-score?ip=maplestory")
+        assert fresh["meta"]["source"] == "on_demand" and fresh["meta"]["ts"] != stale_ts, fresh["meta"]
+        # 다음 모니터 틱이 게시하면 다시 스냅샷을 쓴다.
+        time.sleep(1.1)
+        api._run_monitor_tick("maplestory")
+        assert _poll(client, "/api/risk-score?ip=maplestory")["meta"]["source"] == "snapshot"
+
+        # recompute=1은 디버그 모드에서만 기존처럼 재계산해 risk_timeseries에 기록한다.
+        time.sleep(1.1)
+        before = _risk_rows()
+        api.ENABLE_DEBUG_ENDPOINTS = False
+        assert client.get("/api/risk-score?ip=maplestory&recompute=1").status_code == 403
+        assert _risk_rows() == before
+        api.ENABLE_DEBUG_ENDPOINTS = True
+        try:
+            res = client.get("/api/risk-score?ip=maplestory&recompute=1")
+        finally:
+            api.ENABLE_DEBUG_ENDPOINTS = False
+        assert res.status_code == 200 and res.json()["meta"]["source"] == "recompute", res.text
+        assert _risk_rows() == before + 1
+        assert client.get("/api/risk-score?ip=unknown-ip").status_code == 400
+
+    print("PASS: risk-score 조회가 모니터 틱 스냅샷을 기록 없이 반환하고 오래된 스냅샷은 다시 계산(recompute는 디버그 모드만)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import random
+import sys
+import tempfile
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import db, storage
+
+ROWS = 400
+COMPANIES = ["넥슨", "넥슨", "넷마블", "NC소프트"]
+OUTLETS = ["inven.co.kr", "thisisgame.com", "gamemeca.com", "news.naver.com", "ruliweb.com"]
+SUBJECTS = ["메이플스토리", "던파", "블루아카이브", "FC온라인", "아크레이더스", "신규 게임"]
+ISSUES = ["확률 논란", "서버 장애 점검", "보상 지급", "공정위 제재", "이용자 불만", "업데이트 호평"]
+
+
+def _build_frame(rng: random.Random) -> pd.DataFrame:
+    """재배포 그룹(같은/비슷한 제목을 여러 언론사가 게재)과 같은 배치 안 중복 URL을 섞는다."""
+    now = datetime.now()
+    records = []
+    for i in range(ROWS):
+        base = i // 4 if i % 3 == 0 else i
+        day = now - timedelta(days=1 + (base * 7919) % 30)
+        outlet = rng.choice(OUTLETS)
+        title = f"{SUBJECTS[base % len(SUBJECTS)]} {ISSUES[base % len(ISSUES)]} {base}"
+        if i % 7 == 0:
+            # 재배포본 제목이 살짝 다르다(근접 중복).
+            title += " 단독"
+        records.append(
+            {
+                "company": COMPANIES[base % len(COMPANIES)],
+                "title_clean": title,
+                "description_clean": f"{rng.choice(SUBJECTS)} 관련 {rng.choice(ISSUES)} 소식을 전했다",
+                "originallink": f"https://www.{outlet}/news/{i}",
+                "link": f"https://www.{outlet}/news/{i}",
+                "pubDate_parsed": f"{day:%Y-%m-%d} {rng.randrange(1, 24):02d}:{rng.randrange(60):02d}:00",
+                "date": f"{day:%Y-%m-%d}",
+            }
+        )
+    # 같은 배치 안 중복 URL: 완전히 같은 행과, 같은 URL에 제목만 다른 행
+    for i in range(0, ROWS, 23):
+        records.append(dict(records[i]))
+        records.append({**records[i + 1], "title_clean": records[i + 1]["title_clean"] + " (수정)"})
+    rng.shuffle(records)
+    return pd.DataFrame(records)
+
+
+def _snapshot() -> dict[str, object]:
+    """id/적재 시각과 무관한 비교용 상태(기사 URL/그룹 id 기준)."""
+    conn = storage._connect_readonly()
+    try:
+        url_by_id = {
+            int(r["id"]): f"{r['originallink']}#{r['title_clean']}"
+            for r in conn.execute("SELECT id, originallink, title_clean FROM articles")
+        }
+        articles = sorted(
+            (
+                url_by_id[int(r["id"])],
+                r["company"],
+                r["outlet"],
+                r["pub_date"],
+                r["date"],
+                r["sentiment"],
+                r["is_test"],
+                r["content_hash"],
+                r["source_group_id"],
+                r["event_ts"],
+            )
+            for r in conn.execute("SELECT * FROM articles")
+        )
+        groups = sorted(
+            (r["group_id"], url_by_id[int(r["canonical_article_id"])], r["repost_count"])
+            for r in conn.execute("SELECT group_id, canonical_article_id, repost_count FROM source_groups")
+        )
+        tags = sorted(
+            (url_by_id[int(r["article_id"])], r["tag_type"], r["tag"], r["is_primary"])
+            for r in conn.execute("SELECT article_id, tag_type, tag, is_primary FROM article_tags")
+        )
+        sentiment = sorted(
+            (
+                url_by_id[int(r["article_id"])],
+                r["source_group_id"],
+                r["sentiment_score"],
+                r["sentiment_label"],
+                r["confidence"],
+                r["method"],
+            )
+            for r in conn.execute("SELECT * FROM sentiment_results")
+        )
+        rollup = sorted(tuple(r) for r in conn.execute("SELECT * FROM article_daily_rollup"))
+    finally:
+        conn.close()
+    return {"articles": articles, "groups": groups, "tags": tags, "sentiment": sentiment, "rollup": rollup}
+
+
+def _save(tmp_dir: str, name: str, frame: pd.DataFrame, mode: str) -> tuple[int, dict[str, object]]:
+    os.environ["LIVE_DB_PATH"] = str(Path(tmp_dir) / f"{name}.db")
+    storage.init_db()
+    if mode == "per_row":
+        # 기존 경로처럼 기사 한 건씩 적재한다.
+        inserted = sum(storage.save_articles(frame.iloc[[i]]) for i in range(len(frame)))
+    elif mode == "small_chunks":
+        inserted = storage.save_articles(frame, chunk_size=7)
+    else:
+        inserted = storage.save_articles(frame)
+    return inserted, _snapshot()
+
+
+def main() -> None:
+    frame = _build_frame(random.Random(1))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        inserted, expected = _save(tmp_dir, "per_row", frame, "per_row")
+        assert inserted == len(expected["articles"]) < len(frame), (inserted, len(frame))
+        assert any(count > 1 for _, _, count in expected["groups"]), "재배포 그룹이 있어야 한다"
+        for mode in ("bulk", "small_chunks"):
+            got_inserted, got = _save(tmp_dir, mode, frame, mode)
+            assert got_inserted == inserted, (mode, got_inserted, inserted)
+            for key in expected:
+                assert got[key] == expected[key], f"{mode} {key}"
+
+        # 이미 적재된 배치를 다시 넣어도 아무것도 바뀌지 않는다.
+        assert storage.save_articles(frame) == 0
+        assert _snapshot() == got
+        db.close_all_connections()
+
+    print("PASS: save_articles 일괄 적재가 행 단위 적재와 같은 기사/그룹/태그/감성 결과를 만든다(배치 내 중복 URL 포함)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import calendar
+from datetime import datetime
+import os
+from pathlib import Path
+import sqlite3
+import sys
+import tempfile
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import db, storage
+
+# 스키마 버전 도입 이전 init_db가 만들던 테이블/색인(schema_migrations, event_ts, 태그/롤업/FTS 없음).
+_BASELINE_SCHEMA = """
+CREATE TABLE articles (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company TEXT NOT NULL,
+    title_clean TEXT NOT NULL,
+    description_clean TEXT,
+    originallink TEXT,
+    link TEXT,
+    outlet TEXT,
+    pub_date TEXT,
+    date TEXT,
+    sentiment TEXT,
+    is_test INTEGER NOT NULL DEFAULT 0,
+    content_hash TEXT NOT NULL UNIQUE,
+    created_at TEXT NOT NULL,
+    source_group_id TEXT
+);
+CREATE TABLE source_groups (
+    group_id TEXT PRIMARY KEY,
+    canonical_article_id INTEGER,
+    repost_count INTEGER NOT NULL DEFAULT 1,
+    first_seen_at TEXT NOT NULL,
+    last_seen_at TEXT NOT NULL,
+    FOREIGN KEY(canonical_article_id) REFERENCES articles(id) ON DELETE SET NULL
+);
+CREATE TABLE sentiment_results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    article_id INTEGER NOT NULL,
+    source_group_id TEXT,
+    sentiment_score REAL NOT NULL,
+    sentiment_label TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    method TEXT NOT NULL,
+    analyzed_at TEXT NOT NULL,
+    FOREIGN KEY(article_id) REFERENCES articles(id) ON DELETE CASCADE,
+    FOREIGN KEY(source_group_id) REFERENCES source_groups(group_id) ON DELETE SET NULL
+);
+CREATE TABLE risk_timeseries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ip_id TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    risk_raw REAL NOT NULL,
+    risk_score REAL NOT NULL,
+    issue_heat REAL NOT NULL DEFAULT 0,
+    s_comp REAL NOT NULL,
+    v_comp REAL NOT NULL,
+    t_comp REAL NOT NULL,
+    m_comp REAL NOT NULL,
+    alert_level TEXT NOT NULL,
+    sample_size INTEGER NOT NULL,
+    uncertain_ratio REAL NOT NULL,
+    quality_flag TEXT NOT NULL DEFAULT 'OK',
+    risk_formula_version TEXT NOT NULL DEFAULT 'v1'
+);
+CREATE TABLE burst_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ip_name TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    trigger_reason TEXT NOT NULL,
+    risk_at_event REAL NOT NULL,
+    occurred_at TEXT NOT NULL
+);
+CREATE TABLE scheduler_logs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    run_time TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error_message TEXT
+);
+CREATE TABLE risk_daily_summary (
+    ip_id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    avg_risk REAL NOT NULL,
+    max_risk REAL NOT NULL,
+    article_count INTEGER NOT NULL,
+    sample_size_avg REAL NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (ip_id, date)
+);
+CREATE INDEX idx_articles_company ON articles(company);
+CREATE INDEX idx_articles_pub_date ON articles(pub_date);
+CREATE INDEX idx_risk_ip_ts ON risk_timeseries(ip_id, ts);
+"""
+
+_CREATED_AT = "2025-11-05 08:00:00"
+
+
+def _seed_baseline(path: Path) -> None:
+    """예전 형식 데이터: 발행 시각 없는 행, 'uncertain' 감성 라벨, (ip_id, ts) 중복 이력."""
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(_BASELINE_SCHEMA)
+        samples = [
+            ("2025-11-01 09:30:00", "2025-11-01", "positive"),
+            (None, "2025-11-02", "불확실"),
+            ("", "2025-11-03", "부정"),
+            (None, None, "uncertain"),
+        ]
+        for i, (pub_date, date, sentiment) in enumerate(samples):
+            cur = conn.execute(
+                """
+                INSERT INTO articles (company, title_clean, description_clean, originallink, link, outlet,
+                                      pub_date, date, sentiment, is_test, content_hash, created_at)
+                VALUES ('넥슨', ?, '이용자 반응', ?, ?, 'inven.co.kr', ?, ?, ?, 0, ?, ?)
+                """,
+                (f"메이플스토리 업데이트 소식 {i}", f"https://www.inven.co.kr/news/{i}",
+                 f"https://www.inven.co.kr/news/{i}", pub_date, date, sentiment, f"baseline-{i}", _CREATED_AT),
+            )
+            conn.execute(
+                """
+                INSERT INTO sentiment_results (article_id, sentiment_score, sentiment_label, confidence, method,
+                                               analyzed_at)
+                VALUES (?, 0.0, 'uncertain', 0.5, 'rule_v1', ?)
+                """,
+                (cur.lastrowid, _CREATED_AT),
+            )
+        for risk_score in (40.0, 55.0):
+            conn.execute(
+                """
+                INSERT INTO risk_timeseries (ip_id, ts, risk_raw, risk_score, s_comp, v_comp, t_comp, m_comp,
+                                             alert_level, sample_size, uncertain_ratio)
+                VALUES ('maplestory', '2025-11-05 08:00:00', ?, ?, 0, 0, 0, 0, 'P3', 4, 0)
+                """,
+                (risk_score, risk_score),
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _epoch(value: str) -> int:
+    return calendar.timegm(datetime.strptime(value, "%Y-%m-%d %H:%M:%S").timetuple())
+
+
+def _state(conn: sqlite3.Connection) -> dict[str, object]:
+    return {
+        "migrations": [tuple(r) for r in conn.execute("SELECT * FROM schema_migrations ORDER BY version")],
+        "schema": sorted(tuple(r) for r in conn.execute("SELECT type, name, tbl_name, sql FROM sqlite_master")),
+        "data_version": sorted(tuple(r) for r in conn.execute("SELECT name, version FROM data_version")),
+        "articles": [tuple(r) for r in conn.execute("SELECT * FROM articles ORDER BY id")],
+    }
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "baseline.db"
+        os.environ["LIVE_DB_PATH"] = str(path)
+        _seed_baseline(path)
+
+        # 첫 init_db: 버전 없는 DB에 모든 마이그레이션을 한 번씩 적용한다.
+        storage.init_db()
+        conn = storage._connect()
+        try:
+            assert storage.get_schema_version(conn) == storage.SCHEMA_VERSION
+            migrations = conn.execute("SELECT version, name FROM schema_migrations ORDER BY version").fetchall()
+            assert [(int(r["version"]), r["name"]) for r in migrations] == [
+                (version, name) for version, name, _ in storage._SCHEMA_MIGRATIONS
+            ], migrations
+            event_ts = [r["event_ts"] for r in conn.execute("SELECT event_ts FROM articles ORDER BY id")]
+            assert event_ts == [
+                _epoch("2025-11-01 09:30:00"),
+                _epoch("2025-11-02 00:00:00"),
+                _epoch("2025-11-03 00:00:00"),
+                _epoch(_CREATED_AT),
+            ], event_ts
+            sentiments = [r["sentiment"] for r in conn.execute("SELECT sentiment FROM articles ORDER BY id")]
+            assert sentiments == ["긍정", "중립", "부정", "중립"], sentiments
+            labels = {r[0] for r in conn.execute("SELECT sentiment_label FROM sentiment_results")}
+            assert labels == {"neutral"}, labels
+            risk = conn.execute("SELECT risk_score FROM risk_timeseries").fetchall()
+            assert [r["risk_score"] for r in risk] == [55.0], risk
+            fts = conn.execute("SELECT COUNT(*) FROM articles_fts").fetchone()[0]
+            assert fts == 4, fts
+            assert storage.article_tags_ready(conn) and storage.daily_rollup_ready(conn)
+            triggers = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE '%data_version%'"
+            ).fetchall()
+            assert not triggers, triggers
+            before = _state(conn)
+        finally:
+            conn.close()
+
+        # 두 번째 init_db는 아무것도 쓰지 않는다(다른 연결의 커밋이 있으면 PRAGMA data_version이 바뀐다).
+        observer = sqlite3.connect(path)
+        try:
+            pragma_before = observer.execute("PRAGMA data_version").fetchone()[0]
+            conn = storage._connect()
+            try:
+                assert storage._apply_schema_migrations(conn) == []
+            finally:
+                conn.close()
+            storage.init_db()
+            assert observer.execute("PRAGMA data_version").fetchone()[0] == pragma_before
+        finally:
+            observer.close()
+        conn = storage._connect()
+        try:
+            assert _state(conn) == before
+        finally:
+            conn.close()
+        db.close_all_connections()
+
+    print("PASS: 버전 도입 이전 DB가 한 번에 최신 스키마로 올라가고 두 번째 init_db는 아무것도 쓰지 않음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import storage
+from scripts.article_fixtures import article_frame, temp_live_db
+from utils.sentiment import SENTIMENT_RESULT_COLUMNS, add_sentiment_column, analyze_sentiment_rule_v1
+
+SUBJECTS = ["메이플스토리", "던전앤파이터", "블루아카이브", "FC온라인", "카트라이더", "마비노기"]
+ISSUES = ["확률 논란", "서버 장애 보상", "신규 업데이트 호평", "공정위 제재", "이벤트 흥행", "점검 연장"]
+
+
+class _CallCounter:
+    """storage가 부르는 규칙 채점 함수 호출 수."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self._original = storage.analyze_sentiment_rule_v1
+
+    def __enter__(self) -> "_CallCounter":
+        def counted(title: str, description: str = "") -> dict:
+            self.calls += 1
+            return self._original(title, description)
+
+        storage.analyze_sentiment_rule_v1 = counted
+        return self
+
+    def __exit__(self, *exc) -> None:
+        storage.analyze_sentiment_rule_v1 = self._original
+
+
+def _frame(start: int, rows: int) -> pd.DataFrame:
+    now = datetime.now()
+    frame = article_frame(
+        start,
+        rows,
+        title=lambda i: f"{SUBJECTS[i % len(SUBJECTS)]} {ISSUES[(i * 5) % len(ISSUES)]} 소식 {i * 7919}",
+        description=lambda i: f"{ISSUES[i % len(ISSUES)]} 관련 이용자 반응 {i}",
+        published=lambda i: now - timedelta(hours=1 + i),
+        sentiment=None,
+    )
+    frame = add_sentiment_column(frame)
+    # 규칙 채점과 다른 값(다른 모델 결과)이어야 재사용했는지 저장값으로 구분된다.
+    frame["sentiment_score"] = [round(0.3 + (i % 5) / 10, 3) for i in range(rows)]
+    frame["sentiment_label_en"] = "positive"
+    frame["sentiment"] = "긍정"
+    frame["sentiment_confidence"] = 0.77
+    frame["sentiment_method"] = "frame_model_v9"
+    return frame
+
+
+def _stored_results() -> dict[str, dict]:
+    """기사 URL별 저장된 감성 결과(그룹 대표 기사만 있다)와 기사 행의 감성 라벨."""
+    conn = storage._connect_readonly()
+    try:
+        rows = conn.execute(
+            """
+            SELECT a.originallink, a.sentiment, s.sentiment_score, s.sentiment_label, s.confidence, s.method
+            FROM sentiment_results AS s
+            JOIN articles AS a ON a.id = s.article_id
+            """
+        ).fetchall()
+    finally:
+        conn.close()
+    return {str(r["originallink"]): dict(r) for r in rows}
+
+
+def _assert_matches(stored: dict, expected: dict, link: str) -> None:
+    assert abs(float(stored["sentiment_score"]) - float(expected["sentiment_score"])) < 1e-9, (link, stored, expected)
+    assert stored["sentiment_label"] == expected["sentiment_label"], (link, stored, expected)
+    assert abs(float(stored["confidence"]) - float(expected["confidence"])) < 1e-9, (link, stored, expected)
+    assert stored["method"] == expected["method"], (link, stored, expected)
+    assert stored["sentiment"] == expected["sentiment_kr"], (link, stored, expected)
+
+
+def main() -> None:
+    with temp_live_db("sentiment_reuse.db"):
+        # 감성 결과가 모두 있는 프레임은 한 번도 채점하지 않고 프레임 값을 그대로 저장한다.
+        full = _frame(0, 60)
+        with _CallCounter() as counter:
+            assert storage.save_articles(full) == 60
+        assert counter.calls == 0, counter.calls
+        stored = _stored_results()
+        assert stored
+        for r in full.to_dict("records"):
+            if r["originallink"] in stored:
+                expected = {
+                    "sentiment_score": r["sentiment_score"],
+                    "sentiment_label": r["sentiment_label_en"],
+                    "confidence": r["sentiment_confidence"],
+                    "method": r["sentiment_method"],
+                    "sentiment_kr": r["sentiment"],
+                }
+                _assert_matches(stored[r["originallink"]], expected, r["originallink"])
+
+        # 일부 열이 비었거나(NaN/빈 문자열) 숫자가 아닌 행만 채점한다.
+        partial = _frame(100, 40)
+        missing = {
+            0: ("sentiment_score", np.nan),
+            3: ("sentiment_method", ""),
+            7: ("sentiment_confidence", None),
+            12: ("sentiment_label_en", "  "),
+            20: ("sentiment_score", "abc"),
+        }
+        for pos, (col, value) in missing.items():
+            partial[col] = partial[col].astype(object)
+            partial.at[pos, col] = value
+        assert set(col for col, _ in missing.values()) <= set(SENTIMENT_RESULT_COLUMNS)
+        with _CallCounter() as counter:
+            assert storage.save_articles(partial) == 40
+        assert counter.calls == len(missing), counter.calls
+        stored = _stored_results()
+        for pos, r in enumerate(partial.to_dict("records")):
+            link = r["originallink"]
+            if link not in stored:
+                continue
+            if pos in missing:
+                expected = analyze_sentiment_rule_v1(r["title_clean"], r["description_clean"])
+                # 라벨 열(sentiment)은 프레임 값을 우선한다(기존 동작).
+                expected = {**expected, "sentiment_kr": r["sentiment"]}
+            else:
+                expected = {
+                    "sentiment_score": r["sentiment_score"],
+                    "sentiment_label": r["sentiment_label_en"],
+                    "confidence": r["sentiment_confidence"],
+                    "method": r["sentiment_method"],
+                    "sentiment_kr": r["sentiment"],
+                }
+            _assert_matches(stored[link], expected, link)
+        assert any(partial.iloc[pos]["originallink"] in stored for pos in missing)
+
+    print("PASS: save_articles가 프레임 감성 결과를 재사용하고 빠진 행만 채점")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import sys
+import tempfile
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import db, storage
+
+GROUPS = 60
+COMPANIES = ["넥슨", "넷마블", "엔씨소프트"]
+
+
+def _build_frame() -> pd.DataFrame:
+    """같은 제목/일자의 3개 회사 기사가 한 그룹이 된다. 홀수 그룹은 보존 기간 밖(40일 이전)."""
+    now = datetime.now()
+    records = []
+    for i in range(GROUPS):
+        day = now - timedelta(days=40 + i if i % 2 else 5)
+        for hour, company in enumerate(COMPANIES):
+            records.append(
+                {
+                    "company": company,
+                    "title_clean": f"게임 업계 소식 {i}",
+                    "description_clean": "",
+                    "originallink": "",
+                    "link": "",
+                    "pubDate_parsed": (day + timedelta(hours=hour)).strftime("%Y-%m-%d %H:%M:%S"),
+                    "date": day.strftime("%Y-%m-%d"),
+                    "is_test": 1 if i == 2 else 0,
+                }
+            )
+    return pd.DataFrame(records)
+
+
+def _rows(sql: str, params: tuple = ()) -> list[tuple]:
+    conn = storage._connect_readonly()
+    try:
+        return [tuple(r) for r in conn.execute(sql, params).fetchall()]
+    finally:
+        conn.close()
+
+
+def _assert_consistent(label: str) -> None:
+    result = storage.check_source_group_rollups()
+    assert result["repost_count_mismatch"] == 0 and result["orphan_groups"] == 0, (label, result)
+    # 기존 전체 재계산 결과와 같은 상태여야 한다.
+    expected = _rows(
+        """
+        SELECT source_group_id, COUNT(1) FROM articles
+        WHERE COALESCE(source_group_id, '') != ''
+        GROUP BY source_group_id ORDER BY source_group_id
+        """
+    )
+    assert _rows("SELECT group_id, repost_count FROM source_groups ORDER BY group_id") == expected, label
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["LIVE_DB_PATH"] = str(Path(tmp_dir) / "groups.db")
+        storage.init_db()
+        assert storage.save_articles(_build_frame()) == GROUPS * len(COMPANIES)
+        _assert_consistent("initial")
+
+        # 다른 경로로 생긴 불일치(정리 대상이 아닌 그룹)는 정리 작업이 건드리지 않고 점검기가 찾는다.
+        conn = storage._connect()
+        try:
+            drift_gid = _rows("SELECT source_group_id FROM articles WHERE id = 13")[0][0]
+            conn.execute("UPDATE source_groups SET repost_count = 99 WHERE group_id = ?", (drift_gid,))
+            conn.execute(
+                """
+                INSERT INTO source_groups (group_id, canonical_article_id, repost_count, first_seen_at, last_seen_at)
+                VALUES ('orphan-group', 13, 1, '2026-01-01 00:00:00', '2026-01-01 00:00:00')
+                """
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        drift = {"repost_count_mismatch": 1, "orphan_groups": 1}
+
+        # 상한이 있으면 그룹 일부만 지워져 남은 기사 수로 다시 센다(14번째 그룹은 1건만 삭제).
+        assert storage.cleanup_live_articles(retain_days=30, max_delete_rows=40, dry_run=True) == 40
+        assert storage.cleanup_live_articles(retain_days=30, max_delete_rows=40) == 40
+        counts = sorted(r[0] for r in _rows("SELECT repost_count FROM source_groups WHERE group_id != 'orphan-group'"))
+        assert counts.count(2) == 1 and len(counts) == GROUPS - 13, counts
+        result = storage.check_source_group_rollups()
+        assert {k: result[k] for k in drift} == drift, result
+
+        assert storage.cleanup_live_articles(retain_days=30) == (GROUPS // 2) * len(COMPANIES) - 40
+        assert storage.cleanup_live_articles(retain_days=30) == 0
+        assert len(_rows("SELECT 1 FROM source_groups")) == GROUPS // 2 + 1
+
+        # 테스트 기사 정리도 같은 방식으로 그룹을 맞춘다.
+        conn = storage._connect()
+        try:
+            conn.execute("UPDATE articles SET created_at = '2000-01-01 00:00:00' WHERE is_test = 1")
+            conn.commit()
+        finally:
+            conn.close()
+        assert storage.cleanup_test_articles(retain_hours=1) == 3
+        result = storage.check_source_group_rollups()
+        assert {k: result[k] for k in drift} == drift, result
+
+        # 점검기 보정 후에는 전체 재계산 결과와 같다.
+        result = storage.check_source_group_rollups(repair=True)
+        assert result["repaired_groups"] == 2, result
+        _assert_consistent("repaired")
+        assert storage.check_source_group_rollups(repair=True)["repaired_groups"] == 0
+        db.close_all_connections()
+
+    print("PASS: 기사 정리가 삭제된 그룹만 보정하고 점검기가 나머지 불일치를 찾아 보정")
+
+
+if __name__ == "__main__":
+    main()
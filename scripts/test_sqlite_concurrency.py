@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from backend import db, storage
+
+HOLD_SECONDS = 1.5
+MAX_WAIT_SECONDS = 0.5
+
+
+def _build_frame(start: int, rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "company": "넥슨",
+                "title_clean": f"메이플스토리 업데이트 점검 {i}",
+                "description_clean": "보상 지급 안내",
+                "originallink": f"https://www.inven.co.kr/news/{i}",
+                "link": f"https://www.inven.co.kr/news/{i}",
+                "pubDate_parsed": "2026-01-10 09:00:00",
+                "date": "2026-01-10",
+            }
+            for i in range(start, start + rows)
+        ]
+    )
+
+
+def _scheduler_log_count() -> int:
+    conn = storage._connect_readonly()
+    try:
+        return int(conn.execute("SELECT COUNT(*) FROM scheduler_logs").fetchone()[0])
+    finally:
+        conn.close()
+
+
+def _check_pragmas_and_reuse() -> None:
+    conn = storage._connect()
+    try:
+        assert str(conn.execute("PRAGMA journal_mode").fetchone()[0]).lower() == "wal"
+        assert int(conn.execute("PRAGMA synchronous").fetchone()[0]) == 1  # NORMAL
+        assert int(conn.execute("PRAGMA foreign_keys").fetchone()[0]) == 1
+        assert int(conn.execute("PRAGMA busy_timeout").fetchone()[0]) == db.SQLITE_BUSY_TIMEOUT_MS
+        assert int(conn.execute("PRAGMA temp_store").fetchone()[0]) == 2  # MEMORY
+        nested = storage._connect()
+        assert nested is conn, "같은 스레드의 중첩 호출은 같은 연결을 재사용해야 합니다."
+        nested.close()
+    finally:
+        conn.close()
+    assert storage._connect() is conn
+    conn.close()
+
+    other: list[sqlite3.Connection] = []
+    worker = threading.Thread(target=lambda: other.append(storage._connect()))
+    worker.start()
+    worker.join()
+    assert other and other[0] is not conn, "스레드마다 별도 연결이어야 합니다."
+
+    # 커밋하지 않고 반납한 변경은 기존 close()처럼 버려진다.
+    before = _scheduler_log_count()
+    conn = storage._connect()
+    try:
+        conn.execute(
+            "INSERT INTO scheduler_logs (job_id, run_time, status) VALUES ('uncommitted', '2026-01-10 00:00:00', 'x')"
+        )
+    finally:
+        conn.close()
+    assert _scheduler_log_count() == before
+
+    ro = storage._connect_readonly()
+    try:
+        ro.execute("INSERT INTO scheduler_logs (job_id, run_time, status) VALUES ('ro', '2026-01-10 00:00:00', 'x')")
+        raise AssertionError("읽기 전용 연결에서 쓰기가 허용되었습니다.")
+    except sqlite3.OperationalError as exc:
+        assert "readonly" in str(exc)
+    finally:
+        ro.close()
+
+
+def _reads_during_scheduler_write() -> float:
+    """스케줄러 쓰기 트랜잭션이 잠금을 쥔 동안 조회 API 지연(초, 최대값)."""
+    locked = threading.Event()
+    committed = threading.Event()
+
+    def writer() -> None:
+        conn = storage._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for i in range(200):
+                conn.execute(
+                    "INSERT INTO scheduler_logs (job_id, run_time, status) VALUES (?, '2026-01-10 00:00:00', 'success')",
+                    (f"writer-{i}",),
+                )
+            locked.set()
+            time.sleep(HOLD_SECONDS)
+            conn.commit()
+        finally:
+            conn.close()
+            committed.set()
+
+    before = _scheduler_log_count()
+    thread = threading.Thread(target=writer)
+    thread.start()
+    locked.wait()
+    worst = 0.0
+    for _ in range(5):
+        started = time.perf_counter()
+        storage.get_articles(limit=20)
+        storage.get_risk_dashboard(date_from="2026-01-01", date_to="2026-01-31", ip="maplestory")
+        storage.get_observability_counts()
+        assert _scheduler_log_count() == before, "커밋 전 쓰기가 조회에 보이면 안 됩니다."
+        worst = max(worst, time.perf_counter() - started)
+    assert not committed.is_set(), "조회가 쓰기 커밋 이후에야 끝났습니다(쓰기 대기)."
+    thread.join()
+    assert _scheduler_log_count() == before + 200
+    return worst
+
+
+def _write_during_long_read() -> float:
+    """대시보드 조회 트랜잭션이 열린 동안 스케줄러 쓰기(로그 + 기사 적재) 지연(초)."""
+    reading = threading.Event()
+
+    def reader() -> None:
+        conn = storage._connect_readonly()
+        try:
+            conn.execute("BEGIN")
+            conn.execute("SELECT COUNT(*) FROM articles").fetchone()
+            reading.set()
+            time.sleep(HOLD_SECONDS)
+            conn.commit()
+        finally:
+            conn.close()
+
+    thread = threading.Thread(target=reader)
+    thread.start()
+    reading.wait()
+    started = time.perf_counter()
+    storage.record_scheduler_log(job_id="risk-monitor-maplestory", status="success")
+    storage.save_articles(_build_frame(10_000, 20))
+    elapsed = time.perf_counter() - started
+    thread.join()
+    return elapsed
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        os.environ["LIVE_DB_PATH"] = str(Path(tmp_dir) / "concurrency.db")
+        storage.init_db()
+        storage.save_articles(_build_frame(0, 300))
+
+        _check_pragmas_and_reuse()
+        read_wait = _reads_during_scheduler_write()
+        write_wait = _write_during_long_read()
+        print(f"reads during write: worst={read_wait * 1000:.1f}ms, write during long read: {write_wait * 1000:.1f}ms")
+        assert read_wait < MAX_WAIT_SECONDS, f"쓰기 중 조회가 대기했습니다: {read_wait:.3f}s"
+        assert write_wait < MAX_WAIT_SECONDS, f"긴 조회 중 쓰기가 대기했습니다: {write_wait:.3f}s"
+        db.close_all_connections()
+
+    print("PASS: WAL 연결 계층에서 스케줄러 쓰기와 조회가 서로 대기하지 않음")
+
+
+if __name__ == "__main__":
+    main()
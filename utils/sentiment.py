@@ -50,6 +50,15 @@ POS_DICT = {
     "복구 완료": 0.7,
 }
 
+# 수집 프레임이 감성 결과를 실어 나르는 컬럼(add_sentiment_column 출력 = save_articles 입력 계약)
+SENTIMENT_RESULT_COLUMNS = (
+    "sentiment",
+    "sentiment_score",
+    "sentiment_label_en",
+    "sentiment_confidence",
+    "sentiment_method",
+)
+
 MITIGATION_TERMS = ["개선", "해결", "대응", "조치", "보상안", "재발방지", "정상화", "복구"]
 
 
@@ -124,7 +133,10 @@ def analyze_sentiment_rule_v1(title: str, description: str = "") -> dict:
 
 
 def add_sentiment_column(df: pd.DataFrame, model_id: str | None = None) -> pd.DataFrame:
-    """Add rule-based sentiment column to DataFrame."""
+    """Add rule-based sentiment columns (SENTIMENT_RESULT_COLUMNS) to DataFrame.
+
+    save_articles reuses these columns as-is and only scores rows that lack them.
+    """
     if df.empty:
         return df
 